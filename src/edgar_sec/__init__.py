@@ -33,33 +33,137 @@ Imports:
     CompanyFact: A class representing a company fact.
     FrameDisclosure: A class representing a frame disclosure for a company.
     Frame: A class representing a frame associated with a filing.
+    FramePanel: A class representing a CIK by period panel assembled from frames.
     Company: A class representing a company in the EDGAR database.
+    SubmissionCheckpoint: A class representing the last-seen state of a filer's submission history.
+    SubmissionStore: A class that stores per-CIK checkpoints for incremental submission syncs.
+    FactChange: A class representing a fact added, changed or removed since the last merge.
+    FactStore: A class that stores company facts for diff-based updates.
+    FactCatalog: A class that records seen taxonomies, tags and units to pre-validate requests.
+    CompanyUniverse: A class holding the SEC company list as columns with vectorized lookups.
+    EdgarMirror: A class that mirrors EDGAR data into a local SQLite database.
+    FrameEngine: A class that assembles frames locally from company facts.
+    TimeSeriesEngine: A class that derives discrete quarterly and TTM series from company facts.
+    PointInTimeIndex: A class that answers as-of queries over company facts by filed date.
+    Hooks: A class that registers handlers for the events emitted along the request path.
+    RequestEvent: A class representing one instrumentation event.
+    Metrics: A class that aggregates instrumentation events into counters and latency histograms.
+    ParseExecutor: A class that parses large payloads in a process pool.
+    RequestScheduler: A class that releases requests by priority class within a shared rate budget.
+    Deadline: A class representing the time by which a call must finish.
+    HostLimiter: A class that caps the requests per second sent to each host.
+
+Every submodule and class above is imported lazily, on first attribute access.
+
+Modules:
+    testing: A synthetic payload generator (PayloadGenerator), an offline stand-in for the EDGAR API (MockEdgarServer) and a load-test harness (LoadTest).
 """
+from typing import TYPE_CHECKING, Any, List
+import importlib
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
 
-from . import clients
-from . import helpers
-from . import objects
+if TYPE_CHECKING:
+    from . import clients, helpers, objects, stores, mirror, analytics, instrumentation, metrics, parsing, scheduling, testing
+    from .clients import EdgarAPI
+    from .helpers import EdgarHelpers
+    from .objects import (
+        Address,
+        FormerName,
+        Filing,
+        File,
+        SubmissionHistory,
+        UnitDisclosure,
+        CompanyConcept,
+        TaxonomyDisclosures,
+        TaxonomyFacts,
+        CompanyFacts,
+        FrameDisclosure,
+        Frame,
+        FramePanel,
+        Company,
+    )
+    from .stores import SubmissionCheckpoint, SubmissionStore, FactChange, FactStore, FactCatalog, CompanyUniverse
+    from .mirror import EdgarMirror
+    from .analytics import FrameEngine, TimeSeriesEngine, PointInTimeIndex
+    from .instrumentation import Hooks, RequestEvent
+    from .metrics import Metrics
+    from .parsing import ParseExecutor
+    from .scheduling import RequestScheduler, Deadline, HostLimiter
+    AsyncAPI = EdgarAPI.AsyncAPI
+
+_submodules = ("clients", "helpers", "objects", "stores", "mirror", "analytics", "instrumentation", "metrics", "parsing", "scheduling", "testing")
+_attributes = {
+    "EdgarAPI": "clients",
+    "EdgarHelpers": "helpers",
+    "Address": "objects",
+    "FormerName": "objects",
+    "Filing": "objects",
+    "File": "objects",
+    "SubmissionHistory": "objects",
+    "UnitDisclosure": "objects",
+    "CompanyConcept": "objects",
+    "TaxonomyDisclosures": "objects",
+    "TaxonomyFacts": "objects",
+    "CompanyFacts": "objects",
+    "FrameDisclosure": "objects",
+    "Frame": "objects",
+    "FramePanel": "objects",
+    "Company": "objects",
+    "SubmissionCheckpoint": "stores",
+    "SubmissionStore": "stores",
+    "FactChange": "stores",
+    "FactStore": "stores",
+    "FactCatalog": "stores",
+    "CompanyUniverse": "stores",
+    "EdgarMirror": "mirror",
+    "FrameEngine": "analytics",
+    "TimeSeriesEngine": "analytics",
+    "PointInTimeIndex": "analytics",
+    "Hooks": "instrumentation",
+    "RequestEvent": "instrumentation",
+    "Metrics": "metrics",
+    "ParseExecutor": "parsing",
+    "RequestScheduler": "scheduling",
+    "Deadline": "scheduling",
+    "HostLimiter": "scheduling",
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Import submodules and public classes on first access.
+
+    Importing edgar_sec only loads __about__; the clients module and its httpx, tenacity, cachetools and
+    asyncache dependencies are imported the first time e.g. edgar_sec.EdgarAPI is used. Resolved names are
+    cached in the package namespace, so later lookups are plain attribute reads.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        Any: The submodule or class.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name == "AsyncAPI":
+        value = importlib.import_module(".clients", __name__).EdgarAPI.AsyncAPI
+    elif name in _attributes:
+        value = getattr(importlib.import_module(f".{_attributes[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-from .clients import EdgarAPI
-from .helpers import EdgarHelpers
-from .objects import (
-    Address,
-    FormerName,
-    Filing,
-    File,
-    SubmissionHistory,
-    UnitDisclosure,
-    CompanyConcept,
-    TaxonomyDisclosures,
-    TaxonomyFacts,
-    CompanyFacts,
-    FrameDisclosure,
-    Frame,
-    Company,
-)
+def __dir__() -> List[str]:
+    """
+    List the package attributes, including those not imported yet.
 
-AsyncAPI = EdgarAPI.AsyncAPI
+    Returns:
+        List[str]: The sorted public names.
+    """
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     "__title__",
@@ -72,6 +176,14 @@ __all__ = [
     "clients",
     "helpers",
     "objects",
+    "stores",
+    "mirror",
+    "analytics",
+    "instrumentation",
+    "metrics",
+    "parsing",
+    "scheduling",
+    "testing",
     "EdgarAPI",
     "AsyncAPI",
     "EdgarHelpers",
@@ -87,5 +199,23 @@ __all__ = [
     "CompanyFacts",
     "FrameDisclosure",
     "Frame",
+    "FramePanel",
     "Company",
+    "SubmissionCheckpoint",
+    "SubmissionStore",
+    "FactChange",
+    "FactStore",
+    "FactCatalog",
+    "CompanyUniverse",
+    "EdgarMirror",
+    "FrameEngine",
+    "TimeSeriesEngine",
+    "PointInTimeIndex",
+    "Hooks",
+    "RequestEvent",
+    "Metrics",
+    "ParseExecutor",
+    "RequestScheduler",
+    "Deadline",
+    "HostLimiter",
 ]
@@ -0,0 +1,544 @@
+# filepath: /src/edgar_sec/analytics.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines local analytics engines built on top of EDGAR XBRL data.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from datetime import datetime, date
+import bisect
+from edgar_sec.objects import CompanyConcept, CompanyFacts, FrameDisclosure, Frame, UnitDisclosure
+from edgar_sec.helpers import EdgarHelpers
+from edgar_sec.stores import FactCatalog
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class FrameEngine:
+    """Assemble frames locally from company facts.
+
+    Every fact in a companyfacts payload that EDGAR aligned to a calendar period carries
+    a frame id (e.g. 'CY2019Q1I'). The engine indexes those facts by
+    (taxonomy, tag, unit, frame), so Frame objects for any period can be built from
+    cached or bulk company facts without a call to the frames endpoint. Units are keyed
+    in their frames URL form ('USD-per-shares'), so either spelling finds the same frame.
+    """
+    def __init__(self, company_facts: Optional[Iterable[CompanyFacts]]=None) -> None:
+        """
+        Initialize the FrameEngine.
+
+        Args:
+            company_facts (Iterable[CompanyFacts], optional): Company facts to index immediately.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> engine = ed.FrameEngine([api.get_company_facts(ticker) for ticker in ["AAPL", "MSFT"]])
+            >>> frame = engine.get_frame("us-gaap", "Assets", "USD", "CY2023Q4", instantaneous=True)
+        """
+        self.index: Dict[Tuple[str, str, str, str], Dict[str, Tuple[str, FrameDisclosure]]] = {}
+        self.concepts: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for facts in company_facts or []:
+            self.add(facts)
+    def __repr__(self) -> str:
+        """
+        String representation of the FrameEngine class.
+
+        Returns:
+            str: A string representation of the FrameEngine class.
+        """
+        return f"FrameEngine(frames={len(self.index)})"
+    def __len__(self) -> int:
+        """
+        Get the number of frames the engine can build.
+
+        Returns:
+            int: The number of indexed (taxonomy, tag, unit, frame) combinations.
+        """
+        return len(self.index)
+    def __contains__(self, key: Tuple[str, str, str, str]) -> bool:
+        """
+        Check if a frame can be built.
+
+        Args:
+            key (Tuple[str, str, str, str]): A (taxonomy, tag, unit, frame) tuple.
+
+        Returns:
+            bool: True if the frame is indexed, False otherwise.
+        """
+        taxonomy, tag, unit, frame = key
+        return (taxonomy, tag, FactCatalog.normalize_unit(unit), frame) in self.index
+    # Private Methods
+    def __index(self, cik: str, entity_name: str, taxonomy: str, tag: str, unit: str, data: Dict) -> None:
+        """
+        Index a single raw fact under its frame, keeping the latest filed fact per company.
+        """
+        frame = data.get('frame')
+        if not frame:
+            return
+        filed = data.get('filed', '')
+        companies = self.index.setdefault((taxonomy, tag, FactCatalog.normalize_unit(unit), frame), {})
+        current = companies.get(cik)
+        if current is None or filed >= current[0]:
+            companies[cik] = (filed, FrameDisclosure(
+                accn=data.get('accn', ''),
+                cik=cik,
+                entity_name=entity_name,
+                loc='',
+                end=data.get('end', ''),
+                val=float(data.get('val', ''))
+            ))
+    # Public Methods
+    def add(self, company_facts: CompanyFacts) -> None:
+        """
+        Index the framed facts of a company, replacing any facts previously indexed for the same frames.
+
+        Args:
+            company_facts (CompanyFacts): The company facts to index.
+        """
+        for taxonomy_facts in company_facts.facts:
+            for disclosure in taxonomy_facts.disclosures:
+                self.concepts[(taxonomy_facts.taxonomy, disclosure.name)] = (disclosure.label, disclosure.description)
+                for unit in disclosure.units:
+                    self.__index(company_facts.cik, company_facts.entity_name, taxonomy_facts.taxonomy, disclosure.name, unit.units, {
+                        'frame': unit.frame, 'filed': unit.filed, 'accn': unit.accn, 'end': unit.end, 'val': unit.val
+                    })
+    def add_response(self, response: Dict) -> None:
+        """
+        Index the framed facts of a raw companyfacts payload without parsing it into objects.
+
+        Args:
+            response (Dict): A raw companyfacts payload, e.g. one file of the EDGAR companyfacts bulk archive.
+        """
+        cik = str(response.get('cik', ''))
+        entity_name = response.get('entityName', '')
+        for taxonomy, taxonomy_data in response.get('facts', {}).items():
+            for tag, tag_data in taxonomy_data.items():
+                self.concepts[(taxonomy, tag)] = (tag_data.get('label', ''), tag_data.get('description', ''))
+                for unit, disclosures in tag_data.get('units', {}).items():
+                    for disclosure in disclosures:
+                        self.__index(cik, entity_name, taxonomy, tag, unit, disclosure)
+    def frames(self, taxonomy: Optional[str]=None, tag: Optional[str]=None, unit: Optional[str]=None) -> List[str]:
+        """
+        List the frame ids available, optionally restricted to a concept and unit.
+
+        Args:
+            taxonomy (str, optional): A taxonomy identifier (e.g. 'us-gaap').
+            tag (str, optional): A concept tag (e.g. 'Assets').
+            unit (str, optional): A unit of measure (e.g. 'USD').
+
+        Returns:
+            List[str]: The sorted frame ids.
+        """
+        unit = FactCatalog.normalize_unit(unit) if unit is not None else None
+        return sorted({
+            frame for (frame_taxonomy, frame_tag, frame_unit, frame) in self.index
+            if (taxonomy is None or frame_taxonomy == taxonomy) and (tag is None or frame_tag == tag) and (unit is None or frame_unit == unit)
+        })
+    def get_frame(self, taxonomy: str, tag: str, unit: str, period: Union[str, datetime], instantaneous: bool) -> Frame:
+        """
+        Build a frame from the indexed company facts.
+
+        Args:
+            taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap', 'ifrs-full', 'dei', or 'srt').
+            tag (str): The specific disclosure concept tag (e.g. 'AccountsPayableCurrent', 'Assets').
+            unit (str): Unit of measurement (e.g. 'USD', 'USD-per-shares').
+            period (str | datetime): The reporting period as a datetime object or a string in 'YYYY-MM-DD', 'CY####' or 'CY####Q#' format.
+            instantaneous (bool): Whether the period is instantaneous (e.g. 'CY2019Q1I').
+
+        Returns:
+            Frame: A frame holding one disclosure per indexed company that reported the concept for the period. The frame is empty if no company did.
+
+        Note:
+            Facts in company facts do not carry a location, so FrameDisclosure.loc is empty in locally built frames.
+        """
+        period = EdgarHelpers.frame_period(period, instantaneous)
+        unit = FactCatalog.normalize_unit(unit)
+        label, description = self.concepts.get((taxonomy, tag), ('', ''))
+        disclosures = [disclosure for _, disclosure in self.index.get((taxonomy, tag, unit, period), {}).values()]
+        disclosures.sort(key=lambda disclosure: int(disclosure.cik) if disclosure.cik.isdigit() else 0)
+        # Same Frame fields as EdgarMirror.get_frame, built from the in-memory index instead of SQLite.
+        # pylint: disable=duplicate-code
+        return Frame(
+            taxonomy=taxonomy,
+            tag=tag,
+            ccp=period,
+            uom=unit,
+            label=label,
+            description=description,
+            pts=len(disclosures),
+            disclosures=disclosures
+        )
+
+class TimeSeriesEngine:
+    """Derive discrete quarterly and trailing-twelve-month series from company facts.
+
+    Duration facts are reported as quarters, year-to-date periods and fiscal years. The
+    engine keeps the latest filed value per (start, end) period of each series and
+    groups periods by their start date, so every discrete quarter missing from the
+    filings (e.g. Q4 = FY - 9M YTD) is derived by differencing consecutive YTD periods
+    in a single sorted pass per series instead of pairwise scans.
+    """
+    durations: Tuple[Tuple[str, int, int], ...] = (
+        ('quarter', 60, 120),
+        ('half', 150, 215),
+        ('nine_months', 240, 305),
+        ('annual', 335, 395)
+    )
+    def __init__(self, company_facts: Optional[Iterable[CompanyFacts]]=None) -> None:
+        """
+        Initialize the TimeSeriesEngine.
+
+        Args:
+            company_facts (Iterable[CompanyFacts], optional): Company facts to index immediately.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> engine = ed.TimeSeriesEngine([api.get_company_facts(ticker) for ticker in ["AAPL", "MSFT"]])
+            >>> revenue = engine.ttm("us-gaap", "Revenues", "USD")
+        """
+        self.series: Dict[Tuple[str, str, str, str], Dict[Tuple[int, int], Tuple[str, float]]] = {}
+        self.ordinals: Dict[str, int] = {}
+        for facts in company_facts or []:
+            self.add(facts)
+    def __repr__(self) -> str:
+        """
+        String representation of the TimeSeriesEngine class.
+
+        Returns:
+            str: A string representation of the TimeSeriesEngine class.
+        """
+        return f"TimeSeriesEngine(series={len(self.series)})"
+    def __len__(self) -> int:
+        """
+        Get the number of series indexed.
+
+        Returns:
+            int: The number of indexed (cik, taxonomy, tag, unit) series.
+        """
+        return len(self.series)
+    def __contains__(self, key: Tuple[str, str, str, str]) -> bool:
+        """
+        Check if a series is indexed.
+
+        Args:
+            key (Tuple[str, str, str, str]): A (cik, taxonomy, tag, unit) tuple.
+
+        Returns:
+            bool: True if the series is indexed, False otherwise.
+        """
+        return key in self.series
+    # Private Methods
+    def __ordinal(self, day: str) -> int:
+        """
+        Convert an ISO date to a day ordinal, memoizing the conversion across series.
+        """
+        ordinal = self.ordinals.get(day)
+        if ordinal is None:
+            ordinal = self.ordinals[day] = date.fromisoformat(day).toordinal()
+        return ordinal
+    def __index(self, cik: str, taxonomy: str, tag: str, unit: str, start: Optional[str], end: str, filed: str, val: float) -> None:
+        """
+        Index a single duration fact, keeping the latest filed value per period.
+        """
+        if not start or not end:
+            return
+        periods = self.series.setdefault((cik, taxonomy, tag, unit), {})
+        period = (self.__ordinal(start), self.__ordinal(end))
+        current = periods.get(period)
+        if current is None or filed >= current[0]:
+            periods[period] = (filed, float(val))
+    def __quarters(self, periods: Dict[Tuple[int, int], Tuple[str, float]]) -> Dict[int, Tuple[int, float]]:
+        """
+        Build the discrete quarters of a series as {end ordinal: (start ordinal, value)}.
+        """
+        quarters: Dict[int, Tuple[int, float]] = {}
+        by_start: Dict[int, List[Tuple[int, float]]] = {}
+        for (start, end), (_, val) in periods.items():
+            by_start.setdefault(start, []).append((end, val))
+            if self.classify_days(end - start + 1) == 'quarter':
+                quarters[end] = (start, val)
+        for start, ends in by_start.items():
+            ends.sort()
+            for (previous_end, previous_val), (end, val) in zip(ends, ends[1:]):
+                if end not in quarters and self.classify_days(end - previous_end) == 'quarter':
+                    quarters[end] = (previous_end + 1, val - previous_val)
+        return quarters
+    def __select(self, taxonomy: str, tag: str, unit: str, cik: Optional[str]) -> Iterable[Tuple[str, Dict[Tuple[int, int], Tuple[str, float]]]]:
+        """
+        Iterate over the indexed series of a concept, optionally restricted to one company.
+        """
+        if cik is not None:
+            key = (str(int(cik)), taxonomy, tag, unit)
+            if key in self.series:
+                yield key[0], self.series[key]
+            return
+        for (series_cik, series_taxonomy, series_tag, series_unit), periods in self.series.items():
+            if series_taxonomy == taxonomy and series_tag == tag and series_unit == unit:
+                yield series_cik, periods
+    # Public Methods
+    @classmethod
+    def classify_days(cls, days: int) -> str:
+        """
+        Classify a period length in days.
+
+        Args:
+            days (int): The number of days in the period, inclusive of both ends.
+
+        Returns:
+            str: One of 'quarter', 'half', 'nine_months', 'annual' or 'other'.
+        """
+        for name, low, high in cls.durations:
+            if low <= days <= high:
+                return name
+        return 'other'
+    @classmethod
+    def classify(cls, start: Optional[str], end: str) -> str:
+        """
+        Classify the duration of a fact from its start and end dates.
+
+        Args:
+            start (str, optional): The start date of the fact in 'YYYY-MM-DD' format. Empty for instantaneous facts.
+            end (str): The end date of the fact in 'YYYY-MM-DD' format.
+
+        Returns:
+            str: 'instant' if the fact has no start date, otherwise one of 'quarter', 'half', 'nine_months', 'annual' or 'other'.
+        """
+        if not start:
+            return 'instant'
+        return cls.classify_days(date.fromisoformat(end).toordinal() - date.fromisoformat(start).toordinal() + 1)
+    def add(self, company_facts: CompanyFacts) -> None:
+        """
+        Index the duration facts of a company.
+
+        Args:
+            company_facts (CompanyFacts): The company facts to index.
+        """
+        for taxonomy_facts in company_facts.facts:
+            for disclosure in taxonomy_facts.disclosures:
+                for unit in disclosure.units:
+                    self.__index(company_facts.cik, taxonomy_facts.taxonomy, disclosure.name, unit.units, unit.start, unit.end, unit.filed, unit.val)
+    def add_concept(self, company_concept: CompanyConcept) -> None:
+        """
+        Index the duration facts of a single company concept.
+
+        Args:
+            company_concept (CompanyConcept): The company concept to index.
+        """
+        for unit in company_concept.units:
+            self.__index(company_concept.cik, company_concept.taxonomy, company_concept.tag, unit.units, unit.start, unit.end, unit.filed, unit.val)
+    def add_response(self, response: Dict) -> None:
+        """
+        Index the duration facts of a raw companyfacts payload without parsing it into objects.
+
+        Args:
+            response (Dict): A raw companyfacts payload, e.g. one file of the EDGAR companyfacts bulk archive.
+        """
+        cik = str(response.get('cik', ''))
+        for taxonomy, taxonomy_data in response.get('facts', {}).items():
+            for tag, tag_data in taxonomy_data.items():
+                for unit, disclosures in tag_data.get('units', {}).items():
+                    for disclosure in disclosures:
+                        self.__index(cik, taxonomy, tag, unit, disclosure.get('start'), disclosure.get('end', ''), disclosure.get('filed', ''), disclosure.get('val', 0))
+    def quarterly(self, taxonomy: str, tag: str, unit: str, cik: Optional[str]=None) -> Dict[str, Dict[str, float]]:
+        """
+        Build discrete quarterly series, deriving quarters that were only reported as part of a YTD or fiscal year period.
+
+        Args:
+            taxonomy (str): A taxonomy identifier (e.g. 'us-gaap').
+            tag (str): A duration concept tag (e.g. 'Revenues').
+            unit (str): A unit of measure (e.g. 'USD').
+            cik (str, optional): Restrict the result to one company.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The quarterly values per CIK, keyed by quarter end date in 'YYYY-MM-DD' format and sorted by date.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for series_cik, periods in self.__select(taxonomy, tag, unit, cik):
+            quarters = self.__quarters(periods)
+            result[series_cik] = {date.fromordinal(end).isoformat(): val for end, (_, val) in sorted(quarters.items())}
+        return result
+    def ttm(self, taxonomy: str, tag: str, unit: str, cik: Optional[str]=None) -> Dict[str, Dict[str, float]]:
+        """
+        Build trailing-twelve-month series.
+
+        Args:
+            taxonomy (str): A taxonomy identifier (e.g. 'us-gaap').
+            tag (str): A duration concept tag (e.g. 'Revenues').
+            unit (str): A unit of measure (e.g. 'USD').
+            cik (str, optional): Restrict the result to one company.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The TTM values per CIK, keyed by period end date in 'YYYY-MM-DD' format and sorted by date.
+
+        Note:
+            Reported annual values are used as-is. Other TTM values are the sum of four contiguous discrete quarters; windows with a missing quarter are skipped.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for series_cik, periods in self.__select(taxonomy, tag, unit, cik):
+            values: Dict[int, float] = {}
+            quarters = sorted(self.__quarters(periods).items())
+            for index in range(3, len(quarters)):
+                window = quarters[index - 3:index + 1]
+                if all(0 <= start - previous_end - 1 <= 7 for (previous_end, _), (_, (start, _)) in zip(window, window[1:])):
+                    values[window[-1][0]] = sum(val for _, (_, val) in window)
+            for (start, end), (_, val) in periods.items():
+                if self.classify_days(end - start + 1) == 'annual':
+                    values[end] = val
+            result[series_cik] = {date.fromordinal(end).isoformat(): val for end, val in sorted(values.items())}
+        return result
+
+class PointInTimeIndex:
+    """Answer "what was known at date D" queries over company facts.
+
+    Every reported value of a (start, end) period is kept as a vintage, and the
+    vintages of each period are sorted by filed date. An as-of query bisects the
+    filed dates instead of scanning every disclosure, returning the latest
+    restatement filed on or before the query date.
+    """
+    def __init__(self, company_facts: Optional[Iterable[CompanyFacts]]=None) -> None:
+        """
+        Initialize the PointInTimeIndex.
+
+        Args:
+            company_facts (Iterable[CompanyFacts], optional): Company facts to index immediately.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> index = ed.PointInTimeIndex([api.get_company_facts(ticker="AAPL")])
+            >>> known = index.snapshot("320193", "us-gaap", "Revenues", "USD", "2020-01-31")
+        """
+        self.vintages: Dict[Tuple[str, str, str, str], Dict[Tuple[str, str], Tuple[List[str], List[UnitDisclosure]]]] = {}
+        for facts in company_facts or []:
+            self.add(facts)
+    def __repr__(self) -> str:
+        """
+        String representation of the PointInTimeIndex class.
+
+        Returns:
+            str: A string representation of the PointInTimeIndex class.
+        """
+        return f"PointInTimeIndex(series={len(self.vintages)})"
+    def __len__(self) -> int:
+        """
+        Get the number of series indexed.
+
+        Returns:
+            int: The number of indexed (cik, taxonomy, tag, unit) series.
+        """
+        return len(self.vintages)
+    def __contains__(self, key: Tuple[str, str, str, str]) -> bool:
+        """
+        Check if a series is indexed.
+
+        Args:
+            key (Tuple[str, str, str, str]): A (cik, taxonomy, tag, unit) tuple.
+
+        Returns:
+            bool: True if the series is indexed, False otherwise.
+        """
+        return key in self.vintages
+    # Private Methods
+    def __index(self, cik: str, taxonomy: str, tag: str, disclosure: UnitDisclosure) -> None:
+        """
+        Insert a disclosure into the vintages of its period, keeping them sorted by filed date.
+        """
+        periods = self.vintages.setdefault((cik, taxonomy, tag, disclosure.units), {})
+        filed_dates, disclosures = periods.setdefault((disclosure.start or '', disclosure.end), ([], []))
+        position = bisect.bisect_right(filed_dates, disclosure.filed)
+        filed_dates.insert(position, disclosure.filed)
+        disclosures.insert(position, disclosure)
+    @staticmethod
+    def __date(as_of: Union[str, datetime]) -> str:
+        """
+        Normalize a query date to the 'YYYY-MM-DD' format used by filed dates.
+        """
+        if isinstance(as_of, datetime):
+            return as_of.strftime('%Y-%m-%d')
+        if not isinstance(as_of, str):
+            raise TypeError("as_of must be a string or datetime object.")
+        return as_of
+    # Public Methods
+    def add(self, company_facts: CompanyFacts) -> None:
+        """
+        Index every disclosure of a company.
+
+        Args:
+            company_facts (CompanyFacts): The company facts to index.
+        """
+        for taxonomy_facts in company_facts.facts:
+            for disclosure in taxonomy_facts.disclosures:
+                for unit in disclosure.units:
+                    self.__index(company_facts.cik, taxonomy_facts.taxonomy, disclosure.name, unit)
+    def add_concept(self, company_concept: CompanyConcept) -> None:
+        """
+        Index every disclosure of a single company concept.
+
+        Args:
+            company_concept (CompanyConcept): The company concept to index.
+        """
+        for unit in company_concept.units:
+            self.__index(company_concept.cik, company_concept.taxonomy, company_concept.tag, unit)
+    def as_of(self, cik: str, taxonomy: str, tag: str, unit: str, as_of: Union[str, datetime], end: str, start: Optional[str]=None) -> Optional[UnitDisclosure]:
+        """
+        Get the vintage of a single period that was valid at a date.
+
+        Args:
+            cik (str): The Central Index Key of the company, with or without leading zeros.
+            taxonomy (str): A taxonomy identifier (e.g. 'us-gaap').
+            tag (str): A concept tag (e.g. 'Revenues').
+            unit (str): A unit of measure (e.g. 'USD').
+            as_of (str | datetime): The query date, as a datetime object or a string in 'YYYY-MM-DD' format.
+            end (str): The end date of the period in 'YYYY-MM-DD' format.
+            start (str, optional): The start date of the period in 'YYYY-MM-DD' format. Omit for instantaneous facts.
+
+        Returns:
+            UnitDisclosure | None: The latest disclosure of the period filed on or before the query date, or None if none was filed yet.
+
+        Raises:
+            TypeError: If as_of is not a string or datetime object.
+        """
+        as_of = self.__date(as_of)
+        periods = self.vintages.get((str(int(cik)), taxonomy, tag, unit), {})
+        filed_dates, disclosures = periods.get((start or '', end), ([], []))
+        position = bisect.bisect_right(filed_dates, as_of)
+        return disclosures[position - 1] if position else None
+    def snapshot(self, cik: str, taxonomy: str, tag: str, unit: str, as_of: Union[str, datetime]) -> List[UnitDisclosure]:
+        """
+        Get every period of a series as it was known at a date.
+
+        Args:
+            cik (str): The Central Index Key of the company, with or without leading zeros.
+            taxonomy (str): A taxonomy identifier (e.g. 'us-gaap').
+            tag (str): A concept tag (e.g. 'Revenues').
+            unit (str): A unit of measure (e.g. 'USD').
+            as_of (str | datetime): The query date, as a datetime object or a string in 'YYYY-MM-DD' format.
+
+        Returns:
+            List[UnitDisclosure]: The vintage valid at the query date of each period filed by then, sorted by end and start date.
+
+        Raises:
+            TypeError: If as_of is not a string or datetime object.
+        """
+        as_of = self.__date(as_of)
+        snapshot = []
+        for (start, end), (filed_dates, disclosures) in self.vintages.get((str(int(cik)), taxonomy, tag, unit), {}).items():
+            position = bisect.bisect_right(filed_dates, as_of)
+            if position:
+                snapshot.append(((end, start), disclosures[position - 1]))
+        snapshot.sort(key=lambda item: item[0])
+        return [disclosure for _, disclosure in snapshot]
@@ -19,16 +19,29 @@ A feature-rich python-package for interacting with the US Securities and Exchang
 """
 # Imports
 from collections import deque
-from typing import Optional, Dict, Any, Tuple, Union, cast
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Generator, Hashable, Iterable, List, Mapping, Set, Tuple, Union, cast
 import asyncio
+import contextvars
+import functools
+import os
+import threading
 import time
+import weakref
 from datetime import datetime
-from tenacity import retry, wait_fixed, stop_after_attempt
-from cachetools import FIFOCache, cached
+from tenacity import retry, retry_if_exception, wait_fixed
+from cachetools import FIFOCache, TTLCache, cached
 from asyncache import cached as async_cached
 import httpx
-from edgar_sec.objects import CompanyConcept, SubmissionHistory, CompanyFacts, Frame
+from edgar_sec.objects import CompanyConcept, SubmissionHistory, CompanyFacts, Frame, FramePanel, Filing
 from edgar_sec.helpers import EdgarHelpers
+from edgar_sec.stores import SubmissionStore, FactStore, FactChange, FactCatalog
+from edgar_sec.mirror import EdgarMirror
+from edgar_sec.instrumentation import Hooks, RequestTimer, InstrumentedCache
+from edgar_sec.metrics import Metrics
+from edgar_sec.parsing import ParseExecutor
+from edgar_sec.scheduling import RequestScheduler, Deadline, HostLimiter, AsyncThreadLock
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
 
 class EdgarAPI:
@@ -40,14 +53,25 @@ class EdgarAPI:
     entity submission history and XBRL financial statement data (forms 10-Q, 10-K,
     8-K, 20-F, 40-F, 6-K).
     """
+    instances: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
     # Dunder Methods
-    def __init__(self, cache_mode: bool=False, cache_size: int=256) -> None:
+    def __init__(self, cache_mode: bool=False, cache_size: int=256, mirror: Optional[EdgarMirror]=None, transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]]=None, hooks: Optional[Hooks]=None, metrics: bool=False, parse_executor: Optional[ParseExecutor]=None, scheduler: Optional[RequestScheduler]=None, timeout: Union[float, httpx.Timeout]=10, negative_cache_ttl: float=300, catalog: Optional[FactCatalog]=None, host_limiter: Optional[HostLimiter]=None) -> None:
         """
         Initialize the EdgarAPI class the provide functions for accessing SEC EDGAR data.
 
         Args:
             cache_mode (bool): Whether to enable caching for API responses. Defaults to False.
             cache_size (int): The maximum number of items to store in the cache if caching is enabled. Defaults to 256.
+            mirror (EdgarMirror, optional): A local database mirror. When provided, submissions, concepts, facts and frames are answered from the mirror when fresh, and persisted into it after every fetch.
+            transport (httpx.BaseTransport | httpx.AsyncBaseTransport, optional): The transport used for every request instead of the network, e.g. an edgar_sec.testing.MockEdgarServer. Sync requests need a sync transport and async requests an async one.
+            hooks (Hooks, optional): The instrumentation hook registry, shared with the AsyncAPI. Defaults to an empty registry, available as api.hooks.
+            metrics (bool): Whether to collect request, cache, retry, latency and parse metrics, read with stats(). Defaults to False.
+            parse_executor (ParseExecutor, optional): Parses submissions, concepts, facts and frames responses over its size threshold in a process pool, keeping large parses off the calling thread and event loop.
+            scheduler (RequestScheduler, optional): Releases requests by priority class within its own requests-per-second budget, which it can share with other clients, instead of the client's rate limiter.
+            timeout (float | httpx.Timeout): The httpx timeout of every request, in seconds or as an httpx.Timeout with separate connect, read, write and pool timeouts. Defaults to 10. Use deadline() to bound whole calls.
+            negative_cache_ttl (float): The seconds a 404 Not Found response is cached for when caching is enabled, so repeated requests for a concept or frame that does not exist fail without a request. Defaults to 300.
+            catalog (FactCatalog, optional): A catalog recording the taxonomies, tags and units of every company facts response, against which concept and frame requests are validated before they are sent; a request the catalog conclusively rules out raises a 404 httpx.HTTPStatusError without being sent.
+            host_limiter (HostLimiter, optional): Per-host rate limits applied on top of the client's budget. Defaults to 5 requests per second for www.sec.gov, which serves company_tickers.json, so ticker lookups cannot use up the budget of data.sec.gov.
 
         Returns:
             EdgarAPI: An instance of the EdgarAPI class.
@@ -64,18 +88,39 @@ class EdgarAPI:
             rate limit of 10 requests per second which this implementation automatically respects.
         """
         self.base_url: str = 'https://data.sec.gov'
+        self.files_url: str = 'https://www.sec.gov'
         self.headers: Dict[str, str] = {
             'User-Agent': 'Mozilla/5.0 (compatible; SEC-API/1.0; +https://www.sec.gov)',
             'Accept': 'application/json'
         }
         self.cache_mode: bool = cache_mode
         self.cache_size: int = cache_size
-        self.cache: FIFOCache = FIFOCache(maxsize=cache_size)
+        self.hooks: Hooks = hooks if hooks is not None else Hooks()
+        self.metrics: Optional[Metrics] = Metrics(self.hooks) if metrics else None
+        self.parse_executor: Optional[ParseExecutor] = parse_executor
+        self.scheduler: Optional[RequestScheduler] = scheduler
+        self.timeout: Union[float, httpx.Timeout] = timeout
+        self.cache: FIFOCache = InstrumentedCache(maxsize=cache_size, hooks=self.hooks)
+        self.negative_cache_ttl: float = negative_cache_ttl
+        self.negative_cache: TTLCache = TTLCache(maxsize=cache_size, ttl=negative_cache_ttl)
+        self.catalog: Optional[FactCatalog] = catalog
+        self.host_limiter: HostLimiter = host_limiter if host_limiter is not None else HostLimiter({'www.sec.gov': 5})
         self.max_requests_per_second = 10
+        self.mirror: Optional[EdgarMirror] = mirror
+        self.transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = transport
         self.request_times: deque = deque()
-        self.lock: asyncio.Lock = asyncio.Lock()
-        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(self.max_requests_per_second)
+        self.rate_lock: threading.Lock = threading.Lock()
+        self.cache_lock: threading.RLock = threading.RLock()
+        self.client_lock: threading.Lock = threading.Lock()
+        self.client: Optional[httpx.Client] = None
+        self.client_pid: Optional[int] = None
+        self.engine_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.engine_thread: Optional[threading.Thread] = None
+        self.engine_pid: Optional[int] = None
+        self.loop_state: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.idle_loop_state: Dict[str, Any] = {}
         self.Async: EdgarAPI.AsyncAPI = self.AsyncAPI(self)
+        EdgarAPI.instances[id(self)] = self
     def __repr__(self) -> str:
         """
         string representation of the EdgarAPI class.
@@ -124,10 +169,12 @@ class EdgarAPI:
         return hash((self.cache_mode, self.cache_size))
     def __del__(self) -> None:
         """
-        Destructor for the EdgarAPI class. Clears the cache when the instance is deleted.
+        Destructor for the EdgarAPI class. Clears the cache and closes the shared client when the instance is deleted.
         """
         if hasattr(self, "cache"):
             self.cache.clear()
+        if getattr(self, "client", None) is not None or getattr(self, "engine_loop", None) is not None:
+            self.close()
     def __getitem__(self, key: str) -> Any:
         """
         Get a specific item from the cache.
@@ -141,10 +188,10 @@ class EdgarAPI:
         Raises:
             AttributeError: If the key does not exist.
         """
-        if key in self.cache.keys():
-            return self.cache[key]
-        else:
-            raise AttributeError(f"'{key}' not found in cache.")
+        with self.cache_lock:
+            if key in self.cache.keys():
+                return self.cache[key]
+        raise AttributeError(f"'{key}' not found in cache.")
     def __len__(self) -> int:
         """
         Get the number of cached items in the EdgarAPI class.
@@ -152,7 +199,8 @@ class EdgarAPI:
         Returns:
             int: The number of cached items in the EdgarAPI instance.
         """
-        return len(self.cache)
+        with self.cache_lock:
+            return len(self.cache)
     def __contains__(self, key: str) -> bool:
         """
         Check if a specific item exists in the cache.
@@ -163,7 +211,8 @@ class EdgarAPI:
         Returns:
             bool: True if the attribute exists, False otherwise.
         """
-        return key in self.cache.keys() if self.cache_mode else False
+        with self.cache_lock:
+            return key in self.cache.keys() if self.cache_mode else False
     def __setitem__(self, key: str, value: Any) -> None:
         """
         Set a specific item in the cache.
@@ -172,7 +221,8 @@ class EdgarAPI:
             key (str): The name of the attribute to set.
             value (Any): The value to set.
         """
-        self.cache[key] = value
+        with self.cache_lock:
+            self.cache[key] = value
     def __delitem__(self, key: str) -> None:
         """
         Delete a specific item from the cache.
@@ -183,10 +233,11 @@ class EdgarAPI:
         Raises:
             AttributeError: If the key does not exist in the cache.
         """
-        if key in self.cache.keys():
-            del self.cache[key]
-        else:
-            raise AttributeError(f"'{key}' not found in cache.")
+        with self.cache_lock:
+            if key in self.cache.keys():
+                del self.cache[key]
+                return
+        raise AttributeError(f"'{key}' not found in cache.")
     def __call__(self) -> str:
         """
         Call the EdgarAPI instance to get a summary of its configuration.
@@ -200,43 +251,286 @@ class EdgarAPI:
             f"  Cache Mode: {'Enabled' if self.cache_mode else 'Disabled'}\n"
             f"  Cache Size: {self.cache_size}\n"
         )
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the configuration of the EdgarAPI for pickling, e.g. to pass it to a ProcessPoolExecutor worker.
+
+        Returns:
+            Dict[str, Any]: The client configuration. Locks, the connection pool, the cache contents and registered hooks stay in this process.
+        """
+        return {
+            'base_url': self.base_url,
+            'files_url': self.files_url,
+            'headers': self.headers,
+            'cache_mode': self.cache_mode,
+            'cache_size': self.cache_size,
+            'max_requests_per_second': self.max_requests_per_second,
+            'mirror': self.mirror,
+            'transport': self.transport,
+            'metrics': self.metrics is not None,
+            'parse_executor': self.parse_executor,
+            'scheduler': self.scheduler,
+            'timeout': self.timeout,
+            'negative_cache_ttl': self.negative_cache_ttl,
+            'catalog': self.catalog,
+            'host_limiter': self.host_limiter
+        }
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Rebuild an unpickled EdgarAPI from its configuration, with fresh locks, connection pool, cache, hooks and metrics.
+
+        Args:
+            state (Dict[str, Any]): The output of __getstate__.
+
+        Note:
+            Every unpickled copy rate limits on its own, so divide max_requests_per_second by the number of worker processes to stay within the SEC's limit. Give workers a file-backed EdgarMirror to share fetched data between them.
+        """
+        type(self).__init__(self, cache_mode=state['cache_mode'], cache_size=state['cache_size'], mirror=state['mirror'], transport=state['transport'], metrics=state['metrics'], parse_executor=state['parse_executor'], scheduler=state['scheduler'], timeout=state['timeout'], negative_cache_ttl=state['negative_cache_ttl'], catalog=state['catalog'], host_limiter=state['host_limiter'])
+        self.base_url = state['base_url']
+        self.files_url = state['files_url']
+        self.headers = state['headers']
+        self.max_requests_per_second = state['max_requests_per_second']
+    # Properties
+    @property
+    def lock(self) -> asyncio.Lock:
+        """
+        The asyncio.Lock guarding the async rate limiter on the running event loop.
+
+        Returns:
+            asyncio.Lock: A lock created on first use in the running loop, so one EdgarAPI can serve several loops.
+        """
+        return self.__loop_primitives()['lock']
+    @lock.setter
+    def lock(self, lock: asyncio.Lock) -> None:
+        self.__loop_primitives()['lock'] = lock
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        The asyncio.Semaphore bounding concurrent async requests on the running event loop.
+
+        Returns:
+            asyncio.Semaphore: A semaphore created on first use in the running loop, so one EdgarAPI can serve several loops.
+        """
+        return self.__loop_primitives()['semaphore']
+    @semaphore.setter
+    def semaphore(self, semaphore: asyncio.Semaphore) -> None:
+        self.__loop_primitives()['semaphore'] = semaphore
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        The httpx.AsyncClient whose connection pool is shared by every async request on the running event loop.
+
+        Returns:
+            httpx.AsyncClient: A client created on first use in the running loop, since an AsyncClient's connections belong to one loop. close() closes it.
+        """
+        primitives = self.__loop_primitives()
+        if primitives.get('client') is None:
+            primitives['client'] = httpx.AsyncClient(transport=cast(Optional[httpx.AsyncBaseTransport], self.transport))
+        return primitives['client']
     # Private Methods
-    @retry(wait=wait_fixed(1), stop=stop_after_attempt(3))
-    def __rate_limited(self) -> None:
+    def __loop_primitives(self) -> Dict[str, Any]:
+        """
+        Get the async lock and semaphore of the running event loop, creating them on first use. Entries are dropped with their loop.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        primitives = self.idle_loop_state if loop is None else self.loop_state.get(loop)
+        if not primitives:
+            primitives = {'lock': asyncio.Lock(), 'semaphore': asyncio.Semaphore(self.max_requests_per_second)}
+            if loop is None:
+                self.idle_loop_state.update(primitives)
+            else:
+                self.loop_state[loop] = primitives
+        return primitives
+    @retry(wait=wait_fixed(1), stop=Deadline.stop_after_attempt(3), retry=retry_if_exception(Deadline.retryable), before_sleep=Hooks.before_sleep)
+    def __rate_limited(self, deadline: Optional[Deadline]=None) -> None:
+        """
+        Ensures synchronous requests comply with rate limits. Threads wait their turn on the rate lock, so the limit holds across a thread pool and the AsyncAPI, which takes its slots under the same lock. A slot is recorded at the time the request is let through, so a request whose deadline passes while waiting takes none.
+        """
+        with self.rate_lock:
+            now = time.time()
+            while self.request_times and self.request_times[0] < now - 1:
+                self.request_times.popleft()
+            if len(self.request_times) + 1 >= self.max_requests_per_second:
+                wait = 1 - (now - (self.request_times[0] if self.request_times else now))
+                if deadline is not None:
+                    remaining = deadline.check(wait)
+                    if wait > remaining:
+                        time.sleep(remaining)
+                        raise TimeoutError(f"Deadline of {deadline.seconds}s exceeded waiting for a request slot.")
+                time.sleep(wait)
+                now = time.time()
+            self.request_times.append(now)
+    def __throttle(self, deadline: Optional[Deadline]=None) -> None:
+        """
+        Wait for the scheduler to release the request, or for the rate limiter when there is no scheduler.
+        """
+        if deadline is not None:
+            deadline.check()
+        if self.scheduler is not None:
+            self.scheduler.acquire(deadline)
+        else:
+            self.__rate_limited(deadline)
+    def __client(self) -> httpx.Client:
+        """
+        Get the httpx.Client shared by all threads, creating it on first use and again after a fork, so child processes never reuse the parent's connections.
+        """
+        pid = os.getpid()
+        with self.client_lock:
+            if self.client is None or self.client_pid != pid:
+                self.client = httpx.Client(transport=cast(Optional[httpx.BaseTransport], self.transport))
+                self.client_pid = pid
+            return self.client
+    @staticmethod
+    def __close_async_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        """
+        Close an AsyncClient on the loop it belongs to: awaited there when the loop runs on another thread or is idle, scheduled when it runs on this thread, and dropped with its connections when the loop is closed.
         """
-        Ensures synchronous requests comply with rate limits.
+        if loop.is_closed():
+            return
+        if not loop.is_running():
+            loop.run_until_complete(client.aclose())
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(client.aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    def __engine(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop running the async engine for sync callers, starting it on a daemon thread on first use and again after a fork.
+        """
+        pid = os.getpid()
+        with self.client_lock:
+            if self.engine_loop is None or self.engine_pid != pid:
+                self.engine_loop = asyncio.new_event_loop()
+                self.engine_thread = threading.Thread(target=self.engine_loop.run_forever, name='edgar-sec-engine', daemon=True)
+                self.engine_thread.start()
+                self.engine_pid = pid
+            return self.engine_loop
+    def __batch_async(self, method: str, calls: List[Dict[str, Any]], concurrency: Optional[int], return_exceptions: bool, deadline: Optional[float], call_timeout: Optional[float], fail_fast: bool) -> List[Any]:
         """
-        now = time.time()
-        self.request_times.append(now)
-        while self.request_times and self.request_times[0] < now - 1:
-            self.request_times.popleft()
-        if len(self.request_times) >= self.max_requests_per_second:
-            time.sleep(1 - (now - self.request_times[0]))
-    @retry(wait=wait_fixed(1), stop=stop_after_attempt(3))
-    def __edgar_get_request(self, url_endpoint: str) -> Dict[Any, Any]:
+        Run a batch through AsyncAPI.as_completed on the background event loop and block until every call has finished.
         """
-        Helper method to perform a synchronous GET request to the EDGAR API.
+        async def gather() -> List[Any]:
+            results: List[Any] = [None] * len(calls)
+            async for index, result in self.Async.as_completed(method, enumerate(calls), concurrency=concurrency or self.max_requests_per_second, deadline=deadline, call_timeout=call_timeout, fail_fast=fail_fast):
+                results[cast(int, index)] = result
+            return results
+        future = asyncio.run_coroutine_threadsafe(gather(), self.__engine())
+        try:
+            results = future.result()
+        except BaseException:
+            future.cancel()
+            raise
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    @retry(wait=wait_fixed(1), stop=Deadline.stop_after_attempt(3), retry=retry_if_exception(Deadline.retryable), before_sleep=Hooks.before_sleep)
+    def __edgar_get_request(self, url_endpoint: str, raw: bool=False, base_url: Optional[str]=None) -> Any:
         """
-        def __get_request(url_endpoint: str) -> Dict[Any, Any]:
+        Helper method to perform a synchronous GET request to the EDGAR API, or to another SEC host if base_url is given, returning the raw body instead of decoded JSON if raw.
+        """
+        def __get_request(url_endpoint: str, raw: bool=False, base_url: Optional[str]=None) -> Any:
             """
             Helper method to perform a synchronous GET request to the EDGAR API.
             """
-            self.__rate_limited()
-            with httpx.Client() as client:
-                response = client.get((self.base_url + url_endpoint), headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response_json = response.json()
-                return response_json
-        @cached(cache=self.cache)
-        def __cached_get_request(url_endpoint: str) -> Dict[Any, Any]:
+            url = (base_url or self.base_url) + url_endpoint
+            deadline = Deadline.current()
+            timer = RequestTimer(self.hooks, url_endpoint) if self.hooks else None
+            self.host_limiter.wait(httpx.URL(url).host, deadline)
+            self.__throttle(deadline)
+            if timer is not None:
+                timer.throttled()
+            client = self.__client()
+            timeout = self.timeout if deadline is None else deadline.timeout(self.timeout)
+            if timer is not None:
+                return timer.finish(client.get(url, headers=self.headers, timeout=timeout, extensions=timer.extensions), raw)
+            response = client.get(url, headers=self.headers, timeout=timeout)
+            response.raise_for_status()
+            if raw:
+                return response.content
+            response_json = response.json()
+            return response_json
+        missed: List[bool] = []
+        @cached(cache=self.cache, lock=self.cache_lock)
+        def __cached_get_request(url_endpoint: str, raw: bool=False, base_url: Optional[str]=None) -> Any:
             """
             Helper method to perform a synchronous GET request to the EDGAR API with caching.
             """
-            return __get_request(url_endpoint)
+            missed.append(True)
+            if self.hooks:
+                self.hooks.emit('cache_miss', url_endpoint)
+            try:
+                return __get_request(url_endpoint, raw, base_url)
+            except httpx.HTTPStatusError as exception:
+                if exception.response.status_code == 404:
+                    with self.cache_lock:
+                        self.negative_cache[url_endpoint] = exception.response
+                raise
         if self.cache_mode:
-            return __cached_get_request(url_endpoint)
+            with self.cache_lock:
+                not_found = self.negative_cache.get(url_endpoint)
+            if not_found is not None:
+                if self.hooks:
+                    self.hooks.emit('cache_hit', url_endpoint)
+                not_found.raise_for_status()
+            if base_url is not None:
+                response_json = __cached_get_request(url_endpoint, base_url=base_url)
+            else:
+                response_json = __cached_get_request(url_endpoint, raw=True) if raw else __cached_get_request(url_endpoint)
+            if not missed and self.hooks:
+                self.hooks.emit('cache_hit', url_endpoint)
+            return response_json
         else:
-            return __get_request(url_endpoint)
+            return __get_request(url_endpoint, raw, base_url)
+    @retry(wait=wait_fixed(1), stop=Deadline.stop_after_attempt(3), retry=retry_if_exception(Deadline.retryable), before_sleep=Hooks.before_sleep)
+    def __edgar_conditional_get_request(self, url_endpoint: str, headers: Dict[str, str]) -> Tuple[Optional[Dict[Any, Any]], Dict[str, Optional[str]]]:
+        """
+        Helper method to perform a synchronous conditional GET request to the EDGAR API, bypassing the cache.
+        """
+        deadline = Deadline.current()
+        timer = RequestTimer(self.hooks, url_endpoint) if self.hooks else None
+        self.__throttle(deadline)
+        if timer is not None:
+            timer.throttled()
+        client = self.__client()
+        timeout = self.timeout if deadline is None else deadline.timeout(self.timeout)
+        if timer is not None:
+            response = client.get((self.base_url + url_endpoint), headers=headers, timeout=timeout, extensions=timer.extensions)
+            response_json = timer.finish(response)
+            return response_json, ({} if response_json is None else {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')})
+        response = client.get((self.base_url + url_endpoint), headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            return None, {}
+        response.raise_for_status()
+        return response.json(), {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+    def __edgar_get_payload(self, url_endpoint: str) -> Union[Dict[Any, Any], bytes]:
+        """
+        Helper method to GET a response for __to_object: the raw body when a parse executor is set, decoded JSON otherwise.
+        """
+        if self.parse_executor is None:
+            return self.__edgar_get_request(url_endpoint)
+        return self.__edgar_get_request(url_endpoint, raw=True)
+    def __to_object(self, object_type: Any, url_endpoint: str, response: Union[Dict[Any, Any], bytes], **kwargs: Any) -> Any:
+        """
+        Convert a response into an object, emitting parse_start and parse_end when hooks are registered. Raw bodies are parsed by the parse executor.
+        """
+        parse: Callable[..., Any] = functools.partial(cast(ParseExecutor, self.parse_executor).parse, object_type) if isinstance(response, bytes) else object_type.to_object
+        if not self.hooks:
+            return parse(response, **kwargs)
+        self.hooks.emit('parse_start', url_endpoint, object_type=object_type.__name__)
+        started = time.perf_counter()
+        parsed = parse(response, **kwargs)
+        self.hooks.emit('parse_end', url_endpoint, time.perf_counter() - started, object_type=object_type.__name__)
+        return parsed
     # Public Methods
     def get_submissions(self, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> SubmissionHistory:
         """Get a submission history.
@@ -268,13 +562,19 @@ class EdgarAPI:
         if central_index_key is None and ticker is None:
             raise ValueError("Provide either ticker or central_index_key.")
         if ticker:
-            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker))
-        assert central_index_key is not None
-        central_index_key = EdgarHelpers.cik_validation(central_index_key)
+            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker, api=self))
+        central_index_key = EdgarHelpers.cik_validation(cast(str, central_index_key))
+        if self.mirror is not None:
+            mirrored_history = self.mirror.get_submissions(central_index_key)
+            if mirrored_history is not None:
+                return mirrored_history
         url_endpoint = f'/submissions/CIK{central_index_key}.json'
-        response = self.__edgar_get_request(url_endpoint)
-        return SubmissionHistory.to_object(response)
-    def get_company_concept(self, taxonomy: str, tag: str, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> CompanyConcept:
+        response = self.__edgar_get_payload(url_endpoint)
+        submission_history = self.__to_object(SubmissionHistory, url_endpoint, response)
+        if self.mirror is not None:
+            self.mirror.store_submissions(submission_history)
+        return submission_history
+    def get_company_concept(self, taxonomy: str, tag: str, ticker: Optional[str]=None, central_index_key: Optional[str]=None, dedup: bool=False) -> CompanyConcept:
         """Get a company concept.
 
         Retrieve XBRL disclosures for a specific concept from a company.
@@ -284,6 +584,7 @@ class EdgarAPI:
             central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
             taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap', 'ifrs-full', 'dei', or 'srt').
             tag (str): The specific disclosure concept tag to retrieve, such as 'AccountsPayableCurrent' or 'Assets'.
+            dedup (bool, optional): Collapse facts repeated across filings into one UnitDisclosure listing every source accession. Default is False.
 
         Returns:
             CompanyConcept: An object containing all disclosures related to the specified concept, organized by units of measure.
@@ -299,20 +600,28 @@ class EdgarAPI:
             >>>     print(f"Value: {unit.val}, Period: {unit.end}")
 
         Note:
-            This endpoint returns separate arrays of facts for each unit of measure that the company has disclosed (e.g., values reported in both USD and EUR).
+            This endpoint returns separate arrays of facts for each unit of measure that the company has disclosed (e.g., values reported in both USD and EUR). Deduplicated results bypass the mirror, which stores every disclosure.
         """
         if ticker and central_index_key:
             raise ValueError("Provide either ticker or central_index_key, not both.")
         if central_index_key is None and ticker is None:
             raise ValueError("Provide either ticker or central_index_key.")
         if ticker:
-            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker))
-        assert central_index_key is not None
-        central_index_key = EdgarHelpers.cik_validation(central_index_key)
+            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker, api=self))
+        central_index_key = EdgarHelpers.cik_validation(cast(str, central_index_key))
+        if self.mirror is not None and not dedup:
+            mirrored_concept = self.mirror.get_company_concept(central_index_key, taxonomy, tag)
+            if mirrored_concept is not None:
+                return mirrored_concept
+        if self.catalog is not None:
+            self.catalog.validate_concept(central_index_key, taxonomy, tag)
         url_endpoint = f'/api/xbrl/companyconcept/CIK{central_index_key}/{taxonomy}/{tag}.json'
-        response = self.__edgar_get_request(url_endpoint)
-        return CompanyConcept.to_object(response)
-    def get_company_facts(self, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> CompanyFacts:
+        response = self.__edgar_get_payload(url_endpoint)
+        company_concept = self.__to_object(CompanyConcept, url_endpoint, response, dedup=dedup)
+        if self.mirror is not None and not dedup:
+            self.mirror.store_company_concept(company_concept)
+        return company_concept
+    def get_company_facts(self, ticker: Optional[str]=None, central_index_key: Optional[str]=None, dedup: bool=False) -> CompanyFacts:
         """Get all company facts.
 
         Retrieve all XBRL disclosures for a company in a single request.
@@ -320,6 +629,7 @@ class EdgarAPI:
         Args:
             ticker (str, optional): The ticker symbol of the company. If provided, the CIK will be derived from the ticker.
             central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
+            dedup (bool, optional): Collapse facts repeated across filings into one UnitDisclosure listing every source accession. Default is False.
 
         Returns:
             CompanyFact: An object containing all facts and disclosures for the company, organized by taxonomy and concept.
@@ -336,19 +646,29 @@ class EdgarAPI:
             >>>     print(f"Latest revenue: ${revenue.units['USD'][0].val}")
 
         Note:
-            This is the most comprehensive endpoint, returning all concepts across all taxonomies for a company. The response can be quite large for companies with extensive filing histories.
+            This is the most comprehensive endpoint, returning all concepts across all taxonomies for a company. The response can be quite large for companies with extensive filing histories; dedup typically shrinks it several times. Deduplicated results bypass the mirror, which stores every disclosure.
         """
         if ticker and central_index_key:
             raise ValueError("Provide either ticker or central_index_key, not both.")
         if central_index_key is None and ticker is None:
             raise ValueError("Provide either ticker or central_index_key.")
         if ticker:
-            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker))
-        assert central_index_key is not None
-        central_index_key = EdgarHelpers.cik_validation(central_index_key)
+            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker, api=self))
+        central_index_key = EdgarHelpers.cik_validation(cast(str, central_index_key))
+        if self.mirror is not None and not dedup:
+            mirrored_facts = self.mirror.get_company_facts(central_index_key)
+            if mirrored_facts is not None:
+                if self.catalog is not None:
+                    self.catalog.update(mirrored_facts)
+                return mirrored_facts
         url_endpoint = f'/api/xbrl/companyfacts/CIK{central_index_key}.json'
-        response = self.__edgar_get_request(url_endpoint)
-        return CompanyFacts.to_object(response)
+        response = self.__edgar_get_payload(url_endpoint)
+        company_facts = self.__to_object(CompanyFacts, url_endpoint, response, dedup=dedup)
+        if self.mirror is not None and not dedup:
+            self.mirror.store_company_facts(company_facts)
+        if self.catalog is not None:
+            self.catalog.update(company_facts)
+        return company_facts
     def get_frames(self, taxonomy: str, tag: str, unit: str, period: Union[str, datetime], instantaneous: bool) -> Frame:
         """
 
@@ -374,18 +694,326 @@ class EdgarAPI:
         Note:
             Due to varying company fiscal calendars, the frame data is assembled using the dates that best align with calendar periods. Be mindful that facts in a frame may have different exact reporting start and end dates.
         """
-        if not isinstance(period, (str, datetime)):
-            raise TypeError("period must be a string or datetime object.")
-        if isinstance(period, datetime):
-            period = EdgarHelpers.datetime_cy_conversion(period)
-        elif isinstance(period, str):
-            if not EdgarHelpers.string_cy_validation(period):
-                period = EdgarHelpers.string_cy_conversion(period)
-        if instantaneous and not period.endswith("I"):
-            period += "I"
+        period = EdgarHelpers.frame_period(period, instantaneous)
+        if self.mirror is not None:
+            mirrored_frame = self.mirror.get_frame(taxonomy, tag, unit, period)
+            if mirrored_frame is not None:
+                return mirrored_frame
+        if self.catalog is not None:
+            self.catalog.validate_frame(taxonomy, tag, unit, period)
         url_endpoint = f'/api/xbrl/frames/{taxonomy}/{tag}/{unit}/{period}.json'
+        response = self.__edgar_get_payload(url_endpoint)
+        frame = self.__to_object(Frame, url_endpoint, response)
+        if self.mirror is not None:
+            self.mirror.store_frame(frame, unit, period)
+        return frame
+    def get_frames_panel(self, taxonomy: str, tag: str, unit: str, start: Union[str, datetime], end: Union[str, datetime], instantaneous: bool) -> FramePanel:
+        """Get a panel of frames over a range of periods.
+
+        Retrieve the frame for every period between start and end concurrently and stack them into a CIK by period panel.
+
+        Args:
+            taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap', 'ifrs-full', 'dei', or 'srt').
+            tag (str): The specific disclosure concept tag to retrieve (e.g. 'AccountsPayableCurrent', 'Assets').
+            unit (str): Unit of measurement for the requested data (e.g. 'USD', 'USD-per-shares').
+            start (str | datetime): The first period, as a datetime object or a string in 'YYYY-MM-DD', 'CY####' or 'CY####Q#' format.
+            end (str | datetime): The last period, in the same formats as start.
+            instantaneous (bool): Whether the periods are instantaneous (e.g. 'CY2019Q1I').
+
+        Returns:
+            FramePanel: The panel, holding one value per company and period that was reported, with entity names. Periods whose request failed, e.g. with 404 Not Found at the early end of a long range, are empty and listed in missing.
+
+        Raises:
+            ValueError: If the period range is invalid.
+            Exception: The error of the first period if the request of every period failed.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> panel = api.get_frames_panel("us-gaap", "Assets", "USD", "CY2022Q1", "CY2023Q4", instantaneous=True)
+            >>> matrix = panel.to_dense()
+
+        Note:
+            Annual ranges are used when both bounds are 'CY####' periods; otherwise every quarter in the range is requested. The periods are fetched through the async batch engine, as fast as the rate limit allows.
+        """
+        periods = EdgarHelpers.frame_period_range(start, end, instantaneous)
+        results = self.batch('get_frames', [{'taxonomy': taxonomy, 'tag': tag, 'unit': unit, 'period': period, 'instantaneous': instantaneous} for period in periods], return_exceptions=True, engine='async')
+        frames = [result for result in results if isinstance(result, Frame)]
+        if not frames:
+            raise cast(BaseException, results[0])
+        return FramePanel.to_object(frames, periods)
+    def get_new_filings(self, store: SubmissionStore, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> List[Filing]:
+        """Get filings made since the last sync.
+
+        Retrieve only the filings a company has made since the checkpoint recorded in a SubmissionStore, and advance the checkpoint.
+
+        Args:
+            store (SubmissionStore): The store holding per-CIK checkpoints. It is updated in place; call store.save() to persist it.
+            ticker (str, optional): The ticker symbol of the company. If provided, the CIK will be derived from the ticker.
+            central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
+
+        Returns:
+            List[Filing]: The filings made since the last checkpoint, newest first.
+
+        Raises:
+            ValueError: If the request fails or the response is not valid JSON format.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI()
+            >>> store = ed.SubmissionStore("checkpoints.json")
+            >>> for filing in api.get_new_filings(store, ticker="AAPL"):
+            >>>     print(filing.form, filing.accession_number)
+            >>> store.save()
+
+        Note:
+            The request is sent with If-None-Match / If-Modified-Since validators from the previous run, so an unchanged submission history costs a 304 response and no parsing. These requests bypass the cache.
+        """
+        if ticker and central_index_key:
+            raise ValueError("Provide either ticker or central_index_key, not both.")
+        if central_index_key is None and ticker is None:
+            raise ValueError("Provide either ticker or central_index_key.")
+        if ticker:
+            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker, api=self))
+        central_index_key = EdgarHelpers.cik_validation(cast(str, central_index_key))
+        url_endpoint = f'/submissions/CIK{central_index_key}.json'
+        response, validators = self.__edgar_conditional_get_request(url_endpoint, store.conditional_headers(central_index_key, self.headers))
+        if response is None:
+            return []
+        submission_history = self.__to_object(SubmissionHistory, url_endpoint, response)
+        new_filings = store.new_filings(central_index_key, submission_history.filings)
+        store.advance(central_index_key, submission_history.filings, validators)
+        return new_filings
+    def get_company_facts_changes(self, store: FactStore, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> List[FactChange]:
+        """Get the company facts added, changed or removed since the last merge.
+
+        Retrieve all XBRL disclosures for a company and merge them into a FactStore, returning only the new and restated facts.
+
+        Args:
+            store (FactStore): The store holding previously seen facts. It is updated in place; call store.save() to persist it.
+            ticker (str, optional): The ticker symbol of the company. If provided, the CIK will be derived from the ticker.
+            central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
+
+        Returns:
+            List[FactChange]: The added, changed and removed facts, each with its taxonomy, tag and UnitDisclosure.
+
+        Raises:
+            ValueError: If the request fails or the response is not valid JSON format.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI()
+            >>> store = ed.FactStore("facts/")
+            >>> for change in api.get_company_facts_changes(store, ticker="AAPL"):
+            >>>     print(change.status, change.tag, change.disclosure.val)
+            >>> store.save()
+
+        Note:
+            The payload is merged without being parsed into a CompanyFacts object; UnitDisclosure objects are only built for facts that changed.
+        """
+        if ticker and central_index_key:
+            raise ValueError("Provide either ticker or central_index_key, not both.")
+        if central_index_key is None and ticker is None:
+            raise ValueError("Provide either ticker or central_index_key.")
+        if ticker:
+            central_index_key = cast(str, EdgarHelpers.get_cik(ticker=ticker, api=self))
+        central_index_key = EdgarHelpers.cik_validation(cast(str, central_index_key))
+        url_endpoint = f'/api/xbrl/companyfacts/CIK{central_index_key}.json'
         response = self.__edgar_get_request(url_endpoint)
-        return Frame.to_object(response)
+        return store.merge(response)
+    def get_company_tickers(self) -> Dict[str, Dict[str, Any]]:
+        """Get the company tickers file.
+
+        Retrieve company_tickers.json from www.sec.gov, mapping every listed company to its CIK, ticker and name.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The raw file, keyed by position, with 'cik_str', 'ticker' and 'title' entries.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> tickers = api.get_company_tickers()
+            >>> tickers["0"]["ticker"]
+
+        Note:
+            The request shares this client's connection pool, cache, retries, hooks and rate limit, and is also held to the www.sec.gov limit of its host_limiter. EdgarHelpers.get_cik and EdgarHelpers.get_universe use this method.
+        """
+        return self.__edgar_get_request('/files/company_tickers.json', base_url=self.files_url)
+    def get_company_tickers_exchange(self) -> Dict[str, List[Any]]:
+        """Get the company tickers and exchanges file.
+
+        Retrieve company_tickers_exchange.json from www.sec.gov, listing every listed company's CIK, name, ticker and exchange.
+
+        Returns:
+            Dict[str, List[Any]]: The raw file, with 'fields' naming the columns ('cik', 'name', 'ticker', 'exchange') of every row in 'data'.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> exchanges = api.get_company_tickers_exchange()
+            >>> exchanges["data"][0]
+
+        Note:
+            The request shares this client's connection pool, cache, retries, hooks and rate limit, and is also held to the www.sec.gov limit of its host_limiter. EdgarHelpers.get_universe uses this method.
+        """
+        return self.__edgar_get_request('/files/company_tickers_exchange.json', base_url=self.files_url)
+    def stats(self) -> Dict[str, Any]:
+        """Get client metrics.
+
+        Return a snapshot of the metrics collected by this client and its AsyncAPI.
+
+        Returns:
+            Dict[str, Any]: Requests, errors, bytes_received, cache_hits, cache_misses, cache_evictions, retries, rate_limited (429 responses) and throttle_seconds, plus 'latency' per endpoint and 'parse' per object type with count, sum, p50, p95, p99 and max in seconds.
+
+        Raises:
+            ValueError: If the client was created without metrics=True.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(metrics=True)
+            >>> api.get_submissions(ticker="AAPL")
+            >>> api.stats()["latency"]["submissions"]["p99"]
+
+        Note:
+            Exporters for Prometheus and OpenTelemetry live in edgar_sec.metrics and are installed with the prometheus and opentelemetry extras.
+        """
+        if self.metrics is None:
+            raise ValueError("Metrics are disabled; create the EdgarAPI with metrics=True.")
+        return self.metrics.snapshot()
+    @contextmanager
+    def deadline(self, seconds: float, fail_fast: bool=False) -> Generator[Deadline, None, None]:
+        """Bound the time taken by calls.
+
+        Every call made in the block on the same thread or asyncio task must finish within seconds, including its rate-limit waits and retries, or it raises TimeoutError. Nested deadlines never extend an enclosing one.
+
+        Args:
+            seconds (float): The time allowed, in seconds.
+            fail_fast (bool): Whether to raise as soon as a rate-limit wait is known to outlast the deadline, instead of waiting until it expires. Defaults to False.
+
+        Returns:
+            Generator[Deadline, None, None]: The deadline of the block.
+
+        Raises:
+            ValueError: If seconds is negative.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI()
+            >>> with api.deadline(2.0):
+            >>>     submission_history = api.get_submissions(ticker="AAPL")
+
+        Note:
+            The connect, read, write and pool timeouts of each request are capped at the time remaining, and a request waiting for a rate-limit slot when the deadline passes leaves without using it.
+        """
+        token = Deadline.context.set(Deadline(seconds, fail_fast, Deadline.current()))
+        try:
+            yield cast(Deadline, Deadline.current())
+        finally:
+            Deadline.context.reset(token)
+    def batch(self, method: str, calls: Iterable[Dict[str, Any]], max_workers: Optional[int]=None, return_exceptions: bool=False, engine: str='threads', deadline: Optional[float]=None, call_timeout: Optional[float]=None, fail_fast: bool=False) -> List[Any]:
+        """Call a method for many arguments concurrently.
+
+        Fan one public method out over a list of keyword arguments from a thread pool, or pipeline the calls through the AsyncAPI on a background event loop, sharing this client's rate limit and cache.
+
+        Args:
+            method (str): The name of a public get method, e.g. 'get_company_facts'.
+            calls (Iterable[Dict[str, Any]]): The keyword arguments of every call.
+            max_workers (int, optional): The number of threads, or of calls in flight with the async engine. Defaults to max_requests_per_second.
+            return_exceptions (bool): Whether to return the exception of a failed call in its place instead of raising it. Defaults to False.
+            engine (str): 'threads' to call the sync method from a thread pool, or 'async' to run the AsyncAPI method on the client's background event loop. Defaults to 'threads'.
+            deadline (float, optional): The seconds allowed for the whole batch; calls not finished by then raise TimeoutError.
+            call_timeout (float, optional): The seconds allowed for each call from when it starts, within the batch deadline.
+            fail_fast (bool): Whether a call raises as soon as its rate-limit wait is known to outlast its deadline. Defaults to False.
+
+        Returns:
+            List[Any]: The result of every call, in the order of calls.
+
+        Raises:
+            ValueError: If the method is not a public get method or the engine is unknown.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> facts = api.batch("get_company_facts", [{"ticker": "AAPL"}, {"ticker": "MSFT"}, {"ticker": "GOOG"}])
+            >>> frames = api.batch("get_frames", [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2009, 2025)], engine="async")
+            >>> facts = api.batch("get_company_facts", [{"ticker": "AAPL"}, {"ticker": "MSFT"}], deadline=30.0, call_timeout=5.0, return_exceptions=True)
+
+        Note:
+            Calls never exceed the rate limit however many workers are used; workers beyond it only help to overlap response latency and parsing. The async engine needs no threads per call and suits sync callers such as notebooks and Airflow tasks; its loop runs on a daemon thread until close(). The async engine cancels a call in flight when its deadline passes, while a thread can only stop at its next wait or request timeout.
+        """
+        if not method.startswith('get_') or not callable(getattr(self, method, None)):
+            raise ValueError(f"Unknown method: {method}.")
+        if engine not in ('threads', 'async'):
+            raise ValueError(f"Unknown engine: {engine}.")
+        if engine == 'async':
+            return self.__batch_async(method, list(calls), max_workers, return_exceptions, deadline, call_timeout, fail_fast)
+        function = getattr(self, method)
+        context = contextvars.copy_context()
+        batch_deadline = Deadline(deadline, fail_fast, Deadline.current()) if deadline is not None else Deadline.current()
+        def call(kwargs: Dict[str, Any]) -> Any:
+            call_context = context.copy()
+            call_context.run(Deadline.context.set, Deadline(call_timeout, fail_fast, batch_deadline) if call_timeout is not None else batch_deadline)
+            try:
+                return call_context.run(functools.partial(function, **kwargs))
+            except Exception as exception:
+                if return_exceptions:
+                    return exception
+                raise
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_requests_per_second) as executor:
+            return list(executor.map(call, calls))
+    def close(self) -> None:
+        """
+        Close the connection pool shared by this client's threads and the pools of its async requests on every event loop, and stop the background event loop of the async batch engine; all are restarted on next use.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI()
+            >>> api.get_submissions(ticker="AAPL")
+            >>> api.close()
+        """
+        for loop, primitives in list(self.loop_state.items()):
+            async_client = primitives.pop('client', None)
+            if async_client is not None:
+                self.__close_async_client(loop, async_client)
+        with self.client_lock:
+            if self.client is not None and self.client_pid == os.getpid():
+                self.client.close()
+            self.client = None
+            self.client_pid = None
+            if self.engine_loop is not None and self.engine_pid == os.getpid() and self.engine_thread is not threading.current_thread():
+                self.engine_loop.call_soon_threadsafe(self.engine_loop.stop)
+                cast(threading.Thread, self.engine_thread).join()
+                if not self.engine_loop.is_running():
+                    self.engine_loop.close()
+            self.engine_loop = None
+            self.engine_thread = None
+            self.engine_pid = None
+    @classmethod
+    def after_fork(cls) -> None:
+        """
+        Reset every EdgarAPI in a forked child process.
+
+        Each client gets fresh locks and async primitives, and the parent's connection pool is dropped unclosed, since its locks may have been held and its sockets are shared with the parent. Mirrors are reopened once each, with a connection of their own.
+
+        Note:
+            This is registered with os.register_at_fork and runs automatically in every forked child.
+        """
+        mirrors = {id(api.mirror): api.mirror for api in list(cls.instances.values()) if api.mirror is not None}
+        for mirror in mirrors.values():
+            mirror.reopen()
+        for api in list(cls.instances.values()):
+            api.rate_lock = threading.Lock()
+            api.cache_lock = threading.RLock()
+            api.client_lock = threading.Lock()
+            api.client = None
+            api.client_pid = None
+            api.engine_loop = None
+            api.engine_thread = None
+            api.engine_pid = None
+            api.loop_state = weakref.WeakKeyDictionary()
+            api.idle_loop_state = {}
+            if api.metrics is not None:
+                api.metrics.lock = threading.Lock()
     class AsyncAPI:
         """
         The Async sub-class contains methods for interacting with the SEC EDGAR API asynchronously.
@@ -398,8 +1026,15 @@ class EdgarAPI:
             self._parent: EdgarAPI = parent
             self.cache_mode: bool = parent.cache_mode
             self.cache: FIFOCache = parent.cache
+            self.negative_cache: TTLCache = parent.negative_cache
+            self.catalog: Optional[FactCatalog] = parent.catalog
             self.base_url: str = parent.base_url
             self.headers: Dict[str, str] = parent.headers
+            self.mirror: Optional[EdgarMirror] = parent.mirror
+            self.hooks: Hooks = parent.hooks
+            self.metrics: Optional[Metrics] = parent.metrics
+            self.parse_executor: Optional[ParseExecutor] = parent.parse_executor
+            self.scheduler: Optional[RequestScheduler] = parent.scheduler
         def __repr__(self) -> str:
             """
             String representation of the AsyncAPI Instance.
@@ -463,10 +1098,10 @@ class EdgarAPI:
             Raises:
                 AttributeError: If the key does not exist.
             """
-            if key in self.cache.keys():
-                return self.cache[key]
-            else:
-                raise AttributeError(f"'{key}' not found in cache.")
+            with self._parent.cache_lock:
+                if key in self.cache.keys():
+                    return self.cache[key]
+            raise AttributeError(f"'{key}' not found in cache.")
         def __len__(self) -> int:
             """
             Get the length of the cache.
@@ -474,7 +1109,8 @@ class EdgarAPI:
             Returns:
                 int: The number of items in the cache.
             """
-            return len(self.cache)
+            with self._parent.cache_lock:
+                return len(self.cache)
         def __contains__(self, key: str) -> bool:
             """
             Check if a specific item exists in the cache.
@@ -485,7 +1121,8 @@ class EdgarAPI:
             Returns:
                 bool: True if the attribute exists, False otherwise.
             """
-            return key in self.cache.keys()
+            with self._parent.cache_lock:
+                return key in self.cache.keys()
         def __setitem__(self, key: str, value: Any) -> None:
             """
             Set a specific item in the cache.
@@ -494,7 +1131,8 @@ class EdgarAPI:
                 key (str): The name of the attribute to set.
                 value (Any): The value to set.
             """
-            self.cache[key] = value
+            with self._parent.cache_lock:
+                self.cache[key] = value
         def __delitem__(self, key: str) -> None:
             """
             Delete a specific item from the cache.
@@ -505,10 +1143,11 @@ class EdgarAPI:
             Raises:
                 AttributeError: If the key does not exist in the cache.
             """
-            if key in self.cache.keys():
-                del self.cache[key]
-            else:
-                raise AttributeError(f"'{key}' not found in cache.")
+            with self._parent.cache_lock:
+                if key in self.cache.keys():
+                    del self.cache[key]
+                    return
+            raise AttributeError(f"'{key}' not found in cache.")
         def __call__(self) -> str:
             """
             Call the AsyncAPI instance to get a summary of its configuration.
@@ -528,52 +1167,172 @@ class EdgarAPI:
             """
             Dynamically adjusts the semaphore based on requests left in the second.
             """
-            async with self._parent.lock:
+            await self.__acquire_rate_lock()
+            try:
                 now = time.time()
                 while self._parent.request_times and self._parent.request_times[0] < now - 1:
                     self._parent.request_times.popleft()
                 requests_made = len(self._parent.request_times)
                 requests_left = max(0, self._parent.max_requests_per_second - requests_made)
                 time_left = max(0, 1 - (now - (self._parent.request_times[0] if self._parent.request_times else now)))
-                new_limit = max(1, requests_left)
-                self._parent.semaphore = asyncio.Semaphore(new_limit)
-                return requests_left, time_left
-        @retry(wait=wait_fixed(1), stop=stop_after_attempt(3))
-        async def __rate_limited(self) -> None:
+            finally:
+                self._parent.rate_lock.release()
+            new_limit = max(1, requests_left)
+            self._parent.semaphore = asyncio.Semaphore(new_limit)
+            return requests_left, time_left
+        async def __acquire_rate_lock(self) -> None:
             """
-            Enforces the rate limit dynamically based on requests left in the current second.
+            Acquire the threading rate lock shared with sync callers without blocking the event loop, polling while another thread holds it.
+            """
+            while not self._parent.rate_lock.acquire(blocking=False):
+                await asyncio.sleep(0.005)
+        async def __take_slot(self, deadline: Optional[Deadline]=None) -> None:
+            """
+            Take a slot of the client's budget under the rate lock, pruning and counting in the same critical section as the sync limiter, and wait for the next slot while the budget is spent. Like the sync limiter, it keeps one slot of the budget spare, since requests reach the server later than their slot is recorded.
+            """
+            while True:
+                await self.__acquire_rate_lock()
+                try:
+                    now = time.time()
+                    request_times = self._parent.request_times
+                    while request_times and request_times[0] < now - 1:
+                        request_times.popleft()
+                    if not request_times or len(request_times) + 1 < self._parent.max_requests_per_second:
+                        request_times.append(now)
+                        return
+                    wait = 1 - (now - request_times[0])
+                finally:
+                    self._parent.rate_lock.release()
+                if deadline is not None:
+                    deadline.check(wait)
+                await asyncio.sleep(wait)
+        async def __within(self, awaitable: Awaitable[Any], deadline: Optional[Deadline]) -> Any:
+            """
+            Await within the deadline, cancelling the awaitable and raising TimeoutError when it passes.
+            """
+            if deadline is None:
+                return await awaitable
+            try:
+                return await asyncio.wait_for(awaitable, deadline.remaining())
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Deadline of {deadline.seconds}s exceeded.") from None
+        @retry(wait=wait_fixed(1), stop=Deadline.stop_after_attempt(3), retry=retry_if_exception(Deadline.retryable), before_sleep=Hooks.before_sleep)
+        async def __rate_limited(self, deadline: Optional[Deadline]=None) -> None:
+            """
+            Enforces the rate limit dynamically based on requests left in the current second. The slot is only taken once the wait is over, so a cancelled wait uses none, and it is taken under the rate lock of sync callers, so sync threads and event loops, including the background engine, share one budget.
             """
             async with self._parent.semaphore:
                 requests_left, time_left = await self.__update_semaphore()
-                if requests_left > 0:
-                    sleep_time = time_left / max(1, requests_left)
-                    await asyncio.sleep(sleep_time)
-                else:
-                    await asyncio.sleep(time_left)
-                async with self._parent.lock:
-                    self._parent.request_times.append(time.time())
-        @retry(wait=wait_fixed(1), stop=stop_after_attempt(3))
-        async def __edgar_get_request(self, url_endpoint: str) -> Dict[Any, Any]:
+                sleep_time = time_left / max(1, requests_left) if requests_left > 0 else time_left
+                if deadline is not None:
+                    deadline.check(sleep_time)
+                await asyncio.sleep(sleep_time)
+                await self.__take_slot(deadline)
+        async def __throttle(self, deadline: Optional[Deadline]=None) -> None:
+            """
+            Wait for the scheduler to release the request, or for the rate limiter when there is no scheduler, cancelling the wait when the deadline passes.
             """
-            Helper method to perform an asynchronous GET request to the EDGAR API.
+            if deadline is not None:
+                deadline.check()
+            if self.scheduler is not None:
+                await self.scheduler.acquire_async(deadline)
+            else:
+                await self.__within(self.__rate_limited(deadline), deadline)
+        @retry(wait=wait_fixed(1), stop=Deadline.stop_after_attempt(3), retry=retry_if_exception(Deadline.retryable), before_sleep=Hooks.before_sleep)
+        async def __edgar_get_request(self, url_endpoint: str, raw: bool=False, base_url: Optional[str]=None) -> Any:
             """
-            async def __get_request(url_endpoint: str) -> Dict[Any, Any]:
+            Helper method to perform an asynchronous GET request to the EDGAR API, or to another SEC host if base_url is given, returning the raw body instead of decoded JSON if raw.
+            """
+            async def __get_request(url_endpoint: str, raw: bool=False, base_url: Optional[str]=None) -> Any:
                 """
                 Helper method to perform an asynchronous GET request to the EDGAR API.
                 """
-                await self.__rate_limited()
-                async with httpx.AsyncClient() as client:
-                    response = await client.get((self.base_url + url_endpoint), headers=self.headers, timeout=10)
-                    response.raise_for_status()
-                    response_json = response.json()
-                    return response_json
-            @async_cached(cache=self.cache)
-            async def __cached_get_request(url_endpoint: str) -> Dict[Any, Any]:
-                return await __get_request(url_endpoint)
+                url = (base_url or self.base_url) + url_endpoint
+                deadline = Deadline.current()
+                timer = RequestTimer(self.hooks, url_endpoint, asynchronous=True) if self.hooks else None
+                await self._parent.host_limiter.wait_async(httpx.URL(url).host, deadline)
+                await self.__throttle(deadline)
+                if timer is not None:
+                    timer.throttled()
+                timeout = self._parent.timeout if deadline is None else deadline.timeout(self._parent.timeout)
+                client = self._parent.async_client
+                if timer is not None:
+                    return timer.finish(await self.__within(client.get(url, headers=self.headers, timeout=timeout, extensions=timer.extensions), deadline), raw)
+                response = await self.__within(client.get(url, headers=self.headers, timeout=timeout), deadline)
+                response.raise_for_status()
+                if raw:
+                    return response.content
+                response_json = response.json()
+                return response_json
+            missed: List[bool] = []
+            @async_cached(cache=self.cache, lock=AsyncThreadLock(self._parent.cache_lock))
+            async def __cached_get_request(url_endpoint: str, raw: bool=False, base_url: Optional[str]=None) -> Any:
+                missed.append(True)
+                if self.hooks:
+                    self.hooks.emit('cache_miss', url_endpoint)
+                try:
+                    return await __get_request(url_endpoint, raw, base_url)
+                except httpx.HTTPStatusError as exception:
+                    if exception.response.status_code == 404:
+                        async with AsyncThreadLock(self._parent.cache_lock):
+                            self.negative_cache[url_endpoint] = exception.response
+                    raise
             if self.cache_mode:
-                return await __cached_get_request(url_endpoint)
+                async with AsyncThreadLock(self._parent.cache_lock):
+                    not_found = self.negative_cache.get(url_endpoint)
+                if not_found is not None:
+                    if self.hooks:
+                        self.hooks.emit('cache_hit', url_endpoint)
+                    not_found.raise_for_status()
+                if base_url is not None:
+                    response_json = await __cached_get_request(url_endpoint, base_url=base_url)
+                else:
+                    response_json = await (__cached_get_request(url_endpoint, raw=True) if raw else __cached_get_request(url_endpoint))
+                if not missed and self.hooks:
+                    self.hooks.emit('cache_hit', url_endpoint)
+                return response_json
             else:
-                return await __get_request(url_endpoint)
+                return await __get_request(url_endpoint, raw, base_url)
+        @retry(wait=wait_fixed(1), stop=Deadline.stop_after_attempt(3), retry=retry_if_exception(Deadline.retryable), before_sleep=Hooks.before_sleep)
+        async def __edgar_conditional_get_request(self, url_endpoint: str, headers: Dict[str, str]) -> Tuple[Optional[Dict[Any, Any]], Dict[str, Optional[str]]]:
+            """
+            Helper method to perform an asynchronous conditional GET request to the EDGAR API, bypassing the cache.
+            """
+            deadline = Deadline.current()
+            timer = RequestTimer(self.hooks, url_endpoint, asynchronous=True) if self.hooks else None
+            await self.__throttle(deadline)
+            if timer is not None:
+                timer.throttled()
+            timeout = self._parent.timeout if deadline is None else deadline.timeout(self._parent.timeout)
+            client = self._parent.async_client
+            if timer is not None:
+                response = await self.__within(client.get((self.base_url + url_endpoint), headers=headers, timeout=timeout, extensions=timer.extensions), deadline)
+                response_json = timer.finish(response)
+                return response_json, ({} if response_json is None else {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')})
+            response = await self.__within(client.get((self.base_url + url_endpoint), headers=headers, timeout=timeout), deadline)
+            if response.status_code == 304:
+                return None, {}
+            response.raise_for_status()
+            return response.json(), {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        async def __edgar_get_payload(self, url_endpoint: str) -> Union[Dict[Any, Any], bytes]:
+            """
+            Helper method to GET a response for __to_object_async: the raw body when a parse executor is set, decoded JSON otherwise.
+            """
+            if self.parse_executor is None:
+                return await self.__edgar_get_request(url_endpoint)
+            return await self.__edgar_get_request(url_endpoint, raw=True)
+        async def __to_object_async(self, object_type: Any, url_endpoint: str, response: Union[Dict[Any, Any], bytes], **kwargs: Any) -> Any:
+            """
+            Convert a response into an object, emitting parse_start and parse_end when hooks are registered. Raw bodies are parsed by the parse executor.
+            """
+            parse: Callable[..., Any] = functools.partial(cast(ParseExecutor, self.parse_executor).parse_async, object_type) if isinstance(response, bytes) else object_type.to_object_async
+            if not self.hooks:
+                return await parse(response, **kwargs)
+            self.hooks.emit('parse_start', url_endpoint, object_type=object_type.__name__)
+            started = time.perf_counter()
+            parsed = await parse(response, **kwargs)
+            self.hooks.emit('parse_end', url_endpoint, time.perf_counter() - started, object_type=object_type.__name__)
+            return parsed
         # Public Methods
         async def get_submissions(self, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> SubmissionHistory:
             """Get a submission history.
@@ -608,13 +1367,19 @@ class EdgarAPI:
             if central_index_key is None and ticker is None:
                 raise ValueError("Provide either ticker or central_index_key.")
             if ticker:
-                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker))
-            assert central_index_key is not None
-            central_index_key = await EdgarHelpers.cik_validation_async(central_index_key)
+                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker, api=self._parent))
+            central_index_key = await EdgarHelpers.cik_validation_async(cast(str, central_index_key))
+            if self.mirror is not None:
+                mirrored_history = await asyncio.to_thread(self.mirror.get_submissions, central_index_key)
+                if mirrored_history is not None:
+                    return mirrored_history
             url_endpoint = f'/submissions/CIK{central_index_key}.json'
-            response = await self.__edgar_get_request(url_endpoint)
-            return await SubmissionHistory.to_object_async(response)
-        async def get_company_concept(self, taxonomy: str, tag: str, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> CompanyConcept:
+            response = await self.__edgar_get_payload(url_endpoint)
+            submission_history = await self.__to_object_async(SubmissionHistory, url_endpoint, response)
+            if self.mirror is not None:
+                await asyncio.to_thread(self.mirror.store_submissions, submission_history)
+            return submission_history
+        async def get_company_concept(self, taxonomy: str, tag: str, ticker: Optional[str]=None, central_index_key: Optional[str]=None, dedup: bool=False) -> CompanyConcept:
             """Get a company concept.
 
             Retrieve XBRL disclosures for a specific concept from a company.
@@ -624,6 +1389,7 @@ class EdgarAPI:
                 central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
                 taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap', 'ifrs-full', 'dei', or 'srt').
                 tag (str): The specific disclosure concept tag to retrieve, such as 'AccountsPayableCurrent' or 'Assets'.
+                dedup (bool, optional): Collapse facts repeated across filings into one UnitDisclosure listing every source accession. Default is False.
 
             Returns:
                 CompanyConcept: An object containing all disclosures related to the specified concept, organized by units of measure.
@@ -643,20 +1409,28 @@ class EdgarAPI:
                 >>> asyncio.run(main())
 
             Note:
-                This endpoint returns separate arrays of facts for each unit of measure that the company has disclosed (e.g., values reported in both USD and EUR).
+                This endpoint returns separate arrays of facts for each unit of measure that the company has disclosed (e.g., values reported in both USD and EUR). Deduplicated results bypass the mirror, which stores every disclosure.
             """
             if ticker and central_index_key:
                 raise ValueError("Provide either ticker or central_index_key, not both.")
             if central_index_key is None and ticker is None:
                 raise ValueError("Provide either ticker or central_index_key.")
             if ticker:
-                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker))
-            assert central_index_key is not None
-            central_index_key = await EdgarHelpers.cik_validation_async(central_index_key)
+                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker, api=self._parent))
+            central_index_key = await EdgarHelpers.cik_validation_async(cast(str, central_index_key))
+            if self.mirror is not None and not dedup:
+                mirrored_concept = await asyncio.to_thread(self.mirror.get_company_concept, central_index_key, taxonomy, tag)
+                if mirrored_concept is not None:
+                    return mirrored_concept
+            if self.catalog is not None:
+                self.catalog.validate_concept(central_index_key, taxonomy, tag)
             url_endpoint = f'/api/xbrl/companyconcept/CIK{central_index_key}/{taxonomy}/{tag}.json'
-            response = await self.__edgar_get_request(url_endpoint)
-            return await CompanyConcept.to_object_async(response)
-        async def get_company_facts(self, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> CompanyFacts:
+            response = await self.__edgar_get_payload(url_endpoint)
+            company_concept = await self.__to_object_async(CompanyConcept, url_endpoint, response, dedup=dedup)
+            if self.mirror is not None and not dedup:
+                await asyncio.to_thread(self.mirror.store_company_concept, company_concept)
+            return company_concept
+        async def get_company_facts(self, ticker: Optional[str]=None, central_index_key: Optional[str]=None, dedup: bool=False) -> CompanyFacts:
             """Get all company facts.
 
             Retrieve all XBRL disclosures for a company in a single request.
@@ -664,6 +1438,7 @@ class EdgarAPI:
             Args:
                 ticker (str, optional): The ticker symbol of the company. If provided, the CIK will be derived from the ticker.
                 central_index_key (str): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
+                dedup (bool, optional): Collapse facts repeated across filings into one UnitDisclosure listing every source accession. Default is False.
 
             Returns:
                 CompanyFact: An object containing all facts and disclosures for the company, organized by taxonomy and concept.
@@ -683,19 +1458,29 @@ class EdgarAPI:
                 >>> asyncio.run(main())
 
             Note:
-                This is the most comprehensive endpoint, returning all concepts across all taxonomies for a company. The response can be quite large for companies with extensive filing histories.
+                This is the most comprehensive endpoint, returning all concepts across all taxonomies for a company. The response can be quite large for companies with extensive filing histories; dedup typically shrinks it several times. Deduplicated results bypass the mirror, which stores every disclosure.
             """
             if ticker and central_index_key:
                 raise ValueError("Provide either ticker or central_index_key, not both.")
             if central_index_key is None and ticker is None:
                 raise ValueError("Provide either ticker or central_index_key.")
             if ticker:
-                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker))
-            assert central_index_key is not None
-            central_index_key = await EdgarHelpers.cik_validation_async(central_index_key)
+                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker, api=self._parent))
+            central_index_key = await EdgarHelpers.cik_validation_async(cast(str, central_index_key))
+            if self.mirror is not None and not dedup:
+                mirrored_facts = await asyncio.to_thread(self.mirror.get_company_facts, central_index_key)
+                if mirrored_facts is not None:
+                    if self.catalog is not None:
+                        self.catalog.update(mirrored_facts)
+                    return mirrored_facts
             url_endpoint = f'/api/xbrl/companyfacts/CIK{central_index_key}.json'
-            response = await self.__edgar_get_request(url_endpoint)
-            return await CompanyFacts.to_object_async(response)
+            response = await self.__edgar_get_payload(url_endpoint)
+            company_facts = await self.__to_object_async(CompanyFacts, url_endpoint, response, dedup=dedup)
+            if self.mirror is not None and not dedup:
+                await asyncio.to_thread(self.mirror.store_company_facts, company_facts)
+            if self.catalog is not None:
+                self.catalog.update(company_facts)
+            return company_facts
         async def get_frames(self, taxonomy: str, tag: str, unit: str, period: Union[str, datetime], instantaneous: bool) -> Frame:
             """Get frames for a period.
 
@@ -726,15 +1511,292 @@ class EdgarAPI:
             Note:
                 Due to varying company fiscal calendars, the frame data is assembled using the dates that best align with calendar periods. Be mindful that facts in a frame may have different exact reporting start and end dates.
             """
-            if not isinstance(period, (str, datetime)):
-                raise TypeError("period must be a string or datetime object.")
-            if isinstance(period, datetime):
-                period = await EdgarHelpers.datetime_cy_conversion_async(period)
-            elif isinstance(period, str):
-                if not await EdgarHelpers.string_cy_validation_async(period):
-                    period = await EdgarHelpers.string_cy_conversion_async(period)
-            if instantaneous and not period.endswith("I"):
-                period += "I"
+            period = await EdgarHelpers.frame_period_async(period, instantaneous)
+            if self.mirror is not None:
+                mirrored_frame = await asyncio.to_thread(self.mirror.get_frame, taxonomy, tag, unit, period)
+                if mirrored_frame is not None:
+                    return mirrored_frame
+            if self.catalog is not None:
+                self.catalog.validate_frame(taxonomy, tag, unit, period)
             url_endpoint = f'/api/xbrl/frames/{taxonomy}/{tag}/{unit}/{period}.json'
+            response = await self.__edgar_get_payload(url_endpoint)
+            frame = await self.__to_object_async(Frame, url_endpoint, response)
+            if self.mirror is not None:
+                await asyncio.to_thread(self.mirror.store_frame, frame, unit, period)
+            return frame
+        async def get_frames_panel(self, taxonomy: str, tag: str, unit: str, start: Union[str, datetime], end: Union[str, datetime], instantaneous: bool) -> FramePanel:
+            """Get a panel of frames over a range of periods.
+
+            Retrieve the frame for every period between start and end concurrently and stack them into a CIK by period panel.
+
+            Args:
+                taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap', 'ifrs-full', 'dei', or 'srt').
+                tag (str): The specific disclosure concept tag to retrieve (e.g. 'AccountsPayableCurrent', 'Assets').
+                unit (str): Unit of measurement for the requested data (e.g. 'USD', 'USD-per-shares').
+                start (str | datetime): The first period, as a datetime object or a string in 'YYYY-MM-DD', 'CY####' or 'CY####Q#' format.
+                end (str | datetime): The last period, in the same formats as start.
+                instantaneous (bool): Whether the periods are instantaneous (e.g. 'CY2019Q1I').
+
+            Returns:
+                FramePanel: The panel, holding one value per company and period that was reported, with entity names. Periods whose request failed, e.g. with 404 Not Found at the early end of a long range, are empty and listed in missing.
+
+            Raises:
+                ValueError: If the period range is invalid.
+                Exception: The error of the first period if the request of every period failed.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI().Async
+                >>>     panel = await api.get_frames_panel("us-gaap", "Assets", "USD", "CY2014Q1", "CY2023Q4", instantaneous=True)
+                >>>     print(len(panel.ciks), len(panel.periods))
+                >>> asyncio.run(main())
+
+            Note:
+                Requests for the individual periods share the client's rate limiter, so a long range is fetched as fast as the limit allows.
+            """
+            periods = await EdgarHelpers.frame_period_range_async(start, end, instantaneous)
+            results = await asyncio.gather(*(self.get_frames(taxonomy, tag, unit, period, instantaneous) for period in periods), return_exceptions=True)
+            frames = [result for result in results if isinstance(result, Frame)]
+            if not frames:
+                raise cast(BaseException, results[0])
+            return await FramePanel.to_object_async(frames, periods)
+        async def get_new_filings(self, store: SubmissionStore, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> List[Filing]:
+            """Get filings made since the last sync.
+
+            Retrieve only the filings a company has made since the checkpoint recorded in a SubmissionStore, and advance the checkpoint.
+
+            Args:
+                store (SubmissionStore): The store holding per-CIK checkpoints. It is updated in place; call store.save() to persist it.
+                ticker (str, optional): The ticker symbol of the company. If provided, the CIK will be derived from the ticker.
+                central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
+
+            Returns:
+                List[Filing]: The filings made since the last checkpoint, newest first.
+
+            Raises:
+                ValueError: If the request fails or the response is not valid JSON format.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI().Async
+                >>>     store = ed.SubmissionStore("checkpoints.json")
+                >>>     ciks = ["0000320193", "0000789019"]
+                >>>     results = await asyncio.gather(*(api.get_new_filings(store, central_index_key=cik) for cik in ciks))
+                >>>     store.save()
+                >>> asyncio.run(main())
+
+            Note:
+                The request is sent with If-None-Match / If-Modified-Since validators from the previous run, so an unchanged submission history costs a 304 response and no parsing. These requests bypass the cache.
+            """
+            if ticker and central_index_key:
+                raise ValueError("Provide either ticker or central_index_key, not both.")
+            if central_index_key is None and ticker is None:
+                raise ValueError("Provide either ticker or central_index_key.")
+            if ticker:
+                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker, api=self._parent))
+            central_index_key = await EdgarHelpers.cik_validation_async(cast(str, central_index_key))
+            url_endpoint = f'/submissions/CIK{central_index_key}.json'
+            response, validators = await self.__edgar_conditional_get_request(url_endpoint, store.conditional_headers(central_index_key, self.headers))
+            if response is None:
+                return []
+            submission_history = await self.__to_object_async(SubmissionHistory, url_endpoint, response)
+            new_filings = store.new_filings(central_index_key, submission_history.filings)
+            store.advance(central_index_key, submission_history.filings, validators)
+            return new_filings
+        async def get_company_facts_changes(self, store: FactStore, ticker: Optional[str]=None, central_index_key: Optional[str]=None) -> List[FactChange]:
+            """Get the company facts added, changed or removed since the last merge.
+
+            Retrieve all XBRL disclosures for a company and merge them into a FactStore, returning only the new and restated facts.
+
+            Args:
+                store (FactStore): The store holding previously seen facts. It is updated in place; call store.save() to persist it.
+                ticker (str, optional): The ticker symbol of the company. If provided, the CIK will be derived from the ticker.
+                central_index_key (str, optional): 10-digit Central Index Key (CIK) of the entity, including leading zeros. A CIK may be obtained at the SEC's CIK lookup: https://www.sec.gov/search-filings/cik-lookup
+
+            Returns:
+                List[FactChange]: The added, changed and removed facts, each with its taxonomy, tag and UnitDisclosure.
+
+            Raises:
+                ValueError: If the request fails or the response is not valid JSON format.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI().Async
+                >>>     store = ed.FactStore("facts/")
+                >>>     changes = await api.get_company_facts_changes(store, ticker="AAPL")
+                >>>     store.save()
+                >>> asyncio.run(main())
+
+            Note:
+                The payload is merged without being parsed into a CompanyFacts object; UnitDisclosure objects are only built for facts that changed.
+            """
+            if ticker and central_index_key:
+                raise ValueError("Provide either ticker or central_index_key, not both.")
+            if central_index_key is None and ticker is None:
+                raise ValueError("Provide either ticker or central_index_key.")
+            if ticker:
+                central_index_key = cast(str, await EdgarHelpers.get_cik_async(ticker=ticker, api=self._parent))
+            central_index_key = await EdgarHelpers.cik_validation_async(cast(str, central_index_key))
+            url_endpoint = f'/api/xbrl/companyfacts/CIK{central_index_key}.json'
             response = await self.__edgar_get_request(url_endpoint)
-            return await Frame.to_object_async(response)
+            return await asyncio.to_thread(store.merge, response)
+        async def get_company_tickers(self) -> Dict[str, Dict[str, Any]]:
+            """Get the company tickers file.
+
+            Retrieve company_tickers.json from www.sec.gov, mapping every listed company to its CIK, ticker and name.
+
+            Returns:
+                Dict[str, Dict[str, Any]]: The raw file, keyed by position, with 'cik_str', 'ticker' and 'title' entries.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI(cache_mode=True).Async
+                >>>     tickers = await api.get_company_tickers()
+                >>> asyncio.run(main())
+
+            Note:
+                The request shares this client's cache, retries, hooks and rate limit, and is also held to the www.sec.gov limit of its host_limiter.
+            """
+            return await self.__edgar_get_request('/files/company_tickers.json', base_url=self._parent.files_url)
+        async def get_company_tickers_exchange(self) -> Dict[str, List[Any]]:
+            """Get the company tickers and exchanges file.
+
+            Retrieve company_tickers_exchange.json from www.sec.gov, listing every listed company's CIK, name, ticker and exchange.
+
+            Returns:
+                Dict[str, List[Any]]: The raw file, with 'fields' naming the columns ('cik', 'name', 'ticker', 'exchange') of every row in 'data'.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI(cache_mode=True).Async
+                >>>     exchanges = await api.get_company_tickers_exchange()
+                >>> asyncio.run(main())
+
+            Note:
+                The request shares this client's cache, retries, hooks and rate limit, and is also held to the www.sec.gov limit of its host_limiter.
+            """
+            return await self.__edgar_get_request('/files/company_tickers_exchange.json', base_url=self._parent.files_url)
+        def stats(self) -> Dict[str, Any]:
+            """Get client metrics.
+
+            Return a snapshot of the metrics shared with the parent EdgarAPI.
+
+            Returns:
+                Dict[str, Any]: The same snapshot as EdgarAPI.stats().
+
+            Raises:
+                ValueError: If the client was created without metrics=True.
+            """
+            return self._parent.stats()
+        @contextmanager
+        def deadline(self, seconds: float, fail_fast: bool=False) -> Generator[Deadline, None, None]:
+            """Bound the time taken by calls.
+
+            Every call awaited in the block on the same asyncio task must finish within seconds, including its rate-limit waits and retries, or it raises TimeoutError.
+
+            Args:
+                seconds (float): The time allowed, in seconds.
+                fail_fast (bool): Whether to raise as soon as a rate-limit wait is known to outlast the deadline, instead of waiting until it expires. Defaults to False.
+
+            Returns:
+                Generator[Deadline, None, None]: The deadline of the block.
+
+            Raises:
+                ValueError: If seconds is negative.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI().Async
+                >>>     with api.deadline(2.0):
+                >>>         submission_history = await api.get_submissions(ticker="AAPL")
+                >>> asyncio.run(main())
+            """
+            with self._parent.deadline(seconds, fail_fast) as deadline:
+                yield deadline
+        async def as_completed(self, method: str, calls: Union[Mapping[Hashable, Dict[str, Any]], Iterable[Tuple[Hashable, Dict[str, Any]]]], concurrency: Optional[int]=None, deadline: Optional[float]=None, call_timeout: Optional[float]=None, fail_fast: bool=False) -> AsyncIterator[Tuple[Hashable, Any]]:
+            """Stream results as requests complete.
+
+            Call a public get method for many keyed sets of arguments and yield every result as soon as it arrives, keeping at most concurrency requests in flight.
+
+            Args:
+                method (str): The name of a public get method, e.g. 'get_company_facts'.
+                calls (Mapping[Hashable, Dict[str, Any]] | Iterable[Tuple[Hashable, Dict[str, Any]]]): The keyword arguments of every call keyed by a caller-chosen key, as a mapping or an iterable of (key, kwargs) pairs. Iterables are consumed lazily.
+                concurrency (int, optional): The maximum number of calls in flight. Defaults to max_requests_per_second.
+                deadline (float, optional): The seconds allowed for the whole stream from its first result request; calls not finished by then are cancelled and yield TimeoutError.
+                call_timeout (float, optional): The seconds allowed for each call from when it starts, within the stream deadline; a call still in flight is cancelled and yields TimeoutError.
+                fail_fast (bool): Whether a call fails as soon as its rate-limit wait is known to outlast its deadline. Defaults to False.
+
+            Returns:
+                AsyncIterator[Tuple[Hashable, Any]]: (key, result) pairs in completion order, where result is the exception a failed call raised.
+
+            Raises:
+                ValueError: If the method is not a public get method or concurrency is not a positive integer.
+
+            Example:
+                >>> import edgar_sec as ed
+                >>> import asyncio
+                >>> async def main():
+                >>>     api = ed.EdgarAPI().Async
+                >>>     calls = ((cik, {"central_index_key": cik}) for cik in ciks)
+                >>>     async for cik, facts in api.as_completed("get_company_facts", calls, concurrency=10):
+                >>>         if not isinstance(facts, Exception):
+                >>>             process(cik, facts)
+                >>> asyncio.run(main())
+
+            Note:
+                A new call starts only when the consumer asks for the next result, so a slow consumer holds at most concurrency finished results in memory and the rest of calls is never materialized.
+                Calls still in flight are cancelled when the iterator is closed with aclose() or the consuming task is cancelled; breaking out of an async for loop only closes the iterator once it is garbage collected, so wrap it in contextlib.aclosing() to cancel them right away.
+                A call that outlasts deadline or call_timeout is cancelled and yields TimeoutError without stopping the stream.
+            """
+            if not method.startswith('get_') or not callable(getattr(self, method, None)):
+                raise ValueError(f"Unknown method: {method}.")
+            limit = concurrency if concurrency is not None else self._parent.max_requests_per_second
+            if not isinstance(limit, int) or limit < 1:
+                raise ValueError("concurrency must be a positive integer.")
+            function = getattr(self, method)
+            pending = iter(calls.items() if isinstance(calls, Mapping) else calls)
+            batch_deadline = Deadline(deadline, fail_fast, Deadline.current()) if deadline is not None else Deadline.current()
+            async def call(kwargs: Dict[str, Any]) -> Any:
+                call_deadline = Deadline(call_timeout, fail_fast, batch_deadline) if call_timeout is not None else batch_deadline
+                Deadline.context.set(call_deadline)
+                return await self.__within(function(**kwargs), call_deadline)
+            keys: Dict[asyncio.Future, Hashable] = {}
+            in_flight: Set[asyncio.Future] = set()
+            exhausted = False
+            try:
+                while True:
+                    while not exhausted and len(in_flight) < limit:
+                        try:
+                            key, kwargs = next(pending)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        future = asyncio.ensure_future(call(kwargs))
+                        keys[future] = key
+                        in_flight.add(future)
+                    if not in_flight:
+                        return
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        exception = task.exception()
+                        if exception is not None and not isinstance(exception, Exception):
+                            raise exception
+                        yield keys.pop(task), task.result() if exception is None else exception
+            finally:
+                for task in in_flight:
+                    task.cancel()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=EdgarAPI.after_fork)
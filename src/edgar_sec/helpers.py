@@ -18,26 +18,66 @@
 This module defines helper methods for the edgar-sec package.
 """
 
-from typing import Optional, List, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, List, Union
 from datetime import datetime
 import asyncio
 import re
-import httpx
 from edgar_sec.objects import Company
+from edgar_sec.stores import CompanyUniverse
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
 
+if TYPE_CHECKING:
+    from edgar_sec.clients import EdgarAPI
+
 class EdgarHelpers:
     """
     A class containing helper methods for the Edgar SEC module.
     """
+    default_api: Optional['EdgarAPI'] = None
+    # Private Methods
+    @staticmethod
+    def __api(api: Optional['EdgarAPI']) -> 'EdgarAPI':
+        """
+        Get the client sending a helper's requests: the given one, or a caching EdgarAPI shared by every helper call made without one.
+        """
+        if api is not None:
+            return api
+        if EdgarHelpers.default_api is None:
+            from edgar_sec.clients import EdgarAPI
+            EdgarHelpers.default_api = EdgarAPI(cache_mode=True)
+        return EdgarHelpers.default_api
+    @staticmethod
+    def __companies(data: Union[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]) -> Iterable[Dict[str, Any]]:
+        """
+        Get the company entries of a company_tickers.json payload, which the SEC keys by position.
+        """
+        return data.values() if isinstance(data, dict) else data
+    @staticmethod
+    def __find_cik(data: Union[Dict[str, Dict[str, Any]], List[Dict[str, Any]]], ticker: Optional[str], search_text: Optional[str]) -> str:
+        """
+        Find the CIK of a ticker, or of the first company whose name contains search_text, in a company_tickers.json payload.
+        """
+        if ticker:
+            for item in EdgarHelpers.__companies(data):
+                if item['ticker'] == ticker:
+                    return item['cik_str']
+            raise ValueError(f"Ticker '{ticker}' not found in the SEC EDGAR database.")
+        if not search_text:
+            raise ValueError("Provide exactly one of ticker or search_text.")
+        for item in EdgarHelpers.__companies(data):
+            if search_text.lower() in item['title'].lower():
+                return item['cik_str']
+        raise ValueError(f"Search text '{search_text}' not found in the SEC EDGAR database.")
+    # Public Methods
     @staticmethod
-    def get_cik(ticker:Optional[str]=None, search_text: Optional[str]=None) -> Union[str,List[str]]:
+    def get_cik(ticker:Optional[str]=None, search_text: Optional[str]=None, api: Optional['EdgarAPI']=None) -> Union[str,List[str]]:
         """
         Helper method to get the CIK (Central Index Key) for a given ticker symbol.
 
         Args:
             ticker (str): The ticker symbol of the company.
             search_text (str): The name of the company to search for.
+            api (EdgarAPI, optional): The client fetching company_tickers.json, sharing its connection pool, cache, rate limit and metrics. Defaults to a caching client shared by every helper call.
 
         Returns:
             str | List[str]: The CIK of the company or a list of CIKs if multiple matches are found.
@@ -46,38 +86,53 @@ class EdgarHelpers:
             ValueError: If neither ticker nor search_text is provided, or if both are provided.
 
         Example:
-
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(cache_mode=True)
+            >>> cik = ed.EdgarHelpers.get_cik(ticker="AAPL", api=api)
         """
         if (ticker is None and search_text is None) or (ticker and search_text):
             raise ValueError("Provide exactly one of ticker or search_text.")
-        with httpx.Client() as client:
-            response = client.get(url='https://www.sec.gov/files/company_tickers.json')
-            response.raise_for_status()
-            data = response.json()
-            if ticker:
-                for item in data:
-                    if item['ticker'] == ticker:
-                        return item['cik_str']
-                raise ValueError(f"Ticker '{ticker}' not found in the SEC EDGAR database.")
-            else:
-                assert search_text is not None
-                for item in data:
-                    if search_text.lower() in item['title'].lower():
-                        return item['cik_str']
-                raise ValueError(f"Search text '{search_text}' not found in the SEC EDGAR database.")
+        return EdgarHelpers.__find_cik(EdgarHelpers.__api(api).get_company_tickers(), ticker, search_text)
     @staticmethod
-    def get_universe() -> List[Company]:
+    def get_universe(api: Optional['EdgarAPI']=None) -> List[Company]:
         """
         Helper method to get the universe of companies from the SEC EDGAR database.
 
+        Args:
+            api (EdgarAPI, optional): The client fetching company_tickers.json. Defaults to a caching client shared by every helper call.
+
         Returns:
             List[Company]: A list of Company instances representing the universe of companies.
+
+        Note:
+            Use get_company_universe for a columnar universe with exchanges, vectorized lookups and an on-disk snapshot.
+        """
+        return [Company.to_object(item) for item in EdgarHelpers.__companies(EdgarHelpers.__api(api).get_company_tickers())]
+    @staticmethod
+    def get_company_universe(api: Optional['EdgarAPI']=None, path: Optional[str]=None, max_age: float=86400) -> CompanyUniverse:
         """
-        with httpx.Client() as client:
-            response = client.get(url='https://www.sec.gov/files/company_tickers.json')
-            response.raise_for_status()
-            data = response.json()
-            return [Company.to_object(item) for item in data]
+        Helper method to get the columnar universe of companies from the SEC EDGAR database.
+
+        Args:
+            api (EdgarAPI, optional): The client fetching company_tickers.json and company_tickers_exchange.json. Defaults to a caching client shared by every helper call.
+            path (str, optional): Path of a JSON snapshot of the universe, read instead of fetching while it is fresh and rewritten after fetching.
+            max_age (float): The age in seconds after which the snapshot is fetched again. Defaults to 86400 (one day).
+
+        Returns:
+            CompanyUniverse: The universe as CIK, ticker, name and exchange columns; indexing and iterating it yields Company instances.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> universe = ed.EdgarHelpers.get_company_universe(path="universe.json")
+            >>> ciks = universe.lookup(["AAPL", "MSFT"])
+        """
+        universe = CompanyUniverse(path)
+        if universe.is_stale(max_age):
+            client = EdgarHelpers.__api(api)
+            universe.update(client.get_company_tickers(), client.get_company_tickers_exchange())
+            if path is not None:
+                universe.save()
+        return universe
     @staticmethod
     def datetime_cy_conversion(period: datetime) -> str:
         """
@@ -139,6 +194,62 @@ class EdgarHelpers:
             raise TypeError("period must be a string.")
         return bool(re.fullmatch(r'CY\d{4}(Q[1-4])?', period))
     @staticmethod
+    def frame_period(period: Union[str, datetime], instantaneous: bool) -> str:
+        """
+        Helper method to normalize a frame period to the 'CY####', 'CY####Q#' or 'CY####Q#I' format.
+
+        Args:
+            period (str | datetime): The reporting period as a datetime object or a string in 'YYYY-MM-DD', 'CY####', 'CY####Q#' or 'CY####Q#I' format.
+            instantaneous (bool): Whether the period is instantaneous.
+
+        Returns:
+            str: The frame period, with an 'I' suffix when instantaneous.
+
+        Raises:
+            TypeError: If period is not a string or datetime object.
+        """
+        if not isinstance(period, (str, datetime)):
+            raise TypeError("period must be a string or datetime object.")
+        if isinstance(period, datetime):
+            period = EdgarHelpers.datetime_cy_conversion(period)
+        elif not EdgarHelpers.string_cy_validation(period.removesuffix('I')):
+            period = EdgarHelpers.string_cy_conversion(period)
+        if instantaneous and not period.endswith("I"):
+            period += "I"
+        return period
+    @staticmethod
+    def frame_period_range(start: Union[str, datetime], end: Union[str, datetime], instantaneous: bool) -> List[str]:
+        """
+        Helper method to list the frame periods between two periods, inclusive.
+
+        Args:
+            start (str | datetime): The first period, as accepted by frame_period.
+            end (str | datetime): The last period, as accepted by frame_period.
+            instantaneous (bool): Whether the periods are instantaneous.
+
+        Returns:
+            List[str]: Annual periods ('CY####') if both bounds are annual, otherwise quarterly periods ('CY####Q#' or 'CY####Q#I').
+
+        Raises:
+            ValueError: If the bounds mix annual and quarterly periods, if an annual range is instantaneous, or if start is after end.
+        """
+        first = EdgarHelpers.frame_period(start, False)
+        last = EdgarHelpers.frame_period(end, False)
+        if (len(first) == 6) != (len(last) == 6):
+            raise ValueError("start and end must both be annual or both be quarterly periods.")
+        if len(first) == 6:
+            if instantaneous:
+                raise ValueError("Annual frames cannot be instantaneous.")
+            years = range(int(first[2:6]), int(last[2:6]) + 1)
+            periods = [f"CY{year}" for year in years]
+        else:
+            first_index = int(first[2:6]) * 4 + int(first[7]) - 1
+            last_index = int(last[2:6]) * 4 + int(last[7]) - 1
+            periods = [f"CY{index // 4}Q{index % 4 + 1}{'I' if instantaneous else ''}" for index in range(first_index, last_index + 1)]
+        if not periods:
+            raise ValueError("start must not be after end.")
+        return periods
+    @staticmethod
     def cik_validation(central_index_key: str) -> str:
         """
         Helper method to validate and fix the CIK (Central Index Key) format.
@@ -161,44 +272,55 @@ class EdgarHelpers:
         else:
             return central_index_key
     @staticmethod
-    async def get_cik_async(ticker: Optional[str]=None, search_text: Optional[str] = None) -> Union[str, List[str]]:
+    async def get_cik_async(ticker: Optional[str]=None, search_text: Optional[str] = None, api: Optional['EdgarAPI']=None) -> Union[str, List[str]]:
         """
         Helper method to asynchronously get the CIK (Central Index Key) for a given ticker symbol.
 
         Args:
             ticker (str): The ticker symbol of the company.
             search_text (str): The name of the company to search for.
+            api (EdgarAPI, optional): The client whose AsyncAPI fetches company_tickers.json. Defaults to a caching client shared by every helper call.
 
         Returns:
             str | List[str]: The CIK of the company or a list of CIKs if multiple matches are found.
         """
         if (ticker is None and search_text is None) or (ticker and search_text):
             raise ValueError("Provide exactly one of ticker or search_text.")
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url='https://www.sec.gov/files/company_tickers.json')
-            response.raise_for_status()
-            data = response.json()
-            if ticker:
-                for item in data:
-                    if item['ticker'] == ticker:
-                        return item['cik_str']
-                raise ValueError(f"Ticker '{ticker}' not found in the SEC EDGAR database.")
-            else:
-                assert search_text is not None
-                for item in data:
-                    if search_text.lower() in item['title'].lower():
-                        return item['cik_str']
-                raise ValueError(f"Search text '{search_text}' not found in the SEC EDGAR database.")
+        return EdgarHelpers.__find_cik(await EdgarHelpers.__api(api).Async.get_company_tickers(), ticker, search_text)
     @staticmethod
-    async def get_universe_async() -> List[Company]:
+    async def get_universe_async(api: Optional['EdgarAPI']=None) -> List[Company]:
         """
         Helper method to asynchronously get the universe of companies from the SEC EDGAR database.
+
+        Args:
+            api (EdgarAPI, optional): The client whose AsyncAPI fetches company_tickers.json. Defaults to a caching client shared by every helper call.
+
+        Returns:
+            List[Company]: A list of Company instances representing the universe of companies, built in one worker thread.
+        """
+        data = await EdgarHelpers.__api(api).Async.get_company_tickers()
+        return await asyncio.to_thread(lambda: [Company.to_object(item) for item in EdgarHelpers.__companies(data)])
+    @staticmethod
+    async def get_company_universe_async(api: Optional['EdgarAPI']=None, path: Optional[str]=None, max_age: float=86400) -> CompanyUniverse:
+        """
+        Helper method to asynchronously get the columnar universe of companies from the SEC EDGAR database.
+
+        Args:
+            api (EdgarAPI, optional): The client whose AsyncAPI fetches company_tickers.json and company_tickers_exchange.json. Defaults to a caching client shared by every helper call.
+            path (str, optional): Path of a JSON snapshot of the universe, read instead of fetching while it is fresh and rewritten after fetching.
+            max_age (float): The age in seconds after which the snapshot is fetched again. Defaults to 86400 (one day).
+
+        Returns:
+            CompanyUniverse: The universe as CIK, ticker, name and exchange columns; indexing and iterating it yields Company instances.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url='https://www.sec.gov/files/company_tickers.json')
-            response.raise_for_status()
-            data = response.json()
-            return [await Company.to_object_async(item) for item in data]
+        universe = await asyncio.to_thread(CompanyUniverse, path)
+        if universe.is_stale(max_age):
+            client = EdgarHelpers.__api(api).Async
+            company_tickers, company_tickers_exchange = await asyncio.gather(client.get_company_tickers(), client.get_company_tickers_exchange())
+            await asyncio.to_thread(universe.update, company_tickers, company_tickers_exchange)
+            if path is not None:
+                await asyncio.to_thread(universe.save)
+        return universe
     @staticmethod
     async def datetime_cy_conversion_async(period: datetime) -> str:
         """
@@ -236,6 +358,44 @@ class EdgarHelpers:
         """
         return await asyncio.to_thread(EdgarHelpers.string_cy_validation, period)
     @staticmethod
+    async def frame_period_async(period: Union[str, datetime], instantaneous: bool) -> str:
+        """
+        Helper method to asynchronously normalize a frame period to the 'CY####', 'CY####Q#' or 'CY####Q#I' format.
+
+        Args:
+            period (str | datetime): The reporting period as a datetime object or a string in 'YYYY-MM-DD', 'CY####', 'CY####Q#' or 'CY####Q#I' format.
+            instantaneous (bool): Whether the period is instantaneous.
+
+        Returns:
+            str: The frame period, with an 'I' suffix when instantaneous.
+
+        Raises:
+            TypeError: If period is not a string or datetime object.
+        """
+        if not isinstance(period, (str, datetime)):
+            raise TypeError("period must be a string or datetime object.")
+        if isinstance(period, datetime):
+            period = await EdgarHelpers.datetime_cy_conversion_async(period)
+        elif not await EdgarHelpers.string_cy_validation_async(period.removesuffix('I')):
+            period = await EdgarHelpers.string_cy_conversion_async(period)
+        if instantaneous and not period.endswith("I"):
+            period += "I"
+        return period
+    @staticmethod
+    async def frame_period_range_async(start: Union[str, datetime], end: Union[str, datetime], instantaneous: bool) -> List[str]:
+        """
+        Helper method to asynchronously list the frame periods between two periods, inclusive.
+
+        Args:
+            start (str | datetime): The first period, as accepted by frame_period.
+            end (str | datetime): The last period, as accepted by frame_period.
+            instantaneous (bool): Whether the periods are instantaneous.
+
+        Returns:
+            List[str]: Annual periods ('CY####') if both bounds are annual, otherwise quarterly periods ('CY####Q#' or 'CY####Q#I').
+        """
+        return await asyncio.to_thread(EdgarHelpers.frame_period_range, start, end, instantaneous)
+    @staticmethod
     async def cik_validation_async(central_index_key: str) -> str:
         """
         Helper method to asynchronously validate and fix the CIK (Central Index Key) format.
@@ -0,0 +1,291 @@
+# filepath: /src/edgar_sec/instrumentation.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines the event hooks EdgarAPI and AsyncAPI emit while serving requests.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import time
+import httpx
+from tenacity import RetryCallState
+from cachetools import FIFOCache
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+@dataclass
+class RequestEvent:
+    """
+    A class representing one instrumentation event emitted by EdgarAPI or AsyncAPI.
+    """
+    event: str
+    url_endpoint: Optional[str]
+    elapsed: float
+    timestamp: float
+    details: Dict[str, Any] = field(default_factory=dict)
+
+class Hooks:
+    """Register handlers for the events emitted along the request path.
+
+    Events:
+        request_start: A request is about to be rate limited and sent.
+        request_end: A response arrived; details hold status_code, bytes and the throttle, connect, transfer and decode timings.
+        retry: A failed request or rate limit check will be retried; details hold attempt, exception and sleep.
+        throttle_wait: The rate limiter released a request; elapsed is the time spent waiting.
+        cache_hit: A cached response was returned.
+        cache_miss: A cacheable response was not in the cache.
+        cache_evict: The cache evicted its oldest response to make room.
+        parse_start: A response is about to be converted into an object; details hold object_type.
+        parse_end: A response was converted into an object; elapsed is the construction time.
+
+    Nothing is timed or emitted while no handler is registered, so an EdgarAPI without hooks
+    takes the same path as before. Handlers run synchronously on the calling thread or event loop
+    and exceptions they raise propagate to the caller.
+    """
+    events = ('request_start', 'request_end', 'retry', 'throttle_wait', 'cache_hit', 'cache_miss', 'cache_evict', 'parse_start', 'parse_end')
+    def __init__(self) -> None:
+        """
+        Initialize an empty hook registry.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI()
+            >>> api.hooks.register("request_end", lambda event: print(event.url_endpoint, event.details["transfer"]))
+        """
+        self.handlers: Dict[str, List[Callable[[RequestEvent], None]]] = {}
+    def __repr__(self) -> str:
+        """
+        String representation of the Hooks class.
+
+        Returns:
+            str: A string representation of the Hooks class.
+        """
+        return f"Hooks(events={sorted(self.handlers)})"
+    def __len__(self) -> int:
+        """
+        Get the number of registered handlers.
+
+        Returns:
+            int: The number of handlers across all events.
+        """
+        return sum(len(handlers) for handlers in self.handlers.values())
+    def __contains__(self, event: str) -> bool:
+        """
+        Check if any handler is registered for an event.
+
+        Args:
+            event (str): The event name.
+
+        Returns:
+            bool: True if the event has a handler, False otherwise.
+        """
+        return event in self.handlers
+    def register(self, event: str, handler: Callable[[RequestEvent], None]) -> Callable[[RequestEvent], None]:
+        """
+        Register a handler for an event.
+
+        Args:
+            event (str): One of Hooks.events.
+            handler (Callable[[RequestEvent], None]): Called with a RequestEvent every time the event is emitted.
+
+        Returns:
+            Callable[[RequestEvent], None]: The handler, unchanged.
+
+        Raises:
+            ValueError: If the event is unknown.
+        """
+        if event not in self.events:
+            raise ValueError(f"Unknown event: {event}.")
+        self.handlers.setdefault(event, []).append(handler)
+        return handler
+    def unregister(self, event: str, handler: Callable[[RequestEvent], None]) -> None:
+        """
+        Remove a handler registered for an event.
+
+        Args:
+            event (str): The event name.
+            handler (Callable[[RequestEvent], None]): The handler to remove.
+
+        Raises:
+            ValueError: If the handler is not registered for the event.
+        """
+        if handler not in self.handlers.get(event, []):
+            raise ValueError(f"Handler is not registered for {event}.")
+        self.handlers[event].remove(handler)
+        if not self.handlers[event]:
+            del self.handlers[event]
+    def emit(self, event: str, url_endpoint: Optional[str]=None, elapsed: float=0.0, **details: Any) -> None:
+        """
+        Call every handler registered for an event.
+
+        Args:
+            event (str): The event name.
+            url_endpoint (str, optional): The EDGAR endpoint the event belongs to.
+            elapsed (float): The duration the event measures, in seconds. Defaults to 0.0.
+            **details: Event specific values.
+        """
+        handlers = self.handlers.get(event)
+        if not handlers:
+            return
+        request_event = RequestEvent(event=event, url_endpoint=url_endpoint, elapsed=elapsed, timestamp=time.time(), details=details)
+        for handler in list(handlers):
+            handler(request_event)
+    @staticmethod
+    def before_sleep(retry_state: RetryCallState) -> None:
+        """
+        Tenacity before_sleep callback emitting the retry event on the instance being retried.
+
+        Args:
+            retry_state (RetryCallState): The state of the retried call; its first argument is the EdgarAPI or AsyncAPI instance
+                and its second, when a string, the endpoint reported with the event.
+        """
+        hooks = getattr(retry_state.args[0], 'hooks', None) if retry_state.args else None
+        if not hooks:
+            return
+        exception = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        url_endpoint = retry_state.args[1] if len(retry_state.args) > 1 else None
+        hooks.emit(
+            'retry',
+            url_endpoint if isinstance(url_endpoint, str) else None,
+            retry_state.seconds_since_start or 0.0,
+            attempt=retry_state.attempt_number,
+            exception=exception,
+            sleep=retry_state.next_action.sleep if retry_state.next_action is not None else 0.0
+        )
+
+class RequestTimer:
+    """
+    Time the phases of one request and emit its request_start, throttle_wait and request_end events.
+
+    The connect phase is measured through the httpcore trace extension, so it stays 0.0 when a custom
+    transport (e.g. edgar_sec.testing.MockEdgarServer) serves the request; transfer then covers the whole exchange.
+    """
+    def __init__(self, hooks: Hooks, url_endpoint: str, asynchronous: bool=False) -> None:
+        """
+        Start timing a request and emit request_start.
+
+        Args:
+            hooks (Hooks): The registry to emit on.
+            url_endpoint (str): The EDGAR endpoint being requested.
+            asynchronous (bool): Whether the request is sent by an httpx.AsyncClient. Defaults to False.
+        """
+        self.hooks: Hooks = hooks
+        self.url_endpoint: str = url_endpoint
+        self.started: float = time.perf_counter()
+        self.checkpoint: float = self.started
+        self.connect_started: Optional[float] = None
+        self.timings: Dict[str, float] = {'throttle': 0.0, 'connect': 0.0, 'transfer': 0.0, 'decode': 0.0}
+        self.extensions: Dict[str, Any] = {'trace': self.__trace_async if asynchronous else self.__trace}
+        hooks.emit('request_start', url_endpoint)
+    def __repr__(self) -> str:
+        """
+        String representation of the RequestTimer class.
+
+        Returns:
+            str: A string representation of the RequestTimer class.
+        """
+        return f"RequestTimer(url_endpoint={self.url_endpoint!r})"
+    # Private Methods
+    def __record(self, name: str) -> None:
+        """
+        Record connection events reported by httpcore.
+        """
+        if name.endswith('connect_tcp.started'):
+            self.connect_started = time.perf_counter()
+        elif name.endswith(('connect_tcp.complete', 'start_tls.complete')) and self.connect_started is not None:
+            self.timings['connect'] = time.perf_counter() - self.connect_started
+    def __trace(self, name: str, _info: Dict[str, Any]) -> None:
+        """
+        Synchronous httpcore trace callback.
+        """
+        self.__record(name)
+    async def __trace_async(self, name: str, _info: Dict[str, Any]) -> None:
+        """
+        Asynchronous httpcore trace callback.
+        """
+        self.__record(name)
+    # Public Methods
+    def mark(self, phase: str) -> float:
+        """
+        Attribute the time since the previous mark to a phase.
+
+        Args:
+            phase (str): The phase name.
+
+        Returns:
+            float: The seconds attributed to the phase.
+        """
+        now = time.perf_counter()
+        elapsed = now - self.checkpoint
+        self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+        self.checkpoint = now
+        return elapsed
+    def throttled(self) -> None:
+        """
+        Close the throttle phase and emit throttle_wait.
+        """
+        self.hooks.emit('throttle_wait', self.url_endpoint, self.mark('throttle'))
+    def finish(self, response: httpx.Response, raw: bool=False) -> Any:
+        """
+        Close the transfer phase, decode the response and emit request_end.
+
+        Args:
+            response (httpx.Response): The response to a request sent with this timer's extensions.
+            raw (bool): Whether to return the undecoded body, e.g. for a ParseExecutor. Defaults to False.
+
+        Returns:
+            Dict[Any, Any] | bytes | None: The decoded JSON body, the raw body if raw, or None for a 304 Not Modified response.
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status; request_end is emitted first.
+        """
+        self.mark('transfer')
+        self.timings['transfer'] = max(0.0, self.timings['transfer'] - self.timings['connect'])
+        try:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            if raw:
+                return response.content
+            response_json = response.json()
+            self.mark('decode')
+            return response_json
+        finally:
+            self.hooks.emit('request_end', self.url_endpoint, time.perf_counter() - self.started, status_code=response.status_code, bytes=len(response.content), **self.timings)
+
+class InstrumentedCache(FIFOCache):
+    """
+    A FIFOCache that emits cache_evict when it evicts an entry to make room for a new one.
+    """
+    def __init__(self, maxsize: int, hooks: Hooks) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): The maximum number of cached responses.
+            hooks (Hooks): The registry to emit on.
+        """
+        super().__init__(maxsize=maxsize)
+        self.hooks: Hooks = hooks
+    def popitem(self) -> Any:
+        """
+        Evict the oldest entry and emit cache_evict.
+
+        Returns:
+            Tuple[Any, Any]: The evicted key and value.
+        """
+        key, value = super().popitem()
+        self.hooks.emit('cache_evict', key[0] if isinstance(key, tuple) and key else None)
+        return key, value
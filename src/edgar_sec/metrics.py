@@ -0,0 +1,341 @@
+# filepath: /src/edgar_sec/metrics.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module aggregates instrumentation events into operational metrics and exports them.
+"""
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import statistics
+import threading
+from edgar_sec.instrumentation import Hooks, RequestEvent
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class Metrics:
+    """Aggregate the events emitted by EdgarAPI and AsyncAPI into counters and latency histograms.
+
+    Counters cover requests, errors, bytes received, cache hits, misses and evictions, retries,
+    429 responses and the time spent waiting on the rate limiter. Latencies are kept per endpoint
+    (submissions, companyconcept, companyfacts, frames) and parse times per object type, both as
+    cumulative histogram buckets and as a bounded window of recent observations for percentiles.
+    """
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    counter_names = ('requests', 'errors', 'bytes_received', 'cache_hits', 'cache_misses', 'cache_evictions', 'retries', 'rate_limited', 'throttle_seconds')
+    def __init__(self, hooks: Optional[Hooks]=None, window: int=1024) -> None:
+        """
+        Initialize the metrics registry.
+
+        Args:
+            hooks (Hooks, optional): A hook registry to attach to immediately.
+            window (int): The number of recent observations kept per endpoint and object type for percentiles. Defaults to 1024.
+
+        Raises:
+            ValueError: If window is not a positive integer.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(metrics=True)
+            >>> api.get_company_facts(ticker="AAPL")
+            >>> api.stats()["latency"]["companyfacts"]["p50"]
+        """
+        if not isinstance(window, int) or window < 1:
+            raise ValueError("window must be a positive integer.")
+        self.window: int = window
+        self.hooks: Optional[Hooks] = None
+        self.lock: threading.Lock = threading.Lock()
+        self.counters: Dict[str, float] = dict.fromkeys(self.counter_names, 0)
+        self.latencies: Dict[str, Tuple[deque, List[int], List[float]]] = {}
+        self.parse_times: Dict[str, Tuple[deque, List[int], List[float]]] = {}
+        if hooks is not None:
+            self.attach(hooks)
+    def __repr__(self) -> str:
+        """
+        String representation of the Metrics class.
+
+        Returns:
+            str: A string representation of the Metrics class.
+        """
+        return f"Metrics(requests={self.counters['requests']}, endpoints={sorted(self.latencies)})"
+    def __len__(self) -> int:
+        """
+        Get the number of requests observed.
+
+        Returns:
+            int: The number of completed requests.
+        """
+        return int(self.counters['requests'])
+    # Private Methods
+    def __observe(self, histograms: Dict[str, Tuple[deque, List[int], List[float]]], key: str, value: float) -> None:
+        """
+        Record one observation into the histogram and percentile window of a key.
+        """
+        if key not in histograms:
+            histograms[key] = (deque(maxlen=self.window), [0] * (len(self.buckets) + 1), [0.0])
+        window, counts, total = histograms[key]
+        window.append(value)
+        counts[next((index for index, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))] += 1
+        total[0] += value
+    @staticmethod
+    def __summary(histogram: Tuple[deque, List[int], List[float]]) -> Dict[str, float]:
+        """
+        Summarize a histogram into its count, sum and p50/p95/p99/max of the recent window.
+        """
+        window, counts, total = histogram
+        values = sorted(window)
+        if len(values) > 1:
+            quantiles = statistics.quantiles(values, n=100, method='inclusive')
+            p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+        else:
+            p50 = p95 = p99 = values[0] if values else 0.0
+        return {'count': sum(counts), 'sum': total[0], 'p50': p50, 'p95': p95, 'p99': p99, 'max': values[-1] if values else 0.0}
+    # Public Methods
+    @staticmethod
+    def endpoint(url_endpoint: Optional[str]) -> str:
+        """
+        Get the endpoint family of a URL endpoint.
+
+        Args:
+            url_endpoint (str, optional): An EDGAR URL endpoint, e.g. '/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json'.
+
+        Returns:
+            str: 'submissions', 'companyconcept', 'companyfacts', 'frames', 'files' for www.sec.gov files such as company_tickers.json, or 'other'.
+        """
+        parts = (url_endpoint or '').strip('/').split('/')
+        if parts[0] in ('submissions', 'files'):
+            return parts[0]
+        if len(parts) > 2 and parts[:2] == ['api', 'xbrl']:
+            return parts[2]
+        return 'other'
+    def attach(self, hooks: Hooks) -> None:
+        """
+        Register the metrics handler for every event on a hook registry.
+
+        Args:
+            hooks (Hooks): The registry to observe.
+
+        Raises:
+            ValueError: If the metrics are already attached to a registry.
+        """
+        if self.hooks is not None:
+            raise ValueError("Metrics are already attached to a Hooks registry.")
+        for event in Hooks.events:
+            hooks.register(event, self.handle)
+        self.hooks = hooks
+    def detach(self) -> None:
+        """
+        Remove the metrics handler from the registry it is attached to.
+        """
+        if self.hooks is None:
+            return
+        for event in Hooks.events:
+            self.hooks.unregister(event, self.handle)
+        self.hooks = None
+    def handle(self, event: RequestEvent) -> None:
+        """
+        Update the metrics from one event.
+
+        Args:
+            event (RequestEvent): The event emitted by EdgarAPI or AsyncAPI.
+        """
+        with self.lock:
+            if event.event == 'request_end':
+                self.counters['requests'] += 1
+                self.counters['bytes_received'] += event.details.get('bytes', 0)
+                status_code = event.details.get('status_code', 200)
+                if status_code == 429:
+                    self.counters['rate_limited'] += 1
+                if status_code >= 400:
+                    self.counters['errors'] += 1
+                self.__observe(self.latencies, self.endpoint(event.url_endpoint), event.elapsed - event.details.get('throttle', 0.0))
+            elif event.event == 'throttle_wait':
+                self.counters['throttle_seconds'] += event.elapsed
+            elif event.event == 'retry':
+                self.counters['retries'] += 1
+            elif event.event == 'cache_hit':
+                self.counters['cache_hits'] += 1
+            elif event.event == 'cache_miss':
+                self.counters['cache_misses'] += 1
+            elif event.event == 'cache_evict':
+                self.counters['cache_evictions'] += 1
+            elif event.event == 'parse_end':
+                self.__observe(self.parse_times, event.details['object_type'], event.elapsed)
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a point-in-time copy of every metric.
+
+        Returns:
+            Dict[str, Any]: The counters, plus 'latency' keyed by endpoint and 'parse' keyed by object type, each holding count, sum, p50, p95, p99 and max in seconds. Latencies exclude the rate limiter wait.
+        """
+        with self.lock:
+            snapshot: Dict[str, Any] = dict(self.counters)
+            snapshot['latency'] = {endpoint: self.__summary(histogram) for endpoint, histogram in self.latencies.items()}
+            snapshot['parse'] = {object_type: self.__summary(histogram) for object_type, histogram in self.parse_times.items()}
+            return snapshot
+    def histograms(self) -> Dict[str, Dict[str, Tuple[List[int], float]]]:
+        """
+        Get the cumulative histogram buckets, as consumed by exporters.
+
+        Returns:
+            Dict[str, Dict[str, Tuple[List[int], float]]]: For 'latency' and 'parse', the per-bucket counts (aligned with Metrics.buckets plus an overflow bucket) and the sum of each key.
+        """
+        with self.lock:
+            return {
+                'latency': {key: (list(counts), total[0]) for key, (_, counts, total) in self.latencies.items()},
+                'parse': {key: (list(counts), total[0]) for key, (_, counts, total) in self.parse_times.items()}
+            }
+    def reset(self) -> None:
+        """
+        Zero every counter and histogram.
+        """
+        with self.lock:
+            self.counters = dict.fromkeys(self.counter_names, 0)
+            self.latencies = {}
+            self.parse_times = {}
+
+class PrometheusExporter:
+    """Expose a Metrics registry to Prometheus as a custom collector.
+
+    Requires the prometheus extra (pip install edgar-sec[prometheus]). Counters are exported
+    as edgar_sec_<name>_total and the histograms as edgar_sec_request_latency_seconds
+    (labelled by endpoint) and edgar_sec_parse_seconds (labelled by object_type).
+    """
+    def __init__(self, metrics: Metrics, registry: Any=None) -> None:
+        """
+        Register the collector.
+
+        Args:
+            metrics (Metrics): The metrics to expose.
+            registry (prometheus_client.CollectorRegistry, optional): The registry to register with. Defaults to the global REGISTRY.
+
+        Raises:
+            ImportError: If prometheus-client is not installed.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> from prometheus_client import start_http_server
+            >>> api = ed.EdgarAPI(metrics=True)
+            >>> ed.metrics.PrometheusExporter(api.metrics)
+            >>> start_http_server(8000)
+        """
+        try:
+            from prometheus_client import REGISTRY
+        except ImportError as error:
+            raise ImportError("PrometheusExporter requires prometheus-client: pip install edgar-sec[prometheus]") from error
+        self.metrics: Metrics = metrics
+        self.registry: Any = registry if registry is not None else REGISTRY
+        self.registry.register(self)
+    def __repr__(self) -> str:
+        """
+        String representation of the PrometheusExporter class.
+
+        Returns:
+            str: A string representation of the PrometheusExporter class.
+        """
+        return f"PrometheusExporter(metrics={self.metrics!r})"
+    def collect(self) -> Iterator[Any]:
+        """
+        Yield the current metric families; called by prometheus_client on every scrape.
+
+        Returns:
+            Iterator[Metric]: A counter family per counter and a histogram family per histogram.
+        """
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+        snapshot = self.metrics.snapshot()
+        for name in Metrics.counter_names:
+            yield CounterMetricFamily(f"edgar_sec_{name}", f"EDGAR client {name.replace('_', ' ')}.", value=snapshot[name])
+        histograms = self.metrics.histograms()
+        for kind, metric_name, label in (('latency', 'edgar_sec_request_latency_seconds', 'endpoint'), ('parse', 'edgar_sec_parse_seconds', 'object_type')):
+            family = HistogramMetricFamily(metric_name, f"EDGAR client {kind} in seconds.", labels=[label])
+            for key, (counts, total) in histograms[kind].items():
+                cumulative, buckets = 0, []
+                for bound, count in zip([*map(str, Metrics.buckets), '+Inf'], counts):
+                    cumulative += count
+                    buckets.append((bound, cumulative))
+                family.add_metric([key], buckets, total)
+            yield family
+
+class OpenTelemetryExporter:
+    """Record EdgarAPI events as OpenTelemetry instruments.
+
+    Requires the opentelemetry extra (pip install edgar-sec[opentelemetry]). The exporter
+    registers its own handlers on the hook registry the metrics are attached to, adding to
+    counters as events arrive and recording latencies and parse times into histograms, so the
+    configured MeterProvider aggregates and exports them.
+    """
+    def __init__(self, metrics: Metrics, meter: Any=None) -> None:
+        """
+        Create the instruments and start recording.
+
+        Args:
+            metrics (Metrics): Attached metrics whose hook registry is observed.
+            meter (opentelemetry.metrics.Meter, optional): The meter to create instruments on. Defaults to the global meter named 'edgar_sec'.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+            ValueError: If the metrics are not attached to a hook registry.
+        """
+        try:
+            from opentelemetry import metrics as otel_metrics
+        except ImportError as error:
+            raise ImportError("OpenTelemetryExporter requires opentelemetry-api: pip install edgar-sec[opentelemetry]") from error
+        if metrics.hooks is None:
+            raise ValueError("Metrics must be attached to a Hooks registry.")
+        self.metrics: Metrics = metrics
+        self.hooks: Hooks = metrics.hooks
+        self.meter: Any = meter if meter is not None else otel_metrics.get_meter('edgar_sec', __version__)
+        self.counters: Dict[str, Any] = {name: self.meter.create_counter(f"edgar_sec.{name}") for name in Metrics.counter_names}
+        self.latency: Any = self.meter.create_histogram('edgar_sec.request.latency', unit='s')
+        self.parse: Any = self.meter.create_histogram('edgar_sec.parse.duration', unit='s')
+        for event in Hooks.events:
+            self.hooks.register(event, self.handle)
+    def __repr__(self) -> str:
+        """
+        String representation of the OpenTelemetryExporter class.
+
+        Returns:
+            str: A string representation of the OpenTelemetryExporter class.
+        """
+        return f"OpenTelemetryExporter(metrics={self.metrics!r})"
+    def handle(self, event: RequestEvent) -> None:
+        """
+        Record one event into the OpenTelemetry instruments.
+
+        Args:
+            event (RequestEvent): The event emitted by EdgarAPI or AsyncAPI.
+        """
+        counters = {'retry': 'retries', 'cache_hit': 'cache_hits', 'cache_miss': 'cache_misses', 'cache_evict': 'cache_evictions'}
+        if event.event == 'request_end':
+            endpoint = {'endpoint': Metrics.endpoint(event.url_endpoint)}
+            status_code = event.details.get('status_code', 200)
+            self.counters['requests'].add(1, endpoint)
+            self.counters['bytes_received'].add(event.details.get('bytes', 0), endpoint)
+            if status_code == 429:
+                self.counters['rate_limited'].add(1, endpoint)
+            if status_code >= 400:
+                self.counters['errors'].add(1, endpoint)
+            self.latency.record(event.elapsed - event.details.get('throttle', 0.0), endpoint)
+        elif event.event == 'throttle_wait':
+            self.counters['throttle_seconds'].add(event.elapsed)
+        elif event.event == 'parse_end':
+            self.parse.record(event.elapsed, {'object_type': event.details['object_type']})
+        elif event.event in counters:
+            self.counters[counters[event.event]].add(1)
+    def close(self) -> None:
+        """
+        Stop recording by removing the exporter's handlers.
+        """
+        for event in Hooks.events:
+            self.hooks.unregister(event, self.handle)
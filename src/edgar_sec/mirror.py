@@ -0,0 +1,499 @@
+# filepath: /src/edgar_sec/mirror.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines a local SQLite mirror of EDGAR data.
+"""
+
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import sqlite3
+import threading
+import time
+from edgar_sec.objects import (
+    Address,
+    FormerName,
+    Filing,
+    File,
+    SubmissionHistory,
+    UnitDisclosure,
+    CompanyConcept,
+    TaxonomyDisclosures,
+    TaxonomyFacts,
+    CompanyFacts,
+    FrameDisclosure,
+    Frame,
+)
+from edgar_sec.stores import FactCatalog
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_log (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS entities (
+    cik TEXT PRIMARY KEY,
+    entity_name TEXT
+);
+CREATE TABLE IF NOT EXISTS concepts (
+    cik TEXT NOT NULL,
+    taxonomy TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    label TEXT,
+    description TEXT,
+    PRIMARY KEY (cik, taxonomy, tag)
+);
+CREATE TABLE IF NOT EXISTS facts (
+    cik TEXT NOT NULL,
+    taxonomy TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    start TEXT,
+    end TEXT,
+    val REAL,
+    accn TEXT,
+    fy,
+    fp TEXT,
+    form TEXT,
+    filed TEXT,
+    frame TEXT
+);
+CREATE INDEX IF NOT EXISTS facts_cik ON facts (cik, taxonomy, tag);
+CREATE INDEX IF NOT EXISTS facts_tag ON facts (taxonomy, tag, unit);
+CREATE INDEX IF NOT EXISTS facts_period ON facts (end, start);
+CREATE INDEX IF NOT EXISTS facts_frame ON facts (frame);
+CREATE INDEX IF NOT EXISTS facts_form ON facts (form);
+CREATE TABLE IF NOT EXISTS frames (
+    taxonomy TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    period TEXT NOT NULL,
+    label TEXT,
+    description TEXT,
+    pts INTEGER,
+    PRIMARY KEY (taxonomy, tag, unit, period)
+);
+CREATE TABLE IF NOT EXISTS frame_disclosures (
+    taxonomy TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    period TEXT NOT NULL,
+    cik TEXT NOT NULL,
+    entity_name TEXT,
+    accn TEXT,
+    loc TEXT,
+    end TEXT,
+    val REAL
+);
+CREATE INDEX IF NOT EXISTS frame_disclosures_frame ON frame_disclosures (taxonomy, tag, unit, period);
+CREATE INDEX IF NOT EXISTS frame_disclosures_cik ON frame_disclosures (cik);
+CREATE TABLE IF NOT EXISTS submissions (
+    cik TEXT PRIMARY KEY,
+    name TEXT,
+    entity_type TEXT,
+    sic TEXT,
+    category TEXT,
+    fiscal_year_end TEXT,
+    state_of_incorporation TEXT,
+    details TEXT
+);
+CREATE TABLE IF NOT EXISTS filings (
+    cik TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    accession_number TEXT NOT NULL,
+    filing_date TEXT,
+    report_date TEXT,
+    acceptance_date_time TEXT,
+    act TEXT,
+    form TEXT,
+    file_number TEXT,
+    film_number TEXT,
+    items TEXT,
+    core_type TEXT,
+    size INTEGER,
+    is_xbrl INTEGER,
+    is_inline_xbrl INTEGER,
+    primary_document TEXT,
+    primary_doc_description TEXT,
+    PRIMARY KEY (cik, position)
+);
+CREATE INDEX IF NOT EXISTS filings_form ON filings (form, filing_date);
+CREATE INDEX IF NOT EXISTS filings_accession_number ON filings (accession_number);
+"""
+
+FILING_COLUMNS = (
+    'accession_number', 'filing_date', 'report_date', 'acceptance_date_time', 'act', 'form', 'file_number',
+    'film_number', 'items', 'core_type', 'size', 'is_xbrl', 'is_inline_xbrl', 'primary_document', 'primary_doc_description'
+)
+FACTS_BY_COMPANY = "SELECT taxonomy, tag, unit, start, end, val, accn, fy, fp, form, filed, frame FROM facts WHERE cik = ? ORDER BY rowid"
+FACTS_BY_CONCEPT = "SELECT taxonomy, tag, unit, start, end, val, accn, fy, fp, form, filed, frame FROM facts WHERE cik = ? AND taxonomy = ? AND tag = ? ORDER BY rowid"
+FILINGS_INSERT = (
+    "INSERT INTO filings (cik, position, accession_number, filing_date, report_date, acceptance_date_time, act, form, file_number, "
+    "film_number, items, core_type, size, is_xbrl, is_inline_xbrl, primary_document, primary_doc_description) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+FILINGS_SELECT = (
+    "SELECT accession_number, filing_date, report_date, acceptance_date_time, act, form, file_number, film_number, items, "
+    "core_type, size, is_xbrl, is_inline_xbrl, primary_document, primary_doc_description FROM filings WHERE cik = ? ORDER BY position"
+)
+SUBMISSION_DETAILS = (
+    'sic_description', 'owner_org', 'insider_transaction_for_owner_exists', 'insider_transaction_for_issuer_exists',
+    'tickers', 'exchanges', 'ein', 'lei', 'description', 'website', 'investor_website', 'state_of_incorporation_description',
+    'addresses', 'phone', 'flags', 'former_names', 'files'
+)
+
+class EdgarMirror:
+    """A local SQLite mirror of EDGAR submissions, XBRL facts, concepts and frames.
+
+    Parsed objects are persisted into indexed tables (by CIK, tag, period and form) so
+    cross-sectional questions can be answered with local SQL, and an EdgarAPI created
+    with a mirror answers from it before touching the network.
+    """
+    def __init__(self, path: str=':memory:', max_age: Optional[float]=None) -> None:
+        """
+        Initialize the EdgarMirror, creating the database schema if needed.
+
+        Args:
+            path (str): Path of the SQLite database file. Defaults to an in-memory database.
+            max_age (float, optional): Age in seconds after which mirrored data is considered stale and fetched again. If omitted, mirrored data never expires.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> mirror = ed.EdgarMirror("edgar.db", max_age=86400)
+            >>> api = ed.EdgarAPI(mirror=mirror)
+        """
+        self.path: str = path
+        self.max_age: Optional[float] = max_age
+        self.lock: threading.Lock = threading.Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+    def __repr__(self) -> str:
+        """
+        String representation of the EdgarMirror class.
+
+        Returns:
+            str: A string representation of the EdgarMirror class.
+        """
+        return f"EdgarMirror(path={self.path!r}, max_age={self.max_age})"
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the configuration of the EdgarMirror for pickling.
+
+        Returns:
+            Dict[str, Any]: The database path and max_age; the connection is reopened on unpickling.
+        """
+        return {'path': self.path, 'max_age': self.max_age}
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Reopen an unpickled EdgarMirror's database.
+
+        Args:
+            state (Dict[str, Any]): The output of __getstate__.
+
+        Note:
+            A file-backed mirror is shared by every process that unpickles it; an in-memory mirror is unpickled empty.
+        """
+        type(self).__init__(self, path=state['path'], max_age=state['max_age'])
+    # Private Methods
+    def __touch(self, kind: str, key: str) -> None:
+        """
+        Record that an object was fetched now. Must be called inside a transaction.
+        """
+        self.connection.execute("INSERT OR REPLACE INTO sync_log (kind, key, fetched_at) VALUES (?, ?, ?)", (kind, key, time.time()))
+    def __insert_facts(self, cik: str, taxonomy: str, tag: str, units: List[UnitDisclosure]) -> None:
+        """
+        Insert the disclosures of a single concept. Must be called inside a transaction.
+        """
+        self.connection.executemany(
+            "INSERT INTO facts (cik, taxonomy, tag, unit, start, end, val, accn, fy, fp, form, filed, frame) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(cik, taxonomy, tag, unit.units, unit.start, unit.end, unit.val, unit.accn, unit.fy, unit.fp, unit.form, unit.filed, unit.frame) for unit in units]
+        )
+    def __select_units(self, query: str, params: Sequence[Any]) -> Dict[Tuple[str, str], List[UnitDisclosure]]:
+        """
+        Select disclosures grouped by (taxonomy, tag).
+        """
+        grouped: Dict[Tuple[str, str], List[UnitDisclosure]] = {}
+        rows = self.connection.execute(query, params).fetchall()
+        for taxonomy, tag, unit, start, end, val, accn, fy, fp, form, filed, frame in rows:
+            grouped.setdefault((taxonomy, tag), []).append(
+                UnitDisclosure(units=unit, end=end, val=val, accn=accn, fy=fy, fp=fp, form=form, filed=filed, frame=frame, start=start)
+            )
+        return grouped
+    # Public Methods
+    def is_fresh(self, kind: str, key: str) -> bool:
+        """
+        Check if an object is mirrored and not older than max_age.
+
+        Args:
+            kind (str): The kind of object ('submissions', 'companyconcept', 'companyfacts' or 'frames').
+            key (str): The object key, as used by the store methods.
+
+        Returns:
+            bool: True if the object can be served from the mirror, False otherwise.
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT fetched_at FROM sync_log WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+        if row is None:
+            return False
+        return self.max_age is None or time.time() - row[0] <= self.max_age
+    def query(self, sql: str, params: Sequence[Any]=()) -> List[Tuple[Any, ...]]:
+        """
+        Run a read query against the mirror.
+
+        Args:
+            sql (str): The SQL statement to run.
+            params (Sequence[Any]): Parameters bound to the statement.
+
+        Returns:
+            List[Tuple[Any, ...]]: The resulting rows.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> mirror = ed.EdgarMirror("edgar.db")
+            >>> rows = mirror.query("SELECT cik, val FROM facts WHERE tag = ? AND frame = ?", ("Assets", "CY2023Q4I"))
+        """
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+    def store_submissions(self, submission_history: SubmissionHistory) -> None:
+        """
+        Persist a submission history, replacing any previously mirrored copy.
+
+        Args:
+            submission_history (SubmissionHistory): The submission history to persist.
+        """
+        cik = submission_history.cik.zfill(10)
+        details = {field: getattr(submission_history, field) for field in SUBMISSION_DETAILS}
+        details['addresses'] = [asdict(address) for address in submission_history.addresses]
+        details['former_names'] = [asdict(former_name) for former_name in submission_history.former_names]
+        details['files'] = [asdict(file) for file in submission_history.files]
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO submissions (cik, name, entity_type, sic, category, fiscal_year_end, state_of_incorporation, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cik, submission_history.name, submission_history.entity_type, submission_history.sic, submission_history.category,
+                 submission_history.fiscal_year_end, submission_history.state_of_incorporation, json.dumps(details))
+            )
+            self.connection.execute("DELETE FROM filings WHERE cik = ?", (cik,))
+            self.connection.executemany(
+                FILINGS_INSERT,
+                [(cik, position, *(json.dumps(filing.items) if column == 'items' else getattr(filing, column) for column in FILING_COLUMNS))
+                 for position, filing in enumerate(submission_history.filings)]
+            )
+            self.__touch('submissions', cik)
+    def store_company_concept(self, company_concept: CompanyConcept) -> None:
+        """
+        Persist a company concept, replacing previously mirrored disclosures of the same concept.
+
+        Args:
+            company_concept (CompanyConcept): The company concept to persist.
+        """
+        cik = company_concept.cik.zfill(10)
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO entities (cik, entity_name) VALUES (?, ?)", (cik, company_concept.entity_name))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO concepts (cik, taxonomy, tag, label, description) VALUES (?, ?, ?, ?, ?)",
+                (cik, company_concept.taxonomy, company_concept.tag, company_concept.label, company_concept.description)
+            )
+            self.connection.execute("DELETE FROM facts WHERE cik = ? AND taxonomy = ? AND tag = ?", (cik, company_concept.taxonomy, company_concept.tag))
+            self.__insert_facts(cik, company_concept.taxonomy, company_concept.tag, company_concept.units)
+            self.__touch('companyconcept', f"{cik}/{company_concept.taxonomy}/{company_concept.tag}")
+    def store_company_facts(self, company_facts: CompanyFacts) -> None:
+        """
+        Persist all facts of a company, replacing any previously mirrored facts for it.
+
+        Args:
+            company_facts (CompanyFacts): The company facts to persist.
+        """
+        cik = company_facts.cik.zfill(10)
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO entities (cik, entity_name) VALUES (?, ?)", (cik, company_facts.entity_name))
+            self.connection.execute("DELETE FROM concepts WHERE cik = ?", (cik,))
+            self.connection.execute("DELETE FROM facts WHERE cik = ?", (cik,))
+            for taxonomy_facts in company_facts.facts:
+                self.connection.executemany(
+                    "INSERT INTO concepts (cik, taxonomy, tag, label, description) VALUES (?, ?, ?, ?, ?)",
+                    [(cik, taxonomy_facts.taxonomy, disclosure.name, disclosure.label, disclosure.description) for disclosure in taxonomy_facts.disclosures]
+                )
+                for disclosure in taxonomy_facts.disclosures:
+                    self.__insert_facts(cik, taxonomy_facts.taxonomy, disclosure.name, disclosure.units)
+            self.__touch('companyfacts', cik)
+    def store_frame(self, frame: Frame, unit: Optional[str]=None, period: Optional[str]=None) -> None:
+        """
+        Persist a frame, replacing any previously mirrored copy of the same frame.
+
+        Args:
+            frame (Frame): The frame to persist.
+            unit (str, optional): The unit the frame was requested with; defaults to frame.uom.
+            period (str, optional): The period the frame was requested for; defaults to frame.ccp.
+
+        Note:
+            Frames are keyed by the requested unit and period, with units in their frames URL form ('USD-per-shares'), so a later get_frame with the same arguments finds the frame whatever the response spells them as.
+        """
+        key = (frame.taxonomy, frame.tag, FactCatalog.normalize_unit(unit or frame.uom), period or frame.ccp)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO frames (taxonomy, tag, unit, period, label, description, pts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, frame.label, frame.description, frame.pts)
+            )
+            self.connection.execute("DELETE FROM frame_disclosures WHERE taxonomy = ? AND tag = ? AND unit = ? AND period = ?", key)
+            self.connection.executemany(
+                "INSERT INTO frame_disclosures (taxonomy, tag, unit, period, cik, entity_name, accn, loc, end, val) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*key, disclosure.cik.zfill(10), disclosure.entity_name, disclosure.accn, disclosure.loc, disclosure.end, disclosure.val) for disclosure in frame.disclosures]
+            )
+            self.__touch('frames', '/'.join(key))
+    def get_submissions(self, central_index_key: str) -> Optional[SubmissionHistory]:
+        """
+        Get a mirrored submission history.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+
+        Returns:
+            SubmissionHistory | None: The submission history, or None if it is not mirrored or is stale.
+        """
+        if not self.is_fresh('submissions', central_index_key):
+            return None
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT name, entity_type, sic, category, fiscal_year_end, state_of_incorporation, details FROM submissions WHERE cik = ?", (central_index_key,)
+            ).fetchone()
+            filings = self.connection.execute(FILINGS_SELECT, (central_index_key,)).fetchall()
+        name, entity_type, sic, category, fiscal_year_end, state_of_incorporation, details = row
+        details = json.loads(details)
+        return SubmissionHistory(
+            cik=central_index_key,
+            entity_type=entity_type,
+            sic=sic,
+            name=name,
+            category=category,
+            fiscal_year_end=fiscal_year_end,
+            state_of_incorporation=state_of_incorporation,
+            **{field: details[field] for field in SUBMISSION_DETAILS if field not in ('addresses', 'former_names', 'files')},
+            addresses=[Address(**address) for address in details['addresses']],
+            former_names=[FormerName(**former_name) for former_name in details['former_names']],
+            files=[File(**file) for file in details['files']],
+            filings=[Filing(**{column: json.loads(value) if column == 'items' else value for column, value in zip(FILING_COLUMNS, filing)}) for filing in filings],
+        )
+    def get_company_concept(self, central_index_key: str, taxonomy: str, tag: str) -> Optional[CompanyConcept]:
+        """
+        Get a mirrored company concept.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+            taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap').
+            tag (str): The concept tag (e.g. 'AccountsPayableCurrent').
+
+        Returns:
+            CompanyConcept | None: The company concept, or None if it is not mirrored or is stale. Concepts are also served from mirrored company facts.
+        """
+        if not (self.is_fresh('companyconcept', f"{central_index_key}/{taxonomy}/{tag}") or self.is_fresh('companyfacts', central_index_key)):
+            return None
+        with self.lock:
+            concept = self.connection.execute(
+                "SELECT c.label, c.description, e.entity_name FROM concepts c JOIN entities e ON e.cik = c.cik WHERE c.cik = ? AND c.taxonomy = ? AND c.tag = ?",
+                (central_index_key, taxonomy, tag)
+            ).fetchone()
+            if concept is None:
+                return None
+            units = self.__select_units(FACTS_BY_CONCEPT, (central_index_key, taxonomy, tag))
+        label, description, entity_name = concept
+        return CompanyConcept(
+            cik=str(int(central_index_key)),
+            taxonomy=taxonomy,
+            tag=tag,
+            label=label,
+            description=description,
+            entity_name=entity_name,
+            units=units.get((taxonomy, tag), [])
+        )
+    def get_company_facts(self, central_index_key: str) -> Optional[CompanyFacts]:
+        """
+        Get mirrored company facts.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+
+        Returns:
+            CompanyFacts | None: The company facts, or None if they are not mirrored or are stale.
+        """
+        if not self.is_fresh('companyfacts', central_index_key):
+            return None
+        with self.lock:
+            entity_name = self.connection.execute("SELECT entity_name FROM entities WHERE cik = ?", (central_index_key,)).fetchone()[0]
+            concepts = self.connection.execute("SELECT taxonomy, tag, label, description FROM concepts WHERE cik = ? ORDER BY rowid", (central_index_key,)).fetchall()
+            units = self.__select_units(FACTS_BY_COMPANY, (central_index_key,))
+        taxonomies: Dict[str, List[TaxonomyDisclosures]] = {}
+        for taxonomy, tag, label, description in concepts:
+            taxonomies.setdefault(taxonomy, []).append(TaxonomyDisclosures(name=tag, label=label, description=description, units=units.get((taxonomy, tag), [])))
+        return CompanyFacts(
+            cik=str(int(central_index_key)),
+            entity_name=entity_name,
+            facts=[TaxonomyFacts(taxonomy=taxonomy, disclosures=disclosures) for taxonomy, disclosures in taxonomies.items()]
+        )
+    def get_frame(self, taxonomy: str, tag: str, unit: str, period: str) -> Optional[Frame]:
+        """
+        Get a mirrored frame.
+
+        Args:
+            taxonomy (str): A non-custom taxonomy identifier (e.g. 'us-gaap').
+            tag (str): The concept tag (e.g. 'AccountsPayableCurrent').
+            unit (str): The unit of measure (e.g. 'USD', 'USD-per-shares' or 'USD/shares').
+            period (str): The calendar period in 'CY####', 'CY####Q#' or 'CY####Q#I' format.
+
+        Returns:
+            Frame | None: The frame, or None if it is not mirrored or is stale.
+        """
+        unit = FactCatalog.normalize_unit(unit)
+        key = (taxonomy, tag, unit, period)
+        if not self.is_fresh('frames', '/'.join(key)):
+            return None
+        with self.lock:
+            label, description, pts = self.connection.execute(
+                "SELECT label, description, pts FROM frames WHERE taxonomy = ? AND tag = ? AND unit = ? AND period = ?", key
+            ).fetchone()
+            disclosures = self.connection.execute(
+                "SELECT accn, cik, entity_name, loc, end, val FROM frame_disclosures WHERE taxonomy = ? AND tag = ? AND unit = ? AND period = ? ORDER BY rowid", key
+            ).fetchall()
+        return Frame(
+            taxonomy=taxonomy,
+            tag=tag,
+            ccp=period,
+            uom=unit,
+            label=label,
+            description=description,
+            pts=pts,
+            disclosures=[FrameDisclosure(accn=accn, cik=str(int(cik)), entity_name=entity_name, loc=loc, end=end, val=val) for accn, cik, entity_name, loc, end, val in disclosures]
+        )
+    def reopen(self) -> None:
+        """
+        Give the mirror a new lock and database connection in a forked child process, leaving the parent's connection untouched, since SQLite connections must not be carried across a fork.
+
+        Note:
+            A file-backed mirror is reopened by path and keeps sharing its data with the parent; an in-memory mirror has no file to reopen and keeps the copy inherited from the parent.
+        """
+        self.lock = threading.Lock()
+        if self.path != ':memory:':
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        with self.lock:
+            self.connection.close()
@@ -18,9 +18,9 @@
 This module defines data classes for the EDGAR API responses.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import asyncio
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
 
 @dataclass
@@ -280,6 +280,8 @@ class UnitDisclosure:
     filed: str
     frame: str
     start: Optional[str]
+    accns: Optional[List[str]] = None
+    last_filed: Optional[str] = None
 
     @classmethod
     def to_object(cls, data: Dict, units: str) -> 'UnitDisclosure':
@@ -304,6 +306,35 @@ class UnitDisclosure:
         Asynchronously parses a dictionary and returns a UnitDisclosure object.
         """
         return await asyncio.to_thread(cls.to_object, data, units)
+    @classmethod
+    def to_object_list(cls, disclosures: List[Dict], units: str, dedup: bool=False) -> List['UnitDisclosure']:
+        """
+        Parses a list of dictionaries for one unit and returns UnitDisclosure objects, optionally collapsing facts repeated across filings.
+
+        With dedup, disclosures sharing (start, end, val) become one object carrying the first filing's accn, fy, fp, form and filed, every source accession in accns, and the last filed date in last_filed.
+        """
+        if not dedup:
+            return [cls.to_object(data, units) for data in disclosures]
+        groups: Dict[Tuple, List[Dict]] = {}
+        for data in disclosures:
+            groups.setdefault((data.get('start', ''), data.get('end', ''), data.get('val', '')), []).append(data)
+        unit_disclosures = []
+        for group in groups.values():
+            group.sort(key=lambda data: data.get('filed', ''))
+            unit_disclosure = cls.to_object(group[0], units)
+            unit_disclosure.frame = next((data['frame'] for data in group if data.get('frame')), '')
+            unit_disclosure.accns = [data.get('accn', '') for data in group]
+            unit_disclosure.last_filed = group[-1].get('filed', '')
+            unit_disclosures.append(unit_disclosure)
+        return unit_disclosures
+    @classmethod
+    async def to_object_list_async(cls, disclosures: List[Dict], units: str, dedup: bool=False) -> List['UnitDisclosure']:
+        """
+        Asynchronously parses a list of dictionaries for one unit and returns UnitDisclosure objects, optionally collapsing facts repeated across filings.
+        """
+        if not dedup:
+            return [await cls.to_object_async(data, units) for data in disclosures]
+        return await asyncio.to_thread(cls.to_object_list, disclosures, units, dedup)
 
 @dataclass
 class CompanyConcept:
@@ -319,9 +350,9 @@ class CompanyConcept:
     units: List[UnitDisclosure]
 
     @classmethod
-    def to_object(cls, response: Dict) -> 'CompanyConcept':
+    def to_object(cls, response: Dict, dedup: bool=False) -> 'CompanyConcept':
         """
-        Parses EDGAR API response and returns a single CompanyConcept.
+        Parses EDGAR API response and returns a single CompanyConcept, optionally collapsing facts repeated across filings.
         """
         return cls(
             cik=str(response.get('cik', '')),
@@ -330,12 +361,12 @@ class CompanyConcept:
             label=response.get('label', ''),
             description=response.get('description', ''),
             entity_name=response.get('entityName', ''),
-            units=[UnitDisclosure.to_object(disclosure, unit_type) for unit_type, disclosures in response.get('units', {}).items() for disclosure in disclosures]
+            units=[disclosure for unit_type, disclosures in response.get('units', {}).items() for disclosure in UnitDisclosure.to_object_list(disclosures, unit_type, dedup)]
         )
     @classmethod
-    async def to_object_async(cls, response: Dict) -> 'CompanyConcept':
+    async def to_object_async(cls, response: Dict, dedup: bool=False) -> 'CompanyConcept':
         """
-        Asynchronously parses EDGAR API response and returns a single CompanyConcept.
+        Asynchronously parses EDGAR API response and returns a single CompanyConcept, optionally collapsing facts repeated across filings.
         """
         return cls(
             cik=str(response.get('cik', '')),
@@ -344,7 +375,7 @@ class CompanyConcept:
             label=response.get('label', ''),
             description=response.get('description', ''),
             entity_name=response.get('entityName', ''),
-            units=[await UnitDisclosure.to_object_async(disclosure, unit_type) for unit_type, disclosures in response.get('units', {}).items() for disclosure in disclosures]
+            units=[disclosure for unit_type, disclosures in response.get('units', {}).items() for disclosure in await UnitDisclosure.to_object_list_async(disclosures, unit_type, dedup)]
         )
 
 @dataclass
@@ -358,26 +389,26 @@ class TaxonomyDisclosures:
     units: List[UnitDisclosure]
 
     @classmethod
-    def to_object(cls, data: Dict, name: str) -> 'TaxonomyDisclosures':
+    def to_object(cls, data: Dict, name: str, dedup: bool=False) -> 'TaxonomyDisclosures':
         """
-        Parses an entity disclosure from the API response.
+        Parses an entity disclosure from the API response, optionally collapsing facts repeated across filings.
         """
         return cls(
             name=name,
             label=data.get('label', ''),
             description=data.get('description', ''),
-            units=[UnitDisclosure.to_object(disclosure, unit_type) for unit_type, disclosures in data.get('units', {}).items() for disclosure in disclosures]
+            units=[disclosure for unit_type, disclosures in data.get('units', {}).items() for disclosure in UnitDisclosure.to_object_list(disclosures, unit_type, dedup)]
         )
     @classmethod
-    async def to_object_async(cls, data: Dict, name: str) -> 'TaxonomyDisclosures':
+    async def to_object_async(cls, data: Dict, name: str, dedup: bool=False) -> 'TaxonomyDisclosures':
         """
-        Asynchronously parses an entity disclosure from the API response.
+        Asynchronously parses an entity disclosure from the API response, optionally collapsing facts repeated across filings.
         """
         return cls(
             name=name,
             label=data.get('label', ''),
             description=data.get('description', ''),
-            units=[await UnitDisclosure.to_object_async(disclosure, unit_type) for unit_type, disclosures in data.get('units', {}).items() for disclosure in disclosures]
+            units=[disclosure for unit_type, disclosures in data.get('units', {}).items() for disclosure in await UnitDisclosure.to_object_list_async(disclosures, unit_type, dedup)]
         )
 
 @dataclass
@@ -389,22 +420,22 @@ class TaxonomyFacts:
     disclosures: List[TaxonomyDisclosures]
 
     @classmethod
-    def to_object(cls, data: Dict, taxonomy: str) -> 'TaxonomyFacts':
+    def to_object(cls, data: Dict, taxonomy: str, dedup: bool=False) -> 'TaxonomyFacts':
         """
-        Parses a taxonomy fact from the API response.
+        Parses a taxonomy fact from the API response, optionally collapsing facts repeated across filings.
         """
         return cls(
             taxonomy=taxonomy,
-            disclosures=[TaxonomyDisclosures.to_object(tag_data, tag_name) for tag_name, tag_data in data.items()]
+            disclosures=[TaxonomyDisclosures.to_object(tag_data, tag_name, dedup) for tag_name, tag_data in data.items()]
         )
     @classmethod
-    async def to_object_async(cls, data: Dict, taxonomy: str) -> 'TaxonomyFacts':
+    async def to_object_async(cls, data: Dict, taxonomy: str, dedup: bool=False) -> 'TaxonomyFacts':
         """
-        Asynchronously parses a taxonomy fact from the API response.
+        Asynchronously parses a taxonomy fact from the API response, optionally collapsing facts repeated across filings.
         """
         return cls(
             taxonomy=taxonomy,
-            disclosures=[await TaxonomyDisclosures.to_object_async(tag_data, tag_name) for tag_name, tag_data in data.items()]
+            disclosures=[await TaxonomyDisclosures.to_object_async(tag_data, tag_name, dedup) for tag_name, tag_data in data.items()]
         )
 
 @dataclass
@@ -417,24 +448,24 @@ class CompanyFacts:
     facts: List[TaxonomyFacts]
 
     @classmethod
-    def to_object(cls, response: Dict) -> 'CompanyFacts':
+    def to_object(cls, response: Dict, dedup: bool=False) -> 'CompanyFacts':
         """
-        Parses EDGAR API response and returns a single CompanyFacts.
+        Parses EDGAR API response and returns a single CompanyFacts, optionally collapsing facts repeated across filings.
         """
         return cls(
             cik=str(response.get('cik', '')),
             entity_name=response.get('entityName', ''),
-            facts=[TaxonomyFacts.to_object(taxonomy_data, taxonomy) for taxonomy, taxonomy_data in response.get('facts', {}).items()]
+            facts=[TaxonomyFacts.to_object(taxonomy_data, taxonomy, dedup) for taxonomy, taxonomy_data in response.get('facts', {}).items()]
         )
     @classmethod
-    async def to_object_async(cls, response: Dict) -> 'CompanyFacts':
+    async def to_object_async(cls, response: Dict, dedup: bool=False) -> 'CompanyFacts':
         """
-        Asynchronously parses EDGAR API response and returns a single CompanyFacts.
+        Asynchronously parses EDGAR API response and returns a single CompanyFacts, optionally collapsing facts repeated across filings.
         """
         return cls(
             cik=str(response.get('cik', '')),
             entity_name=response.get('entityName', ''),
-            facts=[await TaxonomyFacts.to_object_async(taxonomy_data, taxonomy) for taxonomy, taxonomy_data in response.get('facts', {}).items()]
+            facts=[await TaxonomyFacts.to_object_async(taxonomy_data, taxonomy, dedup) for taxonomy, taxonomy_data in response.get('facts', {}).items()]
         )
 
 @dataclass
@@ -514,6 +545,60 @@ class Frame:
             disclosures=[await FrameDisclosure.to_object_async(disclosure_data) for disclosure_data in response.get('data', [])]
         )
 
+@dataclass
+class FramePanel:
+    """
+    A class representing a CIK by period panel of a single concept assembled from multiple frames.
+
+    Periods whose frame could not be fetched, e.g. because the SEC has not published it, are listed in missing and hold no values.
+    """
+    taxonomy: str
+    tag: str
+    uom: str
+    periods: List[str]
+    ciks: List[str]
+    entity_names: Dict[str, str]
+    values: Dict[Tuple[str, str], float]
+    missing: List[str] = field(default_factory=list)
+
+    @classmethod
+    def to_object(cls, frames: List[Frame], periods: Optional[List[str]]=None) -> 'FramePanel':
+        """
+        Stacks a list of frames, one per period, into a single FramePanel object, keeping the given periods that have no frame as empty columns.
+        """
+        entity_names: Dict[str, str] = {}
+        values: Dict[Tuple[str, str], float] = {}
+        for frame in frames:
+            for disclosure in frame.disclosures:
+                entity_names[disclosure.cik] = disclosure.entity_name
+                values[(disclosure.cik, frame.ccp)] = disclosure.val
+        return cls(
+            taxonomy=frames[0].taxonomy if frames else '',
+            tag=frames[0].tag if frames else '',
+            uom=frames[0].uom if frames else '',
+            periods=[frame.ccp for frame in frames] if periods is None else list(periods),
+            ciks=sorted(entity_names, key=lambda cik: int(cik) if cik.isdigit() else 0),
+            entity_names=entity_names,
+            values=values,
+            missing=[] if periods is None else [period for period in periods if period not in {frame.ccp for frame in frames}]
+        )
+    @classmethod
+    async def to_object_async(cls, frames: List[Frame], periods: Optional[List[str]]=None) -> 'FramePanel':
+        """
+        Asynchronously stacks a list of frames, one per period, into a single FramePanel object.
+        """
+        return await asyncio.to_thread(cls.to_object, frames, periods)
+    def get(self, cik: str, period: str) -> Optional[float]:
+        """
+        Returns the value reported by a company for a period, or None if it did not report one.
+        """
+        return self.values.get((cik, period))
+    def to_dense(self) -> List[List[Optional[float]]]:
+        """
+        Returns the panel as a dense matrix with one row per CIK and one column per period.
+        """
+        return [[self.values.get((cik, period)) for period in self.periods] for cik in self.ciks]
+
 @dataclass
 class Company:
     """A class representing a company in the Edgar SEC database.
@@ -0,0 +1,317 @@
+# filepath: /src/edgar_sec/parsing.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines a process-pool executor for parsing large EDGAR payloads off the calling process.
+"""
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Dict, Generator, List, Optional, Tuple, get_args, get_origin, get_type_hints
+import asyncio
+import json
+import sys
+from edgar_sec import objects
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class ParseExecutor:
+    """Parse payloads over a size threshold in a process pool.
+
+    Parsing is pure Python and holds the GIL, so a large companyfacts payload stalls every other
+    thread and the event loop for as long as it takes. Payloads at or above the threshold are sent to
+    a worker process as the raw response bytes, decoded and parsed there, and shipped back in a
+    compact form: every object becomes a tuple of its field values and every list of objects a list
+    of such rows. Rebuilding the objects from rows in the calling process is several times cheaper
+    than parsing, and the asynchronous rebuild yields to the event loop between chunks of rows.
+
+    Smaller payloads are decoded and parsed in-process, where the round trip would cost more than it saves.
+    """
+    schemas: Dict[type, Tuple[Tuple[str, ...], Dict[int, type]]] = {}
+    def __init__(self, threshold: int=2_000_000, max_workers: Optional[int]=None, executor: Optional[Executor]=None, chunk_size: int=5000) -> None:
+        """
+        Initialize the ParseExecutor.
+
+        Args:
+            threshold (int): The response size in bytes from which parsing moves to the pool. Defaults to 2,000,000.
+            max_workers (int, optional): The number of worker processes. Defaults to the ProcessPoolExecutor default.
+            executor (Executor, optional): An executor to use instead of creating a ProcessPoolExecutor on first use; it is not shut down by shutdown().
+            chunk_size (int): The number of objects rebuilt between yields to the event loop. Defaults to 5000.
+
+        Raises:
+            ValueError: If threshold is negative or chunk_size is not a positive integer.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> from edgar_sec.parsing import ParseExecutor
+            >>> api = ed.EdgarAPI(parse_executor=ParseExecutor(threshold=1_000_000))
+            >>> facts = await api.Async.get_company_facts(ticker="AAPL")
+        """
+        if threshold < 0:
+            raise ValueError("threshold must not be negative.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.threshold: int = threshold
+        self.max_workers: Optional[int] = max_workers
+        self.chunk_size: int = chunk_size
+        self.owned: bool = executor is None
+        self.executor: Optional[Executor] = executor
+    def __repr__(self) -> str:
+        """
+        String representation of the ParseExecutor class.
+
+        Returns:
+            str: A string representation of the ParseExecutor class.
+        """
+        return f"ParseExecutor(threshold={self.threshold}, max_workers={self.max_workers})"
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the configuration of the ParseExecutor for pickling.
+
+        Returns:
+            Dict[str, Any]: The threshold, max_workers and chunk_size; an unpickled executor starts its own pool on first use.
+        """
+        return {'threshold': self.threshold, 'max_workers': self.max_workers, 'chunk_size': self.chunk_size}
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Rebuild an unpickled ParseExecutor from its configuration.
+
+        Args:
+            state (Dict[str, Any]): The output of __getstate__.
+        """
+        type(self).__init__(self, threshold=state['threshold'], max_workers=state['max_workers'], chunk_size=state['chunk_size'])
+    def __enter__(self) -> 'ParseExecutor':
+        """
+        Enter a context that shuts the pool down on exit.
+
+        Returns:
+            ParseExecutor: The executor.
+        """
+        return self
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """
+        Shut the pool down.
+        """
+        self.shutdown()
+    # Private Methods
+    def __pool(self) -> Executor:
+        """
+        Get the executor, starting the process pool on first use.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+    @staticmethod
+    def __encode(column: List[Any]) -> Tuple[Optional[List[Any]], Any]:
+        """
+        Dictionary-encode a column when at most half of its values are distinct.
+        """
+        codes: Dict[Tuple[type, Any], int] = {}
+        try:
+            indexes = [codes.setdefault((type(value), value), len(codes)) for value in column]
+        except TypeError:
+            return None, column
+        if len(codes) > len(column) // 2:
+            return None, column
+        uniques: List[Any] = [None] * len(codes)
+        for (_, value), code in codes.items():
+            uniques[code] = value
+        return uniques, array('I', indexes)
+    @staticmethod
+    def __decode(column: Tuple[Optional[List[Any]], Any], start: int, stop: int) -> List[Any]:
+        """
+        Decode the rows start to stop of an encoded column.
+        """
+        uniques, data = column
+        if uniques is None:
+            return data[start:stop]
+        return [uniques[code] for code in data[start:stop]]
+    @classmethod
+    def __depth(cls, object_type: type) -> int:
+        """
+        Get the nesting depth of a dataclass, 0 for classes without nested lists.
+        """
+        nested = cls.schema(object_type)[1]
+        return 1 + max(cls.__depth(element_type) for element_type in nested.values()) if nested else 0
+    @classmethod
+    def __rebuild(cls, packed: Tuple[str, Tuple, Dict[str, List[Tuple[Optional[List[Any]], Any]]]], chunk_size: int) -> Generator[None, None, Any]:
+        """
+        Rebuild an object from its compact form, yielding after every chunk_size objects.
+        """
+        name, root, tables = packed
+        built: Dict[str, List[Any]] = {}
+        for type_name in sorted(tables, key=lambda type_name: cls.__depth(getattr(objects, type_name))):
+            object_type = getattr(objects, type_name)
+            nested = cls.schema(object_type)[1]
+            columns = tables[type_name]
+            objects_built = built[type_name] = []
+            rows = len(columns[0][1]) if columns else 0
+            for start in range(0, rows, chunk_size):
+                values = [cls.__decode(column, start, start + chunk_size) for column in columns]
+                for index, element_type in nested.items():
+                    elements = built.get(element_type.__name__, [])
+                    values[index] = [elements[first:last] for first, last in values[index]]
+                objects_built.extend(map(object_type, *values))
+                yield
+        object_type = getattr(objects, name)
+        row = list(root)
+        for index, element_type in cls.schema(object_type)[1].items():
+            first, last = row[index]
+            row[index] = built.get(element_type.__name__, [])[first:last]
+        return object_type(*row)
+    # Public Methods
+    @classmethod
+    def schema(cls, object_type: type) -> Tuple[Tuple[str, ...], Dict[int, type]]:
+        """
+        Get the field names of a dataclass and the element types of its fields holding lists of dataclasses.
+
+        Args:
+            object_type (type): A dataclass from edgar_sec.objects.
+
+        Returns:
+            Tuple[Tuple[str, ...], Dict[int, type]]: The field names in constructor order, and the element type of each nested list field keyed by field index.
+        """
+        if object_type not in cls.schemas:
+            hints = get_type_hints(object_type)
+            names = tuple(field.name for field in fields(object_type))
+            nested = {}
+            for index, name in enumerate(names):
+                args = get_args(hints[name])
+                if get_origin(hints[name]) is list and args and hasattr(args[0], '__dataclass_fields__'):
+                    nested[index] = args[0]
+            cls.schemas[object_type] = (names, nested)
+        return cls.schemas[object_type]
+    @classmethod
+    def pack(cls, value: Any) -> Tuple[str, Tuple, Dict[str, List[Tuple[Optional[List[Any]], Any]]]]:
+        """
+        Convert a parsed object into its compact, columnar form.
+
+        Every nested object is stored as a row of a table per class, and every list of objects as a
+        (first, last) range of rows in the table of its element class. Table columns with at most half
+        distinct values are dictionary-encoded as the distinct values plus an array of codes.
+
+        Args:
+            value (Any): An object from edgar_sec.objects.
+
+        Returns:
+            Tuple[str, Tuple, Dict[str, List]]: The class name, the object's own row, and the encoded columns of every table keyed by class name.
+        """
+        tables: Dict[str, List[List[Any]]] = {}
+        def row(value: Any) -> List[Any]:
+            names, nested = cls.schema(type(value))
+            values = list(attrgetter(*names)(value))
+            for index, element_type in nested.items():
+                rows = [row(element) for element in values[index]]
+                columns = tables.setdefault(element_type.__name__, [[] for _ in cls.schema(element_type)[0]])
+                first = len(columns[0])
+                for column, column_values in zip(columns, zip(*rows)):
+                    column.extend(column_values)
+                values[index] = (first, first + len(rows))
+            return values
+        root = tuple(row(value))
+        return type(value).__name__, root, {type_name: [cls.__encode(column) for column in columns] for type_name, columns in tables.items()}
+    @classmethod
+    def unpack(cls, packed: Tuple[str, Tuple, Dict[str, List[Tuple[Optional[List[Any]], Any]]]]) -> Any:
+        """
+        Rebuild an object from its compact form.
+
+        Args:
+            packed (Tuple[str, Tuple, Dict[str, List]]): The output of pack().
+
+        Returns:
+            Any: The object from edgar_sec.objects.
+        """
+        rebuild = cls.__rebuild(packed, chunk_size=sys.maxsize)
+        while True:
+            try:
+                next(rebuild)
+            except StopIteration as stop:
+                return stop.value
+    @classmethod
+    async def unpack_async(cls, packed: Tuple[str, Tuple, Dict[str, List[Tuple[Optional[List[Any]], Any]]]], chunk_size: int=5000) -> Any:
+        """
+        Rebuild an object from its compact form, yielding to the event loop every chunk_size objects.
+
+        Args:
+            packed (Tuple[str, Tuple, Dict[str, List]]): The output of pack().
+            chunk_size (int): The number of objects rebuilt between yields. Defaults to 5000.
+
+        Returns:
+            Any: The object from edgar_sec.objects.
+        """
+        rebuild = cls.__rebuild(packed, chunk_size)
+        while True:
+            try:
+                next(rebuild)
+            except StopIteration as stop:
+                return stop.value
+            await asyncio.sleep(0)
+    @staticmethod
+    def parse_payload(object_name: str, content: bytes, kwargs: Dict[str, Any]) -> Tuple[str, Tuple, Dict[str, List[Tuple[Optional[List[Any]], Any]]]]:
+        """
+        Decode and parse a payload, returning its compact form; runs in the worker process.
+
+        Args:
+            object_name (str): The name of the class in edgar_sec.objects, e.g. 'CompanyFacts'.
+            content (bytes): The raw JSON response body.
+            kwargs (Dict[str, Any]): Keyword arguments for the class's to_object, e.g. dedup.
+
+        Returns:
+            Tuple[str, Tuple, Dict[str, List]]: The packed object.
+        """
+        return ParseExecutor.pack(getattr(objects, object_name).to_object(json.loads(content), **kwargs))
+    def parse(self, object_type: Any, content: bytes, **kwargs: Any) -> Any:
+        """
+        Parse a raw response body, in the pool when it is at least threshold bytes.
+
+        Args:
+            object_type (type): The class in edgar_sec.objects to parse into.
+            content (bytes): The raw JSON response body.
+            **kwargs: Keyword arguments for the class's to_object, e.g. dedup.
+
+        Returns:
+            Any: The parsed object.
+        """
+        if len(content) < self.threshold:
+            return object_type.to_object(json.loads(content), **kwargs)
+        return self.unpack(self.__pool().submit(ParseExecutor.parse_payload, object_type.__name__, content, kwargs).result())
+    async def parse_async(self, object_type: Any, content: bytes, **kwargs: Any) -> Any:
+        """
+        Asynchronously parse a raw response body, in the pool when it is at least threshold bytes.
+
+        Args:
+            object_type (type): The class in edgar_sec.objects to parse into.
+            content (bytes): The raw JSON response body.
+            **kwargs: Keyword arguments for the class's to_object_async, e.g. dedup.
+
+        Returns:
+            Any: The parsed object.
+        """
+        if len(content) < self.threshold:
+            return await object_type.to_object_async(json.loads(content), **kwargs)
+        loop = asyncio.get_running_loop()
+        packed = await loop.run_in_executor(self.__pool(), ParseExecutor.parse_payload, object_type.__name__, content, kwargs)
+        return await self.unpack_async(packed, self.chunk_size)
+    def shutdown(self, wait: bool=True) -> None:
+        """
+        Shut down the process pool, if this executor started one.
+
+        Args:
+            wait (bool): Whether to wait for running parses to finish. Defaults to True.
+        """
+        if self.owned and self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
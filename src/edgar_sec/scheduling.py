@@ -0,0 +1,588 @@
+# filepath: /src/edgar_sec/scheduling.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines a priority-aware request scheduler that hands out the EDGAR rate budget, per-host rate limits, and the deadlines that bound how long a call may take.
+"""
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generator, Hashable, Optional, Tuple, Union, cast
+import asyncio
+import math
+import os
+import threading
+import time
+import httpx
+from tenacity import RetryCallState
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class Deadline:
+    """A point in time by which a call must finish, including its retries and rate-limit waits.
+
+    Deadlines are set for a block of code with EdgarAPI.deadline() and apply to every request made
+    in it on the same thread or asyncio task. A request checks its deadline before waiting for a rate
+    limit slot, gives up its slot when the deadline passes while waiting, caps the connect, read,
+    write and pool timeouts of httpx at the time remaining, and is not retried once the retry wait
+    would outlast the deadline. An expired deadline raises TimeoutError.
+    """
+    context: ContextVar[Optional['Deadline']] = ContextVar('edgar_sec_deadline', default=None)
+    def __init__(self, seconds: float, fail_fast: bool=False, parent: Optional['Deadline']=None) -> None:
+        """
+        Initialize a Deadline expiring seconds from now.
+
+        Args:
+            seconds (float): The time allowed, in seconds.
+            fail_fast (bool): Whether to raise as soon as a rate-limit wait is known to outlast the deadline, instead of waiting until it expires. Defaults to False.
+            parent (Deadline, optional): An enclosing deadline; the earlier of the two applies.
+
+        Raises:
+            ValueError: If seconds is negative.
+        """
+        if seconds < 0:
+            raise ValueError("seconds must not be negative.")
+        self.seconds: float = seconds
+        self.fail_fast: bool = fail_fast
+        self.expires: float = time.monotonic() + seconds
+        if parent is not None:
+            self.expires = min(self.expires, parent.expires)
+            self.fail_fast = fail_fast or parent.fail_fast
+    def __repr__(self) -> str:
+        """
+        String representation of the Deadline class.
+
+        Returns:
+            str: A string representation of the Deadline class.
+        """
+        return f"Deadline(remaining={self.remaining():.3f}, fail_fast={self.fail_fast})"
+    # Public Methods
+    @classmethod
+    def current(cls) -> Optional['Deadline']:
+        """
+        Get the deadline of the running thread or task.
+
+        Returns:
+            Deadline | None: The innermost deadline set with EdgarAPI.deadline(), or None.
+        """
+        return cls.context.get()
+    def remaining(self) -> float:
+        """
+        Get the time left before the deadline.
+
+        Returns:
+            float: The seconds remaining, 0.0 once expired.
+        """
+        return max(0.0, self.expires - time.monotonic())
+    def check(self, wait: float=0.0) -> float:
+        """
+        Raise if the deadline has passed, or if fail_fast and a wait of the given length would outlast it.
+
+        Args:
+            wait (float): The wait about to start, in seconds. Defaults to 0.0.
+
+        Returns:
+            float: The seconds remaining.
+
+        Raises:
+            TimeoutError: If the deadline has passed, or would be passed by the wait with fail_fast.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise TimeoutError(f"Deadline of {self.seconds}s exceeded.")
+        if self.fail_fast and wait > remaining:
+            raise TimeoutError(f"Waiting {wait:.3f}s for a request slot would exceed the deadline of {self.seconds}s.")
+        return remaining
+    def timeout(self, timeout: Union[float, httpx.Timeout, None]) -> httpx.Timeout:
+        """
+        Cap an httpx timeout at the time remaining.
+
+        Args:
+            timeout (float | httpx.Timeout | None): The configured timeout.
+
+        Returns:
+            httpx.Timeout: The timeout with every phase capped at the time remaining.
+
+        Raises:
+            TimeoutError: If the deadline has passed.
+        """
+        remaining = self.check()
+        configured = httpx.Timeout(timeout)
+        return httpx.Timeout(**{phase: min(remaining, math.inf if value is None else value) for phase, value in configured.as_dict().items()})
+    @staticmethod
+    def stop(retry_state: RetryCallState) -> bool:
+        """
+        Tenacity stop condition ending retries once the next wait would outlast the current deadline.
+
+        Args:
+            retry_state (RetryCallState): The state of the retried call.
+
+        Returns:
+            bool: True if the call must not be retried.
+        """
+        deadline = Deadline.context.get()
+        return deadline is not None and deadline.remaining() <= (getattr(retry_state, 'upcoming_sleep', 0.0) or 0.0)
+    @staticmethod
+    def stop_after_attempt(attempts: int) -> Callable[[RetryCallState], bool]:
+        """
+        Build a tenacity stop condition ending retries after a number of attempts or once the next wait would outlast the current deadline.
+
+        Args:
+            attempts (int): The maximum number of attempts.
+
+        Returns:
+            Callable[[RetryCallState], bool]: The stop condition.
+        """
+        def stop(retry_state: RetryCallState) -> bool:
+            return retry_state.attempt_number >= attempts or Deadline.stop(retry_state)
+        return stop
+    @staticmethod
+    def retryable(exception: BaseException) -> bool:
+        """
+        Tenacity retry predicate retrying every error except expired deadlines, cancellation and 404 Not Found responses, which a retry cannot fix.
+
+        Args:
+            exception (BaseException): The error the call raised.
+
+        Returns:
+            bool: True if the call may be retried.
+        """
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code != 404
+        return isinstance(exception, Exception) and not isinstance(exception, TimeoutError)
+
+class RequestScheduler:
+    """Hand out request slots by priority class, within a shared requests-per-second budget.
+
+    Every request of an EdgarAPI created with scheduler=RequestScheduler() waits in the scheduler's
+    queue instead of the client's own rate limiter. A dispatcher thread releases one request whenever
+    the budget has room, always from the most urgent non-empty priority class, so interactive calls
+    jump ahead of queued batch work and batch work only uses the capacity left over. Within a class,
+    flows take turns round-robin and each flow is served first come, first served, so one tenant's
+    backlog cannot starve another's.
+
+    The priority and flow of a request are taken from the context it is made in; see priority().
+    One scheduler can be shared by several EdgarAPI instances, sync and async, to give them one budget.
+    """
+    priorities: Dict[str, int] = {'interactive': 0, 'normal': 1, 'batch': 2}
+    context: ContextVar[Tuple[int, Hashable]] = ContextVar('edgar_sec_priority', default=(1, None))
+    def __init__(self, max_requests_per_second: int=10) -> None:
+        """
+        Initialize the RequestScheduler.
+
+        Args:
+            max_requests_per_second (int): The budget shared by every request the scheduler releases. Defaults to 10, the SEC's limit.
+
+        Raises:
+            ValueError: If max_requests_per_second is not a positive integer.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> scheduler = ed.RequestScheduler()
+            >>> api = ed.EdgarAPI(scheduler=scheduler)
+            >>> with scheduler.priority("interactive"):
+            >>>     submissions = api.get_submissions(ticker="AAPL")
+        """
+        if not isinstance(max_requests_per_second, int) or max_requests_per_second < 1:
+            raise ValueError("max_requests_per_second must be a positive integer.")
+        self.max_requests_per_second: int = max_requests_per_second
+        self.dispatcher: Optional[threading.Thread] = None
+        self.__reset()
+    def __repr__(self) -> str:
+        """
+        String representation of the RequestScheduler class.
+
+        Returns:
+            str: A string representation of the RequestScheduler class.
+        """
+        return f"RequestScheduler(max_requests_per_second={self.max_requests_per_second}, waiting={len(self)})"
+    def __len__(self) -> int:
+        """
+        Get the number of requests waiting for a slot.
+
+        Returns:
+            int: The number of queued requests across all priority classes and flows.
+        """
+        with self.condition:
+            return sum(len(waiters) for flows in self.queues.values() for waiters in flows.values())
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the configuration of the RequestScheduler for pickling.
+
+        Returns:
+            Dict[str, Any]: The budget; an unpickled scheduler starts with an empty queue and its own dispatcher.
+        """
+        return {'max_requests_per_second': self.max_requests_per_second}
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Rebuild an unpickled RequestScheduler from its configuration.
+
+        Args:
+            state (Dict[str, Any]): The output of __getstate__.
+        """
+        type(self).__init__(self, max_requests_per_second=state['max_requests_per_second'])
+    # Private Methods
+    def __reset(self) -> None:
+        """
+        Create the queues, lock and budget window; called on init and in a forked child, whose copies may be held by threads that no longer exist.
+        """
+        self.condition: threading.Condition = threading.Condition()
+        self.queues: Dict[int, OrderedDict] = {}
+        self.request_times: deque = deque()
+        self.dispatcher = None
+        self.pid: int = os.getpid()
+    def __enqueue(self, waiter: Union[threading.Event, asyncio.Future]) -> None:
+        """
+        Queue a waiter under the priority and flow of the current context and wake the dispatcher, starting it if needed.
+        """
+        if self.pid != os.getpid():
+            self.__reset()
+        level, flow = self.context.get()
+        with self.condition:
+            self.queues.setdefault(level, OrderedDict()).setdefault(flow, deque()).append(waiter)
+            if self.dispatcher is None or not self.dispatcher.is_alive():
+                self.dispatcher = threading.Thread(target=self.__dispatch, name='edgar-sec-scheduler', daemon=True)
+                self.dispatcher.start()
+            self.condition.notify()
+    def __dequeue(self, waiter: Union[threading.Event, asyncio.Future]) -> bool:
+        """
+        Remove a waiter that gave up from the queue of the current context, dropping emptied flows and classes.
+        """
+        level, flow = self.context.get()
+        with self.condition:
+            waiters = self.queues.get(level, OrderedDict()).get(flow)
+            if waiters is None or waiter not in waiters:
+                return False
+            waiters.remove(waiter)
+            if not waiters:
+                del self.queues[level][flow]
+            if not self.queues[level]:
+                del self.queues[level]
+            return True
+    def __next_waiter(self) -> Optional[Union[threading.Event, asyncio.Future]]:
+        """
+        Pop the next live waiter: the most urgent class first, round-robin over its flows. Must be called holding the condition.
+        """
+        for level in sorted(self.queues):
+            flows = self.queues[level]
+            while flows:
+                flow, waiters = next(iter(flows.items()))
+                waiter = waiters.popleft()
+                if waiters:
+                    flows.move_to_end(flow)
+                else:
+                    del flows[flow]
+                if not (isinstance(waiter, asyncio.Future) and waiter.cancelled()):
+                    return waiter
+            del self.queues[level]
+        return None
+    def __dispatch(self) -> None:
+        """
+        Release queued waiters one at a time as the budget allows; runs on the dispatcher thread.
+        """
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                while self.request_times and self.request_times[0] <= now - 1:
+                    self.request_times.popleft()
+                if len(self.request_times) >= self.max_requests_per_second:
+                    self.condition.wait(self.request_times[0] + 1 - now)
+                    continue
+                waiter = self.__next_waiter()
+                if waiter is None:
+                    self.condition.wait()
+                    continue
+                self.request_times.append(now)
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                else:
+                    waiter.get_loop().call_soon_threadsafe(self.__release, waiter)
+    @staticmethod
+    def __release(future: asyncio.Future) -> None:
+        """
+        Resolve an async waiter on its own event loop, unless it was cancelled meanwhile.
+        """
+        if not future.done():
+            future.set_result(None)
+    # Public Methods
+    @contextmanager
+    def priority(self, priority: Union[str, int]='interactive', flow: Hashable=None) -> Generator[None, None, None]:
+        """
+        Make the requests sent inside the block, on this thread or asyncio task, use a priority class and flow.
+
+        Args:
+            priority (str | int): 'interactive', 'normal' (the default outside any block) or 'batch', or an integer where lower is more urgent. Defaults to 'interactive'.
+            flow (Hashable, optional): The flow, e.g. a tenant or job name, that shares the class's capacity round-robin with other flows. Defaults to one shared flow.
+
+        Raises:
+            ValueError: If the priority is an unknown class name.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> scheduler = ed.RequestScheduler()
+            >>> api = ed.EdgarAPI(scheduler=scheduler)
+            >>> with scheduler.priority("batch", flow="nightly-refresh"):
+            >>>     api.batch("get_company_facts", calls)
+        """
+        if isinstance(priority, str):
+            if priority not in self.priorities:
+                raise ValueError(f"Unknown priority: {priority}.")
+            priority = self.priorities[priority]
+        token = self.context.set((priority, flow))
+        try:
+            yield
+        finally:
+            self.context.reset(token)
+    def estimate(self) -> float:
+        """
+        Estimate the wait of a request queued now, assuming every queued request is served first.
+
+        Returns:
+            float: The estimated wait in seconds.
+        """
+        return len(self) / self.max_requests_per_second
+    def acquire(self, deadline: Optional[Deadline]=None) -> None:
+        """
+        Block the calling thread until the scheduler releases a request slot to it.
+
+        Args:
+            deadline (Deadline, optional): The deadline of the request; it leaves the queue when the deadline passes.
+
+        Raises:
+            TimeoutError: If the deadline passes before a slot is released, or with fail_fast if the estimated wait would outlast it.
+        """
+        if deadline is not None:
+            deadline.check(self.estimate())
+        event = threading.Event()
+        self.__enqueue(event)
+        if not event.wait(None if deadline is None else deadline.remaining()) and self.__dequeue(event):
+            raise TimeoutError(f"Deadline of {cast(Deadline, deadline).seconds}s exceeded waiting for a request slot.")
+    async def acquire_async(self, deadline: Optional[Deadline]=None) -> None:
+        """
+        Wait, without blocking the event loop, until the scheduler releases a request slot to the calling task.
+
+        Args:
+            deadline (Deadline, optional): The deadline of the request; it leaves the queue when the deadline passes.
+
+        Raises:
+            TimeoutError: If the deadline passes before a slot is released, or with fail_fast if the estimated wait would outlast it.
+
+        Note:
+            A task cancelled while waiting leaves the queue without using a slot.
+        """
+        if deadline is not None:
+            deadline.check(self.estimate())
+        future = asyncio.get_running_loop().create_future()
+        self.__enqueue(future)
+        try:
+            await asyncio.wait_for(future, None if deadline is None else deadline.remaining())
+        except asyncio.TimeoutError:
+            self.__dequeue(future)
+            raise TimeoutError(f"Deadline of {cast(Deadline, deadline).seconds}s exceeded waiting for a request slot.") from None
+
+class HostLimiter:
+    """Cap the request rate of individual hosts on top of a client's shared budget.
+
+    The EDGAR API is served from data.sec.gov, while reference files such as
+    company_tickers.json are served from www.sec.gov. Every request still counts against
+    the client's requests-per-second budget; a host with a limit here is additionally held
+    to its own rate, so a burst of lookups against one host cannot use up the budget of
+    the other. Slots are reserved under a lock and waited for outside it, so one limiter
+    serves threads and event loops alike.
+    """
+    def __init__(self, limits: Optional[Dict[str, int]]=None) -> None:
+        """
+        Initialize the HostLimiter.
+
+        Args:
+            limits (Dict[str, int], optional): The requests per second allowed for each host, e.g. {'www.sec.gov': 5}. Hosts without a limit are only bound by the client's budget.
+
+        Raises:
+            ValueError: If a limit is not a positive integer.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> api = ed.EdgarAPI(host_limiter=ed.HostLimiter({"www.sec.gov": 2}))
+        """
+        limits = dict(limits or {})
+        for host, limit in limits.items():
+            if not isinstance(limit, int) or limit < 1:
+                raise ValueError(f"The limit of {host} must be a positive integer.")
+        self.limits: Dict[str, int] = limits
+        self.__reset()
+    def __repr__(self) -> str:
+        """
+        String representation of the HostLimiter class.
+
+        Returns:
+            str: A string representation of the HostLimiter class.
+        """
+        return f"HostLimiter(limits={self.limits!r})"
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the configuration of the HostLimiter for pickling.
+
+        Returns:
+            Dict[str, Any]: The limits; an unpickled limiter starts with empty windows.
+        """
+        return {'limits': self.limits}
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Rebuild an unpickled HostLimiter from its configuration.
+
+        Args:
+            state (Dict[str, Any]): The output of __getstate__.
+        """
+        type(self).__init__(self, limits=state['limits'])
+    # Private Methods
+    def __reset(self) -> None:
+        """
+        Create the lock and request windows; called on init and in a forked child.
+        """
+        self.lock: threading.Lock = threading.Lock()
+        self.request_times: Dict[str, deque] = {}
+        self.pid: int = os.getpid()
+    def __reserve(self, host: str, deadline: Optional[Deadline]) -> Tuple[Optional[float], float]:
+        """
+        Reserve the next slot of a host unless the deadline rules it out, returning its start time and the wait for it.
+        """
+        limit = self.limits.get(host)
+        if limit is None:
+            if deadline is not None:
+                deadline.check()
+            return None, 0.0
+        if self.pid != os.getpid():
+            self.__reset()
+        with self.lock:
+            times = self.request_times.setdefault(host, deque())
+            now = time.monotonic()
+            while times and times[0] <= now - 1:
+                times.popleft()
+            start = now if len(times) < limit else times[-limit] + 1
+            if times:
+                start = max(start, times[-1])
+            if deadline is not None:
+                deadline.check(start - now)
+            times.append(start)
+            return start, start - now
+    def __release(self, host: str, start: Optional[float]) -> None:
+        """
+        Give back a reserved slot that will not be used.
+        """
+        if start is None:
+            return
+        with self.lock:
+            times = self.request_times.get(host)
+            if times and start in times:
+                times.remove(start)
+    # Public Methods
+    def reserve(self, host: str) -> float:
+        """
+        Reserve the next request slot of a host.
+
+        Args:
+            host (str): The host the request is sent to, e.g. 'www.sec.gov'.
+
+        Returns:
+            float: The seconds to wait before sending the request; 0.0 for hosts without a limit.
+        """
+        return self.__reserve(host, None)[1]
+    def wait(self, host: str, deadline: Optional[Deadline]=None) -> None:
+        """
+        Block the calling thread until the host's next request slot.
+
+        A wait that would outlast the deadline gives its slot back and sleeps only until the deadline, so a request that times out never holds up the requests behind it.
+
+        Args:
+            host (str): The host the request is sent to.
+            deadline (Deadline, optional): The deadline of the request.
+
+        Raises:
+            TimeoutError: If the deadline has passed or passes while waiting, or with fail_fast if the wait would outlast it.
+        """
+        start, delay = self.__reserve(host, deadline)
+        try:
+            if deadline is not None and delay > deadline.remaining():
+                time.sleep(deadline.remaining())
+                raise TimeoutError(f"Deadline of {deadline.seconds}s exceeded waiting for a request slot.")
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            self.__release(host, start)
+            raise
+    async def wait_async(self, host: str, deadline: Optional[Deadline]=None) -> None:
+        """
+        Wait, without blocking the event loop, until the host's next request slot.
+
+        A wait that would outlast the deadline, or that is cancelled, gives its slot back.
+
+        Args:
+            host (str): The host the request is sent to.
+            deadline (Deadline, optional): The deadline of the request.
+
+        Raises:
+            TimeoutError: If the deadline has passed or passes while waiting, or with fail_fast if the wait would outlast it.
+        """
+        start, delay = self.__reserve(host, deadline)
+        try:
+            if deadline is not None and delay > deadline.remaining():
+                await asyncio.sleep(deadline.remaining())
+                raise TimeoutError(f"Deadline of {deadline.seconds}s exceeded waiting for a request slot.")
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self.__release(host, start)
+            raise
+
+class AsyncThreadLock:
+    """An async context manager over a threading lock, so coroutines can share a lock with threads.
+
+    Entering polls the lock without blocking the event loop, yielding to other tasks while another
+    thread holds it. The async response cache uses it to take the client's cache lock, so the
+    background engine loop and sync threads never write the shared cache at the same time.
+    """
+    def __init__(self, lock: Union[threading.Lock, threading.RLock], poll_interval: float=0.001) -> None:
+        """
+        Initialize the AsyncThreadLock.
+
+        Args:
+            lock (threading.Lock | threading.RLock): The lock shared with synchronous callers.
+            poll_interval (float): The seconds to sleep between attempts while the lock is held elsewhere. Defaults to 0.001.
+        """
+        self.lock: Union[threading.Lock, threading.RLock] = lock
+        self.poll_interval: float = poll_interval
+    def __repr__(self) -> str:
+        """
+        String representation of the AsyncThreadLock class.
+
+        Returns:
+            str: A string representation of the AsyncThreadLock class.
+        """
+        return f"AsyncThreadLock(lock={self.lock!r})"
+    async def __aenter__(self) -> 'AsyncThreadLock':
+        """
+        Acquire the lock, polling while another thread holds it.
+
+        Returns:
+            AsyncThreadLock: The lock itself.
+        """
+        while not self.lock.acquire(blocking=False):
+            await asyncio.sleep(self.poll_interval)
+        return self
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """
+        Release the lock.
+        """
+        self.lock.release()
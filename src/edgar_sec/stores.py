@@ -0,0 +1,877 @@
+# filepath: /src/edgar_sec/stores.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines local stores used for incremental updates and snapshots of EDGAR data.
+"""
+
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Union, cast, overload
+import json
+import os
+import time
+from edgar_sec.objects import Filing, UnitDisclosure, CompanyFacts, Company
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+@dataclass
+class SubmissionCheckpoint:
+    """
+    A class representing the last-seen state of a filer's submission history.
+    """
+    cik: str
+    last_accession_number: str
+    last_filing_date: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    seen_accession_numbers: List[str] = field(default_factory=list)
+
+    @classmethod
+    def to_object(cls, data: Dict) -> 'SubmissionCheckpoint':
+        """
+        Parses a dictionary and returns a SubmissionCheckpoint object.
+        """
+        return cls(
+            cik=data['cik'],
+            last_accession_number=data.get('last_accession_number', ''),
+            last_filing_date=data.get('last_filing_date', ''),
+            etag=data.get('etag'),
+            last_modified=data.get('last_modified'),
+            seen_accession_numbers=list(data.get('seen_accession_numbers', []))
+        )
+
+class SubmissionStore:
+    """A store of per-CIK submission checkpoints used for incremental syncs.
+
+    The store remembers the most recent accession number seen for each filer along
+    with the validators (ETag / Last-Modified) returned by the EDGAR API, so repeat
+    runs can issue conditional requests and only surface filings made since the
+    previous checkpoint.
+    """
+    def __init__(self, path: Optional[str]=None) -> None:
+        """
+        Initialize the SubmissionStore, loading existing checkpoints from disk if a path is given.
+
+        Args:
+            path (str, optional): Path of a JSON file used to persist checkpoints. If omitted, checkpoints are kept in memory only.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> store = ed.SubmissionStore("checkpoints.json")
+        """
+        self.path: Optional[str] = path
+        self.checkpoints: Dict[str, SubmissionCheckpoint] = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+    def __repr__(self) -> str:
+        """
+        String representation of the SubmissionStore class.
+
+        Returns:
+            str: A string representation of the SubmissionStore class.
+        """
+        return f"SubmissionStore(path={self.path!r}, checkpoints={len(self.checkpoints)})"
+    def __len__(self) -> int:
+        """
+        Get the number of filers tracked by the store.
+
+        Returns:
+            int: The number of checkpoints in the store.
+        """
+        return len(self.checkpoints)
+    def __contains__(self, central_index_key: str) -> bool:
+        """
+        Check if a filer has a checkpoint in the store.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+
+        Returns:
+            bool: True if a checkpoint exists, False otherwise.
+        """
+        return central_index_key in self.checkpoints
+    def get(self, central_index_key: str) -> Optional[SubmissionCheckpoint]:
+        """
+        Get the checkpoint recorded for a filer.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+
+        Returns:
+            SubmissionCheckpoint | None: The checkpoint if one exists, otherwise None.
+        """
+        return self.checkpoints.get(central_index_key)
+    def update(self, checkpoint: SubmissionCheckpoint) -> None:
+        """
+        Record a new checkpoint for a filer, replacing any previous one.
+
+        Args:
+            checkpoint (SubmissionCheckpoint): The checkpoint to record.
+        """
+        self.checkpoints[checkpoint.cik] = checkpoint
+    def new_filings(self, central_index_key: str, filings: List[Filing]) -> List[Filing]:
+        """
+        Get the filings made since the last checkpoint for a filer.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+            filings (List[Filing]): The filer's recent filings, newest first, as returned by the submissions endpoint.
+
+        Returns:
+            List[Filing]: The filings newer than the last-seen accession number. If the filer has no checkpoint every filing is returned, and if the last-seen filing is no longer in the list the filings dated on or after the checkpoint's filing date are returned, less those already seen on that date.
+        """
+        checkpoint = self.checkpoints.get(central_index_key)
+        if checkpoint is None:
+            return list(filings)
+        new: List[Filing] = []
+        for filing in filings:
+            if filing.accession_number == checkpoint.last_accession_number:
+                return new
+            new.append(filing)
+        seen = {checkpoint.last_accession_number, *checkpoint.seen_accession_numbers}
+        return [filing for filing in new if filing.filing_date >= checkpoint.last_filing_date and filing.accession_number not in seen]
+    def conditional_headers(self, central_index_key: str, headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Build request headers carrying the validators recorded for a filer.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+            headers (Dict[str, str]): The base request headers.
+
+        Returns:
+            Dict[str, str]: A copy of the base headers with If-None-Match and If-Modified-Since set when known.
+        """
+        conditional = dict(headers)
+        checkpoint = self.checkpoints.get(central_index_key)
+        if checkpoint is not None:
+            if checkpoint.etag:
+                conditional['If-None-Match'] = checkpoint.etag
+            if checkpoint.last_modified:
+                conditional['If-Modified-Since'] = checkpoint.last_modified
+        return conditional
+    def advance(self, central_index_key: str, filings: List[Filing], validators: Dict[str, Optional[str]]) -> SubmissionCheckpoint:
+        """
+        Move a filer's checkpoint to the newest filing in a freshly fetched submission history.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+            filings (List[Filing]): The filer's recent filings, newest first.
+            validators (Dict[str, str | None]): The 'etag' and 'last_modified' response validators.
+
+        Returns:
+            SubmissionCheckpoint: The recorded checkpoint.
+        """
+        last_filing_date = filings[0].filing_date if filings else ''
+        checkpoint = SubmissionCheckpoint(
+            cik=central_index_key,
+            last_accession_number=filings[0].accession_number if filings else '',
+            last_filing_date=last_filing_date,
+            etag=validators.get('etag'),
+            last_modified=validators.get('last_modified'),
+            seen_accession_numbers=[filing.accession_number for filing in filings if filing.filing_date == last_filing_date]
+        )
+        self.update(checkpoint)
+        return checkpoint
+    def load(self) -> None:
+        """
+        Load checkpoints from the store's JSON file.
+
+        Raises:
+            ValueError: If the store was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("SubmissionStore has no path to load from.")
+        with open(self.path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        self.checkpoints = {cik: SubmissionCheckpoint.to_object(checkpoint) for cik, checkpoint in data.items()}
+    def save(self) -> None:
+        """
+        Atomically write the checkpoints to the store's JSON file.
+
+        Raises:
+            ValueError: If the store was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("SubmissionStore has no path to save to.")
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({cik: asdict(checkpoint) for cik, checkpoint in self.checkpoints.items()}, file)
+        os.replace(tmp_path, self.path)
+
+@dataclass
+class FactChange:
+    """
+    A class representing a fact that was added, changed or removed since the last merge of a company's facts.
+    """
+    taxonomy: str
+    tag: str
+    status: str
+    disclosure: UnitDisclosure
+
+class FactStore:
+    """A store of company facts used to compute diff-based updates.
+
+    Facts are kept per CIK in a compact form, keyed by taxonomy, tag, unit, accession
+    number and period. Merging a fresh companyfacts payload against the stored facts
+    only builds UnitDisclosure objects for the facts that were added, changed or
+    removed, so downstream work can be limited to what a new filing actually reported.
+    Each company is stored as a snapshot file plus a log of the deltas of later saves,
+    so saving a changed company appends only what changed. The snapshot is rewritten,
+    and the log cleared, once the log grows larger than the snapshot.
+    """
+    compact_fields = ('val', 'fy', 'fp', 'form', 'filed', 'frame')
+    def __init__(self, directory: Optional[str]=None) -> None:
+        """
+        Initialize the FactStore.
+
+        Args:
+            directory (str, optional): Directory holding a JSON snapshot and a JSON lines delta log of compact facts per CIK. If omitted, facts are kept in memory only.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> store = ed.FactStore("facts/")
+        """
+        self.directory: Optional[str] = directory
+        self.facts: Dict[str, Dict[str, List[Any]]] = {}
+        self.dirty: Set[str] = set()
+        self.deltas: Dict[str, Dict[str, Optional[List[Any]]]] = {}
+        self.compact: Set[str] = set()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+    def __repr__(self) -> str:
+        """
+        String representation of the FactStore class.
+
+        Returns:
+            str: A string representation of the FactStore class.
+        """
+        return f"FactStore(directory={self.directory!r}, companies={len(self.facts)})"
+    def __len__(self) -> int:
+        """
+        Get the number of companies loaded in the store.
+
+        Returns:
+            int: The number of companies in the store.
+        """
+        return len(self.facts)
+    def __contains__(self, central_index_key: str) -> bool:
+        """
+        Check if a company has stored facts.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+
+        Returns:
+            bool: True if facts are stored for the company, False otherwise.
+        """
+        path = self.__path(central_index_key)
+        return central_index_key in self.facts or (path is not None and os.path.exists(path))
+    # Private Methods
+    def __path(self, central_index_key: str) -> Optional[str]:
+        """
+        Path of the JSON file holding a company's fact snapshot.
+        """
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"CIK{central_index_key}.json")
+    def __log_path(self, central_index_key: str) -> str:
+        """
+        Path of the JSON lines file holding the deltas saved since a company's snapshot.
+        """
+        return f"{cast(str, self.__path(central_index_key))[:-len('.json')]}.jsonl"
+    def __company(self, central_index_key: str) -> Dict[str, List[Any]]:
+        """
+        Get a company's compact facts, loading the snapshot and replaying its delta log on first use.
+        """
+        if central_index_key not in self.facts:
+            path = self.__path(central_index_key)
+            facts: Dict[str, List[Any]] = {}
+            if path is not None and os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as file:
+                    facts = json.load(file)
+                log_path = self.__log_path(central_index_key)
+                if os.path.exists(log_path):
+                    with open(log_path, 'r', encoding='utf-8') as file:
+                        for line in file:
+                            try:
+                                delta = json.loads(line)
+                            except ValueError:
+                                # A save interrupted mid-append; rewrite the snapshot on the next save.
+                                self.compact.add(central_index_key)
+                                self.dirty.add(central_index_key)
+                                continue
+                            for key, compact in delta.items():
+                                if compact is None:
+                                    facts.pop(key, None)
+                                else:
+                                    facts[key] = compact
+            self.facts[central_index_key] = facts
+        return self.facts[central_index_key]
+    def __write_snapshot(self, central_index_key: str) -> None:
+        """
+        Atomically rewrite a company's snapshot and clear its delta log.
+        """
+        path = cast(str, self.__path(central_index_key))
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.facts[central_index_key], file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        log_path = self.__log_path(central_index_key)
+        if os.path.exists(log_path):
+            os.remove(log_path)
+    # Public Methods
+    @staticmethod
+    def fact_key(taxonomy: str, tag: str, unit: str, data: Dict) -> str:
+        """
+        Build the key identifying a single fact.
+
+        Args:
+            taxonomy (str): The taxonomy of the fact (e.g. 'us-gaap').
+            tag (str): The concept tag of the fact.
+            unit (str): The unit of measure of the fact.
+            data (Dict): The raw fact from a companyfacts payload.
+
+        Returns:
+            str: The fact key, made of taxonomy, tag, unit, accession number, start and end.
+        """
+        return '|'.join((taxonomy, tag, unit, data.get('accn', ''), data.get('start') or '', data.get('end', '')))
+    def merge(self, response: Dict) -> List[FactChange]:
+        """
+        Merge a companyfacts payload into the store and return the facts that were added, changed or removed.
+
+        Stored facts missing from the payload are dropped from the store and reported with the 'removed'
+        status; their disclosure is rebuilt from the stored compact fields and fact key. Instant facts
+        have a start of None whatever their status.
+
+        Args:
+            response (Dict): A raw companyfacts payload as returned by the EDGAR API.
+
+        Returns:
+            List[FactChange]: The added, changed and removed facts. Only these are parsed into UnitDisclosure objects.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> store = ed.FactStore()
+            >>> changes = store.merge(payload)
+            >>> for change in changes:
+            >>>     print(change.status, change.tag, change.disclosure.val)
+        """
+        central_index_key = str(response.get('cik', '')).zfill(10)
+        stored = self.__company(central_index_key)
+        deltas = self.deltas.setdefault(central_index_key, {})
+        changes: List[FactChange] = []
+        seen: Set[str] = set()
+        for taxonomy, taxonomy_data in response.get('facts', {}).items():
+            for tag, tag_data in taxonomy_data.items():
+                for unit, disclosures in tag_data.get('units', {}).items():
+                    for disclosure in disclosures:
+                        key = self.fact_key(taxonomy, tag, unit, disclosure)
+                        seen.add(key)
+                        compact = [disclosure.get(field) for field in self.compact_fields]
+                        previous = stored.get(key)
+                        if previous == compact:
+                            continue
+                        stored[key] = compact
+                        deltas[key] = compact
+                        changes.append(FactChange(
+                            taxonomy=taxonomy,
+                            tag=tag,
+                            status='added' if previous is None else 'changed',
+                            disclosure=UnitDisclosure.to_object({'start': None, **disclosure}, unit)
+                        ))
+        for key in [key for key in stored if key not in seen]:
+            taxonomy, tag, unit, accn, start, end = key.split('|')
+            disclosure = {field: value for field, value in zip(self.compact_fields, stored.pop(key)) if value is not None}
+            disclosure.update(accn=accn, start=start or None, end=end)
+            deltas[key] = None
+            changes.append(FactChange(taxonomy=taxonomy, tag=tag, status='removed', disclosure=UnitDisclosure.to_object(disclosure, unit)))
+        if changes:
+            self.dirty.add(central_index_key)
+        return changes
+    def save(self) -> None:
+        """
+        Write the facts of every company changed since the last save to the store's directory.
+
+        A company without a snapshot gets one; otherwise the facts changed since the last save are appended
+        to its delta log, and the snapshot is rewritten once the log outgrows it.
+
+        Raises:
+            ValueError: If the store was created without a directory.
+        """
+        if self.directory is None:
+            raise ValueError("FactStore has no directory to save to.")
+        for central_index_key in sorted(self.dirty):
+            path = cast(str, self.__path(central_index_key))
+            log_path = self.__log_path(central_index_key)
+            if central_index_key in self.compact or not os.path.exists(path):
+                self.__write_snapshot(central_index_key)
+            else:
+                with open(log_path, 'a', encoding='utf-8') as file:
+                    file.write(json.dumps(self.deltas.get(central_index_key, {}), separators=(',', ':')) + '\n')
+                if os.path.getsize(log_path) > os.path.getsize(path):
+                    self.__write_snapshot(central_index_key)
+        self.dirty.clear()
+        self.deltas.clear()
+        self.compact.clear()
+
+class FactCatalog:
+    """A catalog of the taxonomies, tags and units seen in company facts, used to pre-validate requests.
+
+    Every companyfacts response recorded in the catalog adds its taxonomy, tag and unit
+    combinations, and the concepts reported by that company. Concept and frame requests
+    are rejected before they spend rate budget only when the catalog is conclusive: a
+    concept request when the company's own facts were recorded within max_age seconds and
+    do not report the concept, and a frame request when the catalog was updated within
+    max_age seconds and the taxonomy it knows has no such tag or unit. Companies and
+    taxonomies the catalog has not seen are never rejected. A rejection raises the same
+    404 Not Found httpx.HTTPStatusError the request itself would have.
+    """
+    base_url: str = 'https://data.sec.gov'
+    def __init__(self, path: Optional[str]=None, max_age: float=86400) -> None:
+        """
+        Initialize the FactCatalog, loading an existing catalog from disk if a path is given.
+
+        Args:
+            path (str, optional): Path of a JSON file used to persist the catalog. If omitted, the catalog is kept in memory only.
+            max_age (float): The age in seconds after which recorded facts no longer reject requests, since companies start reporting new concepts. Defaults to 86400 (one day).
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> catalog = ed.FactCatalog("catalog.json")
+            >>> api = ed.EdgarAPI(catalog=catalog)
+        """
+        self.path: Optional[str] = path
+        self.max_age: float = max_age
+        self.concepts: Dict[str, Dict[str, Set[str]]] = {}
+        self.companies: Dict[str, Set[str]] = {}
+        self.updated: Dict[str, float] = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+    def __repr__(self) -> str:
+        """
+        String representation of the FactCatalog class.
+
+        Returns:
+            str: A string representation of the FactCatalog class.
+        """
+        return f"FactCatalog(path={self.path!r}, taxonomies={len(self.concepts)}, companies={len(self.companies)})"
+    def __len__(self) -> int:
+        """
+        Get the number of tags in the catalog.
+
+        Returns:
+            int: The number of taxonomy and tag combinations in the catalog.
+        """
+        return sum(len(tags) for tags in self.concepts.values())
+    def __contains__(self, central_index_key: str) -> bool:
+        """
+        Check if the facts of a company were recorded in the catalog.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+
+        Returns:
+            bool: True if the company's facts were recorded, False otherwise.
+        """
+        return central_index_key in self.companies
+    # Private Methods
+    def __fresh(self, updated: Optional[float]) -> bool:
+        """
+        Check if facts recorded at a given time are recent enough to reject requests.
+        """
+        return updated is not None and time.time() - updated <= self.max_age
+    def __not_found(self, url_endpoint: str, message: str) -> None:
+        """
+        Raise the 404 Not Found error the request for an endpoint would have raised.
+        """
+        import httpx
+        request = httpx.Request('GET', self.base_url + url_endpoint)
+        raise httpx.HTTPStatusError(message, request=request, response=httpx.Response(404, request=request))
+    # Public Methods
+    @staticmethod
+    def normalize_unit(unit: str) -> str:
+        """
+        Normalize a unit of measure to the form used in frames URLs.
+
+        Args:
+            unit (str): The unit as keyed in companyfacts (e.g. 'USD/shares') or in a frames URL (e.g. 'USD-per-shares').
+
+        Returns:
+            str: The unit with denominators separated by '-per-'.
+        """
+        return unit.replace('/', '-per-')
+    def update(self, company_facts: CompanyFacts) -> None:
+        """
+        Record the taxonomies, tags and units reported in a company's facts.
+
+        Args:
+            company_facts (CompanyFacts): The facts of a company, e.g. as returned by EdgarAPI.get_company_facts.
+        """
+        reported: Set[str] = set()
+        for taxonomy_facts in company_facts.facts:
+            tags = self.concepts.setdefault(taxonomy_facts.taxonomy, {})
+            for disclosure in taxonomy_facts.disclosures:
+                tags.setdefault(disclosure.name, set()).update(self.normalize_unit(unit.units) for unit in disclosure.units)
+                reported.add(f"{taxonomy_facts.taxonomy}/{disclosure.name}")
+        central_index_key = str(company_facts.cik).zfill(10)
+        self.companies[central_index_key] = reported
+        self.updated[central_index_key] = time.time()
+    def validate_concept(self, central_index_key: str, taxonomy: str, tag: str) -> None:
+        """
+        Check that a company concept can exist before requesting it.
+
+        Args:
+            central_index_key (str): 10-digit Central Index Key (CIK) of the entity.
+            taxonomy (str): The taxonomy of the concept (e.g. 'us-gaap').
+            tag (str): The concept tag.
+
+        Raises:
+            httpx.HTTPStatusError: A 404 Not Found error if the company's facts, recorded within max_age seconds, do not report the concept.
+        """
+        reported = self.companies.get(central_index_key)
+        if reported is None or not self.__fresh(self.updated.get(central_index_key)):
+            return
+        if f"{taxonomy}/{tag}" not in reported:
+            self.__not_found(f'/api/xbrl/companyconcept/CIK{central_index_key}/{taxonomy}/{tag}.json', f"CIK{central_index_key} does not report {taxonomy}/{tag}.")
+    def validate_frame(self, taxonomy: str, tag: str, unit: str, period: str) -> None:
+        """
+        Check that a frame can exist before requesting it.
+
+        Args:
+            taxonomy (str): The taxonomy of the frame (e.g. 'us-gaap').
+            tag (str): The concept tag.
+            unit (str): The unit of measure (e.g. 'USD' or 'USD-per-shares').
+            period (str): The frame period (e.g. 'CY2019Q1I'), used in the error's request URL.
+
+        Raises:
+            httpx.HTTPStatusError: A 404 Not Found error if the catalog, updated within max_age seconds, knows the taxonomy but not the tag, or never saw the tag in the unit.
+        """
+        if taxonomy not in self.concepts or not self.__fresh(max(self.updated.values(), default=None)):
+            return
+        url_endpoint = f'/api/xbrl/frames/{taxonomy}/{tag}/{unit}/{period}.json'
+        units = self.concepts[taxonomy].get(tag)
+        if units is None:
+            self.__not_found(url_endpoint, f"Unknown tag: {taxonomy}/{tag}.")
+        elif self.normalize_unit(unit) not in units:
+            self.__not_found(url_endpoint, f"Unknown unit for {taxonomy}/{tag}: {unit}.")
+    def load(self) -> None:
+        """
+        Load the catalog from its JSON file.
+
+        Raises:
+            ValueError: If the catalog was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("FactCatalog has no path to load from.")
+        with open(self.path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        self.concepts = {taxonomy: {tag: {self.normalize_unit(unit) for unit in units} for tag, units in tags.items()} for taxonomy, tags in data['concepts'].items()}
+        self.companies = {cik: set(concepts) for cik, concepts in data['companies'].items()}
+        self.updated = data.get('updated', {})
+    def save(self) -> None:
+        """
+        Atomically write the catalog to its JSON file.
+
+        Raises:
+            ValueError: If the catalog was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("FactCatalog has no path to save to.")
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({
+                'concepts': {taxonomy: {tag: sorted(units) for tag, units in tags.items()} for taxonomy, tags in self.concepts.items()},
+                'companies': {cik: sorted(concepts) for cik, concepts in self.companies.items()},
+                'updated': self.updated
+            }, file, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+class CompanyUniverse:
+    """A columnar snapshot of the companies listed by the SEC, with vectorized lookups.
+
+    The universe keeps company_tickers.json as parallel columns of CIKs, tickers and names,
+    plus the exchange of every ticker from company_tickers_exchange.json, and indexes the
+    tickers once. Looking up, filtering or joining a whole list of companies is then a single
+    pass over that list instead of a scan of the universe per company. Tickers are compared
+    after normalize_ticker, so 'BRK.B', 'brk/b' and 'BRK-B' all match the same company.
+    """
+    columns: Sequence[str] = ('cik', 'ticker', 'title', 'exchange')
+    def __init__(self, path: Optional[str]=None) -> None:
+        """
+        Initialize the CompanyUniverse, loading an existing snapshot from disk if a path is given.
+
+        Args:
+            path (str, optional): Path of a JSON file used to persist the snapshot. If omitted, the universe is kept in memory only.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> universe = ed.EdgarHelpers.get_company_universe(path="universe.json")
+            >>> universe.lookup(["AAPL", "BRK.B"])
+        """
+        self.path: Optional[str] = path
+        self.cik: List[str] = []
+        self.ticker: List[str] = []
+        self.title: List[str] = []
+        self.exchange: List[Optional[str]] = []
+        self.fetched: Optional[float] = None
+        self.index: Dict[str, int] = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+    def __repr__(self) -> str:
+        """
+        String representation of the CompanyUniverse class.
+
+        Returns:
+            str: A string representation of the CompanyUniverse class.
+        """
+        return f"CompanyUniverse(path={self.path!r}, companies={len(self.cik)})"
+    def __len__(self) -> int:
+        """
+        Get the number of companies in the universe.
+
+        Returns:
+            int: The number of rows, one per ticker.
+        """
+        return len(self.cik)
+    def __contains__(self, ticker: str) -> bool:
+        """
+        Check if a ticker is listed in the universe.
+
+        Args:
+            ticker (str): The ticker symbol, in any form accepted by normalize_ticker.
+
+        Returns:
+            bool: True if the ticker is listed, False otherwise.
+        """
+        return self.normalize_ticker(ticker) in self.index
+    @overload
+    def __getitem__(self, row: int) -> Company: ...
+    @overload
+    def __getitem__(self, row: slice) -> 'CompanyUniverse': ...
+    def __getitem__(self, row: Union[int, slice]) -> Union[Company, 'CompanyUniverse']:
+        """
+        Get a row of the universe as a Company, or a slice of rows as a universe.
+
+        Args:
+            row (int | slice): The position of the row, or a slice of positions.
+
+        Returns:
+            Company | CompanyUniverse: The company listed in the row, or an in-memory universe of the sliced rows.
+
+        Raises:
+            TypeError: If row is neither an integer nor a slice.
+        """
+        if isinstance(row, slice):
+            return self.__select(list(range(*row.indices(len(self.cik)))))
+        if not isinstance(row, int):
+            raise TypeError(f"CompanyUniverse indices must be integers or slices, not {type(row).__name__}.")
+        return Company(cik=self.cik[row], ticker=self.ticker[row], title=self.title[row])
+    def __iter__(self) -> Iterator[Company]:
+        """
+        Iterate over the rows of the universe as Company instances.
+
+        Returns:
+            Iterator[Company]: The companies, in the order of company_tickers.json.
+        """
+        return map(Company, self.cik, self.ticker, self.title)
+    # Private Methods
+    def __index(self, tickers: List[str]) -> Dict[str, int]:
+        """
+        Build the index from normalized tickers to rows, keeping the first row of a repeated ticker.
+        """
+        index: Dict[str, int] = {}
+        for row, ticker in enumerate(tickers):
+            index.setdefault(self.normalize_ticker(ticker), row)
+        return index
+    def __column(self, name: str) -> List[Any]:
+        """
+        Get a column by name.
+        """
+        if name not in self.columns:
+            raise ValueError(f"Unknown column: {name}.")
+        return getattr(self, name)
+    def __select(self, rows: List[int]) -> 'CompanyUniverse':
+        """
+        Build an in-memory universe from some of this universe's rows.
+        """
+        universe = CompanyUniverse()
+        for name in self.columns:
+            column = self.__column(name)
+            setattr(universe, name, [column[row] for row in rows])
+        universe.fetched = self.fetched
+        universe.index = self.__index(universe.ticker)
+        return universe
+    # Public Methods
+    @staticmethod
+    def normalize_ticker(ticker: Optional[str]) -> str:
+        """
+        Normalize a ticker symbol to the form used in company_tickers.json.
+
+        Args:
+            ticker (str, optional): The ticker symbol, e.g. 'brk.b' or 'BRK/B'.
+
+        Returns:
+            str: The upper-case ticker with share class separators replaced by '-', e.g. 'BRK-B', or an empty string for a missing ticker.
+        """
+        if not isinstance(ticker, str):
+            return ''
+        return ticker.strip().upper().replace('.', '-').replace('/', '-')
+    def update(self, company_tickers: Union[Dict[str, Dict[str, Any]], List[Dict[str, Any]]], company_tickers_exchange: Optional[Dict[str, List[Any]]]=None) -> None:
+        """
+        Replace the universe with the contents of company_tickers.json.
+
+        Args:
+            company_tickers (Dict[str, Dict[str, Any]] | List[Dict[str, Any]]): The company_tickers.json payload, e.g. as returned by EdgarAPI.get_company_tickers.
+            company_tickers_exchange (Dict[str, List[Any]], optional): The company_tickers_exchange.json payload, e.g. as returned by EdgarAPI.get_company_tickers_exchange. Without it, or for tickers it does not list, the exchange is None.
+        """
+        companies = list(company_tickers.values() if isinstance(company_tickers, dict) else company_tickers)
+        self.cik = [str(item.get('cik_str', '')) for item in companies]
+        self.ticker = [item.get('ticker', '') for item in companies]
+        self.title = [item.get('title', '') for item in companies]
+        self.index = self.__index(self.ticker)
+        exchanges: List[Optional[str]] = [None] * len(companies)
+        if company_tickers_exchange is not None:
+            fields = company_tickers_exchange['fields']
+            ticker_field, exchange_field = fields.index('ticker'), fields.index('exchange')
+            for data in company_tickers_exchange['data']:
+                row = self.index.get(self.normalize_ticker(data[ticker_field]))
+                if row is not None:
+                    exchanges[row] = data[exchange_field]
+        self.exchange = exchanges
+        self.fetched = time.time()
+    def is_stale(self, max_age: float) -> bool:
+        """
+        Check if the snapshot is missing or older than a given age.
+
+        Args:
+            max_age (float): The age in seconds after which the snapshot should be fetched again.
+
+        Returns:
+            bool: True if the universe was never fetched or was fetched more than max_age seconds ago, False otherwise.
+        """
+        return self.fetched is None or time.time() - self.fetched > max_age
+    def lookup(self, tickers: Iterable[Optional[str]], column: str='cik') -> List[Any]:
+        """
+        Look up a column for every ticker of a list in one pass.
+
+        Args:
+            tickers (Iterable[str]): The ticker symbols, in any form accepted by normalize_ticker.
+            column (str): The column to return: 'cik', 'ticker', 'title' or 'exchange'. Defaults to 'cik'.
+
+        Returns:
+            List[Any]: The value of the column for each ticker, in the same order, with None for tickers not in the universe.
+
+        Raises:
+            ValueError: If column is unknown.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> universe = ed.EdgarHelpers.get_company_universe()
+            >>> universe.lookup(["AAPL", "MSFT", "NOT-LISTED"])
+            ['320193', '789019', None]
+        """
+        values = self.__column(column)
+        rows = [self.index.get(self.normalize_ticker(ticker)) for ticker in tickers]
+        return [None if row is None else values[row] for row in rows]
+    def filter(self, exchange: Optional[Union[str, Iterable[str]]]=None, search_text: Optional[str]=None, central_index_keys: Optional[Iterable[Union[str, int]]]=None, tickers: Optional[Iterable[str]]=None) -> 'CompanyUniverse':
+        """
+        Select the companies matching every given condition.
+
+        Args:
+            exchange (str | Iterable[str], optional): The exchange, or exchanges, to keep (e.g. 'NYSE' or ['Nasdaq', 'NYSE']).
+            search_text (str, optional): Text the company name must contain, ignoring case.
+            central_index_keys (Iterable[str | int], optional): The CIKs to keep, with or without leading zeros.
+            tickers (Iterable[str], optional): The tickers to keep, in any form accepted by normalize_ticker.
+
+        Returns:
+            CompanyUniverse: An in-memory universe of the matching rows, in their original order.
+        """
+        rows: List[int] = list(range(len(self.cik)))
+        if tickers is not None:
+            selected = {self.index.get(self.normalize_ticker(ticker)) for ticker in tickers}
+            rows = [row for row in rows if row in selected]
+        if central_index_keys is not None:
+            ciks = {str(int(central_index_key)) for central_index_key in central_index_keys}
+            rows = [row for row in rows if self.cik[row] in ciks]
+        if exchange is not None:
+            exchanges = {exchange} if isinstance(exchange, str) else set(exchange)
+            rows = [row for row in rows if self.exchange[row] in exchanges]
+        if search_text is not None:
+            text = search_text.lower()
+            rows = [row for row in rows if text in self.title[row].lower()]
+        return self.__select(rows)
+    def join(self, records: Iterable[Mapping[str, Any]], on: str='ticker', columns: Sequence[str]=('cik', 'title', 'exchange'), how: str='left') -> List[Dict[str, Any]]:
+        """
+        Join records, e.g. the rows of a holdings file, to the universe by ticker.
+
+        Args:
+            records (Iterable[Mapping[str, Any]]): The records to join, e.g. from csv.DictReader.
+            on (str): The key of the ticker in every record. Defaults to 'ticker'.
+            columns (Sequence[str]): The universe columns added to every record. Defaults to ('cik', 'title', 'exchange').
+            how (str): 'left' to keep unmatched records with None in the added columns, or 'inner' to drop them. Defaults to 'left'.
+
+        Returns:
+            List[Dict[str, Any]]: A copy of every kept record with the added columns, in the order of records.
+
+        Raises:
+            ValueError: If how or a column is unknown.
+
+        Example:
+            >>> import csv
+            >>> import edgar_sec as ed
+            >>> universe = ed.EdgarHelpers.get_company_universe()
+            >>> with open("holdings.csv", newline="") as file:
+            >>>     holdings = universe.join(csv.DictReader(file), on="Symbol", columns=["cik"])
+        """
+        if how not in ('left', 'inner'):
+            raise ValueError(f"Unknown join: {how}.")
+        values = [self.__column(column) for column in columns]
+        joined: List[Dict[str, Any]] = []
+        for record in records:
+            row = self.index.get(self.normalize_ticker(record.get(on)))
+            if row is None:
+                if how == 'left':
+                    joined.append({**record, **dict.fromkeys(columns)})
+                continue
+            joined.append({**record, **{column: value[row] for column, value in zip(columns, values)}})
+        return joined
+    def load(self) -> None:
+        """
+        Load the snapshot from its JSON file.
+
+        Raises:
+            ValueError: If the universe was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("CompanyUniverse has no path to load from.")
+        with open(self.path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        for name in self.columns:
+            setattr(self, name, data[name])
+        self.fetched = data['fetched']
+        self.index = self.__index(self.ticker)
+    def save(self) -> None:
+        """
+        Atomically write the snapshot to its JSON file.
+
+        Raises:
+            ValueError: If the universe was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("CompanyUniverse has no path to save to.")
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'fetched': self.fetched, **{name: self.__column(name) for name in self.columns}}, file, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,728 @@
+# filepath: /src/edgar_sec/testing.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines an offline stand-in for the EDGAR API and a load-test harness.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import random
+import re
+import statistics
+import threading
+import time
+import httpx
+from tenacity import RetryError
+from edgar_sec.clients import EdgarAPI
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class PayloadGenerator:
+    """Generate deterministic, schema-faithful EDGAR payloads at any size.
+
+    Every method returns the raw JSON shape of an EDGAR endpoint (or of the part of
+    one that an edgar_sec.objects class parses), sized by its arguments. Output depends
+    only on the seed and the arguments, not on call order, so payloads are stable across
+    runs for benchmarks and memory profiling.
+    """
+    forms: Tuple[str, ...] = ('10-Q', '10-Q', '10-Q', '10-K', '8-K', '4')
+    states: Tuple[str, ...] = ('CA', 'NY', 'TX', 'WA', 'IL', 'MA', 'DE', 'NJ')
+    exchanges: Tuple[Optional[str], ...] = ('Nasdaq', 'NYSE', 'Nasdaq', 'OTC', 'CBOE', None)
+    def __init__(self, seed: int=0) -> None:
+        """
+        Initialize the PayloadGenerator.
+
+        Args:
+            seed (int): The seed all payloads derive from. Defaults to 0.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> from edgar_sec.testing import PayloadGenerator
+            >>> generator = PayloadGenerator()
+            >>> company_facts = ed.CompanyFacts.to_object(generator.company_facts(320193, tags=2000, facts_per_tag=100))
+        """
+        self.seed: int = seed
+    def __repr__(self) -> str:
+        """
+        String representation of the PayloadGenerator class.
+
+        Returns:
+            str: A string representation of the PayloadGenerator class.
+        """
+        return f"PayloadGenerator(seed={self.seed})"
+    # Private Methods
+    def __random(self, *key: Any) -> random.Random:
+        """
+        Create a random generator seeded by the generator seed and a payload key.
+        """
+        return random.Random(f"{self.seed}:{key}")  # nosec B311 - seeded for reproducible payloads, not security
+    @staticmethod
+    def __period(period: int) -> Tuple[int, int, date, date]:
+        """
+        Get the fiscal year, quarter, quarter start and quarter end of the period-th quarter since 2000.
+        """
+        year, quarter = 2000 + period // 4, period % 4
+        start = date(year, quarter * 3 + 1, 1)
+        end = date(year + 1, 1, 1) - timedelta(days=1) if quarter == 3 else date(year, quarter * 3 + 4, 1) - timedelta(days=1)
+        return year, quarter, start, end
+    # Public Methods
+    def address(self, address_type: str='business', foreign: bool=False) -> Dict[str, Any]:
+        """
+        Generate an address, as parsed by Address.to_object.
+
+        Args:
+            address_type (str): 'business' or 'mailing'. Defaults to 'business'.
+            foreign (bool): Whether the address is outside the US. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: The address payload.
+        """
+        rng = self.__random('address', address_type, foreign)
+        state = rng.choice(self.states)
+        address = {
+            'street1': f"{rng.randint(1, 9999)} MAIN STREET",
+            'street2': rng.choice([None, f"SUITE {rng.randint(100, 999)}"]),
+            'city': f"CITY {rng.randint(1, 500)}",
+            'stateOrCountry': 'X0' if foreign else state,
+            'zipCode': f"{rng.randint(10000, 99999)}",
+            'stateOrCountryDescription': 'UNITED KINGDOM' if foreign else state,
+            'isForeignLocation': int(foreign),
+            'foreignStateTerritory': None
+        }
+        if foreign:
+            address.update({'country': 'United Kingdom', 'countryCode': 'GB'})
+        return address
+    def former_name(self, index: int=0) -> Dict[str, str]:
+        """
+        Generate a former name, as parsed by FormerName.to_object.
+
+        Args:
+            index (int): The position of the former name, oldest first. Defaults to 0.
+
+        Returns:
+            Dict[str, str]: The former name payload.
+        """
+        return {'name': f"FORMER NAME {index} INC", 'from': f"{1990 + index * 5}-01-01T00:00:00.000Z", 'to': f"{1994 + index * 5}-12-31T00:00:00.000Z"}
+    def file(self, cik: int, index: int=0, filing_count: int=1000) -> Dict[str, Any]:
+        """
+        Generate a submissions file reference, as parsed by File.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            index (int): The position of the file, newest first. Defaults to 0.
+            filing_count (int): The number of filings in the file. Defaults to 1000.
+
+        Returns:
+            Dict[str, Any]: The file payload.
+        """
+        return {'name': f"CIK{cik:010d}-submissions-{index + 1:03d}.json", 'filingCount': filing_count, 'filingFrom': f"{1994 + index * 5}-01-01", 'filingTo': f"{1998 + index * 5}-12-31"}
+    def filings(self, cik: int, filings: int=1000) -> Dict[str, List[Any]]:
+        """
+        Generate the columnar recent filings of a submission history, as parsed by Filing.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            filings (int): The number of filings, newest first. Defaults to 1000.
+
+        Returns:
+            Dict[str, List[Any]]: The recent filings payload.
+        """
+        rng = self.__random('filings', cik, filings)
+        filed = [date(2025, 6, 30) - timedelta(days=index * 3 + rng.randint(0, 2)) for index in range(filings)]
+        forms = [rng.choice(self.forms) for _ in range(filings)]
+        return {
+            'accessionNumber': [f"{cik:010d}-{day.year % 100:02d}-{filings - index:06d}" for index, day in enumerate(filed)],
+            'filingDate': [day.isoformat() for day in filed],
+            'reportDate': [(day - timedelta(days=35)).isoformat() if form in ('10-Q', '10-K') else '' for day, form in zip(filed, forms)],
+            'acceptanceDateTime': [f"{day.isoformat()}T16:{rng.randint(0, 59):02d}:00.000Z" for day in filed],
+            'act': ['34' if form != '4' else '' for form in forms],
+            'form': forms,
+            'fileNumber': ['001-36743' if form != '4' else '' for form in forms],
+            'filmNumber': [str(rng.randint(20000000, 25999999)) if form != '4' else '' for form in forms],
+            'items': ['2.02,9.01' if form == '8-K' else '' for form in forms],
+            'core_type': forms,
+            'size': [rng.randint(5000, 15000000) for _ in range(filings)],
+            'isXBRL': [int(form in ('10-Q', '10-K', '8-K')) for form in forms],
+            'isInlineXBRL': [int(form in ('10-Q', '10-K')) for form in forms],
+            'primaryDocument': [f"doc{filings - index}.htm" for index in range(filings)],
+            'primaryDocDescription': forms
+        }
+    def submissions(self, cik: int, filings: int=1000, files: int=0, former_names: int=1) -> Dict[str, Any]:
+        """
+        Generate a submissions response, as parsed by SubmissionHistory.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            filings (int): The number of recent filings. Defaults to 1000, the EDGAR maximum.
+            files (int): The number of additional submissions files referenced. Defaults to 0.
+            former_names (int): The number of former names. Defaults to 1.
+
+        Returns:
+            Dict[str, Any]: The submissions payload.
+        """
+        rng = self.__random('submissions', cik)
+        return {
+            'cik': f"{cik:010d}",
+            'entityType': 'operating',
+            'sic': str(rng.randint(1000, 9999)),
+            'sicDescription': 'Services-Prepackaged Software',
+            'ownerOrg': '06 Technology',
+            'insiderTransactionForOwnerExists': 0,
+            'insiderTransactionForIssuerExists': 1,
+            'name': f"COMPANY {cik} INC",
+            'tickers': [f"T{cik}"],
+            'exchanges': ['Nasdaq'],
+            'ein': f"{rng.randint(100000000, 999999999)}",
+            'lei': None,
+            'description': '',
+            'website': '',
+            'investorWebsite': '',
+            'category': 'Large accelerated filer',
+            'fiscalYearEnd': '1231',
+            'stateOfIncorporation': 'DE',
+            'stateOfIncorporationDescription': 'DE',
+            'addresses': {'mailing': self.address('mailing'), 'business': self.address('business')},
+            'phone': f"{rng.randint(200, 999)}-555-{rng.randint(1000, 9999)}",
+            'flags': '',
+            'formerNames': [self.former_name(index) for index in range(former_names)],
+            'filings': {
+                'recent': self.filings(cik, filings),
+                'files': [self.file(cik, index) for index in range(files)]
+            }
+        }
+    def unit_disclosures(self, cik: int, tag: str, facts: int=100, instant: bool=False) -> List[Dict[str, Any]]:
+        """
+        Generate the disclosures of one concept and unit, as parsed by UnitDisclosure.to_object.
+
+        Every quarter is reported twice, in its own filing and again as a comparative a year later, and about one
+        comparative in twenty is a restatement, mirroring the repetition found in real companyfacts payloads.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            tag (str): The concept tag, which seeds the values.
+            facts (int): The number of disclosures. Defaults to 100.
+            instant (bool): Whether the concept is a point-in-time (balance sheet) concept. Defaults to False.
+
+        Returns:
+            List[Dict[str, Any]]: The disclosures, ordered by period end and filed date.
+        """
+        rng = self.__random('unit_disclosures', cik, tag, instant)
+        base = rng.uniform(1e6, 1e11)
+        disclosures = []
+        for index in range(facts):
+            period, comparative = index // 2, index % 2
+            year, quarter, start, end = self.__period(period)
+            _, filing_quarter, _, filing_end = self.__period(period + comparative * 4)
+            annual = filing_quarter == 3
+            val = round(base * (1 + period / 40) * (4 if annual and not instant else 1))
+            if comparative and rng.random() < 0.05:
+                val = round(val * rng.uniform(0.95, 1.05))
+            disclosure: Dict[str, Any] = {}
+            if not instant:
+                disclosure['start'] = (date(year, 1, 1) if annual and quarter == 3 else start).isoformat()
+            disclosure.update({
+                'end': end.isoformat(),
+                'val': val,
+                'accn': f"{cik:010d}-{(filing_end.year + 1) % 100 if annual else filing_end.year % 100:02d}-{period + comparative * 4:06d}",
+                'fy': filing_end.year,
+                'fp': 'FY' if annual else f"Q{filing_quarter + 1}",
+                'form': '10-K' if annual else '10-Q',
+                'filed': (filing_end + timedelta(days=60 if annual else 35)).isoformat()
+            })
+            if not comparative:
+                disclosure['frame'] = f"CY{year}Q{quarter + 1}I" if instant else (f"CY{year}" if annual and quarter == 3 else f"CY{year}Q{quarter + 1}")
+            disclosures.append(disclosure)
+        return disclosures
+    def taxonomy_disclosures(self, cik: int, tag: str, facts: int=100, instant: bool=False, unit: str='USD') -> Dict[str, Any]:
+        """
+        Generate the payload of one concept in a companyfacts response, as parsed by TaxonomyDisclosures.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            tag (str): The concept tag.
+            facts (int): The number of disclosures. Defaults to 100.
+            instant (bool): Whether the concept is a point-in-time concept. Defaults to False.
+            unit (str): The unit of measure. Defaults to 'USD'.
+
+        Returns:
+            Dict[str, Any]: The concept payload.
+        """
+        return {'label': tag, 'description': f"The amount of {tag}.", 'units': {unit: self.unit_disclosures(cik, tag, facts, instant)}}
+    def taxonomy_facts(self, cik: int, tags: int=100, facts_per_tag: int=100) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate the payload of one taxonomy in a companyfacts response, as parsed by TaxonomyFacts.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            tags (int): The number of concepts; every other concept is a point-in-time concept. Defaults to 100.
+            facts_per_tag (int): The number of disclosures per concept. Defaults to 100.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The taxonomy payload, keyed by concept tag.
+        """
+        return {f"Concept{index}": self.taxonomy_disclosures(cik, f"Concept{index}", facts_per_tag, instant=index % 2 == 0) for index in range(tags)}
+    def company_facts(self, cik: int, tags: int=100, facts_per_tag: int=100) -> Dict[str, Any]:
+        """
+        Generate a companyfacts response, as parsed by CompanyFacts.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            tags (int): The number of us-gaap concepts. Defaults to 100.
+            facts_per_tag (int): The number of disclosures per concept. Defaults to 100, so 200,000 facts need e.g. tags=2000.
+
+        Returns:
+            Dict[str, Any]: The companyfacts payload, with a dei taxonomy holding shares outstanding and a us-gaap taxonomy.
+        """
+        return {
+            'cik': cik,
+            'entityName': f"COMPANY {cik} INC",
+            'facts': {
+                'dei': {'EntityCommonStockSharesOutstanding': self.taxonomy_disclosures(cik, 'EntityCommonStockSharesOutstanding', min(facts_per_tag, 100), instant=True, unit='shares')},
+                'us-gaap': self.taxonomy_facts(cik, tags, facts_per_tag)
+            }
+        }
+    def company_concept(self, cik: int, taxonomy: str='us-gaap', tag: str='Assets', facts: int=100, instant: bool=True) -> Dict[str, Any]:
+        """
+        Generate a companyconcept response, as parsed by CompanyConcept.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            taxonomy (str): The taxonomy. Defaults to 'us-gaap'.
+            tag (str): The concept tag. Defaults to 'Assets'.
+            facts (int): The number of disclosures. Defaults to 100.
+            instant (bool): Whether the concept is a point-in-time concept. Defaults to True.
+
+        Returns:
+            Dict[str, Any]: The companyconcept payload.
+        """
+        return {'cik': cik, 'taxonomy': taxonomy, 'tag': tag, 'entityName': f"COMPANY {cik} INC", **self.taxonomy_disclosures(cik, tag, facts, instant)}
+    def frame_disclosure(self, cik: int, period: str='CY2019Q1I') -> Dict[str, Any]:
+        """
+        Generate one row of a frames response, as parsed by FrameDisclosure.to_object.
+
+        Args:
+            cik (int): The Central Index Key of the filer.
+            period (str): The frame period. Defaults to 'CY2019Q1I'.
+
+        Returns:
+            Dict[str, Any]: The frame row payload.
+        """
+        rng = self.__random('frame_disclosure', cik, period)
+        year, quarter = int(period[2:6]), int(period[7]) if len(period) > 6 else 4
+        _, _, _, end = self.__period((year - 2000) * 4 + quarter - 1)
+        return {
+            'accn': f"{cik:010d}-{(end.year + 1) % 100:02d}-{rng.randint(1, 999999):06d}",
+            'cik': cik,
+            'entityName': f"COMPANY {cik} INC",
+            'loc': f"US-{rng.choice(self.states)}",
+            'end': (end - timedelta(days=rng.choice((0, 0, 0, 1, 30)))).isoformat(),
+            'val': round(rng.lognormvariate(17, 2.5))
+        }
+    def frame(self, taxonomy: str='us-gaap', tag: str='Assets', unit: str='USD', period: str='CY2019Q1I', companies: int=6000) -> Dict[str, Any]:
+        """
+        Generate a frames response, as parsed by Frame.to_object.
+
+        Args:
+            taxonomy (str): The taxonomy. Defaults to 'us-gaap'.
+            tag (str): The concept tag. Defaults to 'Assets'.
+            unit (str): The unit of measure. Defaults to 'USD'.
+            period (str): The frame period. Defaults to 'CY2019Q1I'.
+            companies (int): The number of rows. Defaults to 6000, about the size of a popular us-gaap frame.
+
+        Returns:
+            Dict[str, Any]: The frames payload.
+        """
+        return {
+            'taxonomy': taxonomy,
+            'tag': tag,
+            'ccp': period,
+            'uom': unit,
+            'label': tag,
+            'description': f"The amount of {tag}.",
+            'pts': companies,
+            'data': [self.frame_disclosure(1000 + index * 7, period) for index in range(companies)]
+        }
+    def company_tickers(self, companies: int=10000) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate a company_tickers.json response; each value is parsed by Company.to_object.
+
+        Args:
+            companies (int): The number of companies. Defaults to 10000.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The payload, keyed by position as in the SEC file.
+        """
+        return {str(index): {'cik_str': 1000 + index * 7, 'ticker': f"T{1000 + index * 7}", 'title': f"COMPANY {1000 + index * 7} INC"} for index in range(companies)}
+    def company_tickers_exchange(self, companies: int=10000) -> Dict[str, List[Any]]:
+        """
+        Generate a company_tickers_exchange.json response listing the companies of company_tickers.
+
+        Args:
+            companies (int): The number of companies. Defaults to 10000.
+
+        Returns:
+            Dict[str, List[Any]]: The payload, with 'fields' naming the columns of every row in 'data' as in the SEC file.
+        """
+        return {
+            'fields': ['cik', 'name', 'ticker', 'exchange'],
+            'data': [[1000 + index * 7, f"COMPANY {1000 + index * 7} INC", f"T{1000 + index * 7}", self.exchanges[index % len(self.exchanges)]] for index in range(companies)]
+        }
+
+class MockEdgarServer(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serve EDGAR API responses in-process.
+
+    The server is an httpx transport, so an EdgarAPI built with transport=server sends
+    every sync and async request to it instead of data.sec.gov and www.sec.gov. It
+    answers the submissions, companyfacts, companyconcept and frames endpoints and
+    company_tickers.json and company_tickers_exchange.json with recorded responses when available and synthetic ones
+    otherwise, and can add latency and throttle requests with 429 responses.
+    """
+    routes: Tuple[Tuple[str, str], ...] = (
+        ('submissions', r'/submissions/CIK(?P<cik>\d{10})\.json'),
+        ('companyfacts', r'/api/xbrl/companyfacts/CIK(?P<cik>\d{10})\.json'),
+        ('companyconcept', r'/api/xbrl/companyconcept/CIK(?P<cik>\d{10})/(?P<taxonomy>[^/]+)/(?P<tag>[^/]+)\.json'),
+        ('frames', r'/api/xbrl/frames/(?P<taxonomy>[^/]+)/(?P<tag>[^/]+)/(?P<unit>[^/]+)/(?P<period>CY\d{4}(?:Q[1-4]I?)?)\.json'),
+        ('company_tickers', r'/files/company_tickers\.json'),
+        ('company_tickers_exchange', r'/files/company_tickers_exchange\.json')
+    )
+    def __init__(self, latency: float=0.0, jitter: float=0.0, throttle_rate: float=0.0, rate_limit: Optional[int]=None, payload_size: int=100, responses: Optional[Dict[str, Dict]]=None, seed: int=0) -> None:
+        """
+        Initialize the MockEdgarServer.
+
+        Args:
+            latency (float): Seconds added to every response. Defaults to 0.
+            jitter (float): Maximum random seconds added on top of latency. Defaults to 0.
+            throttle_rate (float): Probability of answering any request with a 429 response. Defaults to 0.
+            rate_limit (int, optional): Requests per second above which the server answers with 429 responses, like data.sec.gov.
+            payload_size (int): Number of filings, concepts and facts per concept, or frame rows in synthetic responses, which come from a PayloadGenerator. Defaults to 100.
+            responses (Dict[str, Dict], optional): Recorded JSON responses keyed by URL path (e.g. '/submissions/CIK0000320193.json'), served instead of synthetic ones.
+            seed (int): Seed for synthetic payloads, latency jitter and throttling. Defaults to 0.
+
+        Raises:
+            ValueError: If payload_size is not a positive integer or throttle_rate is not between 0 and 1.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> from edgar_sec.testing import MockEdgarServer
+            >>> server = MockEdgarServer(latency=0.05, rate_limit=10)
+            >>> api = ed.EdgarAPI(transport=server)
+            >>> facts = api.get_company_facts(central_index_key="0000320193")
+        """
+        if payload_size <= 0:
+            raise ValueError("payload_size must be a positive integer.")
+        if not 0 <= throttle_rate <= 1:
+            raise ValueError("throttle_rate must be between 0 and 1.")
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.throttle_rate: float = throttle_rate
+        self.rate_limit: Optional[int] = rate_limit
+        self.payload_size: int = payload_size
+        self.responses: Dict[str, Dict] = dict(responses or {})
+        self.random: random.Random = random.Random(seed)  # nosec B311 - seeded for reproducible latency and throttling, not security
+        self.generator: PayloadGenerator = PayloadGenerator(seed)
+        self.request_times: deque = deque()
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.lock: threading.Lock = threading.Lock()
+    def __repr__(self) -> str:
+        """
+        String representation of the MockEdgarServer class.
+
+        Returns:
+            str: A string representation of the MockEdgarServer class.
+        """
+        return f"MockEdgarServer(latency={self.latency}, throttle_rate={self.throttle_rate}, rate_limit={self.rate_limit}, payload_size={self.payload_size})"
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state of the MockEdgarServer for pickling, without its lock.
+
+        Returns:
+            Dict[str, Any]: The server's attributes; counters continue from their pickled values.
+        """
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore an unpickled MockEdgarServer with a new lock.
+
+        Args:
+            state (Dict[str, Any]): The output of __getstate__.
+        """
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+    # Private Methods
+    def __delay(self) -> float:
+        """
+        Draw the delay of the next response.
+        """
+        with self.lock:
+            return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+    def __throttle(self) -> bool:
+        """
+        Count a request and decide whether it is answered with a 429 response.
+        """
+        with self.lock:
+            now = time.time()
+            self.requests += 1
+            self.request_times.append(now)
+            while self.request_times and self.request_times[0] < now - 1:
+                self.request_times.popleft()
+            throttled = (self.rate_limit is not None and len(self.request_times) > self.rate_limit) or (self.throttle_rate > 0 and self.random.random() < self.throttle_rate)
+            if throttled:
+                self.throttled += 1
+            return throttled
+    def __synthesize(self, endpoint: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Build a synthetic response for an endpoint.
+        """
+        size = self.payload_size
+        if endpoint == 'submissions':
+            return self.generator.submissions(int(params['cik']), filings=size)
+        if endpoint == 'companyfacts':
+            return self.generator.company_facts(int(params['cik']), tags=size, facts_per_tag=size)
+        if endpoint == 'companyconcept':
+            return self.generator.company_concept(int(params['cik']), params['taxonomy'], params['tag'], facts=size)
+        if endpoint == 'company_tickers':
+            return self.generator.company_tickers(size)
+        if endpoint == 'company_tickers_exchange':
+            return self.generator.company_tickers_exchange(size)
+        return self.generator.frame(params['taxonomy'], params['tag'], params['unit'], params['period'], companies=size)
+    # Public Methods
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer a request without delay.
+
+        Args:
+            request (httpx.Request): The request to answer.
+
+        Returns:
+            httpx.Response: A 429 response if the request is throttled, the recorded or synthetic JSON response if the path matches an endpoint, or a 404 response otherwise.
+        """
+        if self.__throttle():
+            return httpx.Response(429, headers={'Retry-After': '1'}, request=request)
+        path = request.url.path
+        if path in self.responses:
+            return httpx.Response(200, json=self.responses[path], request=request)
+        for endpoint, pattern in self.routes:
+            match = re.fullmatch(pattern, path)
+            if match:
+                return httpx.Response(200, json=self.__synthesize(endpoint, match.groupdict()), request=request)
+        return httpx.Response(404, request=request)
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer a synchronous request after the configured latency.
+
+        Args:
+            request (httpx.Request): The request to answer.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        delay = self.__delay()
+        if delay:
+            time.sleep(delay)
+        return self.respond(request)
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer an asynchronous request after the configured latency.
+
+        Args:
+            request (httpx.Request): The request to answer.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        delay = self.__delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.respond(request)
+
+@dataclass
+class LoadTestReport:
+    """
+    A class representing the results of a load test run.
+    """
+    requests: int
+    errors: int
+    concurrency: int
+    duration: float
+    throughput: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+
+    @classmethod
+    def to_object(cls, latencies: List[float], errors: int, concurrency: int, duration: float) -> 'LoadTestReport':
+        """
+        Summarizes per-call latencies in seconds and returns a LoadTestReport object.
+        """
+        if len(latencies) > 1:
+            quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+            p50, p90, p99 = quantiles[49], quantiles[89], quantiles[98]
+        else:
+            p50 = p90 = p99 = latencies[0] if latencies else 0.0
+        return cls(
+            requests=len(latencies),
+            errors=errors,
+            concurrency=concurrency,
+            duration=duration,
+            throughput=len(latencies) / duration if duration > 0 else 0.0,
+            latency_p50=p50,
+            latency_p90=p90,
+            latency_p99=p99,
+            latency_max=max(latencies, default=0.0)
+        )
+
+class LoadTest:
+    """Drive an EdgarAPI at a fixed concurrency and measure throughput and latency.
+
+    Calls cycle through submissions, company facts, company concept and frames requests
+    for a list of CIKs. Point the API at a MockEdgarServer to tune the rate limiter,
+    retries and concurrency offline.
+    """
+    def __init__(self, api: EdgarAPI, central_index_keys: Optional[List[str]]=None, endpoints: Tuple[str, ...]=('submissions', 'companyfacts', 'companyconcept', 'frames')) -> None:
+        """
+        Initialize the LoadTest.
+
+        Args:
+            api (EdgarAPI): The client under test, usually built with transport=MockEdgarServer(...).
+            central_index_keys (List[str], optional): The CIKs requested in turn. Defaults to ten synthetic CIKs.
+            endpoints (Tuple[str, ...]): The endpoints requested in turn. Defaults to all four.
+
+        Raises:
+            ValueError: If an endpoint is unknown.
+
+        Example:
+            >>> import edgar_sec as ed
+            >>> from edgar_sec.testing import MockEdgarServer, LoadTest
+            >>> api = ed.EdgarAPI(transport=MockEdgarServer(latency=0.05, rate_limit=10))
+            >>> report = LoadTest(api).run_async(requests=200, concurrency=20)
+            >>> print(report.throughput, report.latency_p99)
+        """
+        unknown = set(endpoints) - {'submissions', 'companyfacts', 'companyconcept', 'frames'}
+        if unknown:
+            raise ValueError(f"Unknown endpoints: {', '.join(sorted(unknown))}.")
+        self.api: EdgarAPI = api
+        self.central_index_keys: List[str] = central_index_keys or [f"{index:010d}" for index in range(1, 11)]
+        self.endpoints: Tuple[str, ...] = endpoints
+    def __repr__(self) -> str:
+        """
+        String representation of the LoadTest class.
+
+        Returns:
+            str: A string representation of the LoadTest class.
+        """
+        return f"LoadTest(api={self.api!r}, endpoints={self.endpoints})"
+    # Private Methods
+    def __call(self, index: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Pick the method name and arguments of the index-th call.
+        """
+        endpoint = self.endpoints[index % len(self.endpoints)]
+        cik = self.central_index_keys[index // len(self.endpoints) % len(self.central_index_keys)]
+        if endpoint == 'submissions':
+            return 'get_submissions', {'central_index_key': cik}
+        if endpoint == 'companyfacts':
+            return 'get_company_facts', {'central_index_key': cik}
+        if endpoint == 'companyconcept':
+            return 'get_company_concept', {'taxonomy': 'us-gaap', 'tag': 'Assets', 'central_index_key': cik}
+        return 'get_frames', {'taxonomy': 'us-gaap', 'tag': 'Assets', 'unit': 'USD', 'period': f"CY{2000 + index % 20}Q4", 'instantaneous': True}
+    # Public Methods
+    def run(self, requests: int, concurrency: int=1) -> LoadTestReport:
+        """
+        Run the load test against the synchronous client from a thread pool.
+
+        Args:
+            requests (int): The number of calls to make.
+            concurrency (int): The number of worker threads. Defaults to 1.
+
+        Returns:
+            LoadTestReport: Throughput and latency percentiles of the successful calls, and the number of failed ones.
+        """
+        errors: List[BaseException] = []
+        def timed(index: int) -> Optional[float]:
+            name, kwargs = self.__call(index)
+            start = time.perf_counter()
+            try:
+                getattr(self.api, name)(**kwargs)
+            except (httpx.HTTPError, RetryError, TimeoutError, ValueError) as e:
+                errors.append(e)
+                return None
+            return time.perf_counter() - start
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(timed, range(requests)))
+        duration = time.perf_counter() - start
+        return LoadTestReport.to_object([latency for latency in results if latency is not None], len(errors), concurrency, duration)
+    async def run_async_load(self, requests: int, concurrency: int=10) -> LoadTestReport:
+        """
+        Run the load test against the asynchronous client.
+
+        Args:
+            requests (int): The number of calls to make.
+            concurrency (int): The maximum number of calls in flight. Defaults to 10.
+
+        Returns:
+            LoadTestReport: Throughput and latency percentiles of the successful calls, and the number of failed ones.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        errors: List[BaseException] = []
+        async def timed(index: int) -> Optional[float]:
+            name, kwargs = self.__call(index)
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await getattr(self.api.Async, name)(**kwargs)
+                except (httpx.HTTPError, RetryError, TimeoutError, ValueError) as e:
+                    errors.append(e)
+                    return None
+                return time.perf_counter() - start
+        start = time.perf_counter()
+        results = await asyncio.gather(*(timed(index) for index in range(requests)))
+        duration = time.perf_counter() - start
+        return LoadTestReport.to_object([latency for latency in results if latency is not None], len(errors), concurrency, duration)
+    def run_async(self, requests: int, concurrency: int=10) -> LoadTestReport:
+        """
+        Run the load test against the asynchronous client in a new event loop.
+
+        Args:
+            requests (int): The number of calls to make.
+            concurrency (int): The maximum number of calls in flight. Defaults to 10.
+
+        Returns:
+            LoadTestReport: Throughput and latency percentiles of the successful calls, and the number of failed ones.
+        """
+        return asyncio.run(self.run_async_load(requests, concurrency))
+    def sweep(self, requests: int, concurrency_levels: List[int], run: Optional[Callable[[int, int], LoadTestReport]]=None) -> List[LoadTestReport]:
+        """
+        Run the load test at several concurrency levels.
+
+        Args:
+            requests (int): The number of calls to make at each level.
+            concurrency_levels (List[int]): The concurrency levels to try.
+            run (Callable[[int, int], LoadTestReport], optional): The runner, LoadTest.run or LoadTest.run_async. Defaults to run_async.
+
+        Returns:
+            List[LoadTestReport]: One report per concurrency level.
+        """
+        runner = run or self.run_async
+        return [runner(requests, concurrency) for concurrency in concurrency_levels]
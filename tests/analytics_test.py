@@ -0,0 +1,243 @@
+# filepath: /test/analytics_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the analytics module.
+"""
+from datetime import datetime
+import pytest
+from edgar_sec.analytics import FrameEngine, TimeSeriesEngine, PointInTimeIndex
+from edgar_sec.objects import CompanyConcept, CompanyFacts, Frame, FrameDisclosure
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+def make_company_facts(cik, entity_name, disclosures):
+    return {
+        "cik": cik,
+        "entityName": entity_name,
+        "facts": {
+            "us-gaap": {
+                "Assets": {
+                    "label": "Assets",
+                    "description": "Sum of the carrying amounts of all assets.",
+                    "units": {"USD": disclosures}
+                }
+            }
+        }
+    }
+
+APPLE = make_company_facts(320193, "Apple Inc.", [
+    {"end": "2023-09-30", "val": 352583000000, "accn": "0000320193-23-000106", "fy": 2023, "fp": "FY", "form": "10-K", "filed": "2023-11-03", "frame": "CY2023Q3I"},
+    {"end": "2023-12-30", "val": 353514000000, "accn": "0000320193-24-000006", "fy": 2024, "fp": "Q1", "form": "10-Q", "filed": "2024-02-02", "frame": "CY2023Q4I"},
+    {"end": "2023-12-30", "val": 353514000000, "accn": "0000320193-24-000069", "fy": 2024, "fp": "Q2", "form": "10-Q", "filed": "2024-05-03"},
+])
+
+MICROSOFT = make_company_facts(789019, "MICROSOFT CORPORATION", [
+    {"end": "2023-12-31", "val": 470558000000, "accn": "0000950170-24-008814", "fy": 2024, "fp": "Q2", "form": "10-Q", "filed": "2024-01-30", "frame": "CY2023Q4I"},
+])
+
+REVENUES = {
+    "cik": 320193,
+    "entityName": "Apple Inc.",
+    "facts": {
+        "us-gaap": {
+            "Revenues": {
+                "label": "Revenues",
+                "description": "Revenue.",
+                "units": {
+                    "USD": [
+                        {"start": "2022-09-25", "end": "2022-12-31", "val": 117154, "accn": "a1", "fy": 2023, "fp": "Q1", "form": "10-Q", "filed": "2023-02-03"},
+                        {"start": "2022-09-25", "end": "2023-04-01", "val": 211990, "accn": "a2", "fy": 2023, "fp": "Q2", "form": "10-Q", "filed": "2023-05-05"},
+                        {"start": "2023-01-01", "end": "2023-04-01", "val": 94836, "accn": "a2", "fy": 2023, "fp": "Q2", "form": "10-Q", "filed": "2023-05-05"},
+                        {"start": "2022-09-25", "end": "2023-07-01", "val": 293787, "accn": "a3", "fy": 2023, "fp": "Q3", "form": "10-Q", "filed": "2023-08-04"},
+                        {"start": "2022-09-25", "end": "2023-09-30", "val": 383285, "accn": "a4", "fy": 2023, "fp": "FY", "form": "10-K", "filed": "2023-11-03"},
+                        {"start": "2023-10-01", "end": "2023-12-30", "val": 119575, "accn": "a5", "fy": 2024, "fp": "Q1", "form": "10-Q", "filed": "2024-02-02"},
+                        {"start": "2023-10-01", "end": "2023-12-30", "val": 119500, "accn": "a0", "fy": 2024, "fp": "Q1", "form": "8-K", "filed": "2024-01-15"}
+                    ]
+                }
+            }
+        }
+    }
+}
+
+class TestFrameEngine:
+    def test_init(self):
+        engine = FrameEngine([CompanyFacts.to_object(APPLE)])
+
+        assert len(engine) == 2
+        assert ("us-gaap", "Assets", "USD", "CY2023Q4I") in engine
+        assert repr(engine) == "FrameEngine(frames=2)"
+
+    def test_get_frame(self):
+        engine = FrameEngine([CompanyFacts.to_object(MICROSOFT), CompanyFacts.to_object(APPLE)])
+
+        frame = engine.get_frame("us-gaap", "Assets", "USD", "CY2023Q4", instantaneous=True)
+
+        assert isinstance(frame, Frame)
+        assert frame.ccp == "CY2023Q4I"
+        assert frame.uom == "USD"
+        assert frame.label == "Assets"
+        assert frame.pts == 2
+        assert frame.disclosures == [
+            FrameDisclosure(accn="0000320193-24-000006", cik="320193", entity_name="Apple Inc.", loc="", end="2023-12-30", val=353514000000.0),
+            FrameDisclosure(accn="0000950170-24-008814", cik="789019", entity_name="MICROSOFT CORPORATION", loc="", end="2023-12-31", val=470558000000.0),
+        ]
+        assert engine.get_frame("us-gaap", "Assets", "USD", datetime(2023, 12, 31), instantaneous=True) == frame
+
+        empty = engine.get_frame("us-gaap", "Liabilities", "USD", "CY2023Q4", instantaneous=True)
+        assert empty.pts == 0
+        assert empty.disclosures == []
+
+    def test_add_response(self):
+        engine = FrameEngine()
+        engine.add_response(APPLE)
+        engine.add_response(MICROSOFT)
+
+        parsed = FrameEngine([CompanyFacts.to_object(APPLE), CompanyFacts.to_object(MICROSOFT)])
+
+        assert engine.get_frame("us-gaap", "Assets", "USD", "CY2023Q4", instantaneous=True) == parsed.get_frame("us-gaap", "Assets", "USD", "CY2023Q4", instantaneous=True)
+
+    def test_add_keeps_latest_filed(self):
+        engine = FrameEngine()
+        engine.add_response(APPLE)
+        restated = make_company_facts(320193, "Apple Inc.", [
+            {"end": "2023-12-30", "val": 1.0, "accn": "0000320193-24-000070", "fy": 2024, "fp": "Q2", "form": "10-Q/A", "filed": "2024-06-01", "frame": "CY2023Q4I"},
+        ])
+        engine.add_response(restated)
+
+        frame = engine.get_frame("us-gaap", "Assets", "USD", "CY2023Q4", instantaneous=True)
+
+        assert frame.pts == 1
+        assert frame.disclosures[0].val == 1.0
+
+    def test_frames(self):
+        engine = FrameEngine([CompanyFacts.to_object(APPLE), CompanyFacts.to_object(MICROSOFT)])
+
+        assert engine.frames() == ["CY2023Q3I", "CY2023Q4I"]
+        assert engine.frames("us-gaap", "Assets", "USD") == ["CY2023Q3I", "CY2023Q4I"]
+        assert engine.frames(tag="Liabilities") == []
+
+    def test_get_frame_per_share(self):
+        eps = {
+            "cik": 320193,
+            "entityName": "Apple Inc.",
+            "facts": {
+                "us-gaap": {
+                    "EarningsPerShareBasic": {
+                        "label": "Earnings Per Share, Basic",
+                        "description": "Net income per share.",
+                        "units": {"USD/shares": [
+                            {"start": "2023-10-01", "end": "2023-12-30", "val": 2.19, "accn": "0000320193-24-000006", "fy": 2024, "fp": "Q1", "form": "10-Q", "filed": "2024-02-02", "frame": "CY2023Q4"},
+                        ]}
+                    }
+                }
+            }
+        }
+        engine = FrameEngine([CompanyFacts.to_object(eps)])
+
+        frame = engine.get_frame("us-gaap", "EarningsPerShareBasic", "USD-per-shares", "CY2023Q4", instantaneous=False)
+
+        assert frame.uom == "USD-per-shares"
+        assert frame.pts == 1
+        assert frame.disclosures[0].val == 2.19
+        assert engine.get_frame("us-gaap", "EarningsPerShareBasic", "USD/shares", "CY2023Q4", instantaneous=False) == frame
+        assert ("us-gaap", "EarningsPerShareBasic", "USD/shares", "CY2023Q4") in engine
+        assert engine.frames(unit="USD-per-shares") == engine.frames(unit="USD/shares") == ["CY2023Q4"]
+
+class TestTimeSeriesEngine:
+    def test_init(self):
+        engine = TimeSeriesEngine([CompanyFacts.to_object(REVENUES), CompanyFacts.to_object(APPLE)])
+
+        assert len(engine) == 1
+        assert ("320193", "us-gaap", "Revenues", "USD") in engine
+        assert repr(engine) == "TimeSeriesEngine(series=1)"
+
+    def test_classify(self):
+        assert TimeSeriesEngine.classify("", "2023-09-30") == "instant"
+        assert TimeSeriesEngine.classify("2023-01-01", "2023-04-01") == "quarter"
+        assert TimeSeriesEngine.classify("2022-09-25", "2023-04-01") == "half"
+        assert TimeSeriesEngine.classify("2022-09-25", "2023-07-01") == "nine_months"
+        assert TimeSeriesEngine.classify("2022-09-25", "2023-09-30") == "annual"
+        assert TimeSeriesEngine.classify("2022-09-25", "2022-10-30") == "other"
+
+    def test_quarterly(self):
+        engine = TimeSeriesEngine([CompanyFacts.to_object(REVENUES)])
+
+        assert engine.quarterly("us-gaap", "Revenues", "USD") == {"320193": {
+            "2022-12-31": 117154.0,
+            "2023-04-01": 94836.0,
+            "2023-07-01": 81797.0,
+            "2023-09-30": 89498.0,
+            "2023-12-30": 119575.0
+        }}
+        assert engine.quarterly("us-gaap", "Revenues", "USD", cik="0000320193") == engine.quarterly("us-gaap", "Revenues", "USD")
+        assert engine.quarterly("us-gaap", "Revenues", "USD", cik="789019") == {}
+
+    def test_ttm(self):
+        engine = TimeSeriesEngine()
+        engine.add_response(REVENUES)
+
+        assert engine.ttm("us-gaap", "Revenues", "USD") == {"320193": {
+            "2023-09-30": 383285.0,
+            "2023-12-30": 385706.0
+        }}
+
+    def test_add_concept(self):
+        engine = TimeSeriesEngine()
+        engine.add_concept(CompanyConcept.to_object({
+            "cik": 320193,
+            "taxonomy": "us-gaap",
+            "tag": "Revenues",
+            "entityName": "Apple Inc.",
+            "units": REVENUES["facts"]["us-gaap"]["Revenues"]["units"]
+        }))
+
+        assert engine.quarterly("us-gaap", "Revenues", "USD") == TimeSeriesEngine([CompanyFacts.to_object(REVENUES)]).quarterly("us-gaap", "Revenues", "USD")
+
+class TestPointInTimeIndex:
+    def test_init(self):
+        index = PointInTimeIndex([CompanyFacts.to_object(APPLE)])
+
+        assert len(index) == 1
+        assert ("320193", "us-gaap", "Assets", "USD") in index
+        assert repr(index) == "PointInTimeIndex(series=1)"
+
+    def test_as_of(self):
+        index = PointInTimeIndex([CompanyFacts.to_object(REVENUES)])
+
+        assert index.as_of("320193", "us-gaap", "Revenues", "USD", "2024-01-01", end="2023-12-30", start="2023-10-01") is None
+        early = index.as_of("0000320193", "us-gaap", "Revenues", "USD", "2024-01-20", end="2023-12-30", start="2023-10-01")
+        assert early.val == 119500.0
+        assert early.accn == "a0"
+        late = index.as_of("320193", "us-gaap", "Revenues", "USD", datetime(2024, 2, 2), end="2023-12-30", start="2023-10-01")
+        assert late.val == 119575.0
+        assert index.as_of("320193", "us-gaap", "Revenues", "USD", "2024-02-02", end="2023-12-30") is None
+        with pytest.raises(TypeError, match="as_of must be a string or datetime object."):
+            index.as_of("320193", "us-gaap", "Revenues", "USD", 2024, end="2023-12-30")
+
+    def test_snapshot(self):
+        index = PointInTimeIndex()
+        index.add_concept(CompanyConcept.to_object({
+            "cik": 320193,
+            "taxonomy": "us-gaap",
+            "tag": "Revenues",
+            "entityName": "Apple Inc.",
+            "units": REVENUES["facts"]["us-gaap"]["Revenues"]["units"]
+        }))
+
+        assert [disclosure.accn for disclosure in index.snapshot("320193", "us-gaap", "Revenues", "USD", "2023-05-05")] == ["a1", "a2", "a2"]
+        assert [disclosure.val for disclosure in index.snapshot("320193", "us-gaap", "Revenues", "USD", "2024-01-31")][-1] == 119500.0
+        assert index.snapshot("320193", "us-gaap", "Revenues", "USD", "2020-01-01") == []
+        assert index.snapshot("789019", "us-gaap", "Revenues", "USD", "2024-01-31") == []
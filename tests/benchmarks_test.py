@@ -0,0 +1,139 @@
+# filepath: /test/benchmarks_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Performance benchmarks for the import, parsing, lookup, join, cache and rate limiting paths.
+
+Run with `tox -e benchmark`, which saves every run under .benchmarks/ and compares it
+against the previous saved run. The module is skipped when pytest-benchmark is not installed.
+"""
+import asyncio
+import os
+import subprocess
+import sys
+from unittest.mock import patch, MagicMock
+import pytest
+import edgar_sec
+from edgar_sec.clients import EdgarAPI
+from edgar_sec.helpers import EdgarHelpers
+from edgar_sec.objects import SubmissionHistory, CompanyFacts, Frame
+from edgar_sec.stores import CompanyUniverse
+from edgar_sec.testing import PayloadGenerator, MockEdgarServer
+from edgar_sec.parsing import ParseExecutor
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+pytest.importorskip("pytest_benchmark")
+
+GENERATOR = PayloadGenerator()
+SUBMISSIONS = GENERATOR.submissions(320193, filings=1000)
+SMALL_FILER = GENERATOR.company_facts(320193, tags=20, facts_per_tag=20)
+LARGE_FILER = GENERATOR.company_facts(320193, tags=2000, facts_per_tag=100)
+FRAME = GENERATOR.frame(companies=6000)
+COMPANY_TICKERS = GENERATOR.company_tickers(10000)
+
+class TestParsingBenchmarks:
+    def test_submission_history_to_object(self, benchmark):
+        submission_history = benchmark(SubmissionHistory.to_object, SUBMISSIONS)
+        assert len(submission_history.filings) == 1000
+
+    def test_company_facts_to_object_small_filer(self, benchmark):
+        company_facts = benchmark(CompanyFacts.to_object, SMALL_FILER)
+        assert len(company_facts.facts[1].disclosures) == 20
+
+    def test_company_facts_to_object_large_filer(self, benchmark):
+        company_facts = benchmark.pedantic(CompanyFacts.to_object, args=(LARGE_FILER,), rounds=3, iterations=1)
+        assert len(company_facts.facts[1].disclosures) == 2000
+
+    def test_company_facts_unpack_large_filer(self, benchmark):
+        packed = ParseExecutor.pack(CompanyFacts.to_object(LARGE_FILER))
+        company_facts = benchmark.pedantic(ParseExecutor.unpack, args=(packed,), rounds=3, iterations=1)
+        assert len(company_facts.facts[1].disclosures) == 2000
+
+    def test_frame_to_object(self, benchmark):
+        frame = benchmark(Frame.to_object, FRAME)
+        assert len(frame.disclosures) == 6000
+
+    def test_submission_history_to_object_async(self, benchmark):
+        loop = asyncio.new_event_loop()
+        submission_history = benchmark(lambda: loop.run_until_complete(SubmissionHistory.to_object_async(SUBMISSIONS)))
+        loop.close()
+        assert len(submission_history.filings) == 1000
+
+    def test_company_facts_to_object_async_small_filer(self, benchmark):
+        loop = asyncio.new_event_loop()
+        company_facts = benchmark.pedantic(lambda: loop.run_until_complete(CompanyFacts.to_object_async(SMALL_FILER)), rounds=5, iterations=1)
+        loop.close()
+        assert len(company_facts.facts[1].disclosures) == 20
+
+    def test_frame_to_object_async(self, benchmark):
+        loop = asyncio.new_event_loop()
+        frame = benchmark.pedantic(lambda: loop.run_until_complete(Frame.to_object_async(FRAME)), rounds=5, iterations=1)
+        loop.close()
+        assert len(frame.disclosures) == 6000
+
+class TestLookupBenchmarks:
+    def test_get_cik(self, benchmark):
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(responses={"/files/company_tickers.json": COMPANY_TICKERS}))
+        cik = benchmark(EdgarHelpers.get_cik, ticker="T70993", api=api)
+        assert cik == 70993
+
+    def test_universe_join(self, benchmark):
+        universe = CompanyUniverse()
+        universe.update(COMPANY_TICKERS, GENERATOR.company_tickers_exchange(10000))
+        holdings = [{"ticker": f"t{1000 + index * 7}", "shares": index} for index in range(0, 10000, 2)]
+        joined = benchmark(universe.join, holdings, columns=["cik"])
+        assert joined[-1]["cik"] == "70986"
+
+class TestRequestPathBenchmarks:
+    def test_cache_hit(self, benchmark):
+        api = EdgarAPI(cache_mode=True)
+        fake_response = MagicMock()
+        fake_response.json.return_value = FRAME
+        with patch("httpx.Client.get", return_value=fake_response) as mock_get:
+            response = benchmark(api._EdgarAPI__edgar_get_request, "/api/xbrl/frames/us-gaap/AccountsPayableCurrent/USD/CY2019Q1I.json")
+        mock_get.assert_called_once()
+        assert response is FRAME
+
+    def test_cache_hit_async(self, benchmark):
+        api = EdgarAPI(cache_mode=True).Async
+        loop = asyncio.new_event_loop()
+        fake_response = MagicMock()
+        fake_response.json.return_value = FRAME
+
+        class DummyAsyncClient:
+            async def __aenter__(self):
+                return self
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+            async def get(self, url, headers=None, timeout=None):
+                return fake_response
+
+        with patch("httpx.AsyncClient", return_value=DummyAsyncClient()):
+            response = benchmark(lambda: loop.run_until_complete(api._AsyncAPI__edgar_get_request("/api/xbrl/frames/us-gaap/AccountsPayableCurrent/USD/CY2019Q1I.json")))
+        loop.close()
+        assert response is FRAME
+
+    def test_rate_limiter_overhead(self, benchmark):
+        api = EdgarAPI()
+        api.max_requests_per_second = 10 ** 9
+        benchmark(api._EdgarAPI__rate_limited)
+        assert api.request_times
+
+class TestImportBenchmarks:
+    @pytest.mark.parametrize("statement", ["import edgar_sec", "import edgar_sec.objects", "from edgar_sec import EdgarAPI"])
+    def test_import_time(self, benchmark, statement):
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(edgar_sec.__file__)))
+        benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", statement],), kwargs={"env": env, "check": True}, rounds=5, iterations=1)
@@ -20,12 +20,24 @@ Comprehensive unit tests for the clients module.
 from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import asyncio
+import os
+import functools
+import pickle
 import time
 import pytest
 from cachetools import FIFOCache
 import tenacity
+import httpx
 from edgar_sec.clients import EdgarAPI
+from edgar_sec.objects import Frame
+from edgar_sec.stores import SubmissionStore, FactStore, FactCatalog
+from edgar_sec.mirror import EdgarMirror
+from edgar_sec.instrumentation import Hooks, InstrumentedCache
+from edgar_sec.testing import MockEdgarServer
+from edgar_sec.parsing import ParseExecutor
+from edgar_sec.scheduling import Deadline
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
 
 class TestEdgarAPI:
@@ -367,7 +379,7 @@ class TestEdgarAPI:
             patch.object(api, "_EdgarAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
             patch("edgar_sec.clients.SubmissionHistory.to_object", return_value="submission_obj") as mock_to_object:
             result = api.get_submissions(ticker="DIS")
-            mock_get_cik.assert_called_once_with(ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api)
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with("/submissions/CIK0001744489.json")
             mock_to_object.assert_called_once_with(fake_response)
@@ -442,10 +454,10 @@ class TestEdgarAPI:
             patch.object(api, "_EdgarAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
             patch("edgar_sec.clients.CompanyConcept.to_object", return_value="company_concept_obj") as mock_to_object:
             result = api.get_company_concept(taxonomy=taxonomy, tag=tag, ticker="DIS")
-            mock_get_cik.assert_called_once_with(ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api)
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with(f"/api/xbrl/companyconcept/CIK0001744489/{taxonomy}/{tag}.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_concept_obj"
 
         with patch("edgar_sec.clients.EdgarHelpers.get_cik") as mock_get_cik, \
@@ -456,7 +468,7 @@ class TestEdgarAPI:
             mock_get_cik.assert_not_called()
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with(f"/api/xbrl/companyconcept/CIK0001744489/{taxonomy}/{tag}.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_concept_obj"
 
         with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
@@ -603,10 +615,10 @@ class TestEdgarAPI:
             patch.object(api, "_EdgarAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
             patch("edgar_sec.clients.CompanyFacts.to_object", return_value="company_facts_obj") as mock_to_object:
             result = api.get_company_facts(ticker="DIS")
-            mock_get_cik.assert_called_once_with(ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api)
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with("/api/xbrl/companyfacts/CIK0001744489.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_facts_obj"
 
         with patch("edgar_sec.clients.EdgarHelpers.get_cik") as mock_get_cik, \
@@ -617,7 +629,7 @@ class TestEdgarAPI:
             mock_get_cik.assert_not_called()
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with("/api/xbrl/companyfacts/CIK0001744489.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_facts_obj"
 
         with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
@@ -710,6 +722,509 @@ class TestEdgarAPI:
         with pytest.raises(TypeError, match="period must be a string or datetime object."):
             api.get_frames(taxonomy, tag, unit, 12345, instantaneous=True)
 
+    def test_edgar_conditional_get_request(self):
+        api = EdgarAPI(cache_mode=True, cache_size=10)
+        url_endpoint = "/submissions/CIK0001744489.json"
+        headers = {"If-None-Match": '"abc"'}
+
+        with patch.object(api, "_EdgarAPI__rate_limited", return_value=None):
+            mock_response = MagicMock()
+            mock_response.status_code = 304
+            with patch("httpx.Client.get", return_value=mock_response) as mock_get:
+                assert api._EdgarAPI__edgar_conditional_get_request(url_endpoint, headers) == (None, {})
+                mock_get.assert_called_once_with(api.base_url + url_endpoint, headers=headers, timeout=10)
+                mock_response.json.assert_not_called()
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.raise_for_status.return_value = None
+            mock_response.json.return_value = {"foo": "bar"}
+            mock_response.headers = {"ETag": '"def"', "Last-Modified": "Wed, 02 Jul 2025 23:59:54 GMT"}
+            with patch("httpx.Client.get", return_value=mock_response):
+                response, validators = api._EdgarAPI__edgar_conditional_get_request(url_endpoint, headers)
+                assert response == {"foo": "bar"}
+                assert validators == {"etag": '"def"', "last_modified": "Wed, 02 Jul 2025 23:59:54 GMT"}
+                assert len(api.cache) == 0
+
+    def test_get_new_filings(self):
+        api = EdgarAPI()
+        store = SubmissionStore()
+        fake_response = {
+            "cik": "0001744489",
+            "name": "Walt Disney Co",
+            "filings": {
+                "recent": {
+                    "accessionNumber": ["0001628280-25-034115", "0001628280-25-034114"],
+                    "filingDate": ["2025-07-02", "2025-07-01"],
+                    "reportDate": ["2025-06-30", "2025-06-30"],
+                    "acceptanceDateTime": ["2025-07-02T23:59:54.000Z", "2025-07-01T23:59:43.000Z"],
+                    "act": ["34", "34"],
+                    "form": ["4", "4"],
+                    "fileNumber": ["001-38842", "001-38842"],
+                    "filmNumber": ["25919394", "25919184"],
+                    "items": ["", ""],
+                    "core_type": ["4", "4"],
+                    "size": [5434, 6163],
+                    "isXBRL": [0, 0],
+                    "isInlineXBRL": [0, 0],
+                    "primaryDocument": ["a.xml", "b.xml"],
+                    "primaryDocDescription": ["FORM 4", "FORM 4"]
+                },
+                "files": []
+            }
+        }
+        validators = {"etag": '"abc"', "last_modified": None}
+
+        with patch.object(api, "_EdgarAPI__edgar_conditional_get_request", return_value=(fake_response, validators)) as mock_get_request:
+            filings = api.get_new_filings(store, central_index_key="1744489")
+            mock_get_request.assert_called_once_with("/submissions/CIK0001744489.json", api.headers)
+            assert [filing.accession_number for filing in filings] == ["0001628280-25-034115", "0001628280-25-034114"]
+            assert store.get("0001744489").last_accession_number == "0001628280-25-034115"
+            assert store.get("0001744489").etag == '"abc"'
+
+        with patch.object(api, "_EdgarAPI__edgar_conditional_get_request", return_value=(None, {})) as mock_get_request:
+            assert api.get_new_filings(store, central_index_key="0001744489") == []
+            assert mock_get_request.call_args[0][1]["If-None-Match"] == '"abc"'
+
+        fake_response["filings"]["recent"] = {key: [f"new-{value[0]}" if key == "accessionNumber" else value[0]] + value for key, value in fake_response["filings"]["recent"].items()}
+        with patch("edgar_sec.clients.EdgarHelpers.get_cik", return_value="0001744489") as mock_get_cik, \
+            patch.object(api, "_EdgarAPI__edgar_conditional_get_request", return_value=(fake_response, validators)):
+            filings = api.get_new_filings(store, ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api)
+            assert [filing.accession_number for filing in filings] == ["new-0001628280-25-034115"]
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
+            api.get_new_filings(store, ticker="DIS", central_index_key="0001744489")
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key."):
+            api.get_new_filings(store)
+
+    def test_get_company_facts_changes(self):
+        api = EdgarAPI()
+        store = FactStore()
+        fake_response = {"cik": 1744489, "entityName": "WALT DISNEY CO/", "facts": {}}
+
+        with patch.object(api, "_EdgarAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
+            patch.object(store, "merge", return_value=["change"]) as mock_merge:
+            assert api.get_company_facts_changes(store, central_index_key="1744489") == ["change"]
+            mock_get_request.assert_called_once_with("/api/xbrl/companyfacts/CIK0001744489.json")
+            mock_merge.assert_called_once_with(fake_response)
+
+        with patch("edgar_sec.clients.EdgarHelpers.get_cik", return_value="0001744489") as mock_get_cik, \
+            patch.object(api, "_EdgarAPI__edgar_get_request", return_value=fake_response):
+            assert api.get_company_facts_changes(store, ticker="DIS") == []
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api)
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
+            api.get_company_facts_changes(store, ticker="DIS", central_index_key="0001744489")
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key."):
+            api.get_company_facts_changes(store)
+
+    def test_mirror(self):
+        mirror = EdgarMirror()
+        api = EdgarAPI(mirror=mirror)
+        submissions = {"cik": "0001744489", "name": "Walt Disney Co", "filings": {"recent": {}, "files": []}}
+        concept = {"cik": 1744489, "taxonomy": "us-gaap", "tag": "Assets", "label": "Assets", "description": "", "entityName": "WALT DISNEY CO/", "units": {"USD": [{"end": "2019-09-28", "val": 1.0, "accn": "a", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}]}}
+        facts = {"cik": 1744489, "entityName": "WALT DISNEY CO/", "facts": {"us-gaap": {"Assets": {"label": "Assets", "description": "", "units": concept["units"]}}}}
+        frame = {"taxonomy": "us-gaap", "tag": "Assets", "ccp": "CY2019Q3I", "uom": "USD", "label": "Assets", "description": "", "pts": 0, "data": []}
+
+        assert api.mirror is mirror
+        assert api.Async.mirror is mirror
+
+        for method, args, response in [
+            (api.get_submissions, {"central_index_key": "0001744489"}, submissions),
+            (api.get_company_concept, {"taxonomy": "us-gaap", "tag": "Assets", "central_index_key": "0001744489"}, concept),
+            (api.get_company_facts, {"central_index_key": "0001744489"}, facts),
+            (api.get_frames, {"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": "CY2019Q3", "instantaneous": True}, frame),
+        ]:
+            with patch.object(api, "_EdgarAPI__edgar_get_request", return_value=response) as mock_get_request:
+                fetched = method(**args)
+                mirrored = method(**args)
+                mock_get_request.assert_called_once()
+                assert mirrored == fetched
+
+        with patch.object(api, "_EdgarAPI__edgar_get_request", return_value=facts) as mock_get_request:
+            deduplicated = api.get_company_facts(central_index_key="0001744489", dedup=True)
+            mock_get_request.assert_called_once()
+            assert deduplicated.facts[0].disclosures[0].units[0].accns == ["a"]
+            assert mirror.get_company_facts("0001744489").facts[0].disclosures[0].units[0].accns is None
+
+        per_share = {**frame, "tag": "EarningsPerShareBasic", "ccp": "CY2019Q3", "uom": "USD/shares"}
+        with patch.object(api, "_EdgarAPI__edgar_get_request", return_value=per_share) as mock_get_request:
+            api.get_frames("us-gaap", "EarningsPerShareBasic", "USD-per-shares", "CY2019Q3", instantaneous=False)
+            mirrored = api.get_frames("us-gaap", "EarningsPerShareBasic", "USD-per-shares", "CY2019Q3", instantaneous=False)
+            mock_get_request.assert_called_once()
+            assert mirrored.uom == "USD-per-shares"
+
+    def test_get_frames_panel(self):
+        server = MockEdgarServer(payload_size=2)
+        requests = []
+        def handler(request):
+            requests.append(request.url.path)
+            if request.url.path.endswith("/CY2019Q3I.json"):
+                return httpx.Response(404, request=request)
+            return server.respond(request)
+        api = EdgarAPI(transport=httpx.MockTransport(handler))
+
+        panel = api.get_frames_panel("us-gaap", "Assets", "USD", "CY2019Q3", "CY2020Q1", instantaneous=True)
+
+        assert panel.periods == ["CY2019Q3I", "CY2019Q4I", "CY2020Q1I"]
+        assert panel.missing == ["CY2019Q3I"]
+        assert panel.to_dense()[0][0] is None and panel.to_dense()[0][1] is not None
+        assert len(requests) == 3
+        assert api.engine_loop is not None
+        with pytest.raises(httpx.HTTPStatusError):
+            api.get_frames_panel("us-gaap", "Assets", "USD", "CY2019Q3", "CY2019Q3", instantaneous=True)
+        api.close()
+
+    def test_hooks(self):
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=2))
+        events = []
+        for event in Hooks.events:
+            api.hooks.register(event, events.append)
+
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        assert [event.event for event in events] == [
+            "cache_miss", "request_start", "throttle_wait", "request_end", "parse_start", "parse_end",
+            "cache_hit", "parse_start", "parse_end"
+        ]
+        assert events[3].details["status_code"] == 200
+        assert events[5].details["object_type"] == "Frame"
+        assert api.Async.hooks is api.hooks
+
+    def test_hooks_retry(self):
+        api = EdgarAPI(transport=MockEdgarServer(throttle_rate=1))
+        events = []
+        api.hooks.register("retry", events.append)
+
+        with patch("time.sleep"), pytest.raises(tenacity.RetryError):
+            api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        assert [event.details["attempt"] for event in events] == [1, 2]
+        assert events[0].url_endpoint == "/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json"
+        assert events[0].details["exception"].response.status_code == 429
+
+    def test_stats(self):
+        api = EdgarAPI(cache_mode=True, cache_size=1, metrics=True, transport=MockEdgarServer(payload_size=2))
+
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2020", instantaneous=False)
+        stats = api.stats()
+
+        assert stats["requests"] == 2
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 2
+        assert stats["cache_evictions"] == 1
+        assert stats["bytes_received"] > 0
+        assert stats["latency"]["frames"]["count"] == 2
+        assert stats["parse"]["Frame"]["count"] == 3
+        with pytest.raises(ValueError, match="Metrics are disabled; create the EdgarAPI with metrics=True."):
+            EdgarAPI().stats()
+
+    def test_parse_executor(self):
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=3))
+        expected = api.get_company_facts(central_index_key="0000320193", dedup=True)
+
+        with ParseExecutor(threshold=0, max_workers=1) as executor:
+            api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=3), parse_executor=executor)
+            assert api.get_company_facts(central_index_key="0000320193", dedup=True) == expected
+            assert api.get_company_facts(central_index_key="0000320193", dedup=True) == expected
+            assert api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False).pts == 3
+            assert api.Async.parse_executor is executor
+            assert len(api.cache) == 2
+
+    def test_batch(self):
+        server = MockEdgarServer(payload_size=2)
+        api = EdgarAPI(cache_mode=True, cache_size=4, transport=server)
+        api.max_requests_per_second = 1000
+        calls = [{"central_index_key": str(cik).zfill(10)} for cik in range(1, 9)] * 4
+
+        company_facts = api.batch("get_company_facts", calls, max_workers=8)
+
+        assert [int(facts.cik) for facts in company_facts] == [int(call["central_index_key"]) for call in calls]
+        assert len(api.cache) == 4
+        assert api.cache.currsize == 4
+        assert server.requests >= 8
+        with pytest.raises(ValueError, match="Unknown method: close."):
+            api.batch("close", [{}])
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key."):
+            api.batch("get_submissions", [{}])
+        assert isinstance(api.batch("get_submissions", [{}], return_exceptions=True)[0], ValueError)
+
+    def test_batch_rate_limited(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1))
+        api.max_requests_per_second = 3
+
+        started = time.time()
+        api.batch("get_frames", [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2010, 2014)], max_workers=4)
+
+        assert time.time() - started >= 0.9
+        assert len(api.request_times) <= 3
+
+    def test_shared_client(self, monkeypatch):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1))
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        client = api.client
+        api.get_frames("us-gaap", "Assets", "USD", "CY2020", instantaneous=False)
+        assert api.client is client
+
+        monkeypatch.setattr("os.getpid", lambda: -1)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2021", instantaneous=False)
+        assert api.client is not client
+        assert not client.is_closed
+        monkeypatch.undo()
+
+        client.close()
+        api.close()
+        assert api.client is None
+
+    def test_batch_async_engine(self):
+        server = MockEdgarServer(payload_size=2, latency=0.05)
+        api = EdgarAPI(cache_mode=True, transport=server)
+        api.max_requests_per_second = 1000
+        calls = [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2020)]
+
+        started = time.time()
+        frames = api.batch("get_frames", calls, max_workers=20, engine="async")
+
+        assert time.time() - started < 0.05 * len(calls) / 2
+        assert [frame.ccp for frame in frames] == [call["period"] for call in calls]
+        assert api.engine_thread.is_alive() and api.engine_thread.daemon
+        assert api.batch("get_frames", calls[:2], engine="async") == frames[:2]
+        assert server.requests == 20
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key."):
+            api.batch("get_submissions", [{"central_index_key": "0000320193"}, {}], engine="async")
+        results = api.batch("get_submissions", [{"central_index_key": "0000320193"}, {}], engine="async", return_exceptions=True)
+        assert results[0].cik == "0000320193" and isinstance(results[1], ValueError)
+        with pytest.raises(ValueError, match="Unknown engine: processes."):
+            api.batch("get_frames", calls, engine="processes")
+
+        thread = api.engine_thread
+        api.close()
+        assert not thread.is_alive()
+        assert api.engine_loop is None
+
+    def test_batch_async_engine_client(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1))
+        calls = [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2004)]
+        api.batch("get_frames", calls, engine="async")
+        client = api.loop_state[api.engine_loop]["client"]
+
+        api.batch("get_frames", calls, engine="async")
+
+        assert api.loop_state[api.engine_loop]["client"] is client
+        api.close()
+        assert client.is_closed
+
+    def test_batch_engines_shared_cache(self):
+        api = EdgarAPI(cache_mode=True, cache_size=8, transport=MockEdgarServer(payload_size=1))
+        api.max_requests_per_second = 1000
+        calls = [{"taxonomy": "us-gaap", "tag": tag, "unit": "USD", "period": f"CY{year}", "instantaneous": False} for tag in ("Assets", "Liabilities") for year in range(2000, 2020)]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            threaded = executor.submit(api.batch, "get_frames", calls[::-1], max_workers=8)
+            pipelined = api.batch("get_frames", calls, engine="async")
+
+        assert len(threaded.result()) == len(pipelined) == len(calls)
+        assert len(api) <= 8
+        assert len(api.cache) == len(list(api.cache.keys())) <= 8
+
+        api.close()
+
+    def test_async_cache_lock(self):
+        api = EdgarAPI(cache_mode=True, cache_size=8, transport=MockEdgarServer(payload_size=1))
+        api.max_requests_per_second = 1000
+        owned = []
+        class CheckedCache(InstrumentedCache):
+            def __setitem__(self, key, value):
+                owned.append(api.cache_lock._is_owned())
+                super().__setitem__(key, value)
+        api.cache = api.Async.cache = CheckedCache(maxsize=8, hooks=api.hooks)
+        calls = [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2004)]
+
+        api.batch("get_frames", calls, engine="async")
+        api.batch("get_frames", calls, engine="threads")
+
+        assert len(owned) == 4 and all(owned)
+        api.close()
+
+    def test_batch_async_engine_shared_budget(self):
+        server = MockEdgarServer(payload_size=2, rate_limit=5)
+        api = EdgarAPI(transport=server)
+        api.max_requests_per_second = 5
+        calls = [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2008)]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sync_frames = executor.submit(lambda: [api.get_frames("us-gaap", "Liabilities", "USD", f"CY{year}", instantaneous=False) for year in range(2000, 2006)])
+            frames = api.batch("get_frames", calls, engine="async")
+
+        assert len(frames) == 8 and len(sync_frames.result()) == 6
+        assert server.requests == 14
+        assert server.throttled == 0
+        api.close()
+
+    def test_pickle(self, tmp_path):
+        mirror = EdgarMirror(str(tmp_path / "edgar.db"))
+        api = EdgarAPI(cache_mode=True, cache_size=8, mirror=mirror, transport=MockEdgarServer(payload_size=2), metrics=True, parse_executor=ParseExecutor(threshold=10))
+        api.max_requests_per_second = 5
+        api.hooks.register("request_end", lambda event: None)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        restored = pickle.loads(pickle.dumps(api))
+
+        assert restored == api
+        assert restored.max_requests_per_second == 5
+        assert restored.headers == api.headers
+        assert len(restored.cache) == 0
+        assert len(restored.hooks) == len(api.hooks) - 1
+        assert restored.stats()["requests"] == 0
+        assert restored.parse_executor.threshold == 10 and restored.parse_executor is not api.parse_executor
+        assert restored.mirror.path == mirror.path
+        assert restored.mirror.get_frame("us-gaap", "Assets", "USD", "CY2019") == mirror.get_frame("us-gaap", "Assets", "USD", "CY2019")
+        assert restored.Async._parent is restored
+        assert restored.rate_lock is not api.rate_lock
+
+    def test_process_pool(self):
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=2))
+        expected = api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            frames = list(executor.map(functools.partial(api.get_frames, "us-gaap", "Assets", "USD", instantaneous=False), ["CY2019", "CY2020"]))
+
+        assert frames[0] == expected
+        assert frames[1].ccp == "CY2020"
+
+    def test_after_fork(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1), metrics=True)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        client, rate_lock = api.client, api.rate_lock
+        rate_lock.acquire()
+
+        EdgarAPI.after_fork()
+
+        assert api.client is None and not client.is_closed
+        assert api.rate_lock is not rate_lock and not api.rate_lock.locked()
+        assert api.get_frames("us-gaap", "Assets", "USD", "CY2020", instantaneous=False).ccp == "CY2020"
+        rate_lock.release()
+        client.close()
+
+    def test_after_fork_mirror(self, tmp_path):
+        mirror = EdgarMirror(str(tmp_path / "edgar.db"))
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1), mirror=mirror)
+        other = EdgarAPI(transport=MockEdgarServer(payload_size=1), mirror=mirror)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        connection, lock = mirror.connection, mirror.lock
+
+        EdgarAPI.after_fork()
+
+        assert mirror.connection is not connection and mirror.lock is not lock
+        assert other.mirror.connection is mirror.connection
+        assert api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False).ccp == "CY2019"
+        connection.close()
+        mirror.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_fork_mirror(self, tmp_path):
+        mirror = EdgarMirror(str(tmp_path / "edgar.db"))
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1), mirror=mirror)
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        connection = mirror.connection
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if mirror.connection is not connection and api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False).ccp == "CY2019" else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert mirror.connection is connection
+        mirror.close()
+
+    def test_deadline(self):
+        server = MockEdgarServer(payload_size=1)
+        api = EdgarAPI(transport=server, timeout=httpx.Timeout(10, connect=2))
+        api.max_requests_per_second = 1
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="exceeded waiting for a request slot"):
+            with api.deadline(0.2):
+                api.get_frames("us-gaap", "Assets", "USD", "CY2020", instantaneous=False)
+        assert 0.15 <= time.monotonic() - started < 0.5
+        with pytest.raises(TimeoutError, match="would exceed the deadline"):
+            with api.deadline(0.2, fail_fast=True):
+                api.get_frames("us-gaap", "Assets", "USD", "CY2020", instantaneous=False)
+        assert len(api.request_times) <= 1
+        assert server.requests == 1
+
+        with api.deadline(5.0) as outer:
+            with api.deadline(10.0) as inner:
+                assert inner.expires == outer.expires
+                assert inner.timeout(api.timeout).connect <= 2
+            assert Deadline.current() is outer
+        assert Deadline.current() is None
+        assert pickle.loads(pickle.dumps(api)).timeout == api.timeout
+
+    def test_batch_deadline(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1))
+        api.max_requests_per_second = 3
+        calls = [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2006)]
+
+        started = time.monotonic()
+        results = api.batch("get_frames", calls, max_workers=6, return_exceptions=True, deadline=0.5)
+
+        assert time.monotonic() - started < 1.0
+        assert sum(not isinstance(result, Exception) for result in results) == 2
+        assert all(isinstance(result, TimeoutError) for result in results if isinstance(result, Exception))
+        with pytest.raises(TimeoutError):
+            api.batch("get_frames", calls, call_timeout=0.1, fail_fast=True)
+
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1, latency=0.3))
+        results = api.batch("get_frames", calls[:2], engine="async", call_timeout=0.1, return_exceptions=True)
+        assert all(isinstance(result, TimeoutError) for result in results)
+
+    def test_negative_cache(self):
+        requests = []
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404, request=request)
+        api = EdgarAPI(cache_mode=True, transport=httpx.MockTransport(handler), negative_cache_ttl=0.2)
+
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                api.get_frames("us-gaap", "Missing", "USD", "CY2019", instantaneous=False)
+
+        assert len(requests) == 1
+        assert len(api.negative_cache) == 1 and len(api) == 0
+        time.sleep(0.25)
+        with pytest.raises(httpx.HTTPStatusError):
+            api.get_frames("us-gaap", "Missing", "USD", "CY2019", instantaneous=False)
+        assert len(requests) == 2
+        with pytest.raises(httpx.HTTPStatusError):
+            EdgarAPI(transport=httpx.MockTransport(handler)).get_frames("us-gaap", "Missing", "USD", "CY2019", instantaneous=False)
+        assert len(requests) == 3
+
+    def test_catalog(self):
+        server = MockEdgarServer(payload_size=2)
+        catalog = FactCatalog()
+        api = EdgarAPI(transport=server, catalog=catalog)
+
+        api.get_company_facts(central_index_key="0000320193")
+        concept = api.get_company_concept("us-gaap", "Concept0", central_index_key="0000320193")
+
+        assert concept.tag == "Concept0"
+        with pytest.raises(httpx.HTTPStatusError, match="CIK0000320193 does not report us-gaap/Assets.") as error:
+            api.get_company_concept("us-gaap", "Assets", central_index_key="0000320193")
+        assert error.value.response.status_code == 404
+        with pytest.raises(httpx.HTTPStatusError, match="Unknown unit for us-gaap/Concept0: EUR."):
+            api.get_frames("us-gaap", "Concept0", "EUR", "CY2019", instantaneous=False)
+        api.get_company_concept("us-gaap", "Concept0", central_index_key="0000789019")
+        assert server.requests == 3
+        assert pickle.loads(pickle.dumps(api)).catalog.concepts == catalog.concepts
+
 class TestAsyncAPI:
     # Dunder methods
     def test_init(self):
@@ -929,7 +1444,7 @@ class TestAsyncAPI:
             return None
 
         # Patch async_cached to just call the function
-        def fake_async_cached(cache):
+        def fake_async_cached(cache, lock=None):
             def decorator(func):
                 async def wrapper(*args, **kwargs):
                     return await func(*args, **kwargs)
@@ -938,6 +1453,8 @@ class TestAsyncAPI:
 
         # Dummy AsyncClient for success
         class DummyAsyncClient:
+            def __init__(self, transport=None):
+                self.transport = transport
             async def __aenter__(self):
                 return self
             async def __aexit__(self, exc_type, exc, tb):
@@ -950,6 +1467,8 @@ class TestAsyncAPI:
 
         # Dummy AsyncClient for HTTPStatusError
         class HTTPStatusErrorAsyncClient:
+            def __init__(self, transport=None):
+                self.transport = transport
             async def __aenter__(self):
                 return self
             async def __aexit__(self, exc_type, exc, tb):
@@ -960,6 +1479,8 @@ class TestAsyncAPI:
 
         # Dummy AsyncClient for RequestError
         class RequestErrorAsyncClient:
+            def __init__(self, transport=None):
+                self.transport = transport
             async def __aenter__(self):
                 return self
             async def __aexit__(self, exc_type, exc, tb):
@@ -1162,7 +1683,7 @@ class TestAsyncAPI:
             patch.object(api, "_AsyncAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
             patch("edgar_sec.clients.SubmissionHistory.to_object_async", return_value="submission_obj") as mock_to_object:
             result = await api.get_submissions(ticker="DIS")
-            mock_get_cik.assert_called_once_with(ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api._parent)
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with("/submissions/CIK0001744489.json")
             mock_to_object.assert_called_once_with(fake_response)
@@ -1238,10 +1759,10 @@ class TestAsyncAPI:
             patch.object(api, "_AsyncAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
             patch("edgar_sec.clients.CompanyConcept.to_object_async", return_value="company_concept_obj") as mock_to_object:
             result = await api.get_company_concept(taxonomy=taxonomy, tag=tag, ticker="DIS")
-            mock_get_cik.assert_called_once_with(ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api._parent)
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with(f"/api/xbrl/companyconcept/CIK0001744489/{taxonomy}/{tag}.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_concept_obj"
 
         with patch("edgar_sec.clients.EdgarHelpers.get_cik_async") as mock_get_cik, \
@@ -1252,7 +1773,7 @@ class TestAsyncAPI:
             mock_get_cik.assert_not_called()
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with(f"/api/xbrl/companyconcept/CIK0001744489/{taxonomy}/{tag}.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_concept_obj"
 
         with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
@@ -1400,10 +1921,10 @@ class TestAsyncAPI:
             patch.object(api, "_AsyncAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
             patch("edgar_sec.clients.CompanyFacts.to_object_async", return_value="company_facts_obj") as mock_to_object:
             result = await api.get_company_facts(ticker="DIS")
-            mock_get_cik.assert_called_once_with(ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api._parent)
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with("/api/xbrl/companyfacts/CIK0001744489.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_facts_obj"
 
         with patch("edgar_sec.clients.EdgarHelpers.get_cik_async") as mock_get_cik, \
@@ -1414,7 +1935,7 @@ class TestAsyncAPI:
             mock_get_cik.assert_not_called()
             mock_cik_validation.assert_called_once_with("0001744489")
             mock_get_request.assert_called_once_with("/api/xbrl/companyfacts/CIK0001744489.json")
-            mock_to_object.assert_called_once_with(fake_response)
+            mock_to_object.assert_called_once_with(fake_response, dedup=False)
             assert result == "company_facts_obj"
 
         with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
@@ -1507,3 +2028,309 @@ class TestAsyncAPI:
 
         with pytest.raises(TypeError, match="period must be a string or datetime object."):
             await api.get_frames(taxonomy, tag, unit, 12345, instantaneous=True)
+
+    @pytest.mark.asyncio
+    async def test_edgar_conditional_get_request(self, monkeypatch):
+        api = EdgarAPI(cache_mode=True, cache_size=10).Async
+        url_endpoint = "/submissions/CIK0001744489.json"
+        headers = {"If-None-Match": '"abc"'}
+
+        async def fake_rate_limited(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(api, "_AsyncAPI__rate_limited", fake_rate_limited)
+
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        modified = MagicMock()
+        modified.status_code = 200
+        modified.raise_for_status.return_value = None
+        modified.json.return_value = {"foo": "bar"}
+        modified.headers = {"ETag": '"def"'}
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock, side_effect=[not_modified, modified]) as mock_get:
+            assert await api._AsyncAPI__edgar_conditional_get_request(url_endpoint, headers) == (None, {})
+            response, validators = await api._AsyncAPI__edgar_conditional_get_request(url_endpoint, headers)
+            assert response == {"foo": "bar"}
+            assert validators == {"etag": '"def"', "last_modified": None}
+            assert mock_get.await_count == 2
+            assert len(api.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_new_filings(self):
+        api = EdgarAPI().Async
+        store = SubmissionStore()
+        fake_response = {
+            "cik": "0001744489",
+            "name": "Walt Disney Co",
+            "filings": {
+                "recent": {
+                    "accessionNumber": ["0001628280-25-034115"],
+                    "filingDate": ["2025-07-02"],
+                    "reportDate": ["2025-06-30"],
+                    "acceptanceDateTime": ["2025-07-02T23:59:54.000Z"],
+                    "act": ["34"],
+                    "form": ["4"],
+                    "fileNumber": ["001-38842"],
+                    "filmNumber": ["25919394"],
+                    "items": [""],
+                    "core_type": ["4"],
+                    "size": [5434],
+                    "isXBRL": [0],
+                    "isInlineXBRL": [0],
+                    "primaryDocument": ["a.xml"],
+                    "primaryDocDescription": ["FORM 4"]
+                },
+                "files": []
+            }
+        }
+
+        with patch("edgar_sec.clients.EdgarHelpers.get_cik_async", return_value="0001744489") as mock_get_cik, \
+            patch.object(api, "_AsyncAPI__edgar_conditional_get_request", return_value=(fake_response, {"etag": '"abc"'})) as mock_get_request:
+            filings = await api.get_new_filings(store, ticker="DIS")
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api._parent)
+            mock_get_request.assert_called_once_with("/submissions/CIK0001744489.json", api.headers)
+            assert [filing.accession_number for filing in filings] == ["0001628280-25-034115"]
+
+        with patch.object(api, "_AsyncAPI__edgar_conditional_get_request", return_value=(fake_response, {"etag": '"abc"'})):
+            assert await api.get_new_filings(store, central_index_key="0001744489") == []
+
+        with patch.object(api, "_AsyncAPI__edgar_conditional_get_request", return_value=(None, {})):
+            assert await api.get_new_filings(store, central_index_key="0001744489") == []
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
+            await api.get_new_filings(store, ticker="DIS", central_index_key="0001744489")
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key."):
+            await api.get_new_filings(store)
+
+    @pytest.mark.asyncio
+    async def test_get_company_facts_changes(self):
+        api = EdgarAPI().Async
+        store = FactStore()
+        fake_response = {"cik": 1744489, "entityName": "WALT DISNEY CO/", "facts": {}}
+
+        with patch("edgar_sec.clients.EdgarHelpers.get_cik_async", return_value="0001744489") as mock_get_cik, \
+            patch.object(api, "_AsyncAPI__edgar_get_request", return_value=fake_response) as mock_get_request, \
+            patch.object(store, "merge", return_value=["change"]) as mock_merge:
+            assert await api.get_company_facts_changes(store, ticker="DIS") == ["change"]
+            mock_get_cik.assert_called_once_with(ticker="DIS", api=api._parent)
+            mock_get_request.assert_called_once_with("/api/xbrl/companyfacts/CIK0001744489.json")
+            mock_merge.assert_called_once_with(fake_response)
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key, not both."):
+            await api.get_company_facts_changes(store, ticker="DIS", central_index_key="0001744489")
+
+        with pytest.raises(ValueError, match="Provide either ticker or central_index_key."):
+            await api.get_company_facts_changes(store)
+
+    @pytest.mark.asyncio
+    async def test_mirror(self):
+        api = EdgarAPI(mirror=EdgarMirror()).Async
+        submissions = {"cik": "0001744489", "name": "Walt Disney Co", "filings": {"recent": {}, "files": []}}
+        concept = {"cik": 1744489, "taxonomy": "us-gaap", "tag": "Assets", "label": "Assets", "description": "", "entityName": "WALT DISNEY CO/", "units": {"USD": [{"end": "2019-09-28", "val": 1.0, "accn": "a", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}]}}
+        facts = {"cik": 1744489, "entityName": "WALT DISNEY CO/", "facts": {"us-gaap": {"Assets": {"label": "Assets", "description": "", "units": concept["units"]}}}}
+        frame = {"taxonomy": "us-gaap", "tag": "Assets", "ccp": "CY2019Q3I", "uom": "USD", "label": "Assets", "description": "", "pts": 0, "data": []}
+
+        for method, args, response in [
+            (api.get_submissions, {"central_index_key": "0001744489"}, submissions),
+            (api.get_company_concept, {"taxonomy": "us-gaap", "tag": "Assets", "central_index_key": "0001744489"}, concept),
+            (api.get_company_facts, {"central_index_key": "0001744489"}, facts),
+            (api.get_frames, {"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": "CY2019Q3", "instantaneous": True}, frame),
+        ]:
+            with patch.object(api, "_AsyncAPI__edgar_get_request", return_value=response) as mock_get_request:
+                fetched = await method(**args)
+                mirrored = await method(**args)
+                mock_get_request.assert_called_once()
+                assert mirrored == fetched
+
+    @pytest.mark.asyncio
+    async def test_get_frames_panel(self):
+        api = EdgarAPI(cache_mode=True, cache_size=10).Async
+
+        frames = {period: Frame(taxonomy="us-gaap", tag="Assets", ccp=period, uom="USD", label="", description="", pts=0, disclosures=[]) for period in ("CY2019", "CY2020")}
+
+        async def fake_get_frames(taxonomy, tag, unit, period, instantaneous):
+            await asyncio.sleep(0)
+            if period not in frames:
+                request = httpx.Request("GET", f"https://data.sec.gov/api/xbrl/frames/us-gaap/Assets/USD/{period}.json")
+                raise httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+            return frames[period]
+
+        with patch.object(api, "get_frames", side_effect=fake_get_frames) as mock_get_frames, \
+            patch("edgar_sec.clients.FramePanel.to_object_async", return_value="panel_obj") as mock_to_object:
+            result = await api.get_frames_panel("us-gaap", "Assets", "USD", "CY2018", "CY2020", instantaneous=False)
+            assert mock_get_frames.call_count == 3
+            mock_to_object.assert_called_once_with([frames["CY2019"], frames["CY2020"]], ["CY2018", "CY2019", "CY2020"])
+            assert result == "panel_obj"
+            with pytest.raises(httpx.HTTPStatusError):
+                await api.get_frames_panel("us-gaap", "Assets", "USD", "CY2017", "CY2018", instantaneous=False)
+
+    @pytest.mark.asyncio
+    async def test_hooks(self):
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=2)).Async
+        events = []
+        for event in Hooks.events:
+            api.hooks.register(event, events.append)
+
+        await api.get_company_facts(central_index_key="0000320193")
+        await api.get_company_facts(central_index_key="0000320193")
+
+        assert [event.event for event in events] == [
+            "cache_miss", "request_start", "throttle_wait", "request_end", "parse_start", "parse_end",
+            "cache_hit", "parse_start", "parse_end"
+        ]
+        assert events[3].details["bytes"] > 0
+        assert events[5].details["object_type"] == "CompanyFacts"
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        api = EdgarAPI(metrics=True, transport=MockEdgarServer(payload_size=2)).Async
+
+        await api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        assert api.metrics is api._parent.metrics
+        assert api.stats()["requests"] == 1
+        assert api.stats()["parse"]["Frame"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parse_executor(self):
+        expected = await EdgarAPI(transport=MockEdgarServer(payload_size=3)).Async.get_company_concept("us-gaap", "Assets", central_index_key="0000320193")
+
+        with ParseExecutor(threshold=0, max_workers=1) as executor:
+            api = EdgarAPI(transport=MockEdgarServer(payload_size=3), parse_executor=executor).Async
+            assert await api.get_company_concept("us-gaap", "Assets", central_index_key="0000320193") == expected
+
+    def test_multiple_event_loops(self):
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=2))
+        api.max_requests_per_second = 1000
+
+        async def fetch(period):
+            frames = await asyncio.gather(*(api.Async.get_frames("us-gaap", "Assets", "USD", f"CY{year}", instantaneous=False) for year in range(period, period + 3)))
+            return api.lock, api.semaphore, frames
+
+        first = asyncio.run(fetch(2010))
+        second = asyncio.run(fetch(2011))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = list(executor.map(lambda period: asyncio.run(fetch(period)), [2012, 2013]))
+
+        assert first[0] is not second[0] and first[1] is not second[1]
+        assert threaded[0][0] is not threaded[1][0]
+        assert all(len(result[2]) == 3 for result in [first, second, *threaded])
+        assert len(api.cache) == 6
+        assert isinstance(api.lock, asyncio.Lock) and api.lock is api.lock
+
+    @pytest.mark.asyncio
+    async def test_as_completed(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=2, latency=0.01, jitter=0.02)).Async
+        api._parent.max_requests_per_second = 1000
+        in_flight, peak = [0], [0]
+
+        def started(event):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        api.hooks.register("request_start", started)
+        api.hooks.register("request_end", lambda event: in_flight.__setitem__(0, in_flight[0] - 1))
+        calls = ((year, {"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False}) for year in range(2000, 2012))
+
+        results = [result async for result in api.as_completed("get_frames", calls, concurrency=3)]
+
+        assert sorted(key for key, _ in results) == list(range(2000, 2012))
+        assert all(frame.ccp == f"CY{key}" for key, frame in results)
+        assert peak[0] == 3
+
+        results = [result async for result in api.as_completed("get_submissions", {"bad": {}, "good": {"central_index_key": "0000320193"}})]
+        assert isinstance(dict(results)["bad"], ValueError)
+        assert dict(results)["good"].cik == "0000320193"
+
+        with pytest.raises(ValueError, match="Unknown method: stats."):
+            [result async for result in api.as_completed("stats", {})]
+        with pytest.raises(ValueError, match="concurrency must be a positive integer."):
+            [result async for result in api.as_completed("get_frames", {}, concurrency=0)]
+
+    @pytest.mark.asyncio
+    async def test_as_completed_backpressure(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1)).Async
+        api._parent.max_requests_per_second = 1000
+        requests = []
+        api.hooks.register("request_start", requests.append)
+        calls = ((year, {"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False}) for year in range(2000, 2100))
+
+        stream = api.as_completed("get_frames", calls, concurrency=2)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        assert len(requests) == 2
+
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_as_completed_cancel(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1, latency=0.3)).Async
+        api._parent.max_requests_per_second = 1000
+        finished = []
+        api.hooks.register("request_end", finished.append)
+        calls = {year: {"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2004)}
+
+        async def consume():
+            return [result async for result in api.as_completed("get_frames", calls, concurrency=2)]
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.4)
+
+        assert finished == []
+
+    @pytest.mark.asyncio
+    async def test_deadline(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1, latency=0.3)).Async
+        api._parent.max_requests_per_second = 1000
+
+        with pytest.raises(TimeoutError):
+            with api.deadline(0.1):
+                await api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        started = time.monotonic()
+        calls = {year: {"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2000, 2004)}
+        results = dict([result async for result in api.as_completed("get_frames", calls, call_timeout=0.1)])
+
+        assert time.monotonic() - started < 0.3
+        assert all(isinstance(result, TimeoutError) for result in results.values())
+        results = dict([result async for result in api.as_completed("get_frames", calls, deadline=1.0)])
+        assert [results[year].ccp for year in calls] == [f"CY{year}" for year in calls]
+
+    @pytest.mark.asyncio
+    async def test_negative_cache(self):
+        requests = []
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404, request=request)
+        api = EdgarAPI(cache_mode=True, transport=httpx.MockTransport(handler), catalog=FactCatalog()).Async
+
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await api.get_company_concept("us-gaap", "Missing", central_index_key="0000320193")
+
+        assert len(requests) == 1
+        assert api.negative_cache is api._parent.negative_cache
+
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=2), catalog=FactCatalog()).Async
+        await api.get_company_facts(central_index_key="0000320193")
+        with pytest.raises(httpx.HTTPStatusError, match="Unknown tag: us-gaap/Assets."):
+            await api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+    @pytest.mark.asyncio
+    async def test_shared_async_client(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=1))
+        await api.Async.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        client = api.async_client
+        await api.Async.get_company_tickers()
+
+        assert api.async_client is client
+        api.close()
+        await asyncio.sleep(0)
+        assert client.is_closed
+        assert api.async_client is not client
@@ -18,16 +18,16 @@
 Comprehensive tests for the helpers module.
 """
 
-from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime
 import pytest
+from edgar_sec.clients import EdgarAPI
 from edgar_sec.helpers import EdgarHelpers
 from edgar_sec.objects import Company
+from edgar_sec.testing import MockEdgarServer
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
 
 class TestRequestHelpers:
-    @patch("httpx.Client")
-    def test_get_cik(self, mock_client):
+    def test_get_cik(self):
         fake_response = {
             "0":
             {
@@ -55,28 +55,25 @@ class TestRequestHelpers:
             }
         }
 
-        def fake_json():
-            return [v for v in fake_response.values()]
+        server = MockEdgarServer(responses={"/files/company_tickers.json": fake_response})
+        api = EdgarAPI(cache_mode=True, transport=server)
 
-        mock_instance = MagicMock()
-        mock_instance.get.return_value.json = fake_json
-        mock_instance.get.return_value.raise_for_status = lambda: None
-        mock_client.return_value.__enter__.return_value = mock_instance
-
-        assert EdgarHelpers.get_cik(ticker="AAPL") == 320193
-        assert EdgarHelpers.get_cik(search_text="nvidia") == 1045810
+        assert EdgarHelpers.get_cik(ticker="AAPL", api=api) == 320193
+        assert EdgarHelpers.get_cik(search_text="nvidia", api=api) == 1045810
         with pytest.raises(ValueError, match="Ticker 'TSLA' not found"):
-            EdgarHelpers.get_cik(ticker="TSLA")
+            EdgarHelpers.get_cik(ticker="TSLA", api=api)
         with pytest.raises(ValueError, match="Search text 'foobar' not found"):
-            EdgarHelpers.get_cik(search_text="foobar")
+            EdgarHelpers.get_cik(search_text="foobar", api=api)
+        with pytest.raises(ValueError, match="Provide exactly one of ticker or search_text."):
+            EdgarHelpers.get_cik(api=api)
         with pytest.raises(ValueError, match="Provide exactly one of ticker or search_text."):
-            EdgarHelpers.get_cik()
+            EdgarHelpers.get_cik(ticker="AAPL", search_text="Apple", api=api)
         with pytest.raises(ValueError, match="Provide exactly one of ticker or search_text."):
-            EdgarHelpers.get_cik(ticker="AAPL", search_text="Apple")
+            EdgarHelpers.get_cik(ticker="", api=api)
+        assert server.requests == 1
 
-    @patch("httpx.AsyncClient")
     @pytest.mark.asyncio
-    async def test_get_cik_async(self, mock_client):
+    async def test_get_cik_async(self):
         fake_response = {
             "0":
             {
@@ -104,27 +101,21 @@ class TestRequestHelpers:
             }
         }
 
-        def fake_json():
-            return [v for v in fake_response.values()]
-
-        mock_instance = AsyncMock()
-        mock_instance.get.return_value.json = fake_json
-        mock_instance.get.return_value.raise_for_status = lambda: None
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        server = MockEdgarServer(responses={"/files/company_tickers.json": fake_response})
+        api = EdgarAPI(cache_mode=True, transport=server)
 
-        assert await EdgarHelpers.get_cik_async(ticker="NVDA") == 1045810
-        assert await EdgarHelpers.get_cik_async(search_text="microsoft") == 789019
+        assert await EdgarHelpers.get_cik_async(ticker="NVDA", api=api) == 1045810
+        assert await EdgarHelpers.get_cik_async(search_text="microsoft", api=api) == 789019
         with pytest.raises(ValueError, match="Ticker 'TSLA' not found"):
-            await EdgarHelpers.get_cik_async(ticker="TSLA")
+            await EdgarHelpers.get_cik_async(ticker="TSLA", api=api)
         with pytest.raises(ValueError, match="Search text 'foobar' not found"):
-            await EdgarHelpers.get_cik_async(search_text="foobar")
+            await EdgarHelpers.get_cik_async(search_text="foobar", api=api)
         with pytest.raises(ValueError, match="Provide exactly one of ticker or search_text."):
-            await EdgarHelpers.get_cik_async()
+            await EdgarHelpers.get_cik_async(api=api)
         with pytest.raises(ValueError, match="Provide exactly one of ticker or search_text."):
-            await EdgarHelpers.get_cik_async(ticker="NVDA", search_text="NVIDIA")
+            await EdgarHelpers.get_cik_async(ticker="NVDA", search_text="NVIDIA", api=api)
 
-    @patch("httpx.Client")
-    def test_get_universe(self, mock_client):
+    def test_get_universe(self):
         fake_response = {
             "0":
             {
@@ -152,16 +143,11 @@ class TestRequestHelpers:
             }
         }
 
-        def fake_json():
-            return [v for v in fake_response.values()]
+        server = MockEdgarServer(responses={"/files/company_tickers.json": fake_response})
+        api = EdgarAPI(cache_mode=True, transport=server)
 
-        mock_instance = MagicMock()
-        mock_instance.get.return_value.json = fake_json
-        mock_instance.get.return_value.raise_for_status = lambda: None
-        mock_client.return_value.__enter__.return_value = mock_instance
-
-        universe = EdgarHelpers.get_universe()
-        assert len(universe) == 4
+        universe = EdgarHelpers.get_universe(api=api)
+        assert isinstance(universe, list) and len(universe) == 4
         assert isinstance(universe[0], Company)
         assert isinstance(universe[1], Company)
         assert isinstance(universe[2], Company)
@@ -171,9 +157,8 @@ class TestRequestHelpers:
         assert universe[2].title == "Apple Inc."
         assert universe[3].cik == "1018724"
 
-    @patch("httpx.AsyncClient")
     @pytest.mark.asyncio
-    async def test_get_universe_async(self, mock_client):
+    async def test_get_universe_async(self):
         fake_response = {
             "0":
             {
@@ -201,16 +186,11 @@ class TestRequestHelpers:
             }
         }
 
-        def fake_json():
-            return [v for v in fake_response.values()]
-
-        mock_instance = AsyncMock()
-        mock_instance.get.return_value.json = fake_json
-        mock_instance.get.return_value.raise_for_status = lambda: None
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        server = MockEdgarServer(responses={"/files/company_tickers.json": fake_response})
+        api = EdgarAPI(cache_mode=True, transport=server)
 
-        universe = await EdgarHelpers.get_universe_async()
-        assert len(universe) == 4
+        universe = await EdgarHelpers.get_universe_async(api=api)
+        assert isinstance(universe, list) and len(universe) == 4
         assert isinstance(universe[0], Company)
         assert isinstance(universe[1], Company)
         assert isinstance(universe[2], Company)
@@ -220,6 +200,42 @@ class TestRequestHelpers:
         assert universe[2].title == "Apple Inc."
         assert universe[3].cik == "1018724"
 
+    def test_get_company_universe(self, tmp_path):
+        path = str(tmp_path / "universe.json")
+        server = MockEdgarServer(payload_size=6)
+
+        universe = EdgarHelpers.get_company_universe(api=EdgarAPI(transport=server), path=path)
+        cached = EdgarHelpers.get_company_universe(api=EdgarAPI(transport=server), path=path)
+
+        assert server.requests == 2
+        assert cached.ticker == universe.ticker
+        assert cached.filter(exchange="Nasdaq").lookup(["T1000", "T1014"]) == ["1000", "1014"]
+        EdgarHelpers.get_company_universe(api=EdgarAPI(transport=server), path=path, max_age=0)
+        assert server.requests == 4
+
+    @pytest.mark.asyncio
+    async def test_get_company_universe_async(self, tmp_path):
+        path = str(tmp_path / "universe.json")
+        server = MockEdgarServer(payload_size=6)
+
+        universe = await EdgarHelpers.get_company_universe_async(api=EdgarAPI(transport=server), path=path)
+        cached = await EdgarHelpers.get_company_universe_async(api=EdgarAPI(transport=server), path=path)
+
+        assert server.requests == 2
+        assert cached.exchange == universe.exchange == ["Nasdaq", "NYSE", "Nasdaq", "OTC", "CBOE", None]
+
+    def test_default_api(self, monkeypatch):
+        server = MockEdgarServer(payload_size=3)
+        monkeypatch.setattr(EdgarHelpers, "default_api", EdgarAPI(cache_mode=True, transport=server))
+
+        assert EdgarHelpers.get_cik(ticker="T1007") == 1007
+        assert [company.ticker for company in EdgarHelpers.get_universe()] == ["T1000", "T1007", "T1014"]
+        assert server.requests == 1
+
+        monkeypatch.setattr(EdgarHelpers, "default_api", None)
+        api = EdgarHelpers._EdgarHelpers__api(None)
+        assert api.cache_mode and EdgarHelpers._EdgarHelpers__api(None) is api
+
 class TestConversionHelpers:
     def test_datetime_cy_conversion_all_cases(self):
 
@@ -285,6 +301,46 @@ class TestConversionHelpers:
         with pytest.raises(ValueError, match="Invalid date format. Must be in 'YYYY-MM-DD' format."):
             await EdgarHelpers.string_cy_conversion_async("invalid_date")
 
+class TestFramePeriodHelpers:
+    def test_frame_period(self):
+
+        assert EdgarHelpers.frame_period("CY2019Q1", instantaneous=False) == "CY2019Q1"
+        assert EdgarHelpers.frame_period("CY2019Q1", instantaneous=True) == "CY2019Q1I"
+        assert EdgarHelpers.frame_period("2019-05-01", instantaneous=True) == "CY2019Q2I"
+        assert EdgarHelpers.frame_period(datetime(2019, 12, 31), instantaneous=False) == "CY2019Q4"
+        assert EdgarHelpers.frame_period("CY2019", instantaneous=False) == "CY2019"
+        assert EdgarHelpers.frame_period("CY2019Q1I", instantaneous=True) == "CY2019Q1I"
+        with pytest.raises(TypeError, match="period must be a string or datetime object."):
+            EdgarHelpers.frame_period(2019, instantaneous=False)
+
+    @pytest.mark.asyncio
+    async def test_frame_period_async(self):
+
+        assert await EdgarHelpers.frame_period_async("CY2019Q1", instantaneous=True) == "CY2019Q1I"
+        assert await EdgarHelpers.frame_period_async("2019-05-01", instantaneous=False) == "CY2019Q2"
+        assert await EdgarHelpers.frame_period_async(datetime(2019, 12, 31), instantaneous=True) == "CY2019Q4I"
+        with pytest.raises(TypeError, match="period must be a string or datetime object."):
+            await EdgarHelpers.frame_period_async(2019, instantaneous=False)
+
+    def test_frame_period_range(self):
+
+        assert EdgarHelpers.frame_period_range("CY2019Q3", "CY2020Q2", instantaneous=False) == ["CY2019Q3", "CY2019Q4", "CY2020Q1", "CY2020Q2"]
+        assert EdgarHelpers.frame_period_range("2019-12-31", datetime(2020, 2, 1), instantaneous=True) == ["CY2019Q4I", "CY2020Q1I"]
+        assert EdgarHelpers.frame_period_range("CY2018", "CY2020", instantaneous=False) == ["CY2018", "CY2019", "CY2020"]
+        with pytest.raises(ValueError, match="start and end must both be annual or both be quarterly periods."):
+            EdgarHelpers.frame_period_range("CY2018", "CY2020Q1", instantaneous=False)
+        with pytest.raises(ValueError, match="Annual frames cannot be instantaneous."):
+            EdgarHelpers.frame_period_range("CY2018", "CY2020", instantaneous=True)
+        with pytest.raises(ValueError, match="start must not be after end."):
+            EdgarHelpers.frame_period_range("CY2020Q2", "CY2020Q1", instantaneous=False)
+
+    @pytest.mark.asyncio
+    async def test_frame_period_range_async(self):
+
+        assert await EdgarHelpers.frame_period_range_async("CY2019Q4", "CY2020Q1", instantaneous=True) == ["CY2019Q4I", "CY2020Q1I"]
+        with pytest.raises(ValueError, match="start must not be after end."):
+            await EdgarHelpers.frame_period_range_async("CY2021", "CY2020", instantaneous=False)
+
 class TestValidationHelpers:
     def test_string_cy_validation(self):
         assert EdgarHelpers.string_cy_validation("CY2024") is True
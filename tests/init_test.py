@@ -0,0 +1,52 @@
+# filepath: /test/init_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Tests for the package's lazy imports.
+"""
+import os
+import subprocess
+import sys
+import pytest
+import edgar_sec
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(edgar_sec.__file__)))
+    return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout.strip()
+
+class TestLazyImports:
+    def test_import_is_lazy(self):
+        loaded = run_python(
+            "import sys, edgar_sec, edgar_sec.objects\n"
+            "from edgar_sec.helpers import EdgarHelpers\n"
+            "EdgarHelpers.cik_validation('320193')\n"
+            "print(sorted(name for name in ('httpx', 'tenacity', 'asyncache', 'edgar_sec.clients') if name in sys.modules))"
+        )
+        assert loaded == "[]"
+
+    def test_getattr(self):
+        from edgar_sec.clients import EdgarAPI
+
+        assert edgar_sec.EdgarAPI is EdgarAPI
+        assert edgar_sec.AsyncAPI is EdgarAPI.AsyncAPI
+        assert edgar_sec.testing.__name__ == "edgar_sec.testing"
+        assert all(getattr(edgar_sec, name) is not None for name in edgar_sec.__all__)
+        with pytest.raises(AttributeError, match="module 'edgar_sec' has no attribute 'Filings'"):
+            edgar_sec.Filings
+
+    def test_dir(self):
+        assert set(edgar_sec.__all__) <= set(dir(edgar_sec))
@@ -0,0 +1,131 @@
+# filepath: /test/instrumentation_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the instrumentation module.
+"""
+import httpx
+import pytest
+from tenacity import retry, stop_after_attempt, wait_none
+from edgar_sec.instrumentation import Hooks, RequestEvent, RequestTimer, InstrumentedCache
+from edgar_sec.scheduling import Deadline
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class TestHooks:
+    def test_register(self):
+        hooks = Hooks()
+        handler = lambda event: None
+
+        assert not hooks
+        assert hooks.register("request_end", handler) is handler
+        assert len(hooks) == 1
+        assert "request_end" in hooks
+        assert repr(hooks) == "Hooks(events=['request_end'])"
+        with pytest.raises(ValueError, match="Unknown event: request_done."):
+            hooks.register("request_done", handler)
+
+        hooks.unregister("request_end", handler)
+        assert not hooks
+        assert "request_end" not in hooks
+        with pytest.raises(ValueError, match="Handler is not registered for request_end."):
+            hooks.unregister("request_end", handler)
+
+    def test_emit(self):
+        hooks = Hooks()
+        events = []
+        hooks.register("parse_end", events.append)
+
+        hooks.emit("parse_end", "/submissions/CIK0000320193.json", 0.5, object_type="SubmissionHistory")
+        hooks.emit("parse_start", "/submissions/CIK0000320193.json")
+
+        assert len(events) == 1
+        assert isinstance(events[0], RequestEvent)
+        assert events[0].url_endpoint == "/submissions/CIK0000320193.json"
+        assert events[0].elapsed == 0.5
+        assert events[0].details == {"object_type": "SubmissionHistory"}
+
+    def test_before_sleep(self):
+        class Instance:
+            def __init__(self):
+                self.hooks = Hooks()
+                self.calls = 0
+            @retry(stop=stop_after_attempt(2), wait=wait_none(), before_sleep=Hooks.before_sleep)
+            def request(self, argument):
+                self.calls += 1
+                if self.calls == 1:
+                    raise ValueError("failed")
+                return argument
+        instance = Instance()
+        events = []
+        instance.hooks.register("retry", events.append)
+
+        instance.request("/submissions/CIK0000320193.json")
+        instance.calls = 0
+        instance.request(Deadline(30))
+
+        assert [event.url_endpoint for event in events] == ["/submissions/CIK0000320193.json", None]
+        assert events[1].details["attempt"] == 1
+        assert isinstance(events[1].details["exception"], ValueError)
+
+class TestRequestTimer:
+    def test_finish(self):
+        hooks = Hooks()
+        events = []
+        for event in Hooks.events:
+            hooks.register(event, events.append)
+
+        timer = RequestTimer(hooks, "/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json")
+        timer.throttled()
+        response = httpx.Response(200, json={"pts": 1}, request=httpx.Request("GET", "https://data.sec.gov"))
+
+        assert timer.finish(response) == {"pts": 1}
+        assert [event.event for event in events] == ["request_start", "throttle_wait", "request_end"]
+        assert events[-1].details["status_code"] == 200
+        assert events[-1].details["bytes"] == len(response.content)
+        assert set(events[-1].details) >= {"throttle", "connect", "transfer", "decode"}
+        assert events[-1].elapsed >= events[-1].details["throttle"]
+
+    def test_finish_error(self):
+        hooks = Hooks()
+        events = []
+        hooks.register("request_end", events.append)
+        timer = RequestTimer(hooks, "/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json")
+
+        assert timer.finish(httpx.Response(304, request=httpx.Request("GET", "https://data.sec.gov"))) is None
+        with pytest.raises(httpx.HTTPStatusError):
+            timer.finish(httpx.Response(429, request=httpx.Request("GET", "https://data.sec.gov")))
+        assert [event.details["status_code"] for event in events] == [304, 429]
+
+    def test_trace(self):
+        timer = RequestTimer(Hooks(), "/submissions/CIK0000320193.json")
+
+        timer.extensions["trace"]("connection.connect_tcp.started", {})
+        timer.extensions["trace"]("connection.start_tls.complete", {})
+
+        assert timer.timings["connect"] > 0
+
+class TestInstrumentedCache:
+    def test_popitem(self):
+        hooks = Hooks()
+        events = []
+        hooks.register("cache_evict", events.append)
+        cache = InstrumentedCache(maxsize=1, hooks=hooks)
+
+        cache[("/submissions/CIK0000320193.json",)] = {}
+        cache[("/submissions/CIK0000789019.json",)] = {}
+
+        assert len(cache) == 1
+        assert [event.url_endpoint for event in events] == ["/submissions/CIK0000320193.json"]
@@ -0,0 +1,120 @@
+# filepath: /test/metrics_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the metrics module.
+"""
+import pytest
+from edgar_sec.instrumentation import Hooks
+from edgar_sec.metrics import Metrics, PrometheusExporter, OpenTelemetryExporter
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+FRAMES = "/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json"
+
+def emit_requests(hooks):
+    for elapsed in (0.2, 0.4, 3.0):
+        hooks.emit("throttle_wait", FRAMES, 0.1)
+        hooks.emit("request_end", FRAMES, elapsed, status_code=200, bytes=100, throttle=0.1)
+    hooks.emit("request_end", FRAMES, 0.1, status_code=429, bytes=10, throttle=0.0)
+    hooks.emit("retry", FRAMES, 1.0, attempt=1)
+    hooks.emit("cache_miss", FRAMES)
+    hooks.emit("cache_hit", FRAMES)
+    hooks.emit("cache_evict", FRAMES)
+    hooks.emit("parse_end", FRAMES, 0.05, object_type="Frame")
+
+class TestMetrics:
+    def test_init(self):
+        hooks = Hooks()
+        metrics = Metrics(hooks)
+
+        assert metrics.hooks is hooks
+        assert len(hooks) == len(Hooks.events)
+        assert repr(metrics) == "Metrics(requests=0, endpoints=[])"
+        with pytest.raises(ValueError, match="Metrics are already attached to a Hooks registry."):
+            metrics.attach(hooks)
+        with pytest.raises(ValueError, match="window must be a positive integer."):
+            Metrics(window=0)
+
+        metrics.detach()
+        assert not hooks
+
+    def test_endpoint(self):
+        assert Metrics.endpoint("/submissions/CIK0000320193.json") == "submissions"
+        assert Metrics.endpoint("/api/xbrl/companyconcept/CIK0000320193/us-gaap/Assets.json") == "companyconcept"
+        assert Metrics.endpoint(FRAMES) == "frames"
+        assert Metrics.endpoint("/files/company_tickers.json") == "files"
+        assert Metrics.endpoint(None) == "other"
+
+    def test_snapshot(self):
+        hooks = Hooks()
+        metrics = Metrics(hooks)
+        emit_requests(hooks)
+        snapshot = metrics.snapshot()
+
+        assert len(metrics) == 4
+        assert snapshot["errors"] == snapshot["rate_limited"] == 1
+        assert snapshot["bytes_received"] == 310
+        assert snapshot["retries"] == snapshot["cache_hits"] == snapshot["cache_misses"] == snapshot["cache_evictions"] == 1
+        assert snapshot["throttle_seconds"] == pytest.approx(0.3)
+        assert snapshot["latency"]["frames"]["count"] == 4
+        assert snapshot["latency"]["frames"]["max"] == pytest.approx(2.9)
+        assert snapshot["latency"]["frames"]["p50"] <= snapshot["latency"]["frames"]["p95"] <= snapshot["latency"]["frames"]["p99"]
+        assert snapshot["parse"]["Frame"] == {"count": 1, "sum": 0.05, "p50": 0.05, "p95": 0.05, "p99": 0.05, "max": 0.05}
+        assert metrics.histograms()["latency"]["frames"][0] == [0, 0, 0, 0, 2, 0, 1, 0, 0, 1, 0, 0]
+
+        metrics.reset()
+        assert metrics.snapshot()["latency"] == {}
+        assert len(metrics) == 0
+
+class TestPrometheusExporter:
+    def test_collect(self):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        hooks = Hooks()
+        metrics = Metrics(hooks)
+        registry = prometheus_client.CollectorRegistry()
+        PrometheusExporter(metrics, registry=registry)
+        emit_requests(hooks)
+
+        assert registry.get_sample_value("edgar_sec_requests_total") == 4
+        assert registry.get_sample_value("edgar_sec_rate_limited_total") == 1
+        assert registry.get_sample_value("edgar_sec_request_latency_seconds_count", {"endpoint": "frames"}) == 4
+        assert registry.get_sample_value("edgar_sec_request_latency_seconds_bucket", {"endpoint": "frames", "le": "0.5"}) == 3
+        assert registry.get_sample_value("edgar_sec_parse_seconds_count", {"object_type": "Frame"}) == 1
+
+class TestOpenTelemetryExporter:
+    def test_handle(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        reader = InMemoryMetricReader()
+        hooks = Hooks()
+        exporter = OpenTelemetryExporter(Metrics(hooks), meter=MeterProvider(metric_readers=[reader]).get_meter("edgar_sec"))
+        emit_requests(hooks)
+
+        points = {
+            metric.name: metric.data.data_points
+            for resource_metric in reader.get_metrics_data().resource_metrics
+            for scope_metric in resource_metric.scope_metrics
+            for metric in scope_metric.metrics
+        }
+        assert sum(point.value for point in points["edgar_sec.requests"]) == 4
+        assert sum(point.count for point in points["edgar_sec.request.latency"]) == 4
+        assert sum(point.value for point in points["edgar_sec.cache_evictions"]) == 1
+        with pytest.raises(ValueError, match="Metrics must be attached to a Hooks registry."):
+            OpenTelemetryExporter(Metrics())
+
+        exporter.close()
+        assert len(hooks) == len(Hooks.events)
@@ -0,0 +1,214 @@
+# filepath: /test/mirror_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the mirror module.
+"""
+from unittest.mock import patch
+from edgar_sec.mirror import EdgarMirror
+from edgar_sec.objects import SubmissionHistory, CompanyConcept, CompanyFacts, Frame
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+SUBMISSIONS = {
+    "cik": "0001744489",
+    "entityType": "operating",
+    "sic": "7990",
+    "sicDescription": "Services-Miscellaneous Amusement & Recreation",
+    "name": "Walt Disney Co",
+    "tickers": ["DIS"],
+    "exchanges": ["NYSE"],
+    "fiscalYearEnd": "0927",
+    "stateOfIncorporation": "DE",
+    "addresses": {
+        "business": {
+            "street1": "500 SOUTH BUENA VISTA STREET",
+            "street2": None,
+            "city": "BURBANK",
+            "stateOrCountry": "CA",
+            "zipCode": "91521",
+            "stateOrCountryDescription": "CA",
+            "isForeignLocation": 0
+        }
+    },
+    "formerNames": [{"name": "TWDC Holdco 613 Corp", "from": "2018-06-25T04:00:00.000Z", "to": "2018-06-28T04:00:00.000Z"}],
+    "filings": {
+        "recent": {
+            "accessionNumber": ["0001744489-25-000001", "0001744489-25-000002"],
+            "filingDate": ["2025-08-06", "2025-05-07"],
+            "reportDate": ["2025-06-28", "2025-03-29"],
+            "acceptanceDateTime": ["2025-08-06T16:05:00.000Z", "2025-05-07T16:05:00.000Z"],
+            "act": ["34", "34"],
+            "form": ["10-Q", "10-Q"],
+            "fileNumber": ["001-38842", "001-38842"],
+            "filmNumber": ["251183960", "25921393"],
+            "items": ["", ""],
+            "core_type": ["10-Q", "10-Q"],
+            "size": [9000000, 8000000],
+            "isXBRL": [1, 1],
+            "isInlineXBRL": [1, 1],
+            "primaryDocument": ["dis-20250628.htm", "dis-20250329.htm"],
+            "primaryDocDescription": ["10-Q", "10-Q"]
+        },
+        "files": [{"name": "CIK0001744489-submissions-001.json", "filingCount": 7, "filingFrom": "2018-06-25", "filingTo": "2019-03-18"}]
+    }
+}
+
+COMPANY_FACTS = {
+    "cik": 1744489,
+    "entityName": "WALT DISNEY CO/",
+    "facts": {
+        "us-gaap": {
+            "AccountsPayableCurrent": {
+                "label": "Accounts Payable, Current",
+                "description": "Accounts payable.",
+                "units": {
+                    "USD": [
+                        {"end": "2018-09-29", "val": 6503000000, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20", "frame": "CY2018Q3I"},
+                        {"end": "2019-09-28", "val": 6700000000, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20", "frame": "CY2019Q3I"}
+                    ]
+                }
+            },
+            "Revenues": {
+                "label": "Revenues",
+                "description": "Revenue.",
+                "units": {
+                    "USD": [
+                        {"start": "2018-09-30", "end": "2019-09-28", "val": 69570000000, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20", "frame": "CY2019"}
+                    ]
+                }
+            }
+        }
+    }
+}
+
+FRAME = {
+    "taxonomy": "us-gaap",
+    "tag": "AccountsPayableCurrent",
+    "ccp": "CY2019Q1I",
+    "uom": "USD",
+    "label": "Accounts Payable, Current",
+    "description": "Accounts payable.",
+    "pts": 2,
+    "data": [
+        {"accn": "0001104659-19-016320", "cik": 1750, "entityName": "AAR CORP.", "loc": "US-IL", "end": "2019-02-28", "val": 218600000},
+        {"accn": "0001264931-19-000067", "cik": 1961, "entityName": "WORLDS INC.", "loc": "US-MA", "end": "2019-03-31", "val": 797908}
+    ]
+}
+
+class TestEdgarMirror:
+    def test_init(self, tmp_path):
+        path = str(tmp_path / "edgar.db")
+        mirror = EdgarMirror(path, max_age=60)
+
+        assert mirror.path == path
+        assert mirror.max_age == 60
+        assert repr(mirror) == f"EdgarMirror(path={path!r}, max_age=60)"
+        tables = {row[0] for row in mirror.query("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"sync_log", "entities", "concepts", "facts", "frames", "frame_disclosures", "submissions", "filings"} <= tables
+        mirror.close()
+
+    def test_reopen(self, tmp_path):
+        mirror = EdgarMirror(str(tmp_path / "edgar.db"))
+        mirror.store_submissions(SubmissionHistory.to_object(SUBMISSIONS))
+        connection = mirror.connection
+
+        mirror.reopen()
+
+        assert mirror.connection is not connection
+        assert mirror.get_submissions(SubmissionHistory.to_object(SUBMISSIONS).cik) is not None
+        connection.close()
+        mirror.close()
+        memory = EdgarMirror()
+        connection = memory.connection
+        memory.reopen()
+        assert memory.connection is connection
+
+    def test_submissions_round_trip(self):
+        mirror = EdgarMirror()
+        submission_history = SubmissionHistory.to_object(SUBMISSIONS)
+
+        assert mirror.get_submissions("0001744489") is None
+
+        mirror.store_submissions(submission_history)
+
+        assert mirror.get_submissions("0001744489") == submission_history
+        assert mirror.query("SELECT accession_number FROM filings WHERE form = ? ORDER BY filing_date", ("10-Q",)) == [("0001744489-25-000002",), ("0001744489-25-000001",)]
+
+    def test_company_facts_round_trip(self):
+        mirror = EdgarMirror()
+        company_facts = CompanyFacts.to_object(COMPANY_FACTS)
+
+        assert mirror.get_company_facts("0001744489") is None
+        assert mirror.get_company_concept("0001744489", "us-gaap", "Revenues") is None
+
+        mirror.store_company_facts(company_facts)
+
+        assert mirror.get_company_facts("0001744489") == company_facts
+        concept = mirror.get_company_concept("0001744489", "us-gaap", "Revenues")
+        assert concept.entity_name == "WALT DISNEY CO/"
+        assert concept.units == company_facts.facts[0].disclosures[1].units
+        assert mirror.get_company_concept("0001744489", "us-gaap", "Assets") is None
+        assert mirror.query("SELECT val FROM facts WHERE tag = ? AND frame = ?", ("AccountsPayableCurrent", "CY2019Q3I")) == [(6700000000.0,)]
+
+    def test_company_concept_round_trip(self):
+        mirror = EdgarMirror()
+        response = {
+            "cik": 1744489,
+            "taxonomy": "us-gaap",
+            "tag": "AccountsPayableCurrent",
+            "label": "Accounts Payable, Current",
+            "description": "Accounts payable.",
+            "entityName": "WALT DISNEY CO/",
+            "units": COMPANY_FACTS["facts"]["us-gaap"]["AccountsPayableCurrent"]["units"]
+        }
+        company_concept = CompanyConcept.to_object(response)
+        mirror.store_company_concept(company_concept)
+
+        assert mirror.get_company_concept("0001744489", "us-gaap", "AccountsPayableCurrent") == company_concept
+        assert mirror.get_company_facts("0001744489") is None
+
+    def test_frame_round_trip(self):
+        mirror = EdgarMirror()
+        frame = Frame.to_object(FRAME)
+
+        assert mirror.get_frame("us-gaap", "AccountsPayableCurrent", "USD", "CY2019Q1I") is None
+
+        mirror.store_frame(frame)
+
+        assert mirror.get_frame("us-gaap", "AccountsPayableCurrent", "USD", "CY2019Q1I") == frame
+        assert mirror.query("SELECT entity_name FROM frame_disclosures WHERE cik = ?", ("0000001961",)) == [("WORLDS INC.",)]
+
+    def test_frame_round_trip_per_share(self):
+        mirror = EdgarMirror()
+        frame = Frame.to_object({**FRAME, "tag": "EarningsPerShareBasic", "ccp": "CY2019Q1", "uom": "USD/shares", "pts": 0, "data": []})
+
+        mirror.store_frame(frame, "USD-per-shares", "CY2019Q1")
+
+        mirrored = mirror.get_frame("us-gaap", "EarningsPerShareBasic", "USD-per-shares", "CY2019Q1")
+        assert mirrored is not None
+        assert mirrored.uom == "USD-per-shares"
+        assert mirror.get_frame("us-gaap", "EarningsPerShareBasic", "USD/shares", "CY2019Q1") == mirrored
+        assert mirror.is_fresh("frames", "us-gaap/EarningsPerShareBasic/USD-per-shares/CY2019Q1")
+
+    def test_is_fresh(self):
+        mirror = EdgarMirror(max_age=10)
+        mirror.store_frame(Frame.to_object(FRAME))
+
+        assert mirror.is_fresh("frames", "us-gaap/AccountsPayableCurrent/USD/CY2019Q1I")
+
+        with patch("edgar_sec.mirror.time.time", return_value=2e10):
+            assert not mirror.is_fresh("frames", "us-gaap/AccountsPayableCurrent/USD/CY2019Q1I")
+            assert mirror.get_frame("us-gaap", "AccountsPayableCurrent", "USD", "CY2019Q1I") is None
@@ -32,6 +32,7 @@ from edgar_sec.objects import (
     CompanyFacts,
     FrameDisclosure,
     Frame,
+    FramePanel,
     Company
 )
 from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
@@ -656,6 +657,35 @@ class TestUnitDisclosure:
         assert unit_disclosure.frame == "2022-12-31"
         assert unit_disclosure.start == "2022-01-01"
 
+    def test_unit_disclosure_to_object_list(self):
+        disclosures = [
+            {"start": "2022-01-01", "end": "2022-12-31", "val": 1000, "accn": "a2", "fy": 2023, "fp": "FY", "form": "10-K", "filed": "2024-02-01"},
+            {"start": "2022-01-01", "end": "2022-12-31", "val": 1000, "accn": "a1", "fy": 2022, "fp": "FY", "form": "10-K", "filed": "2023-02-01", "frame": "CY2022"},
+            {"start": "2022-01-01", "end": "2022-12-31", "val": 1100, "accn": "a3", "fy": 2024, "fp": "FY", "form": "10-K", "filed": "2025-02-01"}
+        ]
+        assert len(UnitDisclosure.to_object_list(disclosures, "USD")) == 3
+
+        unit_disclosures = UnitDisclosure.to_object_list(disclosures, "USD", dedup=True)
+        assert len(unit_disclosures) == 2
+        assert unit_disclosures[0].accn == "a1"
+        assert unit_disclosures[0].filed == "2023-02-01"
+        assert unit_disclosures[0].last_filed == "2024-02-01"
+        assert unit_disclosures[0].accns == ["a1", "a2"]
+        assert unit_disclosures[0].frame == "CY2022"
+        assert unit_disclosures[1].val == 1100.0
+        assert unit_disclosures[1].accns == ["a3"]
+
+    @pytest.mark.asyncio
+    async def test_unit_disclosure_to_object_list_async(self):
+        disclosures = [
+            {"end": "2022-12-31", "val": 5, "accn": "a1", "filed": "2023-02-01"},
+            {"end": "2022-12-31", "val": 5, "accn": "a2", "filed": "2023-05-01"}
+        ]
+        unit_disclosures = await UnitDisclosure.to_object_list_async(disclosures, "shares", dedup=True)
+        assert len(unit_disclosures) == 1
+        assert unit_disclosures[0].accns == ["a1", "a2"]
+        assert (await UnitDisclosure.to_object_list_async(disclosures, "shares"))[1].accns is None
+
 class TestCompanyConcept:
     def test_company_concept_to_object(self):
         response = {
@@ -1256,6 +1286,35 @@ class TestCompanyFacts:
         assert isinstance(company_facts.facts, list)
         assert isinstance(company_facts.facts[0], TaxonomyFacts)
 
+    def test_company_facts_to_object_dedup(self):
+        disclosures = [
+            {"end": "2023-09-30", "val": 100, "accn": "a1", "fy": 2023, "fp": "FY", "form": "10-K", "filed": "2023-11-03"},
+            {"end": "2023-09-30", "val": 100, "accn": "a2", "fy": 2024, "fp": "Q1", "form": "10-Q", "filed": "2024-02-02"}
+        ]
+        response = {"cik": 320193, "entityName": "Apple Inc.", "facts": {"us-gaap": {"Assets": {"label": "Assets", "description": "Assets.", "units": {"USD": disclosures}}}}}
+
+        assert len(CompanyFacts.to_object(response).facts[0].disclosures[0].units) == 2
+        units = CompanyFacts.to_object(response, dedup=True).facts[0].disclosures[0].units
+        assert len(units) == 1
+        assert units[0].accns == ["a1", "a2"]
+        assert units[0].last_filed == "2024-02-02"
+
+        concept = CompanyConcept.to_object({"cik": 320193, "taxonomy": "us-gaap", "tag": "Assets", "units": {"USD": disclosures}}, dedup=True)
+        assert concept.units == units
+
+    @pytest.mark.asyncio
+    async def test_company_facts_to_object_async_dedup(self):
+        disclosures = [
+            {"end": "2023-09-30", "val": 100, "accn": "a1", "filed": "2023-11-03"},
+            {"end": "2023-09-30", "val": 100, "accn": "a2", "filed": "2024-02-02"}
+        ]
+        response = {"cik": 320193, "entityName": "Apple Inc.", "facts": {"us-gaap": {"Assets": {"units": {"USD": disclosures}}}}}
+
+        company_facts = await CompanyFacts.to_object_async(response, dedup=True)
+        assert company_facts == CompanyFacts.to_object(response, dedup=True)
+        concept = await CompanyConcept.to_object_async({"cik": 320193, "taxonomy": "us-gaap", "tag": "Assets", "units": {"USD": disclosures}}, dedup=True)
+        assert concept.units == company_facts.facts[0].disclosures[0].units
+
 class TestFrameDisclosure:
     def test_frame_disclosure_to_object(self):
         response = {
@@ -1404,6 +1463,45 @@ class TestFrame:
         assert isinstance(frame.disclosures, list)
         assert isinstance(frame.disclosures[0], FrameDisclosure)
 
+class TestFramePanel:
+    def frames(self):
+        return [
+            Frame(taxonomy="us-gaap", tag="Assets", ccp="CY2019Q4I", uom="USD", label="Assets", description="Assets.", pts=2, disclosures=[
+                FrameDisclosure(accn="0000320193-20-000010", cik="320193", entity_name="Apple Inc.", loc="US-CA", end="2019-12-28", val=340618000000.0),
+                FrameDisclosure(accn="0001564590-20-002450", cik="789019", entity_name="MICROSOFT CORPORATION", loc="US-WA", end="2019-12-31", val=278955000000.0)
+            ]),
+            Frame(taxonomy="us-gaap", tag="Assets", ccp="CY2020Q1I", uom="USD", label="Assets", description="Assets.", pts=1, disclosures=[
+                FrameDisclosure(accn="0001564590-20-019706", cik="789019", entity_name="MICROSOFT CORPORATION", loc="US-WA", end="2020-03-31", val=285449000000.0)
+            ])
+        ]
+
+    def test_frame_panel_to_object(self):
+        panel = FramePanel.to_object(self.frames())
+        assert isinstance(panel, FramePanel)
+        assert panel.taxonomy == "us-gaap"
+        assert panel.tag == "Assets"
+        assert panel.uom == "USD"
+        assert panel.periods == ["CY2019Q4I", "CY2020Q1I"]
+        assert panel.ciks == ["320193", "789019"]
+        assert panel.entity_names == {"320193": "Apple Inc.", "789019": "MICROSOFT CORPORATION"}
+        assert panel.get("789019", "CY2020Q1I") == 285449000000.0
+        assert panel.get("320193", "CY2020Q1I") is None
+        assert panel.to_dense() == [[340618000000.0, None], [278955000000.0, 285449000000.0]]
+
+    @pytest.mark.asyncio
+    async def test_frame_panel_to_object_async(self):
+        panel = await FramePanel.to_object_async(self.frames())
+        assert isinstance(panel, FramePanel)
+        assert len(panel.values) == 3
+        assert FramePanel.to_object([]).to_dense() == []
+
+    def test_frame_panel_missing_periods(self):
+        panel = FramePanel.to_object(self.frames(), ["CY2019Q3I", "CY2019Q4I", "CY2020Q1I"])
+        assert panel.periods == ["CY2019Q3I", "CY2019Q4I", "CY2020Q1I"]
+        assert panel.missing == ["CY2019Q3I"]
+        assert panel.to_dense() == [[None, 340618000000.0, None], [None, 278955000000.0, 285449000000.0]]
+        assert FramePanel.to_object(self.frames()).missing == []
+
 class TestCompany:
     def test_company_to_object(self):
         data = {
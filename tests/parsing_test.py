@@ -0,0 +1,101 @@
+# filepath: /test/parsing_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the parsing module.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import pytest
+from edgar_sec.objects import SubmissionHistory, CompanyConcept, CompanyFacts, Frame, UnitDisclosure
+from edgar_sec.parsing import ParseExecutor
+from edgar_sec.testing import PayloadGenerator
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+GENERATOR = PayloadGenerator()
+COMPANY_FACTS = GENERATOR.company_facts(320193, tags=4, facts_per_tag=20)
+
+class TestParseExecutor:
+    def test_init(self):
+        executor = ParseExecutor(threshold=10, max_workers=2)
+
+        assert repr(executor) == "ParseExecutor(threshold=10, max_workers=2)"
+        assert executor.executor is None
+        with pytest.raises(ValueError, match="threshold must not be negative."):
+            ParseExecutor(threshold=-1)
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer."):
+            ParseExecutor(chunk_size=0)
+
+    def test_schema(self):
+        names, nested = ParseExecutor.schema(CompanyConcept)
+
+        assert names[-1] == "units"
+        assert nested == {len(names) - 1: UnitDisclosure}
+        assert ParseExecutor.schema(UnitDisclosure)[1] == {}
+
+    @pytest.mark.parametrize("object_type, payload, kwargs", [
+        (SubmissionHistory, GENERATOR.submissions(320193, filings=30, files=2), {}),
+        (CompanyConcept, GENERATOR.company_concept(320193, facts=12), {"dedup": True}),
+        (CompanyFacts, COMPANY_FACTS, {}),
+        (CompanyFacts, COMPANY_FACTS, {"dedup": True}),
+        (Frame, GENERATOR.frame(companies=40), {}),
+        (CompanyConcept, {"cik": 1, "units": {}}, {}),
+    ])
+    def test_pack(self, object_type, payload, kwargs):
+        parsed = object_type.to_object(payload, **kwargs)
+        packed = ParseExecutor.pack(parsed)
+
+        assert packed[0] == object_type.__name__
+        assert ParseExecutor.unpack(packed) == parsed
+
+    def test_pack_encoding(self):
+        _, _, tables = ParseExecutor.pack(CompanyFacts.to_object(COMPANY_FACTS))
+        names = ParseExecutor.schema(UnitDisclosure)[0]
+        columns = dict(zip(names, tables["UnitDisclosure"]))
+
+        assert columns["form"][0] == ["10-Q", "10-K"]
+        assert len(columns["form"][1]) == 100
+        _, _, tables = ParseExecutor.pack(Frame.to_object(GENERATOR.frame(companies=40)))
+        assert tables["FrameDisclosure"][1][0] is None
+
+    @pytest.mark.asyncio
+    async def test_unpack_async(self):
+        parsed = CompanyFacts.to_object(COMPANY_FACTS)
+
+        assert await ParseExecutor.unpack_async(ParseExecutor.pack(parsed), chunk_size=7) == parsed
+
+    def test_parse(self):
+        content = json.dumps(COMPANY_FACTS).encode()
+        expected = CompanyFacts.to_object(COMPANY_FACTS, dedup=True)
+
+        executor = ParseExecutor(threshold=len(content) + 1)
+        assert executor.parse(CompanyFacts, content, dedup=True) == expected
+        assert executor.executor is None
+
+        with ParseExecutor(threshold=0, max_workers=1) as executor:
+            assert executor.parse(CompanyFacts, content, dedup=True) == expected
+            assert executor.executor is not None
+        assert executor.executor is None
+
+    @pytest.mark.asyncio
+    async def test_parse_async(self):
+        content = json.dumps(COMPANY_FACTS).encode()
+        pool = ThreadPoolExecutor(max_workers=1)
+
+        with ParseExecutor(threshold=0, executor=pool) as executor:
+            assert await executor.parse_async(CompanyFacts, content) == CompanyFacts.to_object(COMPANY_FACTS)
+        assert executor.executor is pool
+        pool.shutdown()
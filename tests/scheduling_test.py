@@ -0,0 +1,294 @@
+# filepath: /test/scheduling_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the scheduling module.
+"""
+import asyncio
+import pickle
+import threading
+import time
+import httpx
+import pytest
+from edgar_sec.clients import EdgarAPI
+from edgar_sec.scheduling import RequestScheduler, Deadline, HostLimiter, AsyncThreadLock
+from edgar_sec.testing import MockEdgarServer
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class TestDeadline:
+    def test_init(self):
+        deadline = Deadline(5.0)
+        child = Deadline(10.0, fail_fast=True, parent=deadline)
+
+        assert 4.9 < deadline.remaining() <= 5.0
+        assert child.expires == deadline.expires and child.fail_fast
+        assert repr(Deadline(1.0)).startswith("Deadline(remaining=")
+        with pytest.raises(ValueError, match="seconds must not be negative."):
+            Deadline(-1.0)
+
+    def test_check(self):
+        assert Deadline(1.0).check(5.0) > 0.9
+        with pytest.raises(TimeoutError, match="would exceed the deadline of 1.0s."):
+            Deadline(1.0, fail_fast=True).check(5.0)
+        with pytest.raises(TimeoutError, match="Deadline of 0.0s exceeded."):
+            Deadline(0.0).check()
+
+    def test_timeout(self):
+        timeout = Deadline(2.0).timeout(httpx.Timeout(10, connect=1))
+
+        assert timeout.connect == 1
+        assert 1.9 < timeout.read <= 2.0
+        assert 1.9 < Deadline(2.0).timeout(None).pool <= 2.0
+
+    def test_retry(self):
+        assert Deadline.retryable(ValueError())
+        assert not Deadline.retryable(TimeoutError())
+        assert not Deadline.retryable(asyncio.CancelledError())
+        request = httpx.Request("GET", "https://data.sec.gov/api/xbrl/frames/us-gaap/Missing/USD/CY2019.json")
+        assert not Deadline.retryable(httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request)))
+        assert Deadline.retryable(httpx.HTTPStatusError("Server Error", request=request, response=httpx.Response(503, request=request)))
+        assert not Deadline.stop(None)
+        stop = Deadline.stop_after_attempt(3)
+        assert not stop(type("RetryState", (), {"attempt_number": 2, "upcoming_sleep": 1.0})())
+        assert stop(type("RetryState", (), {"attempt_number": 3, "upcoming_sleep": 1.0})())
+        token = Deadline.context.set(Deadline(0.5))
+        try:
+            assert Deadline.stop(type("RetryState", (), {"upcoming_sleep": 1.0})())
+            assert stop(type("RetryState", (), {"attempt_number": 1, "upcoming_sleep": 1.0})())
+        finally:
+            Deadline.context.reset(token)
+
+class TestRequestScheduler:
+    def test_init(self):
+        scheduler = RequestScheduler(max_requests_per_second=5)
+
+        assert repr(scheduler) == "RequestScheduler(max_requests_per_second=5, waiting=0)"
+        assert len(scheduler) == 0
+        with pytest.raises(ValueError, match="max_requests_per_second must be a positive integer."):
+            RequestScheduler(max_requests_per_second=0)
+        with pytest.raises(ValueError, match="Unknown priority: urgent."):
+            with scheduler.priority("urgent"):
+                pass
+
+    def test_priority_context(self):
+        scheduler = RequestScheduler()
+
+        assert RequestScheduler.context.get() == (1, None)
+        with scheduler.priority("batch", flow="nightly"):
+            assert RequestScheduler.context.get() == (2, "nightly")
+            with scheduler.priority():
+                assert RequestScheduler.context.get() == (0, None)
+            with scheduler.priority(5):
+                assert RequestScheduler.context.get() == (5, None)
+        assert RequestScheduler.context.get() == (1, None)
+
+    def test_budget(self):
+        scheduler = RequestScheduler(max_requests_per_second=3)
+
+        started = time.monotonic()
+        for _ in range(4):
+            scheduler.acquire()
+
+        assert time.monotonic() - started >= 0.9
+        assert scheduler.dispatcher.daemon
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        scheduler = RequestScheduler(max_requests_per_second=4)
+        for _ in range(4):
+            await scheduler.acquire_async()
+        released = []
+
+        async def acquire(name):
+            await scheduler.acquire_async()
+            released.append(name)
+
+        tasks = []
+        for flow in ("a", "b"):
+            with scheduler.priority("batch", flow=flow):
+                tasks.extend(asyncio.create_task(acquire(f"{flow}{index}")) for index in range(2))
+        cancelled = asyncio.create_task(acquire("cancelled"))
+        with scheduler.priority("interactive"):
+            tasks.append(asyncio.create_task(acquire("interactive")))
+        await asyncio.sleep(0.05)
+        assert len(scheduler) == 6
+        cancelled.cancel()
+
+        await asyncio.gather(*tasks)
+
+        assert released == ["interactive", "a0", "b0", "a1", "b1"]
+        assert cancelled.cancelled()
+        assert len(scheduler) == 0
+
+    def test_edgar_api(self):
+        scheduler = RequestScheduler(max_requests_per_second=100)
+        server = MockEdgarServer(payload_size=2)
+        api = EdgarAPI(transport=server, scheduler=scheduler)
+        other = EdgarAPI(transport=server, scheduler=scheduler)
+
+        with scheduler.priority("batch"):
+            frames = api.batch("get_frames", [{"taxonomy": "us-gaap", "tag": "Assets", "unit": "USD", "period": f"CY{year}", "instantaneous": False} for year in range(2010, 2016)])
+        with scheduler.priority("interactive"):
+            submission_history = other.get_submissions(central_index_key="0000320193")
+
+        assert [frame.ccp for frame in frames] == [f"CY{year}" for year in range(2010, 2016)]
+        assert submission_history.cik == "0000320193"
+        assert server.requests == 7
+        assert not api.request_times
+        assert len(scheduler.request_times) == 7
+        assert api.Async.scheduler is scheduler
+
+    @pytest.mark.asyncio
+    async def test_edgar_api_async(self):
+        scheduler = RequestScheduler(max_requests_per_second=100)
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=2), scheduler=scheduler).Async
+
+        with scheduler.priority("interactive"):
+            frame = await api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+
+        assert frame.ccp == "CY2019"
+        assert len(scheduler.request_times) == 1
+
+    def test_pickle(self):
+        scheduler = RequestScheduler(max_requests_per_second=4)
+        scheduler.acquire()
+
+        restored = pickle.loads(pickle.dumps(EdgarAPI(scheduler=scheduler))).scheduler
+
+        assert restored.max_requests_per_second == 4
+        assert not restored.request_times
+        assert restored.dispatcher is None
+
+    def test_deadline(self):
+        scheduler = RequestScheduler(max_requests_per_second=1)
+        scheduler.acquire()
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="exceeded waiting for a request slot."):
+            scheduler.acquire(Deadline(0.1))
+        assert time.monotonic() - started < 0.5
+        assert len(scheduler) == 0 and not scheduler.queues
+
+    @pytest.mark.asyncio
+    async def test_deadline_async(self):
+        scheduler = RequestScheduler(max_requests_per_second=1)
+        await scheduler.acquire_async()
+
+        with pytest.raises(TimeoutError):
+            await scheduler.acquire_async(Deadline(0.1))
+        assert len(scheduler) == 0
+
+class TestHostLimiter:
+    def test_reserve(self):
+        limiter = HostLimiter({"www.sec.gov": 2})
+
+        assert repr(limiter) == "HostLimiter(limits={'www.sec.gov': 2})"
+        assert limiter.reserve("data.sec.gov") == 0.0
+        assert limiter.reserve("www.sec.gov") == 0.0
+        assert limiter.reserve("www.sec.gov") == 0.0
+        assert 0.9 < limiter.reserve("www.sec.gov") <= 1.0
+        assert 0.9 < limiter.reserve("www.sec.gov") <= 1.0
+        assert 1.9 < limiter.reserve("www.sec.gov") <= 2.0
+        assert not limiter.request_times.get("data.sec.gov")
+        with pytest.raises(ValueError, match="The limit of www.sec.gov must be a positive integer."):
+            HostLimiter({"www.sec.gov": 0})
+        with pytest.raises(TimeoutError, match="would exceed the deadline"):
+            limiter.wait("www.sec.gov", Deadline(0.5, fail_fast=True))
+        assert len(limiter.request_times["www.sec.gov"]) == 5
+
+    def test_wait_releases_slot_on_timeout(self):
+        limiter = HostLimiter({"www.sec.gov": 1})
+        limiter.reserve("www.sec.gov")
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="exceeded waiting for a request slot"):
+            limiter.wait("www.sec.gov", Deadline(0.1))
+
+        assert time.monotonic() - started < 0.5
+        assert len(limiter.request_times["www.sec.gov"]) == 1
+        assert 0.5 < limiter.reserve("www.sec.gov") <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_wait_async_releases_slot(self):
+        limiter = HostLimiter({"www.sec.gov": 1})
+        limiter.reserve("www.sec.gov")
+
+        with pytest.raises(TimeoutError):
+            await limiter.wait_async("www.sec.gov", Deadline(0.05))
+        assert len(limiter.request_times["www.sec.gov"]) == 1
+
+        task = asyncio.create_task(limiter.wait_async("www.sec.gov"))
+        await asyncio.sleep(0.05)
+        assert len(limiter.request_times["www.sec.gov"]) == 2
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert len(limiter.request_times["www.sec.gov"]) == 1
+
+    def test_edgar_api(self):
+        server = MockEdgarServer(payload_size=3)
+        api = EdgarAPI(transport=server, host_limiter=HostLimiter({"www.sec.gov": 1}))
+
+        started = time.monotonic()
+        api.get_company_tickers()
+        api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        assert time.monotonic() - started < 0.5
+        tickers = api.get_company_tickers()
+
+        assert time.monotonic() - started >= 0.9
+        assert tickers["2"]["ticker"] == "T1014"
+        assert server.requests == 3
+        assert pickle.loads(pickle.dumps(api)).host_limiter.limits == {"www.sec.gov": 1}
+        assert EdgarAPI().host_limiter.limits == {"www.sec.gov": 5}
+
+    @pytest.mark.asyncio
+    async def test_edgar_api_async(self):
+        requests = []
+        api = EdgarAPI(cache_mode=True, transport=MockEdgarServer(payload_size=3)).Async
+        api.hooks.register("request_start", lambda event: requests.append(event.url_endpoint))
+
+        tickers = await api.get_company_tickers()
+
+        assert await api.get_company_tickers() == tickers
+        assert requests == ["/files/company_tickers.json"]
+        assert api._parent.host_limiter.request_times["www.sec.gov"]
+
+class TestAsyncThreadLock:
+    @pytest.mark.asyncio
+    async def test_shared_with_thread(self):
+        lock = threading.RLock()
+        async_lock = AsyncThreadLock(lock)
+        released = threading.Event()
+
+        assert repr(async_lock).startswith("AsyncThreadLock(lock=")
+
+        def hold():
+            with lock:
+                released.wait(1)
+        thread = threading.Thread(target=hold)
+        thread.start()
+        await asyncio.sleep(0.01)
+        entered = asyncio.ensure_future(async_lock.__aenter__())
+        await asyncio.sleep(0.05)
+        assert not entered.done()
+
+        released.set()
+        assert await asyncio.wait_for(entered, 1) is async_lock
+        await async_lock.__aexit__(None, None, None)
+        thread.join()
+        async with async_lock:
+            assert lock.acquire(blocking=False)
+            lock.release()
@@ -0,0 +1,409 @@
+# filepath: /test/stores_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the stores module.
+"""
+import httpx
+import pytest
+from edgar_sec.objects import Filing, UnitDisclosure, CompanyFacts, Company
+from edgar_sec.stores import SubmissionCheckpoint, SubmissionStore, FactChange, FactStore, FactCatalog, CompanyUniverse
+from edgar_sec.testing import PayloadGenerator
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+def make_filing(accession_number, filing_date):
+    return Filing(
+        accession_number=accession_number,
+        filing_date=filing_date,
+        report_date="",
+        acceptance_date_time="",
+        act="34",
+        form="10-Q",
+        file_number="001-38842",
+        film_number="",
+        items=[],
+        core_type="",
+        size=0,
+        is_xbrl=True,
+        is_inline_xbrl=True,
+        primary_document="",
+        primary_doc_description=""
+    )
+
+class TestSubmissionStore:
+    def test_init(self):
+        store = SubmissionStore()
+
+        assert store.path is None
+        assert len(store) == 0
+        assert repr(store) == "SubmissionStore(path=None, checkpoints=0)"
+
+    def test_new_filings(self):
+        store = SubmissionStore()
+        filings = [
+            make_filing("0000000000-25-000003", "2025-07-03"),
+            make_filing("0000000000-25-000002", "2025-07-02"),
+            make_filing("0000000000-25-000001", "2025-07-01"),
+        ]
+
+        assert store.new_filings("0001744489", filings) == filings
+
+        store.update(SubmissionCheckpoint(cik="0001744489", last_accession_number="0000000000-25-000002", last_filing_date="2025-07-02"))
+
+        assert "0001744489" in store
+        assert store.new_filings("0001744489", filings) == filings[:1]
+
+        store.update(SubmissionCheckpoint(cik="0001744489", last_accession_number="0000000000-24-000001", last_filing_date="2025-07-02"))
+
+        assert store.new_filings("0001744489", filings) == filings[:2]
+
+    def test_new_filings_skips_seen_on_checkpoint_date(self):
+        store = SubmissionStore()
+        seen = [
+            make_filing("0000000000-25-000003", "2025-07-02"),
+            make_filing("0000000000-25-000002", "2025-07-02"),
+            make_filing("0000000000-25-000001", "2025-07-01"),
+        ]
+        store.advance("0001744489", seen, {})
+
+        assert store.get("0001744489").seen_accession_numbers == ["0000000000-25-000003", "0000000000-25-000002"]
+
+        later = make_filing("0000000000-25-000004", "2025-07-02")
+        newest = make_filing("0000000000-25-000005", "2025-07-03")
+        # The last-seen filing has rolled out of the list, so new_filings falls back to the checkpoint date.
+        filings = [newest, later, seen[1], seen[2]]
+
+        assert store.new_filings("0001744489", filings) == [newest, later]
+
+    def test_conditional_headers(self):
+        store = SubmissionStore()
+        headers = {"Accept": "application/json"}
+
+        assert store.conditional_headers("0001744489", headers) == headers
+
+        store.update(SubmissionCheckpoint(cik="0001744489", last_accession_number="", last_filing_date="", etag='"abc"', last_modified="Wed, 02 Jul 2025 23:59:54 GMT"))
+        conditional = store.conditional_headers("0001744489", headers)
+
+        assert conditional["If-None-Match"] == '"abc"'
+        assert conditional["If-Modified-Since"] == "Wed, 02 Jul 2025 23:59:54 GMT"
+        assert "If-None-Match" not in headers
+
+    def test_advance(self):
+        store = SubmissionStore()
+        filings = [make_filing("0000000000-25-000002", "2025-07-02"), make_filing("0000000000-25-000001", "2025-07-01")]
+
+        checkpoint = store.advance("0001744489", filings, {"etag": '"abc"', "last_modified": None})
+
+        assert checkpoint.last_accession_number == "0000000000-25-000002"
+        assert checkpoint.last_filing_date == "2025-07-02"
+        assert checkpoint.etag == '"abc"'
+        assert store.get("0001744489") == checkpoint
+
+        checkpoint = store.advance("0001744489", [], {})
+
+        assert checkpoint.last_accession_number == ""
+        assert checkpoint.etag is None
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "checkpoints.json")
+        store = SubmissionStore(path)
+        store.update(SubmissionCheckpoint(cik="0001744489", last_accession_number="0000000000-25-000002", last_filing_date="2025-07-02", etag='"abc"'))
+        store.save()
+
+        reloaded = SubmissionStore(path)
+
+        assert len(reloaded) == 1
+        assert reloaded.get("0001744489") == store.get("0001744489")
+
+        with pytest.raises(ValueError, match="SubmissionStore has no path to save to."):
+            SubmissionStore().save()
+        with pytest.raises(ValueError, match="SubmissionStore has no path to load from."):
+            SubmissionStore().load()
+
+def make_company_facts(disclosures):
+    return {
+        "cik": 1744489,
+        "entityName": "WALT DISNEY CO/",
+        "facts": {
+            "us-gaap": {
+                "AccountsPayableCurrent": {
+                    "label": "Accounts Payable, Current",
+                    "description": "",
+                    "units": {"USD": disclosures}
+                }
+            }
+        }
+    }
+
+class TestFactStore:
+    def test_init(self, tmp_path):
+        store = FactStore()
+
+        assert store.directory is None
+        assert len(store) == 0
+        assert repr(store) == "FactStore(directory=None, companies=0)"
+
+        directory = tmp_path / "facts"
+        FactStore(str(directory))
+
+        assert directory.is_dir()
+
+    def test_fact_key(self):
+        data = {"accn": "0001744489-19-000225", "end": "2019-09-28", "start": None}
+
+        assert FactStore.fact_key("us-gaap", "Revenues", "USD", data) == "us-gaap|Revenues|USD|0001744489-19-000225||2019-09-28"
+
+    def test_merge(self):
+        store = FactStore()
+        first = {"end": "2018-09-29", "val": 6503000000, "accn": "0001744489-19-000173", "fy": 2019, "fp": "Q3", "form": "10-Q", "filed": "2019-08-14"}
+        second = {"end": "2019-09-28", "val": 6700000000, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20", "frame": "CY2019Q3I"}
+
+        changes = store.merge(make_company_facts([first]))
+
+        assert len(changes) == 1
+        assert isinstance(changes[0], FactChange)
+        assert changes[0].status == "added"
+        assert changes[0].taxonomy == "us-gaap"
+        assert changes[0].tag == "AccountsPayableCurrent"
+        assert isinstance(changes[0].disclosure, UnitDisclosure)
+        assert "0001744489" in store
+
+        assert store.merge(make_company_facts([first])) == []
+
+        restated = dict(first, frame="CY2018Q3I")
+        changes = store.merge(make_company_facts([restated, second]))
+
+        assert [change.status for change in changes] == ["changed", "added"]
+        assert changes[1].disclosure.val == 6700000000.0
+
+        changes = store.merge(make_company_facts([second]))
+
+        assert len(changes) == 1
+        assert changes[0].status == "removed"
+        assert changes[0].tag == "AccountsPayableCurrent"
+        assert changes[0].disclosure.accn == "0001744489-19-000173"
+        assert changes[0].disclosure.end == "2018-09-29"
+        assert changes[0].disclosure.frame == "CY2018Q3I"
+        assert changes[0].disclosure.val == 6503000000.0
+        assert changes[0].disclosure.start is None
+        assert store.merge(make_company_facts([second])) == []
+
+    def test_save_and_load(self, tmp_path):
+        directory = str(tmp_path)
+        store = FactStore(directory)
+        disclosure = {"end": "2019-09-28", "val": 1, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}
+        store.merge(make_company_facts([disclosure]))
+        store.save()
+
+        assert (tmp_path / "CIK0001744489.json").exists()
+        assert store.dirty == set()
+
+        reloaded = FactStore(directory)
+
+        assert "0001744489" in reloaded
+        assert reloaded.merge(make_company_facts([disclosure])) == []
+        assert len(reloaded.merge(make_company_facts([dict(disclosure, val=2)]))) == 1
+
+        with pytest.raises(ValueError, match="FactStore has no directory to save to."):
+            FactStore().save()
+
+    def test_save_appends_deltas(self, tmp_path):
+        directory = str(tmp_path)
+        store = FactStore(directory)
+        disclosures = [
+            {"end": "2019-09-28", "val": 1, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"},
+            {"end": "2018-09-29", "val": 2, "accn": "0001744489-19-000173", "fy": 2019, "fp": "Q3", "form": "10-Q", "filed": "2019-08-14"},
+        ]
+        store.merge(make_company_facts(disclosures))
+        store.save()
+        snapshot = (tmp_path / "CIK0001744489.json").read_text()
+
+        store.merge(make_company_facts([dict(disclosures[0], val=3)]))
+        store.save()
+
+        assert (tmp_path / "CIK0001744489.json").read_text() == snapshot
+        assert len((tmp_path / "CIK0001744489.jsonl").read_text().splitlines()) == 1
+
+        reloaded = FactStore(directory)
+
+        assert reloaded.merge(make_company_facts([dict(disclosures[0], val=3)])) == []
+
+        with open(tmp_path / "CIK0001744489.jsonl", "a", encoding="utf-8") as file:
+            file.write('{"truncated')
+        reloaded = FactStore(directory)
+
+        assert reloaded.merge(make_company_facts([dict(disclosures[0], val=3)])) == []
+        reloaded.save()
+        assert not (tmp_path / "CIK0001744489.jsonl").exists()
+
+        for val in range(10, 20):
+            store.merge(make_company_facts([dict(disclosures[0], val=val)]))
+            store.save()
+
+        assert not (tmp_path / "CIK0001744489.jsonl").exists() or (tmp_path / "CIK0001744489.jsonl").stat().st_size <= len(snapshot)
+        assert FactStore(directory).merge(make_company_facts([dict(disclosures[0], val=19)])) == []
+
+class TestFactCatalog:
+    def test_validate(self):
+        catalog = FactCatalog()
+        disclosure = {"end": "2019-09-28", "val": 1, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}
+        catalog.validate_frame("us-gaap", "Unknown", "USD", "CY2019")
+        catalog.update(CompanyFacts.to_object(make_company_facts([disclosure])))
+
+        assert len(catalog) == 1
+        assert "0001744489" in catalog
+        assert repr(catalog) == "FactCatalog(path=None, taxonomies=1, companies=1)"
+        catalog.validate_concept("0001744489", "us-gaap", "AccountsPayableCurrent")
+        catalog.validate_concept("0000320193", "us-gaap", "AccountsPayableCurrent")
+        catalog.validate_concept("0000320193", "us-gaap", "Assets")
+        catalog.validate_concept("0000320193", "ifrs-full", "Revenue")
+        catalog.validate_frame("us-gaap", "AccountsPayableCurrent", "USD", "CY2019")
+        catalog.validate_frame("dei", "EntityCommonStockSharesOutstanding", "shares", "CY2019Q1I")
+        with pytest.raises(httpx.HTTPStatusError, match="CIK0001744489 does not report us-gaap/Assets.") as error:
+            catalog.validate_concept("0001744489", "us-gaap", "Assets")
+        assert error.value.response.status_code == 404
+        assert error.value.request.url == "https://data.sec.gov/api/xbrl/companyconcept/CIK0001744489/us-gaap/Assets.json"
+        with pytest.raises(httpx.HTTPStatusError, match="Unknown tag: us-gaap/Assets.") as error:
+            catalog.validate_frame("us-gaap", "Assets", "USD", "CY2019")
+        assert error.value.request.url.path == "/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json"
+        with pytest.raises(httpx.HTTPStatusError, match="Unknown unit for us-gaap/AccountsPayableCurrent: EUR."):
+            catalog.validate_frame("us-gaap", "AccountsPayableCurrent", "EUR", "CY2019")
+
+    def test_units(self):
+        catalog = FactCatalog()
+        disclosure = {"end": "2019-09-28", "val": 1, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}
+        company_facts = make_company_facts([disclosure])
+        units = company_facts["facts"]["us-gaap"]["AccountsPayableCurrent"]["units"]
+        units["USD/shares"] = units.pop("USD")
+        catalog.update(CompanyFacts.to_object(company_facts))
+
+        catalog.validate_frame("us-gaap", "AccountsPayableCurrent", "USD-per-shares", "CY2019")
+        assert FactCatalog.normalize_unit("USD/shares") == "USD-per-shares"
+
+    def test_staleness(self):
+        catalog = FactCatalog(max_age=60)
+        disclosure = {"end": "2019-09-28", "val": 1, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}
+        catalog.update(CompanyFacts.to_object(make_company_facts([disclosure])))
+        catalog.updated["0001744489"] -= 120
+
+        catalog.validate_concept("0001744489", "us-gaap", "Assets")
+        catalog.validate_frame("us-gaap", "Assets", "USD", "CY2019")
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "catalog.json")
+        catalog = FactCatalog(path)
+        disclosure = {"end": "2019-09-28", "val": 1, "accn": "0001744489-19-000225", "fy": 2019, "fp": "FY", "form": "10-K", "filed": "2019-11-20"}
+        catalog.update(CompanyFacts.to_object(make_company_facts([disclosure])))
+        catalog.save()
+
+        reloaded = FactCatalog(path)
+
+        assert reloaded.concepts == {"us-gaap": {"AccountsPayableCurrent": {"USD"}}}
+        assert reloaded.companies == {"0001744489": {"us-gaap/AccountsPayableCurrent"}}
+        assert reloaded.updated == catalog.updated
+        with pytest.raises(ValueError, match="FactCatalog has no path to save to."):
+            FactCatalog().save()
+
+def make_universe():
+    universe = CompanyUniverse()
+    universe.update(
+        {
+            "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+            "1": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+            "2": {"cik_str": 1067983, "ticker": "BRK-A", "title": "BERKSHIRE HATHAWAY INC"},
+            "3": {"cik_str": 789019, "ticker": "MSFT", "title": "MICROSOFT CORP"}
+        },
+        {
+            "fields": ["cik", "name", "ticker", "exchange"],
+            "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"], [1067983, "BERKSHIRE HATHAWAY INC", "BRK-B", "NYSE"], [789019, "MICROSOFT CORP", "MSFT", "Nasdaq"]]
+        }
+    )
+    return universe
+
+class TestCompanyUniverse:
+    def test_update(self):
+        universe = make_universe()
+
+        assert len(universe) == 4
+        assert repr(universe) == "CompanyUniverse(path=None, companies=4)"
+        assert universe[0] == Company(cik="320193", ticker="AAPL", title="Apple Inc.")
+        assert [company.ticker for company in universe] == ["AAPL", "BRK-B", "BRK-A", "MSFT"]
+        assert universe[-1].ticker == "MSFT"
+        assert universe[1:3].ticker == ["BRK-B", "BRK-A"] and "brk.a" in universe[1:3]
+        assert universe[::-2].cik == ["789019", "1067983"]
+        with pytest.raises(TypeError, match="indices must be integers or slices, not str."):
+            universe["AAPL"]
+        assert universe.exchange == ["Nasdaq", "NYSE", None, "Nasdaq"]
+        assert "brk.b" in universe and "GOOG" not in universe
+        assert not universe.is_stale(60) and CompanyUniverse().is_stale(60)
+        assert CompanyUniverse.normalize_ticker(" brk/b ") == "BRK-B"
+        assert CompanyUniverse.normalize_ticker(None) == ""
+
+    def test_lookup(self):
+        universe = make_universe()
+
+        assert universe.lookup(["MSFT", "brk.b", "GOOG", None]) == ["789019", "1067983", None, None]
+        assert universe.lookup(["AAPL"], column="exchange") == ["Nasdaq"]
+        with pytest.raises(ValueError, match="Unknown column: sector."):
+            universe.lookup(["AAPL"], column="sector")
+
+    def test_filter(self):
+        universe = make_universe()
+
+        assert universe.filter(exchange="Nasdaq").ticker == ["AAPL", "MSFT"]
+        assert universe.filter(exchange=["NYSE", "Nasdaq"], search_text="berkshire").ticker == ["BRK-B"]
+        assert universe.filter(central_index_keys=["0001067983"]).ticker == ["BRK-B", "BRK-A"]
+        assert universe.filter(tickers=["msft", "AAPL", "GOOG"]).cik == ["320193", "789019"]
+        assert "MSFT" in universe.filter(central_index_keys=[789019])
+        assert len(universe.filter(search_text="alphabet")) == 0
+
+    def test_join(self):
+        universe = make_universe()
+        holdings = [{"Symbol": "BRK.B", "Shares": "10"}, {"Symbol": "GOOG", "Shares": "5"}, {"Symbol": "aapl", "Shares": "1"}]
+
+        assert universe.join(holdings, on="Symbol", columns=["cik"]) == [
+            {"Symbol": "BRK.B", "Shares": "10", "cik": "1067983"},
+            {"Symbol": "GOOG", "Shares": "5", "cik": None},
+            {"Symbol": "aapl", "Shares": "1", "cik": "320193"}
+        ]
+        assert [row["exchange"] for row in universe.join(holdings, on="Symbol", how="inner")] == ["NYSE", "Nasdaq"]
+        assert "cik" not in holdings[0]
+        with pytest.raises(ValueError, match="Unknown join: outer."):
+            universe.join(holdings, how="outer")
+
+    def test_large_universe(self):
+        generator = PayloadGenerator()
+        universe = CompanyUniverse()
+        universe.update(generator.company_tickers(10000), generator.company_tickers_exchange(10000))
+        tickers = [f"T{1000 + index * 7}" for index in range(0, 10000, 3)]
+
+        assert universe.lookup(tickers) == [ticker[1:] for ticker in tickers]
+        assert len(universe.join({"ticker": ticker} for ticker in tickers)) == len(tickers)
+        assert universe.exchange[:6] == ["Nasdaq", "NYSE", "Nasdaq", "OTC", "CBOE", None]
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "universe.json")
+        universe = make_universe()
+        universe.path = path
+        universe.save()
+
+        reloaded = CompanyUniverse(path)
+
+        assert reloaded.ticker == universe.ticker and reloaded.exchange == universe.exchange
+        assert reloaded.fetched == universe.fetched
+        assert reloaded.lookup(["BRK.B"]) == ["1067983"]
+        with pytest.raises(ValueError, match="CompanyUniverse has no path to save to."):
+            CompanyUniverse().save()
@@ -0,0 +1,166 @@
+# filepath: /test/testing_test.py
+#
+# Copyright (c) 2025 Nikhil Sunder
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Comprehensive tests for the testing module.
+"""
+import httpx
+import pytest
+import tenacity
+from edgar_sec.clients import EdgarAPI
+from edgar_sec.objects import SubmissionHistory, CompanyFacts, CompanyConcept, Frame
+from edgar_sec.testing import PayloadGenerator, MockEdgarServer, LoadTest, LoadTestReport
+from edgar_sec.__about__ import __title__, __version__, __author__, __license__, __copyright__, __description__, __url__
+
+class TestPayloadGenerator:
+    def test_deterministic(self):
+        assert PayloadGenerator(seed=1).company_facts(320193, tags=3, facts_per_tag=5) == PayloadGenerator(seed=1).company_facts(320193, tags=3, facts_per_tag=5)
+        assert PayloadGenerator(seed=1).frame(companies=5) != PayloadGenerator(seed=2).frame(companies=5)
+        assert repr(PayloadGenerator(seed=1)) == "PayloadGenerator(seed=1)"
+
+    def test_submissions(self):
+        payload = PayloadGenerator().submissions(320193, filings=50, files=2, former_names=3)
+        submission_history = SubmissionHistory.to_object(payload)
+
+        assert submission_history.cik == "0000320193"
+        assert len(submission_history.filings) == 50
+        assert len(submission_history.files) == 2
+        assert len(submission_history.former_names) == 3
+        assert all(len(column) == 50 for column in payload["filings"]["recent"].values())
+
+    def test_company_facts(self):
+        payload = PayloadGenerator().company_facts(320193, tags=4, facts_per_tag=10)
+        company_facts = CompanyFacts.to_object(payload)
+
+        assert [facts.taxonomy for facts in company_facts.facts] == ["dei", "us-gaap"]
+        assert len(company_facts.facts[1].disclosures) == 4
+        assert all(len(disclosures.units) == 10 for disclosures in company_facts.facts[1].disclosures)
+        assert len(CompanyFacts.to_object(payload, dedup=True).facts[1].disclosures[0].units) < 10
+
+    def test_company_concept(self):
+        company_concept = CompanyConcept.to_object(PayloadGenerator().company_concept(320193, tag="Assets", facts=6))
+
+        assert company_concept.tag == "Assets"
+        assert len(company_concept.units) == 6
+        assert not any(unit.start for unit in company_concept.units)
+
+    def test_frame(self):
+        frame = Frame.to_object(PayloadGenerator().frame(period="CY2019", companies=25))
+
+        assert frame.ccp == "CY2019"
+        assert frame.pts == len(frame.disclosures) == 25
+        assert len({disclosure.cik for disclosure in frame.disclosures}) == 25
+
+    def test_company_tickers(self):
+        company_tickers = PayloadGenerator().company_tickers(3)
+
+        assert list(company_tickers) == ["0", "1", "2"]
+        assert set(company_tickers["0"]) == {"cik_str", "ticker", "title"}
+
+class TestMockEdgarServer:
+    def test_init(self):
+        server = MockEdgarServer(latency=0.1, throttle_rate=0.5, rate_limit=10, payload_size=5)
+
+        assert repr(server) == "MockEdgarServer(latency=0.1, throttle_rate=0.5, rate_limit=10, payload_size=5)"
+        with pytest.raises(ValueError, match="payload_size must be a positive integer."):
+            MockEdgarServer(payload_size=0)
+        with pytest.raises(ValueError, match="throttle_rate must be between 0 and 1."):
+            MockEdgarServer(throttle_rate=2)
+
+    def test_respond(self):
+        server = MockEdgarServer(payload_size=3, responses={"/submissions/CIK0000320193.json": {"cik": "0000320193", "name": "Apple Inc."}})
+        with httpx.Client(transport=server, base_url="https://data.sec.gov") as client:
+            assert client.get("/submissions/CIK0000320193.json").json()["name"] == "Apple Inc."
+            assert len(client.get("/submissions/CIK0000789019.json").json()["filings"]["recent"]["form"]) == 3
+            assert len(client.get("/api/xbrl/companyfacts/CIK0000789019.json").json()["facts"]["us-gaap"]) == 3
+            assert client.get("/api/xbrl/companyconcept/CIK0000789019/us-gaap/Assets.json").json()["tag"] == "Assets"
+            assert client.get("/api/xbrl/frames/us-gaap/Assets/USD/CY2019Q1I.json").json()["ccp"] == "CY2019Q1I"
+            assert client.get("/api/xbrl/unknown.json").status_code == 404
+        assert server.requests == 6
+        assert server.throttled == 0
+
+    def test_throttling(self):
+        server = MockEdgarServer(rate_limit=2)
+        with httpx.Client(transport=server, base_url="https://data.sec.gov") as client:
+            statuses = [client.get("/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json").status_code for _ in range(4)]
+        assert statuses == [200, 200, 429, 429]
+        assert server.throttled == 2
+
+        server = MockEdgarServer(throttle_rate=1)
+        response = server.respond(httpx.Request("GET", "https://data.sec.gov/api/xbrl/frames/us-gaap/Assets/USD/CY2019.json"))
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+    def test_edgar_api(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=4))
+
+        assert isinstance(api.get_submissions(central_index_key="0000320193"), SubmissionHistory)
+        assert len(api.get_company_facts(central_index_key="0000320193").facts[1].disclosures) == 4
+        assert isinstance(api.get_company_concept("us-gaap", "Assets", central_index_key="0000320193"), CompanyConcept)
+        assert api.get_frames("us-gaap", "Assets", "USD", "CY2019Q1", instantaneous=True).pts == 4
+
+    @pytest.mark.asyncio
+    async def test_edgar_api_async(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=2, latency=0.01)).Async
+
+        assert isinstance(await api.get_company_facts(central_index_key="0000320193"), CompanyFacts)
+        assert isinstance(await api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False), Frame)
+
+    def test_edgar_api_throttled(self):
+        api = EdgarAPI(transport=MockEdgarServer(throttle_rate=1))
+
+        with pytest.raises(tenacity.RetryError) as excinfo:
+            api.get_frames("us-gaap", "Assets", "USD", "CY2019", instantaneous=False)
+        assert excinfo.value.last_attempt.exception().response.status_code == 429
+
+class TestLoadTest:
+    def test_init(self):
+        api = EdgarAPI()
+
+        assert LoadTest(api).central_index_keys[0] == "0000000001"
+        with pytest.raises(ValueError, match="Unknown endpoints: filings."):
+            LoadTest(api, endpoints=("filings",))
+
+    def test_run(self):
+        server = MockEdgarServer(payload_size=2)
+        api = EdgarAPI(transport=server)
+        api.max_requests_per_second = 1000
+
+        report = LoadTest(api).run(requests=8, concurrency=2)
+
+        assert isinstance(report, LoadTestReport)
+        assert report.requests == 8
+        assert report.errors == 0
+        assert report.concurrency == 2
+        assert report.throughput > 0
+        assert report.latency_p50 <= report.latency_p99 <= report.latency_max
+        assert server.requests == 8
+
+    def test_run_async(self):
+        api = EdgarAPI(transport=MockEdgarServer(payload_size=2))
+        api.max_requests_per_second = 1000
+
+        reports = LoadTest(api, endpoints=("frames",)).sweep(requests=4, concurrency_levels=[1, 4])
+
+        assert [report.concurrency for report in reports] == [1, 4]
+        assert all(report.requests == 4 and report.errors == 0 for report in reports)
+
+    def test_report(self):
+        report = LoadTestReport.to_object([0.5], errors=1, concurrency=1, duration=2.0)
+
+        assert report.latency_p50 == report.latency_p99 == 0.5
+        assert report.throughput == 0.5
+        assert LoadTestReport.to_object([], errors=0, concurrency=1, duration=0.0).throughput == 0.0